@@ -37,6 +37,7 @@ class SpyderKernel(IPythonKernel):
         # All functions that can be called through the comm
         handlers = {
             'set_breakpoints': self.set_spyder_breakpoints,
+            'update_breakpoints': self.update_spyder_breakpoints,
             'set_pdb_ignore_lib': self.set_pdb_ignore_lib,
             'set_pdb_execute_events': self.set_pdb_execute_events,
             'get_value': self.get_value,
@@ -54,9 +55,15 @@ class SpyderKernel(IPythonKernel):
             'get_env': self.get_env,
             'close_all_mpl_figures': self.close_all_mpl_figures,
             'show_mpl_backend_errors': self.show_mpl_backend_errors,
+            'get_startup_timeline': self.get_startup_timeline,
             'get_namespace_view': self.get_namespace_view,
+            'get_namespace_view_delta': self.get_namespace_view_delta,
             'set_namespace_view_settings': self.set_namespace_view_settings,
             'get_var_properties': self.get_var_properties,
+            'get_collection_page': self.get_collection_page,
+            'get_collection_item': self.get_collection_item,
+            'set_collection_item': self.set_collection_item,
+            'close_collection': self.close_collection,
             'set_sympy_forecolor': self.set_sympy_forecolor,
             'set_pdb_echo_code': self.set_pdb_echo_code,
             'update_syspath': self.update_syspath,
@@ -67,9 +74,15 @@ class SpyderKernel(IPythonKernel):
                 call_id, handlers[call_id])
 
         self.namespace_view_settings = {}
+        self._namespace_view_cache = {}
+        self._namespace_view_sent = None
+        self._namespace_view_sent_settings = None
+        self._namespace_view_version = 0
+        self._collection_indexes = {}
 
         self._pdb_obj = None
         self._pdb_step = None
+        self._pdb_step_sent = None
         self._pdb_print_code = True
         self._do_publish_pdb_state = True
         self._mpl_backend_error = None
@@ -112,6 +125,17 @@ class SpyderKernel(IPythonKernel):
         if self._pdb_obj:
             self._pdb_obj.set_spyder_breakpoints(breakpoints)
 
+    def update_spyder_breakpoints(self, breakpoints):
+        """
+        Handle a message from the frontend with the breakpoints of the
+        files that changed.
+
+        Returns False if all breakpoints need to be sent instead.
+        """
+        if self._pdb_obj:
+            return self._pdb_obj.update_spyder_breakpoints(breakpoints)
+        return True
+
     def set_pdb_echo_code(self, state):
         """Set if pdb should echo the code.
 
@@ -186,6 +210,61 @@ class SpyderKernel(IPythonKernel):
         else:
             return None
 
+    def get_namespace_view_delta(self, reset=False, version=None):
+        """
+        Return the changes of the namespace view since the last call.
+
+        This is a dictionary with the following structure
+
+        {'reset': False, 'update': {'a': {'color': ..., 'view': ...}},
+         'remove': ['b'], 'base': 1, 'version': 2}
+
+        Here:
+        * 'update' has the entries of the variables that were added or
+          changed, with the same structure as in get_namespace_view.
+        * 'remove' are the variables that were removed.
+        * 'reset' is True if 'update' has the full namespace view instead,
+          which happens on the first call, when *reset* is True or when the
+          settings changed.
+        * 'version' numbers the view sent with each call, and 'base' is the
+          version the changes apply to.
+
+        If *version* is given, it must be the version of the last view
+        received by the frontend. The full view is sent if it isn't the
+        last one sent by the kernel.
+
+        The entries of variables that can't change in place and still point
+        to the same objects are not computed again.
+        """
+        from spyder_kernels.utils.nsview import (get_view_delta,
+                                                 make_remote_view)
+
+        settings = self.namespace_view_settings
+        if not settings:
+            return None
+
+        if (reset or self._namespace_view_sent is None or
+                settings != self._namespace_view_sent_settings or
+                (version is not None and
+                 version != self._namespace_view_version)):
+            reset = True
+            self._namespace_view_cache = {}
+            self._namespace_view_sent_settings = dict(settings)
+
+        ns = self._get_current_namespace()
+        view = make_remote_view(ns, settings, EXCLUDED_NAMES,
+                                cache=self._namespace_view_cache)
+        if reset:
+            delta = {'update': view, 'remove': []}
+        else:
+            delta = get_view_delta(self._namespace_view_sent, view)
+        delta['reset'] = reset
+        delta['base'] = self._namespace_view_version
+        self._namespace_view_version += 1
+        delta['version'] = self._namespace_view_version
+        self._namespace_view_sent = view
+        return delta
+
     def get_var_properties(self):
         """
         Get some properties of the variables in the current
@@ -218,6 +297,72 @@ class SpyderKernel(IPythonKernel):
         else:
             return None
 
+    def get_collection_page(self, name, start, stop, sort_column=None,
+                            reverse=False, filter_text=''):
+        """
+        Return the rows between start and stop of the collection name,
+        sorted by sort_column and filtered by filter_text.
+
+        This is a dictionary with the following structure
+
+        {'length': 1000000, 'total': 1000, 'type': 'dict', 'readonly': False,
+         'rows': [{'key': "'a'", 'type': 'int', 'size': 1,
+                   'color': '#0000ff', 'view': '1'}]}
+
+        Here:
+        * 'length' is the number of elements of the collection.
+        * 'total' is the number of rows left after filtering.
+        * 'rows' has the same entries as get_namespace_view, plus the
+          display of the key of each row.
+
+        The sorted and filtered index of the collection is kept until its
+        sorting or filter change, or the variable points to another object.
+        """
+        index = self._get_collection_index(name, sort_column, reverse,
+                                           filter_text)
+        if index is None:
+            return None
+        from spyder_kernels.utils.nsview import get_human_readable_type
+
+        self._do_publish_pdb_state = False
+        minmax = self.namespace_view_settings.get('minmax', False)
+        try:
+            rows = index.get_rows(start, stop, minmax=minmax)
+        except (KeyError, IndexError):
+            # The collection changed in place since the index was created
+            index = self._get_collection_index(name, sort_column, reverse,
+                                               filter_text, rebuild=True)
+            rows = index.get_rows(start, stop, minmax=minmax)
+        return {'length': index.length,
+                'total': len(index),
+                'type': get_human_readable_type(index.original),
+                'readonly': isinstance(index.original, (tuple, set)),
+                'rows': rows}
+
+    def get_collection_item(self, name, row):
+        """Get the value of a row of the collection name."""
+        self._do_publish_pdb_state = False
+        index = self._collection_indexes[name]
+        try:
+            return index.get_item(row)
+        except (KeyError, IndexError):
+            # The collection changed in place since the index was created
+            index = self._get_collection_index(
+                name, index.sort_column, index.reverse, index.filter_text,
+                rebuild=True)
+            return index.get_item(row)
+
+    def set_collection_item(self, name, row, value):
+        """Set the value of a row of the collection name."""
+        index = self._collection_indexes.pop(name)
+        # The index is created again on the next page, because the new
+        # value can change its sorting and filtering
+        index.original[index.get_key(row)] = value
+
+    def close_collection(self, name):
+        """Forget the index of the collection name."""
+        self._collection_indexes.pop(name, None)
+
     def get_value(self, name):
         """Get the value of a variable"""
         ns = self._get_current_namespace()
@@ -314,12 +459,24 @@ class SpyderKernel(IPythonKernel):
         """
         Publish Variable Explorer state and Pdb step through
         send_spyder_msg.
+
+        Only what changed since the last publication is sent, and nothing
+        at all if the step and the namespace view are the same. That's the
+        case after most commands that don't run code, and after stepping
+        commands, which are published again when the debugger stops.
         """
         if self._pdb_obj and self._do_publish_pdb_state:
-            state = dict(namespace_view = self.get_namespace_view(),
-                         var_properties = self.get_var_properties(),
-                         step = self._pdb_step)
-            self.frontend_call(blocking=False).pdb_state(state)
+            state = {}
+            if self._pdb_step != self._pdb_step_sent:
+                state['step'] = self._pdb_step
+            delta = self.get_namespace_view_delta()
+            if delta is not None and (delta['reset'] or delta['update'] or
+                                      delta['remove']):
+                state['namespace_view_delta'] = delta
+                state['var_properties'] = self.get_var_properties()
+            if state:
+                self.frontend_call(blocking=False).pdb_state(state)
+                self._pdb_step_sent = self._pdb_step
         self._do_publish_pdb_state = True
 
     def pdb_continue(self):
@@ -456,6 +613,27 @@ class SpyderKernel(IPythonKernel):
             else:
                 return glbs
 
+    def _get_collection_index(self, name, sort_column=None, reverse=False,
+                              filter_text='', rebuild=False):
+        """
+        Return the index over the collection name, creating it if it
+        doesn't exist, is out of date or rebuild is True.
+        """
+        from spyder_kernels.utils.pagedview import (CollectionIndex,
+                                                    PAGED_TYPES)
+
+        value = self._get_current_namespace().get(name)
+        if not isinstance(value, PAGED_TYPES):
+            self._collection_indexes.pop(name, None)
+            return None
+        index = self._collection_indexes.get(name)
+        signature = CollectionIndex.get_signature(value, sort_column,
+                                                  reverse, filter_text)
+        if rebuild or index is None or index.signature != signature:
+            index = CollectionIndex(value, sort_column, reverse, filter_text)
+            self._collection_indexes[name] = index
+        return index
+
     def _mglobals(self):
         """Return current globals -- handles Pdb frames"""
         if self._pdb_frame is not None:
@@ -526,6 +704,8 @@ class SpyderKernel(IPythonKernel):
     def _register_pdb_session(self, pdb_obj):
         """Register Pdb session to use it later"""
         self._pdb_obj = pdb_obj
+        # The frontend forgets the last step when a session starts
+        self._pdb_step_sent = None
 
     # --- For the Help plugin
     def _eval(self, text):
@@ -551,6 +731,17 @@ class SpyderKernel(IPythonKernel):
         backend: A parameter that can be passed to %matplotlib
                  (e.g. 'inline' or 'tk').
         """
+        if (backend == 'inline' and not pylab and
+                'matplotlib.pyplot' not in sys.modules):
+            # Importing Matplotlib slows down the startup, and ipykernel
+            # makes inline its default backend anyway, so our inline
+            # options are applied when the user imports pyplot.
+            from spyder_kernels.customize.importhooks import (
+                register_post_import_hook)
+            register_post_import_hook('matplotlib.pyplot',
+                                      self._set_deferred_mpl_backend)
+            return
+
         import traceback
         from IPython.core.getipython import get_ipython
 
@@ -592,11 +783,33 @@ class SpyderKernel(IPythonKernel):
 
         self._mpl_backend_error = error
 
+    def _set_deferred_mpl_backend(self, pyplot):
+        """Set the inline backend after pyplot is imported."""
+        import matplotlib
+        # Don't replace a backend selected by the user before importing
+        # pyplot (e.g. with matplotlib.use)
+        if 'inline' not in matplotlib.get_backend().lower():
+            return
+        self._set_mpl_backend('inline')
+        # The prompt was shown long ago, so errors are shown right away
+        self.show_mpl_backend_errors()
+
     def show_mpl_backend_errors(self):
         """Show Matplotlib backend errors after the prompt is ready."""
         if self._mpl_backend_error is not None:
             print(self._mpl_backend_error)  # spyder: test-skip
 
+    def get_startup_timeline(self):
+        """
+        Return the timeline of the kernel startup, with its text report.
+
+        It's empty if the kernel wasn't started by spyder_kernels.console.
+        """
+        from spyder_kernels.utils.timeline import STARTUP_TIMELINE
+        timeline = STARTUP_TIMELINE.to_dict()
+        timeline['report'] = STARTUP_TIMELINE.report()
+        return timeline
+
     def set_sympy_forecolor(self, background_color='dark'):
         """Set SymPy forecolor depending on console background."""
         if os.environ.get('SPY_SYMPY_O') == 'True':
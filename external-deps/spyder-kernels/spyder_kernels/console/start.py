@@ -17,6 +17,10 @@ import os.path as osp
 import sys
 import site
 
+# Local imports
+from spyder_kernels.customize.importhooks import IMPORT_HOOKS
+from spyder_kernels.utils.timeline import STARTUP_TIMELINE
+
 
 PY2 = sys.version[0] == '2'
 
@@ -49,7 +53,17 @@ def is_module_installed(module_name):
     """
     Simpler version of spyder.utils.programs.is_module_installed
     to improve startup time.
+
+    In Python 3 modules are looked for without importing them.
     """
+    if module_name in sys.modules:
+        return True
+    if not PY2:
+        import importlib.util
+        try:
+            return importlib.util.find_spec(module_name) is not None
+        except Exception:
+            return False
     try:
         __import__(module_name)
         return True
@@ -285,8 +299,12 @@ def main():
     __doc__ = ''
     __name__ = '__main__'
 
+    # Record the startup phases and the imports done during them
+    IMPORT_HOOKS.start_timing(STARTUP_TIMELINE)
+
     # Import our customizations into the kernel
-    import_spydercustomize()
+    with STARTUP_TIMELINE.phase('Import spydercustomize'):
+        import_spydercustomize()
 
     # Remove current directory from sys.path to prevent kernel
     # crashes when people name Python files or modules with
@@ -296,16 +314,19 @@ def main():
         sys.path.remove('')
 
     # Fire up the kernel instance.
-    from ipykernel.kernelapp import IPKernelApp
-    from spyder_kernels.console.kernel import SpyderKernel
+    with STARTUP_TIMELINE.phase('Import kernel'):
+        from ipykernel.kernelapp import IPKernelApp
+        from spyder_kernels.console.kernel import SpyderKernel
 
     kernel = IPKernelApp.instance()
     kernel.kernel_class = SpyderKernel
-    try:
-        kernel.config = kernel_config()
-    except:
-        pass
-    kernel.initialize()
+    with STARTUP_TIMELINE.phase('Kernel configuration'):
+        try:
+            kernel.config = kernel_config()
+        except:
+            pass
+    with STARTUP_TIMELINE.phase('Kernel initialization'):
+        kernel.initialize()
 
     # Set our own magics
     kernel.shell.register_magic_function(varexp)
@@ -316,6 +337,9 @@ def main():
     import pdb
     kernel.shell.InteractiveTB.debugger_cls = pdb.Pdb
 
+    IMPORT_HOOKS.stop_timing()
+    STARTUP_TIMELINE.finish()
+
     # Start the (infinite) kernel event loop.
     kernel.start()
 
@@ -193,6 +193,123 @@ def test_get_namespace_view(kernel):
     assert "'view': '1'" in nsview
 
 
+def test_get_namespace_view_delta(kernel):
+    """
+    Test that only the changes of the namespace view are sent.
+    """
+    kernel.do_execute('a = 1; b = "spam"; c = [1]', True)
+    delta = kernel.get_namespace_view_delta()
+    assert delta['reset']
+    assert set(delta['update']) == set(['a', 'b', 'c'])
+
+    # Nothing changed, but lists are always computed again
+    delta = kernel.get_namespace_view_delta()
+    assert not delta['reset']
+    assert delta['update'] == {}
+    assert delta['remove'] == []
+
+    kernel.do_execute('a = 2; del b; c.append(2)', True)
+    delta = kernel.get_namespace_view_delta()
+    assert set(delta['update']) == set(['a', 'c'])
+    assert delta['update']['a']['view'] == '2'
+    assert delta['update']['c']['size'] == 2
+    assert delta['remove'] == ['b']
+
+    # A full view is sent when asked for or when settings change
+    assert kernel.get_namespace_view_delta(reset=True)['reset']
+    kernel.namespace_view_settings = dict(kernel.namespace_view_settings,
+                                          minmax=True)
+    delta = kernel.get_namespace_view_delta()
+    assert delta['reset']
+    assert set(delta['update']) == set(['a', 'c'])
+
+    # Views are numbered, and a full view is sent if the frontend doesn't
+    # have the last one
+    delta = kernel.get_namespace_view_delta(version=delta['version'])
+    assert not delta['reset']
+    assert delta['version'] == delta['base'] + 1
+    delta = kernel.get_namespace_view_delta(version=delta['base'])
+    assert delta['reset']
+    assert set(delta['update']) == set(['a', 'c'])
+
+
+def test_publish_pdb_state(kernel, monkeypatch):
+    """
+    Test that Pdb states are only published with what changed.
+    """
+    states = []
+
+    class FrontendCall(object):
+        def pdb_state(self, state):
+            states.append(state)
+
+    class PdbMock(object):
+        curframe = None
+
+    monkeypatch.setattr(kernel, 'frontend_call',
+                        lambda blocking=False: FrontendCall())
+    kernel._register_pdb_session(PdbMock())
+    try:
+        kernel.do_execute('a = 1', True)
+        kernel._pdb_step = {'fname': 'test.py', 'lineno': 1}
+        kernel.publish_pdb_state()
+        assert set(states[-1]) == set(['step', 'namespace_view_delta',
+                                       'var_properties'])
+
+        # Nothing is sent if nothing changed
+        kernel.publish_pdb_state()
+        assert len(states) == 1
+
+        # Only the step if the namespace view didn't change
+        kernel._pdb_step = {'fname': 'test.py', 'lineno': 2}
+        kernel.publish_pdb_state()
+        assert states[-1] == {'step': {'fname': 'test.py', 'lineno': 2}}
+
+        # Only the namespace if the step didn't change
+        kernel.do_execute('a = 2', True)
+        kernel.publish_pdb_state()
+        assert set(states[-1]) == set(['namespace_view_delta',
+                                       'var_properties'])
+        assert list(states[-1]['namespace_view_delta']['update']) == ['a']
+    finally:
+        kernel._register_pdb_session(None)
+
+
+def test_get_collection_page(kernel):
+    """
+    Test that collections are sent to the frontend in pages.
+    """
+    kernel.do_execute('d = {str(i): i for i in range(100)}', True)
+    page = kernel.get_collection_page('d', 10, 12, sort_column=3,
+                                      reverse=True)
+    assert page['length'] == page['total'] == 100
+    assert page['type'] == 'dict'
+    assert not page['readonly']
+    assert [row['view'] for row in page['rows']] == ['89', '88']
+
+    kernel.set_collection_item('d', 10, -1)
+    assert kernel.get_value('d')['89'] == -1
+
+    # The edited value is sorted again
+    page = kernel.get_collection_page('d', 99, 100, sort_column=3,
+                                      reverse=True)
+    assert [row['key'] for row in page['rows']] == ['89']
+
+    page = kernel.get_collection_page('d', 0, 10, filter_text='9')
+    assert page['total'] == 19
+    assert kernel.get_collection_item('d', 0) == 9
+
+    # Indexes are rebuilt when the collection changes in place
+    kernel.do_execute('del d["9"]; d["x9"] = 100', True)
+    assert kernel.get_collection_item('d', 0) == 19
+    page = kernel.get_collection_page('d', 0, 100, filter_text='9')
+    assert page['total'] == 19
+    assert page['rows'][-1]['view'] == '100'
+
+    kernel.close_collection('d')
+    assert kernel.get_collection_page('e', 0, 10) is None
+
+
 def test_get_var_properties(kernel):
     """
     Test the properties fo the variables in the namespace.
@@ -645,6 +762,61 @@ def test_matplotlib_inline(kernel):
         assert 'inline' in value
 
 
+@flaky(max_runs=3)
+def test_matplotlib_user_backend():
+    """Test that a backend selected before importing pyplot is kept."""
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    with setup_kernel(cmd) as client:
+        code = ("import matplotlib; matplotlib.use('Agg'); "
+                "import matplotlib.pyplot; backend = matplotlib.get_backend()")
+        client.execute(code, user_expressions={'output': 'backend'})
+        reply = client.get_shell_msg(block=True, timeout=TIMEOUT)
+
+        # Transform value obtained through user_expressions
+        user_expressions = reply['content']['user_expressions']
+        str_value = user_expressions['output']['data']['text/plain']
+        value = ast.literal_eval(str_value)
+
+        assert value.lower() == 'agg'
+
+
+@flaky(max_runs=3)
+@pytest.mark.skipif(not PY3, reason="Customizations are eager in Python 2")
+def test_lazy_customizations_and_timeline():
+    """
+    Test that optional modules are patched when imported, not at startup,
+    and that the startup timeline is recorded.
+    """
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    with setup_kernel(cmd) as client:
+        def get_value(code, expression):
+            client.execute(code, user_expressions={'output': expression})
+            reply = client.get_shell_msg(block=True, timeout=TIMEOUT)
+            user_expressions = reply['content']['user_expressions']
+            str_value = user_expressions['output']['data']['text/plain']
+            return ast.literal_eval(str_value)
+
+        # Optional modules are not imported at startup
+        code = "import sys"
+        value = get_value(code, "[m in sys.modules for m in "
+                                "('turtle', 'pandas', 'matplotlib.pyplot')]")
+        assert value == [False, False, False]
+
+        # But they're patched when imported
+        code = "import unittest"
+        assert get_value(code, "unittest.main.__name__") == 'IPyTesProgram'
+
+        # The timeline has the startup phases
+        code = "timeline = get_ipython().kernel.get_startup_timeline()"
+        assert get_value(code, "timeline['finished']")
+        names = get_value(code, "[e['name'] for e in timeline['entries']]")
+        assert 'Kernel initialization' in names
+
+
 def test_do_complete(kernel):
     """
     Check do complete works in normal and debugging mode.
@@ -663,6 +835,46 @@ def test_do_complete(kernel):
     assert 'baba' in match['matches']
 
 
+def test_update_breakpoints(kernel, tmpdir):
+    """
+    Check breakpoints are updated only for the files that changed.
+    """
+    file_a = tmpdir.join('a.py')
+    file_a.write('a = 1\nb = 2\nc = 3\n')
+    file_b = tmpdir.join('b.py')
+    file_b.write('d = 4\n')
+    fname_a, fname_b = str(file_a), str(file_b)
+
+    pdb_obj = SpyderPdb()
+    pdb_obj.starting = False
+    kernel._pdb_obj = pdb_obj
+
+    # Incremental updates need all breakpoints first
+    assert not kernel.update_spyder_breakpoints({fname_a: [(1, None)]})
+
+    kernel.set_spyder_breakpoints({fname_a: [(1, None), (2, None)],
+                                   fname_b: [(1, None)]})
+    bp_b = pdb_obj.get_breaks(pdb_obj.canonic(fname_b), 1)[0]
+
+    assert kernel.update_spyder_breakpoints(
+        {fname_a: [(1, None), (3, 'c > 0')]})
+    assert pdb_obj.get_file_breaks(fname_a) == [1, 3]
+    assert pdb_obj.get_breaks(pdb_obj.canonic(fname_a), 3)[0].cond == 'c > 0'
+
+    # Breakpoints of other files are left untouched
+    assert pdb_obj.get_breaks(pdb_obj.canonic(fname_b), 1) == [bp_b]
+
+    assert kernel.update_spyder_breakpoints({fname_b: []})
+    assert pdb_obj.get_file_breaks(fname_b) == []
+
+    # Frames from files without breakpoints are skipped
+    frame = inspect.currentframe()
+    assert not pdb_obj.has_file_breaks(frame)
+    assert not pdb_obj.break_anywhere(frame)
+    assert not pdb_obj.break_here(frame)
+    kernel._pdb_obj = None
+
+
 @pytest.mark.parametrize("exclude_callables_and_modules", [True, False])
 @pytest.mark.parametrize("exclude_unsupported", [True, False])
 def test_callables_and_modules(kernel, exclude_callables_and_modules,
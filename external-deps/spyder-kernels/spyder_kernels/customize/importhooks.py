@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Hooks run when modules are imported.
+
+They allow to patch optional modules (PyQt, pandas, turtle, etc) the first
+time the user imports them instead of importing them when the kernel starts,
+and to time the imports done during the kernel startup.
+"""
+
+import logging
+import sys
+
+from spyder_kernels.py3compat import PY2
+from spyder_kernels.utils.timeline import IMPORT
+
+
+logger = logging.getLogger(__name__)
+
+# Levels of nested imports recorded in timelines
+IMPORT_DEPTH = 2
+
+
+class HookedLoader(object):
+    """Loader that notifies an ImportHookFinder of the modules it loads."""
+
+    def __init__(self, loader, finder, name):
+        self.loader = loader
+        self.finder = finder
+        self.name = name
+        self._create_duration = 0
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        create_module = getattr(self.loader, 'create_module', None)
+        if create_module is None:
+            return None
+        # Extension modules are initialized here
+        timeline = self.finder.timeline
+        start = timeline.clock() if timeline is not None else 0
+        self.finder._depth += 1
+        try:
+            return create_module(spec)
+        finally:
+            self.finder._depth -= 1
+            if timeline is not None:
+                self._create_duration = timeline.clock() - start
+
+    def exec_module(self, module):
+        self.finder._exec_module(self.loader, self.name, module,
+                                 self._create_duration)
+
+
+class ImportHookFinder(object):
+    """
+    Meta path finder that runs the hooks registered for the modules it sees
+    imported and records import times in a timeline.
+
+    Import times include the imports done by the module itself. Only
+    imports nested less than IMPORT_DEPTH levels are recorded.
+    """
+
+    def __init__(self):
+        self.timeline = None
+        self._hooks = {}
+        self._depth = 0
+
+    def install(self):
+        """Add the finder at the start of sys.meta_path."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def start_timing(self, timeline):
+        """Record the duration of imports in `timeline`."""
+        self.timeline = timeline
+        self.install()
+
+    def stop_timing(self):
+        """Stop recording imports."""
+        self.timeline = None
+
+    def register(self, name, hook):
+        """
+        Call `hook` with module `name` after it's imported, or right away
+        if it was imported already.
+
+        Python 2 doesn't support module specs, so the module is imported
+        right away there, if possible.
+        """
+        module = sys.modules.get(name)
+        if module is None and PY2:
+            try:
+                __import__(name)
+                module = sys.modules[name]
+            except Exception:
+                return
+        if module is not None:
+            self._run_hook(hook, module)
+            return
+        self._hooks.setdefault(name, []).append(hook)
+        self.install()
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Find the spec of `fullname` with the next finders and wrap it."""
+        if self.timeline is None and fullname not in self._hooks:
+            return None
+
+        index = sys.meta_path.index(self) if self in sys.meta_path else -1
+        for finder in sys.meta_path[index + 1:]:
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if hasattr(spec.loader, 'exec_module'):
+            spec.loader = HookedLoader(spec.loader, self, fullname)
+        return spec
+
+    def _exec_module(self, loader, name, module, create_duration=0):
+        """Execute `module` with its original loader and run its hooks."""
+        timeline = self.timeline
+        start = timeline.clock() if timeline is not None else 0
+        depth = self._depth
+        self._depth += 1
+        try:
+            loader.exec_module(module)
+        finally:
+            self._depth -= 1
+            # Leave the original loader for reloads and importlib.resources
+            module.__loader__ = loader
+            spec = getattr(module, '__spec__', None)
+            if spec is not None:
+                spec.loader = loader
+            if timeline is not None and depth < IMPORT_DEPTH:
+                duration = timeline.clock() - start + create_duration
+                timeline.add(IMPORT, name, start - create_duration, duration,
+                             depth=depth)
+
+        for hook in self._hooks.pop(name, []):
+            # Modules can replace themselves in sys.modules
+            self._run_hook(hook, sys.modules.get(name, module))
+
+    def _run_hook(self, hook, module):
+        """Run a hook, making sure it doesn't break the import."""
+        try:
+            hook(module)
+        except Exception:
+            logger.debug("Error in import hook of %s",
+                         getattr(module, '__name__', module), exc_info=True)
+
+
+IMPORT_HOOKS = ImportHookFinder()
+
+
+def register_post_import_hook(name, hook):
+    """Call `hook` with module `name` after it's imported."""
+    IMPORT_HOOKS.register(name, hook)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""Statistical profiler that samples the stack of a running thread."""
+
+import sys
+import threading
+
+
+# Default time between samples, in seconds
+DEFAULT_INTERVAL = 0.005
+
+
+def get_frame_key(frame):
+    """Return the (filename, line, name) key of a frame's function."""
+    code = frame.f_code
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+
+class StackSampler(object):
+    """
+    Sample the call stack of a thread from a background thread.
+
+    Identical stacks are aggregated, so memory grows with the number of
+    different code paths and not with the duration of the run.
+
+    Parameters
+    ----------
+    interval: float
+        Time between samples, in seconds.
+    thread_id: int
+        Identifier of the thread to sample. By default the thread that
+        creates the sampler.
+    root_filename: str
+        If given, only the frames called from code in this file are kept
+        and samples taken outside of it are discarded. This removes the
+        frames of the kernel machinery that runs the code.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL, thread_id=None,
+                 root_filename=None):
+        self.interval = interval
+        if thread_id is None:
+            thread_id = threading.current_thread().ident
+        self.thread_id = thread_id
+        self.root_filename = root_filename
+        self.stacks = {}
+        self.samples = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Start sampling in a background thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name='spyder_stack_sampler')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the background thread to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Take a sample of the stack of the sampled thread."""
+        frame = sys._current_frames().get(self.thread_id)
+        stack = []
+        while frame is not None:
+            stack.append(get_frame_key(frame))
+            frame = frame.f_back
+        stack.reverse()
+
+        if self.root_filename is not None:
+            for index, key in enumerate(stack):
+                if key[0] == self.root_filename:
+                    stack = stack[index:]
+                    break
+            else:
+                return
+
+        if stack:
+            stack = tuple(stack)
+            self.stacks[stack] = self.stacks.get(stack, 0) + 1
+            self.samples += 1
+
+    def get_data(self):
+        """
+        Return the aggregated samples.
+
+        Stacks go from the outermost to the innermost frame, and each frame
+        is a [filename, line, name] list.
+        """
+        return {
+            'interval': self.interval,
+            'samples': self.samples,
+            'stacks': [[[list(key) for key in stack], count]
+                       for stack, count in self.stacks.items()],
+        }
@@ -25,7 +25,9 @@ from IPython.core.getipython import get_ipython
 
 from spyder_kernels.py3compat import TimeoutError, PY2, _print, encode
 from spyder_kernels.comms.frontendcomm import CommError, frontend_request
+from spyder_kernels.customize.importhooks import register_post_import_hook
 from spyder_kernels.customize.namespace_manager import NamespaceManager
+from spyder_kernels.customize.sampler import DEFAULT_INTERVAL, StackSampler
 from spyder_kernels.customize.spyderpdb import SpyderPdb
 from spyder_kernels.customize.umr import UserModuleReloader
 
@@ -152,10 +154,9 @@ else:
 # Qt sees them as a singleton (There is only one Application!). Deleting one
 # QApplication causes all the other Python instances to become broken.
 # See spyder-ide/spyder/issues/2970
-try:
-    from PyQt5 import QtWidgets
-
-    class SpyderQApplication(QtWidgets.QApplication):
+# The patch is applied when PyQt is imported, to not slow down the startup.
+def _patch_qapplication(module):
+    class SpyderQApplication(module.QApplication):
         def __init__(self, *args, **kwargs):
             super(SpyderQApplication, self).__init__(*args, **kwargs)
             # Add reference to avoid destruction
@@ -163,24 +164,10 @@ try:
             SpyderQApplication._instance_list.append(self)
 
     SpyderQApplication._instance_list = []
-    QtWidgets.QApplication = SpyderQApplication
-except Exception:
-    pass
-
-try:
-    from PyQt4 import QtGui
-
-    class SpyderQApplication(QtGui.QApplication):
-        def __init__(self, *args, **kwargs):
-            super(SpyderQApplication, self).__init__(*args, **kwargs)
-            # Add reference to avoid destruction
-            # This creates a Memory leak but avoids a Segmentation fault
-            SpyderQApplication._instance_list.append(self)
+    module.QApplication = SpyderQApplication
 
-    SpyderQApplication._instance_list = []
-    QtGui.QApplication = SpyderQApplication
-except Exception:
-    pass
+register_post_import_hook('PyQt5.QtWidgets', _patch_qapplication)
+register_post_import_hook('PyQt4.QtGui', _patch_qapplication)
 
 # =============================================================================
 # IPython adjustments
@@ -188,17 +175,17 @@ except Exception:
 # Patch unittest.main so that errors are printed directly in the console.
 # See http://comments.gmane.org/gmane.comp.python.ipython.devel/10557
 # Fixes Issue 1370
-import unittest
-from unittest import TestProgram
+def _patch_unittest(unittest):
+    class IPyTesProgram(unittest.TestProgram):
+        def __init__(self, *args, **kwargs):
+            test_runner = unittest.TextTestRunner(stream=sys.stderr)
+            kwargs['testRunner'] = kwargs.pop('testRunner', test_runner)
+            kwargs['exit'] = False
+            unittest.TestProgram.__init__(self, *args, **kwargs)
 
-class IPyTesProgram(TestProgram):
-    def __init__(self, *args, **kwargs):
-        test_runner = unittest.TextTestRunner(stream=sys.stderr)
-        kwargs['testRunner'] = kwargs.pop('testRunner', test_runner)
-        kwargs['exit'] = False
-        TestProgram.__init__(self, *args, **kwargs)
+    unittest.main = IPyTesProgram
 
-unittest.main = IPyTesProgram
+register_post_import_hook('unittest', _patch_unittest)
 
 # Ignore some IPython/ipykernel warnings
 try:
@@ -214,45 +201,40 @@ except Exception:
 # This is needed to prevent turtle scripts crashes after multiple runs in the
 # same IPython Console instance.
 # See Spyder issue #6278
-try:
-    import turtle
-    from turtle import Screen, Terminator
-
+def _patch_turtle(turtle):
     def spyder_bye():
         try:
-            Screen().bye()
+            turtle.Screen().bye()
             turtle.TurtleScreen._RUNNING = True
-        except Terminator:
+        except turtle.Terminator:
             pass
     turtle.bye = spyder_bye
-except Exception:
-    pass
+
+register_post_import_hook('turtle', _patch_turtle)
 
 
 # =============================================================================
 # Pandas adjustments
 # =============================================================================
-try:
-    import pandas as pd
-
+def _patch_pandas(pd):
     # Set Pandas output encoding
     pd.options.display.encoding = 'utf-8'
 
-    # Filter warning that appears for DataFrames with np.nan values
-    # Example:
-    # >>> import pandas as pd, numpy as np
-    # >>> pd.Series([np.nan,np.nan,np.nan],index=[1,2,3])
-    # Fixes Issue 2991
-    # For 0.18-
-    warnings.filterwarnings(action='ignore', category=RuntimeWarning,
-                            module='pandas.core.format',
-                            message=".*invalid value encountered in.*")
-    # For 0.18.1+
-    warnings.filterwarnings(action='ignore', category=RuntimeWarning,
-                            module='pandas.formats.format',
-                            message=".*invalid value encountered in.*")
-except Exception:
-    pass
+register_post_import_hook('pandas', _patch_pandas)
+
+# Filter warning that appears for DataFrames with np.nan values
+# Example:
+# >>> import pandas as pd, numpy as np
+# >>> pd.Series([np.nan,np.nan,np.nan],index=[1,2,3])
+# Fixes Issue 2991
+# For 0.18-
+warnings.filterwarnings(action='ignore', category=RuntimeWarning,
+                        module='pandas.core.format',
+                        message=".*invalid value encountered in.*")
+# For 0.18.1+
+warnings.filterwarnings(action='ignore', category=RuntimeWarning,
+                        module='pandas.formats.format',
+                        message=".*invalid value encountered in.*")
 
 
 # =============================================================================
@@ -275,11 +257,10 @@ except Exception:
 # =============================================================================
 # This patch is only needed on Windows and Python 3
 if os.name == 'nt' and not PY2:
-    # This could fail with changes in Python itself, so we protect it
-    # with a try/except
-    try:
-        import multiprocessing.spawn
-        _old_preparation_data = multiprocessing.spawn.get_preparation_data
+    # This could fail with changes in Python itself, so it's applied with an
+    # import hook, which ignores errors
+    def _patch_multiprocessing(spawn):
+        _old_preparation_data = spawn.get_preparation_data
 
         def _patched_preparation_data(name):
             """
@@ -294,9 +275,9 @@ if os.name == 'nt' and not PY2:
                 main_module.__spec__ = ''
                 return _old_preparation_data(name)
 
-        multiprocessing.spawn.get_preparation_data = _patched_preparation_data
-    except Exception:
-        pass
+        spawn.get_preparation_data = _patched_preparation_data
+
+    register_post_import_hook('multiprocessing.spawn', _patch_multiprocessing)
 
 
 # =============================================================================
@@ -446,6 +427,26 @@ def exec_code(code, filename, ns_globals, ns_locals=None, post_mortem=False):
             ipython_shell.showtraceback(tb_offset=1)
 
 
+# Code of the files whose cells were run, with the version of each one.
+# The frontend only sends the code of a file when its version changes.
+FILE_CODE_CACHE = {}
+
+
+def get_cell_code(cellname, filename):
+    """
+    Retrieve the code of a cell and of the file that contains it.
+
+    The file code is cached, so running cells of a file only transfers it
+    again when it changed.
+    """
+    version, file_code = FILE_CODE_CACHE.get(filename, (None, None))
+    reply = frontend_request().get_cell_code(cellname, filename, version)
+    if reply['file_code'] is not None:
+        file_code = reply['file_code']
+        FILE_CODE_CACHE[filename] = (reply['file_version'], file_code)
+    return reply['cell_code'], file_code
+
+
 def get_file_code(filename):
     """Retrive the content of a file."""
     # Get code from spyder
@@ -591,7 +592,7 @@ def runcell(cellname, filename=None, post_mortem=False):
     ipython_shell = get_ipython()
     try:
         # Get code from spyder
-        cell_code = frontend_request().run_cell(cellname, filename)
+        cell_code, file_code = get_cell_code(cellname, filename)
     except Exception:
         _print("This command failed to be executed because an error occurred"
                " while trying to get the cell code from Spyder's"
@@ -606,10 +607,6 @@ def runcell(cellname, filename=None, post_mortem=False):
     # Trigger `post_execute` to exit the additional pre-execution.
     # See Spyder PR #7310.
     ipython_shell.events.trigger('post_execute')
-    try:
-        file_code = get_file_code(filename)
-    except Exception:
-        file_code = None
     with NamespaceManager(filename, current_namespace=True,
                           file_code=file_code) as (ns_globals, ns_locals):
         exec_code(cell_code, filename, ns_globals, ns_locals,
@@ -636,6 +633,63 @@ def debugcell(cellname, filename=None, post_mortem=False):
 builtins.debugcell = debugcell
 
 
+def send_profile_samples(sampler):
+    """Send the samples taken by `sampler` to Spyder's Profiler."""
+    data = sampler.get_data()
+    if not data['samples']:
+        _print("No samples were taken, the code ran for less than the "
+               "sampling interval.\n")
+        return
+    try:
+        frontend_request(blocking=False).profile_samples(data)
+    except (CommError, TimeoutError):
+        _print("The profiling results couldn't be sent to Spyder.\n")
+
+
+def profilefile(filename=None, args=None, wdir=None, current_namespace=False,
+                interval=DEFAULT_INTERVAL):
+    """
+    Profile filename by sampling its call stack
+    args: command line arguments (string)
+    wdir: working directory
+    current_namespace: if true, run the file in the current namespace
+    interval: time between samples, in seconds
+    """
+    if filename is None:
+        filename = get_current_file_name()
+        if filename is None:
+            return
+    elif os.name == 'nt':
+        # Use the same filename as runfile, so its frames are found
+        filename = filename.replace('/', '\\')
+    with StackSampler(interval=interval,
+                      root_filename=filename) as sampler:
+        runfile(filename, args=args, wdir=wdir,
+                current_namespace=current_namespace)
+    send_profile_samples(sampler)
+
+
+builtins.profilefile = profilefile
+
+
+def profilecell(cellname, filename=None, interval=DEFAULT_INTERVAL):
+    """Profile a cell by sampling its call stack."""
+    if filename is None:
+        filename = get_current_file_name()
+        if filename is None:
+            return
+    elif os.name == 'nt':
+        # Use the same filename as runcell, so its frames are found
+        filename = filename.replace('/', '\\')
+    with StackSampler(interval=interval,
+                      root_filename=filename) as sampler:
+        runcell(cellname, filename)
+    send_profile_samples(sampler)
+
+
+builtins.profilecell = profilecell
+
+
 def cell_count(filename=None):
     """
     Get the number of cells in a file.
@@ -54,6 +54,10 @@ class SpyderPdb(ipyPdb, object):  # Inherits `object` to call super() in PY2
         self.pdb_execute_events = False
         super(SpyderPdb, self).__init__()
         self._pdb_breaking = False
+        # Canonical filenames of the code objects seen by the debugger
+        self._code_filenames = {}
+        # Only incremental updates are accepted after a full update
+        self._has_spyder_breakpoints = False
 
     # --- Methods overriden for code execution
     def default(self, line):
@@ -326,6 +330,15 @@ class SpyderPdb(ipyPdb, object):  # Inherits `object` to call super() in PY2
             self.notify_spyder(self.curframe)
         return super(SpyderPdb, self).postcmd(stop, line)
 
+    def break_anywhere(self, frame):
+        """
+        Return True if there is any breakpoint in the file of frame.
+
+        Reimplemented to use the fast check of has_file_breaks, because
+        this is called for every function call while debugging.
+        """
+        return self.has_file_breaks(frame)
+
     if PY2:
         def break_here(self, frame):
             """
@@ -334,6 +347,8 @@ class SpyderPdb(ipyPdb, object):  # Inherits `object` to call super() in PY2
             Fixes Issue 1484
             """
             from bdb import effective
+            if not self.has_file_breaks(frame):
+                return False
             filename = self.canonic(frame.f_code.co_filename)
             try:
                 filename = unicode(filename, "utf-8")
@@ -358,10 +373,72 @@ class SpyderPdb(ipyPdb, object):  # Inherits `object` to call super() in PY2
                 return True
             else:
                 return False
+    else:
+        def break_here(self, frame):
+            """Skip frames from files without breakpoints right away."""
+            if not self.has_file_breaks(frame):
+                return False
+            return super(SpyderPdb, self).break_here(frame)
 
     # --- Methods defined by us for Spyder integration
+    def has_file_breaks(self, frame):
+        """
+        Return True if the file of frame has breakpoints.
+
+        The canonical filename of each code object is cached because
+        computing it is the most expensive part of the check.
+        """
+        if not self.breaks:
+            return False
+        co_filename = frame.f_code.co_filename
+        try:
+            filename = self._code_filenames[co_filename]
+        except KeyError:
+            filename = self.canonic(co_filename)
+            self._code_filenames[co_filename] = filename
+        return filename in self.breaks
+
+    def update_spyder_breakpoints(self, breakpoints):
+        """
+        Update the Spyder breakpoints of some files.
+
+        Parameters
+        ----------
+        breakpoints: dict
+            Maps filenames to their list of (line number, condition)
+            breakpoints. Files with an empty list have no breakpoints
+            anymore and files not included are left unchanged.
+
+        Returns
+        -------
+        bool
+            False if there were no breakpoints to update, i.e. if
+            set_spyder_breakpoints wasn't called before.
+        """
+        if not self._has_spyder_breakpoints:
+            return False
+        for fname, data in list(breakpoints.items()):
+            filename = self.canonic(fname)
+            wanted = set((linenumber, condition)
+                         for linenumber, condition in data)
+
+            # Keep lines with exactly the wanted breakpoint
+            for linenumber in list(self.breaks.get(filename, [])):
+                bps = bdb.Breakpoint.bplist.get((filename, linenumber), [])
+                if (len(bps) == 1 and
+                        (linenumber, bps[0].cond) in wanted):
+                    wanted.discard((linenumber, bps[0].cond))
+                else:
+                    self.clear_break(filename, linenumber)
+
+            for linenumber, condition in sorted(
+                    wanted, key=lambda bp: bp[0]):
+                self.set_break(filename, linenumber, cond=condition)
+        return True
+
     def set_spyder_breakpoints(self, breakpoints):
         """Set Spyder breakpoints."""
+        self._has_spyder_breakpoints = True
         self.clear_all_breaks()
         # -----Really deleting all breakpoints:
         for bp in bdb.Breakpoint.bpbynumber:
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""Tests for the import hooks."""
+
+import sys
+
+import pytest
+
+from spyder_kernels.customize.importhooks import ImportHookFinder
+from spyder_kernels.py3compat import PY2
+from spyder_kernels.utils.timeline import IMPORT, KernelStartupTimeline
+
+
+@pytest.fixture
+def finder(tmpdir):
+    """Import hook finder and a directory with a package to import."""
+    package = tmpdir.mkdir('hooked_package')
+    package.join('__init__.py').write('value = 1\n')
+    package.join('child.py').write('import hooked_package.grandchild\n')
+    package.join('grandchild.py').write('value = 2\n')
+    sys.path.insert(0, str(tmpdir))
+
+    finder = ImportHookFinder()
+    yield finder
+
+    if finder in sys.meta_path:
+        sys.meta_path.remove(finder)
+    sys.path.remove(str(tmpdir))
+    for name in list(sys.modules):
+        if name.startswith('hooked_package'):
+            del sys.modules[name]
+
+
+@pytest.mark.skipif(PY2, reason="Hooks are run right away in Python 2")
+def test_post_import_hooks(finder):
+    """Test that hooks are run after the modules are imported."""
+    seen = []
+    finder.register('hooked_package', lambda module: seen.append(module))
+    finder.register('hooked_package.child', lambda module: 1 / 0)
+    assert finder in sys.meta_path
+    assert seen == []
+
+    import hooked_package.child
+    assert seen == [hooked_package]
+    assert seen[0].value == 1
+
+    # The original loader is restored
+    loader = type(hooked_package.__loader__).__name__
+    assert loader != 'HookedLoader'
+    assert type(hooked_package.__spec__.loader).__name__ == loader
+
+    # Hooks of modules already imported are run right away
+    finder.register('hooked_package', lambda module: seen.append(module))
+    assert len(seen) == 2
+
+
+@pytest.mark.skipif(PY2, reason="Imports are not timed in Python 2")
+def test_import_timing(finder):
+    """Test that imports are recorded in the timeline."""
+    timeline = KernelStartupTimeline()
+    finder.start_timing(timeline)
+    import hooked_package.child
+    finder.stop_timing()
+    import hooked_package.grandchild
+
+    # Entries are added when imports end
+    imports = [(entry['name'], entry['depth']) for entry in timeline.entries
+               if entry['kind'] == IMPORT]
+    assert imports == [('hooked_package', 0),
+                       ('hooked_package.grandchild', 1),
+                       ('hooked_package.child', 0)]
+
+    # Only the outermost imports are added to the total
+    child = timeline.entries[-1]
+    assert timeline.total(IMPORT) == (timeline.entries[0]['duration'] +
+                                      child['duration'])
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""Tests for the stack sampler."""
+
+import time
+
+from spyder_kernels.customize.sampler import StackSampler
+
+
+def busy_loop(duration):
+    """Keep the current thread busy for `duration` seconds."""
+    end = time.time() + duration
+    total = 0
+    while time.time() < end:
+        total += 1
+    return total
+
+
+def test_sampler():
+    """Test that the stacks of the sampled thread are aggregated."""
+    with StackSampler(interval=0.001) as sampler:
+        busy_loop(0.2)
+
+    data = sampler.get_data()
+    assert data['interval'] == 0.001
+    assert data['samples'] == sum(count for _, count in data['stacks'])
+
+    # Stacks go from the outermost to the innermost frame
+    busy_stacks = [stack for stack, _ in data['stacks']
+                   if stack[-1][2] == 'busy_loop']
+    assert busy_stacks
+    assert all(stack[-2][2] == 'test_sampler' for stack in busy_stacks)
+
+
+def test_sampler_root_filename():
+    """Test that frames outside the root file are removed."""
+    with StackSampler(interval=0.001, root_filename=__file__) as sampler:
+        busy_loop(0.1)
+
+    data = sampler.get_data()
+    assert data['samples'] > 0
+    for stack, _ in data['stacks']:
+        assert stack[0][0] == __file__
+        assert stack[0][2] == 'test_sampler_root_filename'
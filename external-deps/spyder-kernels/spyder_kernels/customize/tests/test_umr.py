@@ -11,6 +11,7 @@
 # Stdlib imports
 import os
 import sys
+import time
 
 # Third party imports
 import pytest
@@ -119,3 +120,67 @@ def test_umr_reload_modules(user_module):
     # Reload user modules
     import foo3
     assert umr.is_module_reloadable(foo3, 'foo3')
+
+
+def test_umr_selective(tmpdir, monkeypatch):
+    """
+    Test that the selective UMR only reloads changed modules and the
+    modules that import them.
+    """
+    monkeypatch.syspath_prepend(to_text_string(tmpdir))
+    monkeypatch.setenv('SPY_UMR_SELECTIVE', 'True')
+    package = tmpdir.mkdir('selective')
+    package.join('__init__.py').write('')
+    package.join('base.py').write('def f():\n    return 1\n')
+    package.join('user.py').write('from selective.base import f\n')
+    package.join('other.py').write('from selective import user\n')
+    package.join('heavy.py').write('x = 1\n')
+
+    umr = UserModuleReloader()
+    import selective.other
+    import selective.heavy
+    umr.run()
+    assert umr.modnames_to_reload == []
+
+    # Changing base reloads its direct and indirect importers only
+    base = package.join('base.py')
+    base.write('def f():\n    return 22\n')
+    # Use an older time to make sure the new source is detected
+    os.utime(to_text_string(base), (time.time() - 10, time.time() - 10))
+    umr.run()
+    assert umr.modnames_to_reload == ['selective.base', 'selective.other',
+                                      'selective.user']
+    assert 'selective.heavy' in sys.modules
+    assert 'selective' in sys.modules
+
+    import selective.other
+    assert selective.user.f() == 22
+    umr.run()
+    assert umr.modnames_to_reload == []
+
+
+def test_umr_selective_constants(tmpdir, monkeypatch):
+    """
+    Test that the selective UMR reloads modules that only took constants
+    from a changed module.
+    """
+    monkeypatch.syspath_prepend(to_text_string(tmpdir))
+    monkeypatch.setenv('SPY_UMR_SELECTIVE', 'True')
+    package = tmpdir.mkdir('constants')
+    package.join('__init__.py').write('')
+    package.join('values.py').write('LIMIT = 1\n')
+    package.join('user.py').write('from .values import LIMIT\n')
+
+    umr = UserModuleReloader()
+    import constants.user
+    umr.run()
+    assert umr.modnames_to_reload == []
+
+    values = package.join('values.py')
+    values.write('LIMIT = 22\n')
+    os.utime(to_text_string(values), (time.time() - 10, time.time() - 10))
+    umr.run()
+    assert umr.modnames_to_reload == ['constants.user', 'constants.values']
+
+    import constants.user
+    assert constants.user.LIMIT == 22
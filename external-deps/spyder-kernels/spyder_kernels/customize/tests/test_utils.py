@@ -9,7 +9,9 @@
 import os
 import sys
 
-from spyder_kernels.customize.utils import create_pathlist
+import pytest
+
+from spyder_kernels.customize.utils import create_pathlist, path_is_library
 
 
 def test_user_sitepackages_in_pathlist():
@@ -22,3 +24,18 @@ def test_user_sitepackages_in_pathlist():
         user_path = 'Roaming'
 
     assert any([user_path in path for path in create_pathlist()])
+
+
+def test_path_is_library(tmpdir):
+    """Test that library paths are detected and remembered."""
+    assert path_is_library(pytest.__file__)
+    assert path_is_library(os.__file__)
+    assert path_is_library(None)
+
+    user_file = str(tmpdir.join('script.py'))
+    assert not path_is_library(user_file)
+    assert path_is_library(user_file, initial_pathlist=[str(tmpdir)])
+
+    # Results don't change for the same arguments
+    for __ in range(3):
+        assert not path_is_library(user_file)
@@ -5,8 +5,11 @@
 
 """User module reloader."""
 
+import ast
+import inspect
 import os
 import sys
+import time
 
 from spyder_kernels.customize.utils import path_is_library
 from spyder_kernels.py3compat import PY2, _print
@@ -19,6 +22,10 @@ class UserModuleReloader(object):
 
     pathlist [list]: blacklist in terms of module path
     namelist [list]: blacklist in terms of module name
+
+    In selective mode, only the user modules whose source changed since the
+    last run are deleted, together with the user modules that import them,
+    directly or through other user modules.
     """
 
     def __init__(self, namelist=None, pathlist=None):
@@ -56,6 +63,17 @@ class UserModuleReloader(object):
         # List of module names to reload
         self.modnames_to_reload = []
 
+        # Source file stamps of the user modules kept in selective mode
+        self.stamps = {}
+
+        # Modules imported by the source of each user module, with the
+        # stamp of the source they were found in
+        self.source_imports = {}
+
+        # Time of the last run, to detect changes in modules imported
+        # after it
+        self.last_run_time = time.time()
+
         # Activate Cython support
         self.has_cython = False
         self.activate_cython()
@@ -68,6 +86,10 @@ class UserModuleReloader(object):
         verbose = os.environ.get("SPY_UMR_VERBOSE", "")
         self.verbose = verbose.lower() == "true"
 
+        # Check if only changed modules and their importers are reloaded
+        selective = os.environ.get("SPY_UMR_SELECTIVE", "")
+        self.selective = selective.lower() == "true"
+
     def is_module_reloadable(self, module, modname):
         """Decide if a module is reloadable or not."""
         if self.has_cython:
@@ -127,17 +149,188 @@ class UserModuleReloader(object):
         Do not del C modules
         """
         self.modnames_to_reload = []
+        user_modules = {}
         for modname, module in list(sys.modules.items()):
             if modname not in self.previous_modules:
                 # Decide if a module can be reloaded or not
                 if self.is_module_reloadable(module, modname):
-                    self.modnames_to_reload.append(modname)
-                    del sys.modules[modname]
-                else:
-                    continue
+                    user_modules[modname] = module
+
+        if self.selective:
+            for modname in self.get_changed_modules(user_modules):
+                self.modnames_to_reload.append(modname)
+                self.stamps.pop(modname, None)
+                self.source_imports.pop(modname, None)
+                module = sys.modules.pop(modname)
+
+                # Remove it from its package too, or "from package import
+                # module" would return it instead of importing it again
+                package_name, __, name = modname.rpartition('.')
+                package = sys.modules.get(package_name)
+                if (package is not None and
+                        getattr(package, name, None) is module):
+                    delattr(package, name)
+            self.last_run_time = time.time()
+        else:
+            for modname in user_modules:
+                self.modnames_to_reload.append(modname)
+                del sys.modules[modname]
 
         # Report reloaded modules
         if self.verbose and self.modnames_to_reload:
             modnames = self.modnames_to_reload
             _print("\x1b[4;33m%s\x1b[24m%s\x1b[0m"
-                   % ("Reloaded modules", ": "+", ".join(modnames)))
\ No newline at end of file
+                   % ("Reloaded modules", ": "+", ".join(modnames)))
+
+    def get_changed_modules(self, user_modules):
+        """
+        Return the names of the modules in `user_modules` that must be
+        reloaded: those whose source changed, plus their importers.
+
+        The stamps of the other modules are saved to detect their changes
+        in the next run.
+        """
+        changed = set()
+        for modname, module in user_modules.items():
+            stamp = get_module_stamp(module)
+            if modname in self.stamps:
+                if stamp != self.stamps[modname]:
+                    changed.add(modname)
+            elif stamp is not None and stamp[0] >= self.last_run_time:
+                # Imported during the last run, but it could have been
+                # modified after that
+                changed.add(modname)
+            self.stamps[modname] = stamp
+
+            # The imports of unchanged sources are not parsed again
+            if self.source_imports.get(modname, (None,))[0] != stamp:
+                self.source_imports[modname] = (
+                    stamp, get_source_imports(module, modname))
+
+        imports = dict((modname, self.source_imports[modname][1])
+                       for modname in user_modules)
+        importers = get_importers(user_modules, imports)
+        pending = list(changed)
+        while pending:
+            for importer in importers.get(pending.pop(), ()):
+                if importer not in changed:
+                    changed.add(importer)
+                    pending.append(importer)
+        return sorted(changed)
+
+
+def get_module_stamp(module):
+    """
+    Return the (mtime, size) of the source file of `module`, or None if
+    it doesn't have one.
+    """
+    filename = getattr(module, '__file__', None)
+    if not filename:
+        return None
+    if filename.endswith(('.pyc', '.pyo')):
+        filename = filename[:-1]
+    try:
+        stat = os.stat(filename)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (stat.st_mtime, stat.st_size)
+
+
+def get_source_file(module):
+    """Return the path of the Python source of `module`, or None."""
+    filename = getattr(module, '__file__', None)
+    if not filename:
+        return None
+    if filename.endswith(('.pyc', '.pyo')):
+        filename = filename[:-1]
+    if not filename.endswith(('.py', '.pyw')):
+        return None
+    return filename
+
+
+def get_source_imports(module, modname):
+    """
+    Return the names of the modules imported by the source of `module`,
+    including those only used to get names such as constants from them
+    with "from module import name".
+
+    Names after "from package import" are included too, because they can
+    be submodules of the package.
+    """
+    filename = get_source_file(module)
+    if filename is None:
+        return set()
+    try:
+        with open(filename, 'rb') as f:
+            tree = ast.parse(f.read(), filename)
+    except (IOError, OSError, SyntaxError, TypeError, ValueError):
+        return set()
+
+    # Package used to resolve relative imports
+    package = getattr(module, '__package__', None)
+    if package is None:
+        if hasattr(module, '__path__'):
+            package = modname
+        else:
+            package = modname.rpartition('.')[0]
+
+    imports = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                # "import package.module" binds the package too
+                parts = alias.name.split('.')
+                imports.update('.'.join(parts[:i + 1])
+                               for i in range(len(parts)))
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                parts = package.split('.')
+                if node.level > 1:
+                    parts = parts[:-(node.level - 1)]
+                base = '.'.join(parts)
+                if node.module:
+                    base = base + '.' + node.module if base else node.module
+            else:
+                base = node.module
+            if not base:
+                continue
+            imports.add(base)
+            imports.update(base + '.' + alias.name for alias in node.names)
+    return imports
+
+
+def get_importers(modules, imports=None):
+    """
+    Return a dictionary with the names of the modules of `modules` that
+    reference objects of each one of them.
+
+    References are found in the globals of each module: other modules, and
+    functions and classes defined in them. `imports` can map the name of
+    each module to the modules it imports (see get_source_imports), to
+    also find the modules it only took other names from.
+    """
+    importers = {}
+    for modname, dependencies in (imports or {}).items():
+        for dependency in dependencies:
+            if dependency != modname and dependency in modules:
+                importers.setdefault(dependency, set()).add(modname)
+    for modname, module in modules.items():
+        try:
+            namespace = list(vars(module).items())
+        except TypeError:
+            continue
+        for name, value in namespace:
+            if inspect.ismodule(value):
+                dependency = getattr(value, '__name__', None)
+                if dependency == modname + '.' + name:
+                    # Submodules are set as attributes of their packages
+                    # by the import system, and removed from them when
+                    # they're reloaded
+                    continue
+            elif inspect.isclass(value) or inspect.isroutine(value):
+                dependency = getattr(value, '__module__', None)
+            else:
+                continue
+            if dependency != modname and dependency in modules:
+                importers.setdefault(dependency, set()).add(modname)
+    return importers
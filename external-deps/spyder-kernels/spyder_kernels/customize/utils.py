@@ -45,45 +45,70 @@ def create_pathlist():
     return standard_paths + user_path
 
 
-def path_is_library(path, initial_pathlist=None):
-    """Decide if a path is in user code or a library according to its path."""
-    # Compute DEFAULT_PATHLIST only once and make it global to reuse it
-    # in any future call of this function.
-    if 'DEFAULT_PATHLIST' not in globals():
-        global DEFAULT_PATHLIST
-        DEFAULT_PATHLIST = create_pathlist()
+# Paths that can be part of the default Linux installation, Homebrew or the
+# user site-packages in a virtualenv.
+LIBRARY_PATTERNS = [
+    r'^/usr/lib',
+    r'^/usr/local/lib',
+    r'^/usr/.*/dist-packages/',
+    r'^/home/.*/.local/lib',
+    r'^/Library/',
+    r'^/Users/.*/Library/',
+    r'^/Users/.*/.local/',
+]
+
+# Compiled matchers and classified paths, per initial pathlist
+_LIBRARY_REGEXES = {}
+_LIBRARY_PATHS = {}
+
+
+def get_library_regex(initial_pathlist=()):
+    """
+    Return a compiled regular expression that matches library paths.
+
+    It matches paths that contain any of the paths in `initial_pathlist` or
+    the default pathlist, or (except on Windows) any of LIBRARY_PATTERNS, in
+    a single search.
+    """
+    initial_pathlist = tuple(initial_pathlist)
+    regex = _LIBRARY_REGEXES.get(initial_pathlist)
+    if regex is None:
+        # Compute DEFAULT_PATHLIST only once and make it global to reuse it
+        # in any future call of this function.
+        if 'DEFAULT_PATHLIST' not in globals():
+            global DEFAULT_PATHLIST
+            DEFAULT_PATHLIST = create_pathlist()
 
-    if initial_pathlist is None:
-        initial_pathlist = []
+        pathlist = list(initial_pathlist) + DEFAULT_PATHLIST
+        alternatives = [re.escape(path) for path in pathlist]
+        if not os.name == 'nt':
+            alternatives += LIBRARY_PATTERNS
+        regex = re.compile('|'.join(
+            '(?:{})'.format(alternative) for alternative in alternatives))
+        _LIBRARY_REGEXES[initial_pathlist] = regex
+    return regex
 
-    pathlist = initial_pathlist + DEFAULT_PATHLIST
 
+def path_is_library(path, initial_pathlist=None):
+    """
+    Decide if a path is in user code or a library according to its path.
+
+    Results are cached, because this is called for every frame visited
+    by the debugger when library files are ignored.
+    """
     if path is None:
         # Path probably comes from a C module that is statically linked
         # into the interpreter. There is no way to know its path, so we
         # choose to ignore it.
         return True
-    elif any([p in path for p in pathlist]):
+
+    initial_pathlist = tuple(initial_pathlist) if initial_pathlist else ()
+    paths = _LIBRARY_PATHS.setdefault(initial_pathlist, {})
+    try:
+        return paths[path]
+    except KeyError:
         # We don't want to consider paths that belong to the standard
         # library or installed to site-packages.
-        return True
-    elif not os.name == 'nt':
-        # Paths containing the strings below can be part of the default
-        # Linux installation, Homebrew or the user site-packages in a
-        # virtualenv.
-        patterns = [
-            r'^/usr/lib.*',
-            r'^/usr/local/lib.*',
-            r'^/usr/.*/dist-packages/.*',
-            r'^/home/.*/.local/lib.*',
-            r'^/Library/.*',
-            r'^/Users/.*/Library/.*',
-            r'^/Users/.*/.local/.*',
-        ]
-
-        if [p for p in patterns if re.search(p, path)]:
-            return True
-        else:
-            return False
-    else:
-        return False
+        is_library = bool(get_library_regex(initial_pathlist).search(path))
+        paths[path] = is_library
+        return is_library
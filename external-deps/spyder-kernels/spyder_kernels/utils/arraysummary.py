@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Bounded min/max summaries of Numpy arrays for the Variable Explorer.
+
+Small arrays are summarized directly. Large ones are scanned in chunks
+under a time budget, and their partial results are kept so the next
+refresh continues the scan where the previous one stopped.
+
+Summaries are kept per array object and memory buffer, and dropped when
+a sample of the array's elements changes. Other writes can't be detected,
+so summaries are only exact when the whole array was scanned on the same
+refresh. The others are marked as approximate.
+"""
+
+from collections import OrderedDict
+import time
+import weakref
+
+import numpy as np
+
+
+# Arrays with fewer elements are summarized in a single step
+CHUNK_SIZE = 2 ** 20
+
+# Maximum time spent scanning an array on each refresh, in seconds
+TIME_BUDGET = 0.05
+
+# Number of elements used to detect writes to cached arrays
+SAMPLE_SIZE = 1024
+
+# Maximum number of cached summaries
+MAX_ENTRIES = 32
+
+
+def get_buffer_key(value):
+    """Return what identifies the memory seen by an array."""
+    return (value.__array_interface__['data'][0], value.shape,
+            value.strides, value.dtype.str)
+
+
+def get_sample(value):
+    """Return evenly spaced elements of an array, as a flat array."""
+    indices = np.linspace(0, value.size - 1,
+                          min(SAMPLE_SIZE, value.size)).astype(np.intp)
+    return value.flat[indices]
+
+
+class ArraySummary(object):
+    """Min/max of an array, computed one chunk at a time."""
+
+    def __init__(self, value):
+        self.ref = weakref.ref(value)
+        self.buffer_key = get_buffer_key(value)
+        sample = get_sample(value)
+        self.generation = hash(sample.tobytes())
+        # The sample gives a first approximation
+        self.min = sample.min()
+        self.max = sample.max()
+        self.position = 0
+        self.scanned = False
+
+    def restart(self):
+        """Scan the array again, keeping the current values until then."""
+        self.position = 0
+        self.scanned = False
+
+    def is_valid(self, value):
+        """
+        Return True if this is still the summary of `value`.
+
+        Numpy doesn't track writes to arrays, so a hash of a sample of their
+        elements is used to detect them.
+        """
+        return (self.ref() is value and
+                self.buffer_key == get_buffer_key(value) and
+                self.generation == hash(get_sample(value).tobytes()))
+
+    def scan(self, value, deadline):
+        """Scan chunks of `value` until it's done or `deadline` passes."""
+        # Chunks have the same number of elements whatever the shape of the
+        # array. Contiguous arrays are flattened without copying them, and
+        # only the elements of each chunk are copied for the others.
+        if value.flags.c_contiguous:
+            elements = value.reshape(-1)
+        else:
+            elements = value.flat
+        while self.position < value.size:
+            chunk = elements[self.position:self.position + CHUNK_SIZE]
+            if self.position == 0:
+                # Discard the approximation of the sample
+                self.min, self.max = chunk.min(), chunk.max()
+            else:
+                self.min = np.minimum(self.min, chunk.min())
+                self.max = np.maximum(self.max, chunk.max())
+            self.position += CHUNK_SIZE
+            if time.time() > deadline:
+                break
+        self.scanned = self.position >= value.size
+
+
+class ArraySummaryCache(object):
+    """Bounded cache of the summaries of the last seen large arrays."""
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._summaries = OrderedDict()
+
+    def clear(self):
+        """Remove all summaries."""
+        self._summaries.clear()
+
+    def get_minmax(self, value, time_budget=None):
+        """
+        Return (min, max, exact) for the elements of `value`.
+
+        `exact` is False if the array wasn't fully scanned within the time
+        budget, in which case min and max were computed from part of its
+        elements or from elements scanned on previous calls. By default
+        `time_budget` is TIME_BUDGET.
+        """
+        if value.size == 0:
+            # Same error as value.min()
+            raise ValueError('Empty arrays have no minimum or maximum')
+        if value.size <= CHUNK_SIZE:
+            return value.min(), value.max(), True
+
+        key = id(value)
+        summary = self._summaries.pop(key, None)
+        if summary is None or not summary.is_valid(value):
+            summary = ArraySummary(value)
+        elif summary.scanned:
+            # The sample could have missed writes to the array, so scan it
+            # again instead of showing stale values as exact
+            summary.restart()
+        resumed = summary.position > 0
+        self._summaries[key] = summary
+        while len(self._summaries) > self.max_entries:
+            self._summaries.popitem(last=False)
+
+        if time_budget is None:
+            time_budget = TIME_BUDGET
+        summary.scan(value, time.time() + time_budget)
+        return summary.min, summary.max, summary.scanned and not resumed
+
+
+ARRAY_SUMMARIES = ArraySummaryCache()
+
+
+def get_minmax_display(value):
+    """Return the min/max display of an array for the Variable Explorer."""
+    vmin, vmax, exact = ARRAY_SUMMARIES.get_minmax(value)
+    if exact:
+        return 'Min: %r\nMax: %r' % (vmin, vmax)
+    # Approximate values are marked with a tilde
+    return 'Min: ~%r\nMax: ~%r' % (vmin, vmax)
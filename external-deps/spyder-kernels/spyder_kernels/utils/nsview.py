@@ -221,6 +221,15 @@ COLORS = {
 CUSTOM_TYPE_COLOR = "#7755aa"
 UNSUPPORTED_COLOR = "#ffffff"
 
+# Types whose values can't change in place, so their displays in the
+# namespace view can be reused while variables point to the same objects
+IMMUTABLE_TYPES = set(
+    [bool, type(None), datetime.date, datetime.datetime, datetime.time,
+     datetime.timedelta, int64, int32, int16, int8, uint64, uint32, uint16,
+     uint8, float64, float32, float16, complex128, complex64, bool_] +
+    list(NUMERIC_TYPES) + list(TEXT_TYPES) + [bytes])
+IMMUTABLE_TYPES.discard(FakeObject)
+
 def get_color_name(value):
     """Return color name depending on value type"""
     if not is_known_type(value):
@@ -367,8 +376,10 @@ def value_to_display(value, minmax=False, level=0):
         elif isinstance(value, ndarray):
             if level == 0:
                 if minmax:
+                    from spyder_kernels.utils.arraysummary import (
+                        get_minmax_display)
                     try:
-                        display = 'Min: %r\nMax: %r' % (value.min(), value.max())
+                        display = get_minmax_display(value)
                     except (TypeError, ValueError):
                         if value.dtype.type in numeric_numpy_types:
                             display = str(value)
@@ -680,7 +691,7 @@ def get_remote_data(data, settings, mode, more_excluded_names=None):
     """
     supported_types = get_supported_types()
     assert mode in list(supported_types.keys())
-    excluded_names = settings['excluded_names']
+    excluded_names = list(settings['excluded_names'])
     if more_excluded_names is not None:
         excluded_names += more_excluded_names
     return globalsfilter(
@@ -695,18 +706,73 @@ def get_remote_data(data, settings, mode, more_excluded_names=None):
         excluded_names=excluded_names)
 
 
-def make_remote_view(data, settings, more_excluded_names=None):
+def get_fingerprint(value):
+    """
+    Return a cheap fingerprint of *value* that changes when its entry in
+    the namespace view could change, or None if there's no such fingerprint
+    and the entry must always be computed again.
+
+    Containers and arrays can be modified in place and their displays
+    depend on their contents, so they always get None.
+    """
+    value_type = type(value)
+    if value_type in IMMUTABLE_TYPES:
+        try:
+            return (value_type, id(value), hash(value))
+        except TypeError:
+            return None
+    elif value_type is DataFrame:
+        # Its display only shows the column names
+        return (value_type, id(value), value.shape, id(value.columns))
+    elif value_type is Series:
+        return (value_type, id(value), value.shape)
+    return None
+
+
+def make_remote_view(data, settings, more_excluded_names=None, cache=None):
     """
     Make a remote view of dictionary *data*
     -> globals explorer
+
+    If given, *cache* is a dictionary used to reuse the entries of the
+    variables that didn't change since the last call (see get_fingerprint).
+    It's updated in place and must be cleared when *settings* change.
     """
     data = get_remote_data(data, settings, mode='editable',
                            more_excluded_names=more_excluded_names)
     remote = {}
     for key, value in list(data.items()):
+        fingerprint = get_fingerprint(value) if cache is not None else None
+        if fingerprint is not None and key in cache:
+            cached_fingerprint, entry = cache[key]
+            if cached_fingerprint == fingerprint:
+                remote[key] = entry
+                continue
         view = value_to_display(value, minmax=settings['minmax'])
         remote[key] = {'type':  get_human_readable_type(value),
                        'size':  get_size(value),
                        'color': get_color_name(value),
                        'view':  view}
+        if fingerprint is not None:
+            cache[key] = (fingerprint, remote[key])
+    if cache is not None:
+        for key in list(cache):
+            if key not in remote:
+                cache.pop(key)
     return remote
+
+
+def get_view_delta(old_view, new_view):
+    """
+    Return the changes needed to turn the remote view *old_view* into
+    *new_view*, as a dictionary with the following structure
+
+    {'update': {'a': {'color': ..., 'size': ..., 'type': ..., 'view': ...}},
+     'remove': ['b']}
+    """
+    update = {}
+    for key, entry in new_view.items():
+        if old_view.get(key) != entry:
+            update[key] = entry
+    remove = [key for key in old_view if key not in new_view]
+    return {'update': update, 'remove': remove}
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Paged views of large collections for the Variable Explorer.
+
+Instead of sending a whole list or dict to the frontend, the kernel keeps
+a sorted and filtered index over its keys and only sends the rows of the
+visible page.
+"""
+
+from spyder_kernels.py3compat import to_text_string
+from spyder_kernels.utils.nsview import (get_color_name,
+                                         get_human_readable_type, get_size,
+                                         value_to_display)
+
+
+# Columns of the collections editor
+KEY_COLUMN, TYPE_COLUMN, SIZE_COLUMN, VALUE_COLUMN = range(4)
+
+# Collections that can be shown in pages
+PAGED_TYPES = (list, tuple, dict, set)
+
+
+def sort_keys(keys, get_sort_value, reverse=False):
+    """
+    Sort `keys` by the value returned by `get_sort_value` for each of them.
+
+    Values that can't be compared with each other are sorted by their
+    type and text representation instead.
+    """
+    try:
+        return sorted(keys, key=get_sort_value, reverse=reverse)
+    except TypeError:
+        def get_text(key):
+            value = get_sort_value(key)
+            return (type(value).__name__, to_text_string(value))
+        return sorted(keys, key=get_text, reverse=reverse)
+
+
+class CollectionIndex(object):
+    """
+    Sorted and filtered index over the keys of a collection.
+
+    Parameters
+    ----------
+    value: list, tuple, dict or set
+        Indexed collection. Sets are indexed by the position of their
+        elements in a snapshot taken when the index is created.
+    sort_column: int
+        Column used to sort the index (see KEY_COLUMN and the following
+        constants), or None to keep the order of the collection.
+    reverse: bool
+        Whether to sort in descending order.
+    filter_text: str
+        If given, only keys whose text representation contains it (ignoring
+        case) are kept.
+    """
+
+    def __init__(self, value, sort_column=None, reverse=False,
+                 filter_text=''):
+        self.signature = self.get_signature(value, sort_column, reverse,
+                                            filter_text)
+        self.sort_column = sort_column
+        self.reverse = reverse
+        self.filter_text = filter_text
+        self.length = len(value)
+        self.original = value
+        if isinstance(value, set):
+            value = list(value)
+        self.value = value
+
+        if isinstance(value, dict):
+            keys = list(value)
+        else:
+            # Ranges don't take memory for lists without sorting or filter
+            keys = range(len(value))
+
+        if filter_text:
+            filter_text = filter_text.lower()
+            keys = [key for key in keys
+                    if filter_text in to_text_string(key).lower()]
+
+        if sort_column == KEY_COLUMN:
+            keys = sort_keys(keys, lambda key: key, reverse)
+        elif sort_column == TYPE_COLUMN:
+            keys = sort_keys(
+                keys, lambda key: get_human_readable_type(value[key]), reverse)
+        elif sort_column == SIZE_COLUMN:
+            keys = sort_keys(keys, lambda key: get_size(value[key]), reverse)
+        elif sort_column == VALUE_COLUMN:
+            keys = sort_keys(keys, lambda key: value[key], reverse)
+        self.keys = keys
+
+    @staticmethod
+    def get_signature(value, sort_column=None, reverse=False,
+                      filter_text=''):
+        """Return what determines the contents of an index."""
+        return (id(value), len(value), sort_column, reverse, filter_text)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def get_key(self, row):
+        """Return the key of `row`."""
+        return self.keys[row]
+
+    def get_item(self, row):
+        """Return the value of `row`."""
+        return self.value[self.keys[row]]
+
+    def get_rows(self, start, stop, minmax=False):
+        """Return the entries of the rows between `start` and `stop`."""
+        rows = []
+        for row in range(max(0, start), min(stop, len(self.keys))):
+            key = self.keys[row]
+            value = self.value[key]
+            rows.append({'key': value_to_display(key),
+                         'type': get_human_readable_type(value),
+                         'size': get_size(value),
+                         'color': get_color_name(value),
+                         'view': value_to_display(value, minmax=minmax)})
+        return rows
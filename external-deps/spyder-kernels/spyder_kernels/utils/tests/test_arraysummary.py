@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for arraysummary.py
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local imports
+from spyder_kernels.utils import arraysummary
+from spyder_kernels.utils.arraysummary import ArraySummaryCache
+from spyder_kernels.utils.nsview import value_to_display
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Use tiny chunks so small arrays are scanned in several steps."""
+    monkeypatch.setattr(arraysummary, 'CHUNK_SIZE', 100)
+    monkeypatch.setattr(arraysummary, 'SAMPLE_SIZE', 10)
+
+
+def test_small_arrays():
+    """Small arrays are summarized exactly in one step."""
+    cache = ArraySummaryCache()
+    assert cache.get_minmax(np.array([3, 1, 2])) == (1, 3, True)
+    with pytest.raises(ValueError):
+        cache.get_minmax(np.array([]))
+
+
+def test_chunked_scan(small_chunks):
+    """Large arrays are scanned in chunks, resuming on each call."""
+    value = np.arange(1000.0).reshape(100, 10)
+    value[57, 3] = -5
+    cache = ArraySummaryCache()
+
+    # No time left: only the first chunk is scanned
+    vmin, vmax, exact = cache.get_minmax(value, time_budget=-1)
+    assert not exact
+    assert (vmin, vmax) == (0, 99)
+
+    # The scan continues where it stopped. Its result is still approximate
+    # because earlier chunks could have been written to since.
+    summary = cache._summaries[id(value)]
+    while not summary.scanned:
+        vmin, vmax, exact = cache.get_minmax(value, time_budget=-1)
+    assert not exact
+    assert (vmin, vmax) == (-5, 999)
+
+    # Fully scanned arrays are scanned again, which is exact when done
+    # within the time budget
+    assert cache.get_minmax(value) == (-5, 999, True)
+    assert cache._summaries[id(value)] is summary
+
+
+@pytest.mark.parametrize('value', [np.arange(1000.0).reshape(1, 1000),
+                                   np.arange(2000.0).reshape(2, 1000)[:, ::2],
+                                   np.arange(1000.0).reshape(10, 100).T])
+def test_chunks_by_element_count(small_chunks, value):
+    """Chunks have CHUNK_SIZE elements whatever the shape of the array."""
+    cache = ArraySummaryCache()
+    vmin, vmax, exact = cache.get_minmax(value, time_budget=-1)
+    calls = 1
+    while not cache._summaries[id(value)].scanned:
+        vmin, vmax, exact = cache.get_minmax(value, time_budget=-1)
+        calls += 1
+    assert calls == 10
+    assert (vmin, vmax) == (value.min(), value.max())
+
+
+def test_writes_invalidate_summaries(small_chunks):
+    """Summaries are computed again when sampled elements change."""
+    value = np.zeros(1000)
+    cache = ArraySummaryCache()
+    assert cache.get_minmax(value) == (0, 0, True)
+    value[-1] = 7
+    assert cache.get_minmax(value) == (0, 7, True)
+
+    # A view of the same buffer with another shape is a different array
+    view = value.reshape(10, 100)
+    assert cache.get_minmax(view) == (0, 7, True)
+
+
+def test_unsampled_writes(small_chunks):
+    """Writes missed by the sample don't give stale exact results."""
+    value = np.zeros(1000)
+    cache = ArraySummaryCache()
+    assert cache.get_minmax(value) == (0, 0, True)
+    value[7] = 5
+    assert cache.get_minmax(value) == (0, 5, True)
+
+    # Without time to scan the array again, results are approximate
+    value[8] = -5
+    vmin, vmax, exact = cache.get_minmax(value, time_budget=-1)
+    assert (vmin, vmax, exact) == (-5, 5, False)
+    value[9] = 9
+    while not cache._summaries[id(value)].scanned:
+        vmin, vmax, exact = cache.get_minmax(value, time_budget=-1)
+    assert not exact
+
+
+def test_cache_is_bounded(small_chunks):
+    """Only the summaries of the last seen arrays are kept."""
+    cache = ArraySummaryCache(max_entries=2)
+    values = [np.ones(1000) * i for i in range(3)]
+    for value in values:
+        cache.get_minmax(value)
+    assert list(cache._summaries) == [id(values[1]), id(values[2])]
+
+
+def test_approximate_display(small_chunks, monkeypatch):
+    """Approximate summaries are marked in the Variable Explorer."""
+    monkeypatch.setattr(arraysummary, 'TIME_BUDGET', -1)
+    arraysummary.ARRAY_SUMMARIES.clear()
+    value = np.arange(1000)
+    display = value_to_display(value, minmax=True)
+    assert display.startswith('Min: ~')
+    assert '~' not in value_to_display(np.arange(10), minmax=True)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -23,7 +23,8 @@ import xarray as xr
 from spyder_kernels.py3compat import PY2
 from spyder_kernels.utils.nsview import (sort_against, is_supported,
                                          value_to_display,
-                                         get_supported_types)
+                                         get_supported_types,
+                                         get_view_delta, make_remote_view)
 
 def generate_complex_object():
     """Taken from issue #4221."""
@@ -263,5 +264,48 @@ def test_ellipses(tmpdir):
     assert b' ...' in value_to_display(buffer)
 
 
+def test_make_remote_view_cache():
+    """
+    Test that the entries of unchanged immutable values are reused and
+    the ones of mutable values are always computed again.
+    """
+    settings = {'check_all': False, 'exclude_private': True,
+                'exclude_uppercase': True, 'exclude_capitalized': False,
+                'exclude_unsupported': False,
+                'exclude_callables_and_modules': True, 'excluded_names': [],
+                'minmax': False}
+    data = {'a': 1.5, 'b': 'spam', 'c': [1, 2], 'd': np.arange(3), 'e': DF}
+    cache = {}
+    view = make_remote_view(data, settings, cache=cache)
+    assert set(cache) == set(['a', 'b', 'e'])
+
+    data['c'].append(3)
+    data['d'][0] = 10
+    new_view = make_remote_view(data, settings, cache=cache)
+    assert new_view['a'] is view['a']
+    assert new_view['b'] is view['b']
+    assert new_view['e'] is view['e']
+    assert new_view['c']['size'] == 3
+    assert new_view['d']['view'] == '[10  1  2]'
+
+    # Removed variables are dropped from the cache
+    del data['a']
+    make_remote_view(data, settings, cache=cache)
+    assert 'a' not in cache
+
+    # Settings are not modified
+    make_remote_view(data, settings, more_excluded_names=['b'], cache=cache)
+    assert settings['excluded_names'] == []
+
+
+def test_get_view_delta():
+    """Test the changes between two remote views."""
+    old_view = {'a': {'view': '1'}, 'b': {'view': '2'}, 'c': {'view': '3'}}
+    new_view = {'a': {'view': '1'}, 'b': {'view': '4'}, 'd': {'view': '5'}}
+    delta = get_view_delta(old_view, new_view)
+    assert delta['update'] == {'b': {'view': '4'}, 'd': {'view': '5'}}
+    assert delta['remove'] == ['c']
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for pagedview.py
+"""
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder_kernels.utils.pagedview import (CollectionIndex, KEY_COLUMN,
+                                            SIZE_COLUMN, VALUE_COLUMN)
+
+
+def test_list_index():
+    """Lists are paged in their own order unless sorted or filtered."""
+    value = list(range(100, 0, -1))
+    index = CollectionIndex(value)
+    assert len(index) == 100
+    assert [index.get_key(row) for row in (0, 50, 99)] == [0, 50, 99]
+    assert index.get_rows(98, 200) == [
+        {'key': '98', 'type': 'int', 'size': 1, 'color': '#0000ff',
+         'view': '2'},
+        {'key': '99', 'type': 'int', 'size': 1, 'color': '#0000ff',
+         'view': '1'}]
+
+    index = CollectionIndex(value, sort_column=VALUE_COLUMN)
+    assert index.get_item(0) == 1
+    assert index.get_key(0) == 99
+
+    index = CollectionIndex(value, filter_text='9')
+    assert len(index) == 19
+    assert index.get_item(0) == 91
+
+
+def test_dict_index():
+    """Dicts are sorted by keys even when they can't be compared."""
+    value = {'b': [1, 2], 1: 'spam', 'a': None}
+    index = CollectionIndex(value, sort_column=KEY_COLUMN, reverse=True)
+    assert [row['key'] for row in index.get_rows(0, 3)] == ["b", "a", "1"]
+
+    index = CollectionIndex(value, sort_column=SIZE_COLUMN)
+    assert index.get_key(2) == 'b'
+
+
+def test_set_index():
+    """Sets are indexed by the position of their elements."""
+    value = set(['a', 'b', 'c'])
+    index = CollectionIndex(value, sort_column=VALUE_COLUMN)
+    assert [index.get_item(row) for row in range(3)] == ['a', 'b', 'c']
+    assert index.signature == CollectionIndex.get_signature(
+        value, sort_column=VALUE_COLUMN)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Kernel startup timeline.
+
+Records how long each phase of the kernel startup and the slowest imports
+done during it take, so the frontend can show what delays the first prompt.
+"""
+
+from contextlib import contextmanager
+import time
+
+
+PHASE = 'phase'
+IMPORT = 'import'
+
+# Imports that take less than this, in seconds, are left out of reports
+IMPORT_THRESHOLD = 0.005
+
+try:
+    default_clock = time.perf_counter
+except AttributeError:
+    # Python 2
+    default_clock = time.time
+
+
+class KernelStartupTimeline(object):
+    """Collect timed startup entries, either phases or imports."""
+
+    def __init__(self, clock=default_clock):
+        self._clock = clock
+        self.origin = clock()
+        self.entries = []
+        self.end = None
+
+    def add(self, kind, name, start, duration, depth=0):
+        """
+        Add an entry measured from `start` and lasting `duration`.
+
+        `depth` is the number of entries of the same kind that contain it.
+        """
+        self.entries.append({
+            'kind': kind,
+            'name': name,
+            'start': start - self.origin,
+            'duration': duration,
+            'depth': depth,
+        })
+
+    def clock(self):
+        """Return the current time of the timeline's clock."""
+        return self._clock()
+
+    @contextmanager
+    def phase(self, name):
+        """Context manager to time a startup phase."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.add(PHASE, name, start, self._clock() - start)
+
+    def finish(self):
+        """Mark the end of the startup."""
+        self.end = self._clock()
+
+    def elapsed(self):
+        """Time taken by the startup, or elapsed since it started."""
+        end = self.end if self.end is not None else self._clock()
+        return end - self.origin
+
+    def total(self, kind=None):
+        """
+        Sum of the durations of the outermost entries of `kind` (or all of
+        them).
+        """
+        return sum(entry['duration'] for entry in self.entries
+                   if (kind is None or entry['kind'] == kind) and
+                   entry['depth'] == 0)
+
+    def to_dict(self):
+        """Return the timeline in a form that can be sent to the frontend."""
+        return {'entries': list(self.entries),
+                'elapsed': self.elapsed(),
+                'finished': self.end is not None}
+
+    def report(self):
+        """Return the timeline as a human readable table."""
+        lines = ["Kernel startup timeline",
+                 "{:>10} {:>10}  {:<7} {}".format('start (ms)', 'took (ms)',
+                                                  'kind', 'name')]
+        entries = [entry for entry in self.entries
+                   if entry['kind'] != IMPORT or
+                   entry['duration'] >= IMPORT_THRESHOLD]
+        for entry in sorted(entries, key=lambda e: (e['start'], e['depth'])):
+            lines.append("{:>10.1f} {:>10.1f}  {:<7} {}{}".format(
+                entry['start'] * 1000, entry['duration'] * 1000,
+                entry['kind'], '  ' * entry['depth'], entry['name']))
+        lines.append("Imports: {:.1f} ms, total: {:.1f} ms".format(
+            self.total(IMPORT) * 1000, self.elapsed() * 1000))
+        return '\n'.join(lines)
+
+
+STARTUP_TIMELINE = KernelStartupTimeline()
@@ -75,6 +75,13 @@ def get_options(argv=None):
         help="Profile mode (internal test, not related "
              "with Python profiling)"
     )
+    parser.add_argument(
+        '--startup-timeline',
+        dest="startup_timeline",
+        action='store_true',
+        default=False,
+        help="Print how long each startup phase and plugin took to load"
+    )
     parser.add_argument(
         '--window-title',
         type=str,
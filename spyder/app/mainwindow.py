@@ -198,6 +198,7 @@ from spyder.utils.qthelpers import (create_action, add_actions, get_icon,
                                     MENU_SEPARATOR, set_menu_icons)
 from spyder.otherplugins import get_spyderplugins_mods
 from spyder.app import tour
+from spyder.app.timeline import StartupTimeline
 
 #==============================================================================
 # Third-party library imports
@@ -224,6 +225,8 @@ class MainWindow(QMainWindow):
     CURSORBLINK_OSDEFAULT = QApplication.cursorFlashTime()
     SPYDER_PATH = get_conf_path('path')
     SPYDER_NOT_ACTIVE_PATH = get_conf_path('not_active_path')
+    # Time to wait after the window is shown to construct deferred plugins
+    DEFERRED_PLUGINS_DELAY = 2000
     BOOKMARKS = (
          ('Python2', "https://docs.python.org/2/index.html",
           _("Python2 documentation")),
@@ -260,6 +263,10 @@ class MainWindow(QMainWindow):
         QMainWindow.__init__(self)
         qapp = QApplication.instance()
 
+        # Startup timeline, dumped to stderr with --startup-timeline
+        self.timeline = StartupTimeline()
+        self.show_startup_timeline = options.startup_timeline
+
         if running_under_pytest():
             self._proxy_style = None
         else:
@@ -337,6 +344,10 @@ class MainWindow(QMainWindow):
         self.findinfiles = None
         self.thirdparty_plugins = []
 
+        # Plugins whose construction is deferred until Spyder is idle
+        # because they were closed in the last session
+        self.deferred_plugins = OrderedDict()
+
         # Tour  # TODO: Should I consider it a plugin?? or?
         self.tour = None
         self.tours_available = None
@@ -528,6 +539,7 @@ class MainWindow(QMainWindow):
         # in the future)
         # self.setTabPosition(Qt.AllDockWidgetAreas, QTabWidget.North)
 
+        self.timeline.checkpoint("MainWindow constructor")
         logger.info("End of MainWindow constructor")
 
     #---- Window setup
@@ -574,6 +586,7 @@ class MainWindow(QMainWindow):
                 css_path = CSS_PATH
         else:
             css_path = CSS_PATH
+        self.timeline.checkpoint("Python path and theme")
 
         logger.info("Creating core actions...")
         self.close_dockwidget_action = create_action(
@@ -841,45 +854,56 @@ class MainWindow(QMainWindow):
         logger.info("Loading switcher...")
         self.create_switcher()
 
+        self.timeline.checkpoint("Core actions, menus and toolbars")
+
         # Internal console plugin
         logger.info("Loading internal console...")
-        from spyder.plugins.console.plugin import Console
-        self.console = Console(self, namespace=None, exitfunc=self.closing,
-                            profile=self.profile,
-                            multithreaded=self.multithreaded,
-                            message=_("Spyder Internal Console\n\n"
-                                    "This console is used to report application\n"
-                                    "internal errors and to inspect Spyder\n"
-                                    "internals with the following commands:\n"
-                                    "  spy.app, spy.window, dir(spy)\n\n"
-                                    "Please don't use it to run your code\n\n"))
-        self.console.register_plugin()
+        with self.timeline.plugin('Internal console'):
+            from spyder.plugins.console.plugin import Console
+            self.console = Console(
+                self, namespace=None, exitfunc=self.closing,
+                profile=self.profile,
+                multithreaded=self.multithreaded,
+                message=_("Spyder Internal Console\n\n"
+                          "This console is used to report application\n"
+                          "internal errors and to inspect Spyder\n"
+                          "internals with the following commands:\n"
+                          "  spy.app, spy.window, dir(spy)\n\n"
+                          "Please don't use it to run your code\n\n"))
+            self.console.register_plugin()
 
         # Code completion client initialization
         self.set_splash(_("Starting code completion manager..."))
-        from spyder.plugins.completion.plugin import CompletionManager
-        self.completions = CompletionManager(self)
+        with self.timeline.plugin('Completions'):
+            from spyder.plugins.completion.plugin import CompletionManager
+            self.completions = CompletionManager(self)
 
         # Working directory plugin
         logger.info("Loading working directory...")
-        from spyder.plugins.workingdirectory.plugin import WorkingDirectory
-        self.workingdirectory = WorkingDirectory(self, self.init_workdir, main=self)
-        self.workingdirectory.register_plugin()
-        self.toolbarslist.append(self.workingdirectory.toolbar)
+        with self.timeline.plugin('Working directory'):
+            from spyder.plugins.workingdirectory.plugin import (
+                WorkingDirectory)
+            self.workingdirectory = WorkingDirectory(self, self.init_workdir,
+                                                     main=self)
+            self.workingdirectory.register_plugin()
+            self.toolbarslist.append(self.workingdirectory.toolbar)
 
         # Help plugin
         if CONF.get('help', 'enable'):
             self.set_splash(_("Loading help..."))
-            from spyder.plugins.help.plugin import Help
-            self.help = Help(self, css_path=css_path)
-            self.help.register_plugin()
+            with self.timeline.plugin('Help'):
+                from spyder.plugins.help.plugin import Help
+                self.help = Help(self, css_path=css_path)
+                self.help.register_plugin()
 
         # Outline explorer widget
         if CONF.get('outline_explorer', 'enable'):
             self.set_splash(_("Loading outline explorer..."))
-            from spyder.plugins.outlineexplorer.plugin import OutlineExplorer
-            self.outlineexplorer = OutlineExplorer(self)
-            self.outlineexplorer.register_plugin()
+            with self.timeline.plugin('Outline explorer'):
+                from spyder.plugins.outlineexplorer.plugin import (
+                    OutlineExplorer)
+                self.outlineexplorer = OutlineExplorer(self)
+                self.outlineexplorer.register_plugin()
 
         if is_anaconda():
             from spyder.widgets.status import CondaStatus
@@ -889,14 +913,16 @@ class MainWindow(QMainWindow):
 
         # Editor plugin
         self.set_splash(_("Loading editor..."))
-        from spyder.plugins.editor.plugin import Editor
-        self.editor = Editor(self)
-        self.editor.register_plugin()
+        with self.timeline.plugin('Editor'):
+            from spyder.plugins.editor.plugin import Editor
+            self.editor = Editor(self)
+            self.editor.register_plugin()
 
         # Start code completion client
         self.set_splash(_("Launching code completion client for Python..."))
-        self.completions.start()
-        self.completions.start_client(language='python')
+        with self.timeline.phase('Start code completion client'):
+            self.completions.start()
+            self.completions.start_client(language='python')
 
         # Populating file menu entries
         quit_action = create_action(self, _("&Quit"),
@@ -926,55 +952,66 @@ class MainWindow(QMainWindow):
 
         # Namespace browser
         self.set_splash(_("Loading namespace browser..."))
-        from spyder.plugins.variableexplorer.plugin import VariableExplorer
-        self.variableexplorer = VariableExplorer(self)
-        self.variableexplorer.register_plugin()
+        with self.timeline.plugin('Variable explorer'):
+            from spyder.plugins.variableexplorer.plugin import (
+                VariableExplorer)
+            self.variableexplorer = VariableExplorer(self)
+            self.variableexplorer.register_plugin()
 
         # Figure browser
-        self.set_splash(_("Loading figure browser..."))
-        from spyder.plugins.plots.plugin import Plots
-        self.plots = Plots(self)
-        self.plots.register_plugin()
+        if self.is_plugin_deferrable('plots'):
+            self.deferred_plugins['plots'] = (_("Plots"), self._load_plots)
+        else:
+            self.set_splash(_("Loading figure browser..."))
+            self._load_plots()
 
         # History log widget
         if CONF.get('historylog', 'enable'):
-            self.set_splash(_("Loading history plugin..."))
-            from spyder.plugins.history.plugin import HistoryLog
-            self.historylog = HistoryLog(self)
-            self.historylog.register_plugin()
+            if self.is_plugin_deferrable('historylog'):
+                self.deferred_plugins['historylog'] = (
+                    _("History"), self._load_historylog)
+            else:
+                self.set_splash(_("Loading history plugin..."))
+                self._load_historylog()
 
         # IPython console
         self.set_splash(_("Loading IPython console..."))
-        from spyder.plugins.ipythonconsole.plugin import IPythonConsole
-        self.ipyconsole = IPythonConsole(self, css_path=css_path)
-        self.ipyconsole.register_plugin()
+        with self.timeline.plugin('IPython console'):
+            from spyder.plugins.ipythonconsole.plugin import IPythonConsole
+            self.ipyconsole = IPythonConsole(self, css_path=css_path)
+            self.ipyconsole.register_plugin()
 
         # Explorer
         if CONF.get('explorer', 'enable'):
             self.set_splash(_("Loading file explorer..."))
-            from spyder.plugins.explorer.plugin import Explorer
-            self.explorer = Explorer(self)
-            self.explorer.register_plugin()
+            with self.timeline.plugin('Explorer'):
+                from spyder.plugins.explorer.plugin import Explorer
+                self.explorer = Explorer(self)
+                self.explorer.register_plugin()
 
         # Online help widget
         if CONF.get('onlinehelp', 'enable'):
-            self.set_splash(_("Loading online help..."))
-            from spyder.plugins.onlinehelp.plugin import OnlineHelp
-            self.onlinehelp = OnlineHelp(self)
-            self.onlinehelp.register_plugin()
+            if self.is_plugin_deferrable('onlinehelp'):
+                self.deferred_plugins['onlinehelp'] = (
+                    _("Online help"), self._load_onlinehelp)
+            else:
+                self.set_splash(_("Loading online help..."))
+                self._load_onlinehelp()
 
         # Project explorer widget
         self.set_splash(_("Loading project explorer..."))
-        from spyder.plugins.projects.plugin import Projects
-        self.projects = Projects(self)
-        self.projects.register_plugin()
-        self.project_path = self.projects.get_pythonpath(at_start=True)
+        with self.timeline.plugin('Projects'):
+            from spyder.plugins.projects.plugin import Projects
+            self.projects = Projects(self)
+            self.projects.register_plugin()
+            self.project_path = self.projects.get_pythonpath(at_start=True)
 
         # Find in files
         if CONF.get('find_in_files', 'enable'):
-            from spyder.plugins.findinfiles.plugin import FindInFiles
-            self.findinfiles = FindInFiles(self)
-            self.findinfiles.register_plugin()
+            with self.timeline.plugin('Find in files'):
+                from spyder.plugins.findinfiles.plugin import FindInFiles
+                self.findinfiles = FindInFiles(self)
+                self.findinfiles.register_plugin()
 
         # Load other plugins (former external plugins)
         # TODO: Use this bucle to load all internall plugins and remove
@@ -982,12 +1019,13 @@ class MainWindow(QMainWindow):
         other_plugins = ['breakpoints', 'profiler', 'pylint']
         for plugin_name in other_plugins:
             if CONF.get(plugin_name, 'enable'):
-                module = importlib.import_module(
-                        'spyder.plugins.{}'.format(plugin_name))
-                plugin = module.PLUGIN_CLASS(self)
-                if plugin.check_compatibility()[0]:
-                    self.thirdparty_plugins.append(plugin)
-                    plugin.register_plugin()
+                with self.timeline.plugin(plugin_name):
+                    module = importlib.import_module(
+                            'spyder.plugins.{}'.format(plugin_name))
+                    plugin = module.PLUGIN_CLASS(self)
+                    if plugin.check_compatibility()[0]:
+                        self.thirdparty_plugins.append(plugin)
+                        plugin.register_plugin()
 
         # Third-party plugins
         from spyder import dependencies
@@ -995,29 +1033,32 @@ class MainWindow(QMainWindow):
         self.set_splash(_("Loading third-party plugins..."))
         for mod in get_spyderplugins_mods():
             try:
-                plugin = mod.PLUGIN_CLASS(self)
-                if plugin.check_compatibility()[0]:
-                    if hasattr(plugin, 'COMPLETION_CLIENT_NAME'):
-                        self.completions.register_completion_plugin(plugin)
-                    else:
-                        self.thirdparty_plugins.append(plugin)
-                        plugin.register_plugin()
-
-                    # Add to dependencies dialog
-                    module = mod.__name__
-                    name = module.replace('_', '-')
-                    if plugin.DESCRIPTION:
-                        description = plugin.DESCRIPTION
-                    else:
-                        description = plugin.get_plugin_title()
+                with self.timeline.plugin(mod.__name__):
+                    plugin = mod.PLUGIN_CLASS(self)
+                    if plugin.check_compatibility()[0]:
+                        if hasattr(plugin, 'COMPLETION_CLIENT_NAME'):
+                            self.completions.register_completion_plugin(
+                                plugin)
+                        else:
+                            self.thirdparty_plugins.append(plugin)
+                            plugin.register_plugin()
+
+                        # Add to dependencies dialog
+                        module = mod.__name__
+                        name = module.replace('_', '-')
+                        if plugin.DESCRIPTION:
+                            description = plugin.DESCRIPTION
+                        else:
+                            description = plugin.get_plugin_title()
 
-                    dependencies.add(module, name, description,
-                                     '', None, kind=dependencies.PLUGIN)
+                        dependencies.add(module, name, description,
+                                         '', None, kind=dependencies.PLUGIN)
 
             except Exception as error:
                 print("%s: %s" % (mod, str(error)), file=STDERR)
                 traceback.print_exc(file=STDERR)
 
+        self.timeline.checkpoint("Plugins")
         self.set_splash(_("Setting up main window..."))
 
         # Help menu
@@ -1084,6 +1125,13 @@ class MainWindow(QMainWindow):
                                   report_action, dep_action,
                                   self.check_updates_action, support_action,
                                   MENU_SEPARATOR]
+        # Worker metrics, only useful for debugging
+        if get_debug_level():
+            metrics_action = create_action(
+                self, _("Worker metrics..."),
+                triggered=self.show_worker_metrics)
+            self.help_menu_actions.insert(
+                self.help_menu_actions.index(dep_action) + 1, metrics_action)
         # Python documentation
         if get_python_doc_path() is not None:
             pydoc_act = create_action(self, _("Python documentation"),
@@ -1232,9 +1280,12 @@ class MainWindow(QMainWindow):
         # toolbar actions are all defined:
         self.all_actions_defined.emit()
 
+        self.timeline.checkpoint("Help, view and status bar menus")
+
         # Window set-up
         logger.info("Setting up window...")
         self.setup_layout(default=False)
+        self.timeline.checkpoint("Window layout")
 
         if self.splash is not None:
             self.splash.hide()
@@ -1352,7 +1403,7 @@ class MainWindow(QMainWindow):
                 plugin.dockwidget.raise_()
 
         # Show history file if no console is visible
-        if not self.ipyconsole._isvisible:
+        if self.historylog is not None and not self.ipyconsole._isvisible:
             self.historylog.add_history(get_conf_path('history.py'))
 
         if self.open_project:
@@ -1403,6 +1454,127 @@ class MainWindow(QMainWindow):
 
         # Notify that the setup of the mainwindow was finished
         self.sig_setup_finished.emit()
+        self.timeline.checkpoint("Post visible setup")
+
+        # Construct plugins that were closed in the last session once the
+        # window is shown and startup work is done, unless they're
+        # opened before from View > Panes
+        QTimer.singleShot(self.DEFERRED_PLUGINS_DELAY,
+                          self.load_deferred_plugins)
+
+    # ---- Deferred plugins
+    def is_plugin_deferrable(self, name):
+        """
+        Return True if the construction of plugin `name` can wait until
+        the main window is shown, i.e. if its pane was closed the last time
+        Spyder was closed.
+
+        Only Plots, History and Online help can be deferred. Help, Files
+        and Projects are used directly by the editor, the consoles and the
+        working directory while they are set up, and Find adds its actions
+        to the Search menu and toolbar, which are built before the window
+        is shown.
+        """
+        if running_under_pytest() or not CONF.get('main', 'lazy_plugins'):
+            return False
+
+        # Default layouts need all plugins, so nothing can be deferred
+        # the first time Spyder runs.
+        if CONF.get('main', 'window/state', None) is None:
+            return False
+
+        return name in CONF.get('main', 'closed_plugins')
+
+    def load_deferred_plugin(self, name):
+        """
+        Construct deferred plugin `name` if it's still pending and return
+        it, or None.
+        """
+        if name not in self.deferred_plugins:
+            return None
+        __, loader = self.deferred_plugins.pop(name)
+
+        try:
+            plugin = loader()
+        except Exception as error:
+            print("%s: %s" % (name, str(error)), file=STDERR)
+            traceback.print_exc(file=STDERR)
+            return None
+
+        # Put the pane back in its place of the saved layout and keep it
+        # closed, as it was in the last session.
+        self.restoreDockWidget(plugin.dockwidget)
+        plugin._initialize_plugin_in_mainwindow_layout()
+        plugin.dockwidget.hide()
+
+        self.toggle_lock(self.interface_locked)
+        self.apply_shortcuts()
+        if self.plugins_menu is not None:
+            self.plugins_menu.clear()
+            self.create_plugins_menu()
+        return plugin
+
+    def show_deferred_plugin(self, name):
+        """Construct deferred plugin `name` and show its pane."""
+        plugin = self.load_deferred_plugin(name)
+        if plugin is not None:
+            plugin.switch_to_plugin()
+
+    def load_all_deferred_plugins(self):
+        """Construct all pending deferred plugins right away."""
+        for name in list(self.deferred_plugins):
+            self.load_deferred_plugin(name)
+
+    @Slot()
+    def load_deferred_plugins(self):
+        """
+        Construct pending deferred plugins, one per event loop iteration
+        to keep the interface responsive.
+        """
+        if self.deferred_plugins:
+            self.load_deferred_plugin(next(iter(self.deferred_plugins)))
+            QTimer.singleShot(0, self.load_deferred_plugins)
+            return
+
+        report = self.timeline.report()
+        logger.info(report)
+        if self.show_startup_timeline:
+            print(report, file=STDERR)
+
+    def _load_plots(self):
+        """Create and register the Plots plugin."""
+        with self.timeline.plugin('Plots'):
+            from spyder.plugins.plots.plugin import Plots
+            self.plots = Plots(self)
+            self.plots.register_plugin()
+
+        # Add the consoles started before the plugin was deferred
+        if self.ipyconsole is not None:
+            self.ipyconsole.add_clients_to_plots()
+        return self.plots
+
+    def _load_historylog(self):
+        """Create and register the History plugin."""
+        with self.timeline.plugin('History'):
+            from spyder.plugins.history.plugin import HistoryLog
+            self.historylog = HistoryLog(self)
+            self.historylog.register_plugin()
+
+        # Add the history of the consoles started before the plugin was
+        # deferred
+        if self.ipyconsole is not None:
+            self.ipyconsole.add_clients_to_history()
+            if not self.ipyconsole._isvisible:
+                self.historylog.add_history(get_conf_path('history.py'))
+        return self.historylog
+
+    def _load_onlinehelp(self):
+        """Create and register the Online help plugin."""
+        with self.timeline.plugin('Online help'):
+            from spyder.plugins.onlinehelp.plugin import OnlineHelp
+            self.onlinehelp = OnlineHelp(self)
+            self.onlinehelp.register_plugin()
+        return self.onlinehelp
 
     def handle_new_screen(self, screen):
         """Connect DPI signals for new screen."""
@@ -1679,6 +1851,8 @@ class MainWindow(QMainWindow):
 
     def setup_default_layouts(self, index, settings):
         """Setup default layouts when run for the first time."""
+        # Default layouts place all plugins
+        self.load_all_deferred_plugins()
         self.setUpdatesEnabled(False)
 
         first_spyder_run = bool(self.first_spyder_run)  # Store copy
@@ -2377,6 +2551,16 @@ class MainWindow(QMainWindow):
                 order[pos] = action
             else:
                 order.append(action)
+        # Deferred plugins are constructed when their pane is shown
+        for name, (title, __) in self.deferred_plugins.items():
+            action = create_action(
+                self, title, triggered=(
+                    lambda checked=False, name=name:
+                        self.show_deferred_plugin(name)))
+            if name in order:
+                order[order.index(name)] = action
+            else:
+                order.append(action)
         actions = order[:]
         for action in order:
             if type(action) is str:
@@ -2484,6 +2668,15 @@ class MainWindow(QMainWindow):
         if not self.completions.closing_plugin(cancelable):
             return False
 
+        # Remember closed panes to defer their creation in the next session.
+        # This needs to be done before closing undocked plugin windows.
+        closed_plugins = [
+            plugin.CONF_SECTION for plugin in self.widgetlist
+            if plugin.dockwidget.isHidden()
+            and plugin._undocked_window is None]
+        CONF.set('main', 'closed_plugins',
+                 closed_plugins + list(self.deferred_plugins))
+
         for plugin in (self.widgetlist + self.thirdparty_plugins):
             plugin._close_window()
             if not plugin.closing_plugin(cancelable):
@@ -2795,6 +2988,14 @@ class MainWindow(QMainWindow):
         dlg.set_data(dependencies.DEPENDENCIES)
         dlg.exec_()
 
+    @Slot()
+    def show_worker_metrics(self):
+        """Show the queues and timings of python workers"""
+        from spyder.widgets.workermetrics import WorkerMetricsDialog
+        dlg = WorkerMetricsDialog(self)
+        dlg.setAttribute(Qt.WA_DeleteOnClose)
+        dlg.show()
+
     def render_issue(self, description='', traceback=''):
         """Render issue before sending it to Github"""
         # Get component versions
@@ -3163,6 +3364,9 @@ class MainWindow(QMainWindow):
             self.prefs_dialog_instance = None
 
         if self.prefs_dialog_instance is None:
+            # Deferred plugins also have preference pages
+            self.load_all_deferred_plugins()
+
             dlg = ConfigDialog(self)
             dlg.setStyleSheet("QTabWidget::tab-bar {"
                               "alignment: left;}")
@@ -26,6 +26,7 @@ def test_get_options():
     assert not options.show_console
     assert not options.multithreaded
     assert not options.profile
+    assert not options.startup_timeline
     assert options.window_title is None
     assert options.project is None
     assert options.opengl_implementation is None
@@ -43,6 +44,9 @@ def test_get_options():
     assert options.optimize
     assert options.working_directory == 'test dir'
 
+    options, args = getopt(['--startup-timeline'])
+    assert options.startup_timeline
+
     options, args = getopt('--window-title MyWindow'.split())
     assert options.window_title == 'MyWindow'
 
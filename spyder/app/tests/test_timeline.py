@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for timeline.py
+"""
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.app.timeline import PHASE, PLUGIN, StartupTimeline
+
+
+class FakeClock(object):
+    """Clock that advances one second each time it's read."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+def test_startup_timeline():
+    timeline = StartupTimeline(clock=FakeClock())
+
+    timeline.checkpoint('Constructor')
+    with timeline.plugin('Editor'):
+        pass
+    with timeline.phase('Completions'):
+        pass
+    timeline.checkpoint('Plugins')
+
+    names = [entry['name'] for entry in timeline.entries]
+    assert names == ['Constructor', 'Editor', 'Completions', 'Plugins']
+    assert timeline.entries[0]['duration'] == 1
+    assert timeline.entries[1]['kind'] == PLUGIN
+    assert timeline.entries[1]['start'] == 2
+    assert timeline.total(PLUGIN) == 1
+    assert timeline.total(PHASE) == 1 + 1 + 5
+
+    report = timeline.report()
+    assert 'Editor' in report
+    assert report.splitlines()[-1].startswith('Plugins: 1000.0 ms')
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Startup timeline.
+
+Records how long each phase of Spyder's startup and each plugin construction
+takes, so startup regressions can be measured with ``--startup-timeline``.
+"""
+
+# Standard library imports
+from contextlib import contextmanager
+
+# Local imports
+from spyder.py3compat import perf_counter
+
+
+PHASE = 'phase'
+PLUGIN = 'plugin'
+
+
+class StartupTimeline(object):
+    """Collect timed startup entries, either phases or plugins."""
+
+    def __init__(self, clock=perf_counter):
+        self._clock = clock
+        self.origin = clock()
+        self.entries = []
+        self._last_checkpoint = self.origin
+
+    def add(self, kind, name, start, duration):
+        """Add an entry measured from `start` and lasting `duration`."""
+        self.entries.append({
+            'kind': kind,
+            'name': name,
+            'start': start - self.origin,
+            'duration': duration,
+        })
+
+    @contextmanager
+    def measure(self, name, kind=PHASE):
+        """Context manager to time the code it wraps."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.add(kind, name, start, self._clock() - start)
+
+    def phase(self, name):
+        """Time a startup phase."""
+        return self.measure(name, kind=PHASE)
+
+    def plugin(self, name):
+        """Time the construction and registration of a plugin."""
+        return self.measure(name, kind=PLUGIN)
+
+    def checkpoint(self, name):
+        """
+        Record the phase that started at the previous checkpoint (or when
+        the timeline was created) and ends now as `name`.
+        """
+        now = self._clock()
+        self.add(PHASE, name, self._last_checkpoint,
+                 now - self._last_checkpoint)
+        self._last_checkpoint = now
+
+    def elapsed(self):
+        """Time elapsed since the timeline was created."""
+        return self._clock() - self.origin
+
+    def total(self, kind=None):
+        """Sum of the durations of all entries of `kind` (or all of them)."""
+        return sum(entry['duration'] for entry in self.entries
+                   if kind is None or entry['kind'] == kind)
+
+    def report(self):
+        """Return the timeline as a human readable table."""
+        lines = ["Spyder startup timeline",
+                 "{:>10} {:>10}  {:<7} {}".format('start (ms)', 'took (ms)',
+                                                  'kind', 'name')]
+        for entry in sorted(self.entries, key=lambda e: e['start']):
+            lines.append("{:>10.1f} {:>10.1f}  {:<7} {}".format(
+                entry['start'] * 1000, entry['duration'] * 1000,
+                entry['kind'], entry['name']))
+        lines.append("Plugins: {:.1f} ms, total: {:.1f} ms".format(
+            self.total(PLUGIN) * 1000, self.elapsed() * 1000))
+        return '\n'.join(lines)
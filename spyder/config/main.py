@@ -94,6 +94,8 @@ DEFAULTS = [
               'cursor/width': 2,
               'completion/size': (300, 180),
               'report_error/remember_token': False,
+              'lazy_plugins': True,
+              'closed_plugins': [],
               }),
             ('quick_layouts',
              {
@@ -118,6 +120,7 @@ DEFAULTS = [
               'custom': False,
               'umr/enabled': True,
               'umr/verbose': True,
+              'umr/selective': False,
               'umr/namelist': [],
               'custom_interpreters_list': [],
               'custom_interpreter': '',
@@ -150,6 +153,7 @@ DEFAULTS = [
               'out_prompt': '',
               'show_elapsed_time': False,
               'ask_before_restart': True,
+              'kernel_pool_size': 0,
               # This is True because there are libraries like Pyomo
               # that generate a lot of Command Prompts while running,
               # and that's extremely annoying for Windows users.
@@ -304,6 +308,7 @@ DEFAULTS = [
             ('profiler',
              {
               'enable': True,
+              'sampling_interval': 5,
               }),
             ('pylint',
              {
@@ -542,6 +547,7 @@ NAME_MAP = {
     # not good for version control
     'transient': [
         ('main', [
+            'closed_plugins',
             'completion/size',
             'crash',
             'current_version',
@@ -9,6 +9,7 @@ Spyder third-party plugins configuration management.
 """
 
 # Standard library imports
+import json
 import logging
 import os
 import os.path as osp
@@ -29,6 +30,8 @@ logger = logging.getLogger(__name__)
 USER_PLUGIN_DIR = "plugins"
 PLUGIN_PREFIX = "spyder_"
 IO_PREFIX = PLUGIN_PREFIX + "io_"
+MANIFEST_FILE = "plugins_manifest.json"
+MANIFEST_VERSION = 2
 
 
 def get_spyderplugins_mods(io=False):
@@ -41,43 +44,156 @@ def get_spyderplugins_mods(io=False):
     modlist, modnames = [], []
 
     # The user plugins directory is given the priority when looking for modules
-    for plugin_path in [user_plugin_path] + sys.path:
-        _get_spyderplugins(plugin_path, io, modnames, modlist)
+    plugin_paths = [user_plugin_path] + sys.path
+    manifest = get_plugins_manifest(plugin_paths)
+    lookup = 'io' if io else 'plugins'
+    old_not_plugins = manifest['not_plugins'].get(lookup, {})
+    not_plugins = {}
+
+    for name, plugin_path in manifest['candidates']:
+        # Ensure right type of plugin
+        if io and not name.startswith(IO_PREFIX):
+            continue
+
+        # Don't import again modules that were found not to be plugins,
+        # unless their files changed since then
+        mtime = _get_package_mtime(name, plugin_path)
+        if name in old_not_plugins and old_not_plugins[name] == mtime:
+            not_plugins[name] = mtime
+            continue
+
+        # Import the plugin
+        if not _import_plugin(name, plugin_path, modnames, modlist):
+            not_plugins[name] = mtime
+
+    if not_plugins != old_not_plugins:
+        manifest['not_plugins'][lookup] = not_plugins
+        _save_plugins_manifest(manifest)
+
     return modlist
 
 
-def _get_spyderplugins(plugin_path, is_io, modnames, modlist):
-    """Scan the directory `plugin_path` for plugin packages and loads them."""
-    if not osp.isdir(plugin_path):
-        return
+def get_plugins_manifest(plugin_paths):
+    """
+    Return the manifest of plugin candidates found in `plugin_paths`.
 
-    for name in os.listdir(plugin_path):
-        # This is needed in order to register the spyder_io_hdf5 plugin.
-        # See spyder-ide/spyder#4487.
-        # Is this a Spyder plugin?
-        if not name.startswith(PLUGIN_PREFIX):
-            continue
+    The manifest is saved in Spyder's config directory and keyed on the
+    scanned paths and their modification times, so the paths are only
+    listed again when a package is added to or removed from one of them.
+
+    Packages that are not plugins are recorded in 'not_plugins', separately
+    for the `io` and regular lookups, with the modification time of their
+    files (see _get_package_mtime).
+    """
+    key = _get_plugin_paths_key(plugin_paths)
+    manifest = _load_plugins_manifest()
+    if manifest is not None and manifest.get('key') == key:
+        return manifest
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'key': key,
+        'candidates': _scan_plugin_paths(plugin_paths),
+        'not_plugins': {},
+    }
+    _save_plugins_manifest(manifest)
+    return manifest
+
+
+def _get_plugin_paths_key(plugin_paths):
+    """Return a list of [path, mtime] pairs that identify `plugin_paths`."""
+    key = []
+    for plugin_path in plugin_paths:
+        try:
+            mtime = os.stat(plugin_path).st_mtime
+        except (OSError, TypeError):
+            mtime = None
+        key.append([plugin_path, mtime])
+    return key
 
-        # Ensure right type of plugin
-        if is_io and not name.startswith(IO_PREFIX):
-            continue
 
-        # Skip names that end in certain suffixes
-        forbidden_suffixes = ['dist-info', 'egg.info', 'egg-info', 'egg-link',
-                              'kernels']
-        if any([name.endswith(s) for s in forbidden_suffixes]):
+def _get_package_mtime(name, plugin_path):
+    """
+    Return the latest modification time of the package `name` in
+    `plugin_path` and of its top-level modules, or None.
+    """
+    package_path = osp.join(plugin_path, name)
+    try:
+        entries = [entry for entry in os.listdir(package_path)
+                   if entry.endswith('.py')]
+    except OSError:
+        return None
+
+    mtimes = []
+    for entry in [''] + entries:
+        try:
+            mtimes.append(os.stat(osp.join(package_path, entry)).st_mtime)
+        except OSError:
+            pass
+    return max(mtimes) if mtimes else None
+
+
+def _scan_plugin_paths(plugin_paths):
+    """Return [name, path] pairs of plugin packages in `plugin_paths`."""
+    candidates = []
+    for plugin_path in plugin_paths:
+        try:
+            names = os.listdir(plugin_path)
+        except (OSError, TypeError):
             continue
 
-        # Import the plugin
-        _import_plugin(name, plugin_path, modnames, modlist)
+        for name in sorted(names):
+            if (_is_plugin_name(name) and
+                    osp.isdir(osp.join(plugin_path, name))):
+                candidates.append([name, plugin_path])
+    return candidates
+
+
+def _is_plugin_name(name):
+    """Check if `name` can be the name of a Spyder plugin package."""
+    # This is needed in order to register the spyder_io_hdf5 plugin.
+    # See spyder-ide/spyder#4487.
+    # Is this a Spyder plugin?
+    if not name.startswith(PLUGIN_PREFIX):
+        return False
+
+    # Skip names that end in certain suffixes
+    forbidden_suffixes = ['dist-info', 'egg.info', 'egg-info', 'egg-link',
+                          'kernels']
+    return not any([name.endswith(s) for s in forbidden_suffixes])
+
+
+def _load_plugins_manifest():
+    """Load the plugins manifest or return None if it's not valid."""
+    try:
+        with open(get_conf_path(MANIFEST_FILE), 'r') as f:
+            manifest = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if (not isinstance(manifest, dict) or
+            manifest.get('version') != MANIFEST_VERSION):
+        return None
+    return manifest
+
+
+def _save_plugins_manifest(manifest):
+    """Save the plugins manifest, ignoring errors."""
+    try:
+        with open(get_conf_path(MANIFEST_FILE), 'w') as f:
+            json.dump(manifest, f)
+    except (IOError, OSError) as error:
+        logger.debug("Unable to save plugins manifest: %s", error)
 
 
 def _import_plugin(module_name, plugin_path, modnames, modlist):
     """Import the plugin `module_name` from `plugin_path`, add it to `modlist`
     and adds its name to `modnames`.
+
+    Return False if the module was imported but it's not a Spyder plugin.
     """
     if module_name in modnames:
-        return
+        return True
     try:
         # First add a mock module with the LOCALEPATH attribute so that the
         # helper method can find the locale on import
@@ -95,10 +211,13 @@ def _import_plugin(module_name, plugin_path, modnames, modlist):
             sys.modules[module_name] = module
             modlist.append(module)
             modnames.append(module_name)
+        elif module:
+            return False
     except Exception as e:
         sys.stderr.write("ERROR: 3rd party plugin import failed for "
                          "`{0}`\n".format(module_name))
         traceback.print_exc(file=sys.stderr)
+    return True
 
 
 def _import_module_from_path(module_name, plugin_path):
@@ -65,6 +65,7 @@ class ScrollFlagArea(Panel):
         editor.sig_alt_mouse_moved.connect(self.mouseMoveEvent)
         editor.sig_leave_out.connect(self.update)
         editor.sig_flags_changed.connect(self.delayed_update_flags)
+        editor.sig_tasks_changed.connect(self.delayed_update_flags)
         editor.sig_theme_colors_changed.connect(self.update_flag_colors)
 
         self._update_list_timer = QTimer(self)
@@ -1589,26 +1589,46 @@ class Editor(SpyderPluginWidget):
         results = editorstack.get_todo_results()
         self.todo_menu.clear()
         filename = self.get_current_filename()
+        self.__add_todo_actions(self.todo_menu, filename, results)
+
+        # Tasks of the other open files of the project, or of all of them
+        # if there's no active project
+        project_path = None
+        if self.projects is not None:
+            project_path = self.projects.get_active_project_path()
+        if project_path:
+            project_path = osp.join(osp.abspath(project_path), '')
+        other_results = [
+            (fname, fresults)
+            for fname, fresults in editorstack.get_all_todo_results()
+            if fname != filename and (
+                not project_path or
+                osp.abspath(fname).startswith(project_path))]
+        if other_results:
+            self.todo_menu.addSeparator()
+            for fname, fresults in other_results:
+                menu = self.todo_menu.addMenu(
+                    ima.icon('todo_list'), osp.basename(fname))
+                menu.setToolTip(fname)
+                self.__add_todo_actions(menu, fname, fresults)
+        self.update_todo_actions()
+
+    def __add_todo_actions(self, menu, filename, results):
+        """Add an action to go to each task of a file to menu"""
         for text, line0 in results:
             icon = ima.icon('todo')
-            slot = lambda _checked, _l=line0: self.load(filename, goto=_l)
+            slot = (lambda _checked, _f=filename, _l=line0:
+                    self.load(_f, goto=_l))
             action = create_action(self, text=text, icon=icon, triggered=slot)
-            self.todo_menu.addAction(action)
-        self.update_todo_actions()
+            menu.addAction(action)
 
     def todo_results_changed(self):
         """
-        Synchronize todo results between editorstacks
         Refresh todo list navigation buttons
+
+        Tasks are kept in the document, so they're shared by all
+        editorstacks.
         """
-        editorstack = self.get_current_editorstack()
-        results = editorstack.get_todo_results()
-        index = editorstack.get_stack_index()
-        if index != -1:
-            filename = editorstack.data[index].filename
-            for other_editorstack in self.editorstacks:
-                if other_editorstack is not editorstack:
-                    other_editorstack.set_todo_results(filename, results)
         self.update_todo_actions()
 
     def refresh_eol_chars(self, os_name):
@@ -1665,7 +1685,8 @@ class Editor(SpyderPluginWidget):
         editorstack = self.get_current_editorstack()
         results = editorstack.get_todo_results()
         state = (self.get_option('todo_list') and
-                 results is not None and len(results))
+                 results is not None and
+                 bool(len(results) or editorstack.get_all_todo_results()))
         if state is not None:
             self.todo_list_action.setEnabled(state)
 
@@ -1877,7 +1898,7 @@ class Editor(SpyderPluginWidget):
     @Slot(str, int, str, object)
     def load(self, filenames=None, goto=None, word='',
              editorwindow=None, processevents=True, start_column=None,
-             set_focus=True, add_where='end'):
+             set_focus=True, add_where='end', lazy=False):
         """
         Load a text file
         editorwindow: load in this editorwindow (useful when clicking on
@@ -1885,6 +1906,8 @@ class Editor(SpyderPluginWidget):
         processevents: determines if processEvents() should be called at the
         end of this method (set to False to prevent keyboard events from
         creeping through to the editor during debugging)
+        lazy: load the files that don't get the focus without showing them,
+        and finish loading each one the first time it's shown
         """
         # Switch to editor before trying to load a file
         try:
@@ -1974,6 +1997,10 @@ class Editor(SpyderPluginWidget):
         for index, filename in enumerate(filenames):
             # -- Do not open an already opened file
             focus = set_focus and index == 0
+            if lazy and not focus:
+                self.__load_lazily(filename, add_where,
+                                   None if goto is None else goto[index])
+                continue
             current_editor = self.set_current_filename(filename,
                                                        editorwindow,
                                                        focus=focus)
@@ -1996,7 +2023,6 @@ class Editor(SpyderPluginWidget):
                 current_editor.debugger.load_breakpoints()
                 current_editor.set_bookmarks(load_bookmarks(filename))
                 self.register_widget_shortcuts(current_editor)
-                current_es.analyze_script()
                 self.__add_recent_file(filename)
             if goto is not None: # 'word' is assumed to be None as well
                 current_editor.go_to_line(goto[index], word=word,
@@ -2016,6 +2042,28 @@ class Editor(SpyderPluginWidget):
                 pdb_last_step = self.main.ipyconsole.get_pdb_last_step()
                 self.update_pdb_state(current_pdb_state, pdb_last_step)
 
+    def __load_lazily(self, filename, add_where, goto=None):
+        """
+        Load filename in a new tab without showing it.
+
+        Already opened files are left as they are.
+        """
+        editorstack = self.editorstacks[0]
+        if (editorstack.has_filename(filename) is not None
+                or not osp.isfile(filename)):
+            return
+        finfo = editorstack.load(filename, set_current=False,
+                                 add_where=add_where, lazy=True)
+        finfo.path = self.main.get_spyder_pythonpath()
+        self._clone_file_everywhere(finfo)
+        editor = finfo.editor
+        editor.debugger.load_breakpoints()
+        editor.set_bookmarks(load_bookmarks(filename))
+        self.register_widget_shortcuts(editor)
+        self.__add_recent_file(filename)
+        if goto is not None:
+            editor.go_to_line(goto)
+
     @Slot()
     def print_file(self):
         """Print current file"""
@@ -2240,6 +2288,9 @@ class Editor(SpyderPluginWidget):
     @Slot()
     def go_to_next_todo(self):
         self.switch_to_plugin()
+        if not self.get_current_editorstack().get_todo_results():
+            # Only other files have tasks
+            return
         editor = self.get_current_editor()
         position = editor.go_to_next_todo()
         filename = self.get_current_filename()
@@ -2860,14 +2911,6 @@ class Editor(SpyderPluginWidget):
                     self.get_option('autosave_interval') * 1000)
             self.autosave.enabled = self.get_option('autosave_enabled')
 
-            # We must update the current editor after the others:
-            # (otherwise, code analysis buttons state would correspond to the
-            #  last editor instead of showing the one of the current editor)
-            if finfo is not None:
-                # TODO: Connect this to the LSP
-                if todo_n in options and todo_o:
-                    finfo.run_todo_finder()
-
     # --- Open files
     def get_open_filenames(self):
         """Get the list of open files in the current stack"""
@@ -2924,13 +2967,15 @@ class Editor(SpyderPluginWidget):
                     # the last focused file.
                     if index > 0:
                         self.load(filenames[index::-1], goto=clines[index::-1],
-                                  set_focus=False, add_where='start')
+                                  set_focus=False, add_where='start',
+                                  lazy=True)
                     # Then we load the files located to the right of the last
                     # focused file in the tabbar, while keeping the focus on
                     # the last focused file.
                     if index < (len(filenames) - 1):
                         self.load(filenames[index+1:], goto=clines[index:],
-                                  set_focus=False, add_where='end')
+                                  set_focus=False, add_where='end',
+                                  lazy=True)
                     # Finally we load any recovered files at the end of the tabbar,
                     # while keeping focus on the last focused file.
                     if self.autosave.recover_files_to_open:
@@ -2938,12 +2983,12 @@ class Editor(SpyderPluginWidget):
                                   set_focus=False, add_where='end')
                 else:
                     if filenames:
-                        self.load(filenames, goto=clines)
+                        self.load(filenames, goto=clines, lazy=True)
                     if self.autosave.recover_files_to_open:
                         self.load(self.autosave.recover_files_to_open)
             else:
                 if filenames:
-                    self.load(filenames)
+                    self.load(filenames, lazy=True)
                 if self.autosave.recover_files_to_open:
                     self.load(self.autosave.recover_files_to_open)
 
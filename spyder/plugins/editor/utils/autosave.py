@@ -18,7 +18,9 @@ multiple instances of Spyder can run simultaneously.
 
 File contents are compared using their hash. The variable `file_hashes`
 contains the hash of all files currently open in the editor and all autosave
-files.
+files. The hash of the contents of the editor is only computed again when
+their revision changes, so checking files that were not edited is cheap.
+Autosave files are written atomically in a separate thread.
 
 On startup, the contents of the autosave directory is checked and if autosave
 files are found, the user is asked whether to recover them;
@@ -40,7 +42,9 @@ from spyder.config.base import _, get_conf_path, running_under_pytest
 from spyder.plugins.editor.widgets.autosaveerror import AutosaveErrorDialog
 from spyder.plugins.editor.widgets.recover import RecoveryDialog
 from spyder.py3compat import PY2
+from spyder.utils import encoding
 from spyder.utils.programs import is_spyder_process
+from spyder.utils.workers import WorkerManager
 
 
 logger = logging.getLogger(__name__)
@@ -248,6 +252,8 @@ class AutosaveForStack(object):
         self.stack = editorstack
         self.name_mapping = {}
         self.file_hashes = {}
+        # A single thread writes autosave files in the order they're saved
+        self.worker_manager = WorkerManager(max_threads=1, name='Autosave')
 
     def create_unique_autosave_filename(self, filename, autosave_dir):
         """
@@ -388,21 +394,47 @@ class AutosaveForStack(object):
         Autosave a file.
 
         Save a copy in a file with name `self.get_autosave_filename()` and
-        update the cached hash of the autosave file. An error dialog notifies
-        the user of any errors raised when saving.
+        update the cached hash of the autosave file. The copy is written in a
+        separate thread and an error dialog notifies the user of any errors
+        raised when saving.
 
         Args:
             fileinfo (FileInfo): file that is to be autosaved.
         """
         autosave_filename = self.get_autosave_filename(finfo.filename)
         logger.debug('Autosaving %s to %s', finfo.filename, autosave_filename)
-        try:
-            self.stack._write_to_file(finfo, autosave_filename)
-            autosave_hash = self.stack.compute_hash(finfo)
-            self.file_hashes[autosave_filename] = autosave_hash
-        except EnvironmentError as error:
+        text = finfo.editor.get_text_with_eol()
+        # Updated right away so the file is not autosaved again while it's
+        # being written
+        self.file_hashes[autosave_filename] = self.stack.compute_hash(finfo)
+        worker = self.worker_manager.create_python_worker(
+            encoding.write, text, autosave_filename, finfo.encoding)
+        worker.sig_finished.connect(
+            lambda worker, output, error: self.autosave_finished(
+                finfo.filename, autosave_filename, error))
+        worker.start()
+
+    def autosave_finished(self, filename, autosave_filename, error):
+        """
+        Handle the end of writing an autosave file.
+
+        Args:
+            filename (str): name of the autosaved file
+            autosave_filename (str): name of the autosave file
+            error (Exception or None): error raised while writing, if any
+        """
+        if autosave_filename not in self.name_mapping.values():
+            # The autosave file was removed while it was being written
+            try:
+                os.remove(autosave_filename)
+            except EnvironmentError:
+                pass
+            return
+        if error is not None:
+            # Autosave the file again next time
+            self.file_hashes.pop(autosave_filename, None)
             action = (_('Error while autosaving {} to {}')
-                      .format(finfo.filename, autosave_filename))
+                      .format(filename, autosave_filename))
             msgbox = AutosaveErrorDialog(action, error)
             msgbox.exec_if_enabled()
 
@@ -61,6 +61,7 @@ class BlockUserData(QTextBlockUserData):
         self.bookmarks = []
         self.code_analysis = []
         self.todo = ''
+        self.tasks = []
         self.color = color
         self.oedata = None
         self.import_statement = None
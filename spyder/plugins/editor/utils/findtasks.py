@@ -20,14 +20,19 @@ DEBUG_EDITOR = get_debug_level() >= 3
 # =============================================================================
 TASKS_PATTERN = r"(^|#)[ ]*(TODO|FIXME|XXX|HINT|TIP|@todo|" \
                 r"HACK|BUG|OPTIMIZE|!!!|\?\?\?)([^#]*)"
+TASKS_PROG = re.compile(TASKS_PATTERN)
+
+
+def find_line_tasks(text):
+    """Find tasks in a single line of text."""
+    return [todo[-1].strip(' :').capitalize() if todo[-1] else todo[-2]
+            for todo in TASKS_PROG.findall(text)]
 
 
 def find_tasks(source_code):
     """Find tasks in source code (TODO, FIXME, XXX, ...)."""
     results = []
     for line, text in enumerate(source_code.splitlines()):
-        for todo in re.findall(TASKS_PATTERN, text):
-            todo_text = (todo[-1].strip(' :').capitalize() if todo[-1]
-                         else todo[-2])
+        for todo_text in find_line_tasks(text):
             results.append((todo_text, line + 1))
     return results
@@ -14,6 +14,7 @@ import pytest
 # Local imports
 from spyder.plugins.editor.utils.autosave import (AutosaveForStack,
                                                   AutosaveForPlugin)
+from spyder.utils import encoding
 
 
 def test_autosave_component_set_interval(mocker):
@@ -151,12 +152,14 @@ def test_autosave(mocker, have_hash):
     """Test that AutosaveForStack.maybe_autosave writes the contents to the
     autosave file and updates the file_hashes."""
     mock_editor = mocker.Mock()
+    mock_editor.get_text_with_eol.return_value = 'spam'
     mock_fileinfo = mocker.Mock(editor=mock_editor, filename='orig',
-                                newly_created=False)
+                                newly_created=False, encoding='utf-8')
     mock_document = mocker.Mock()
     mock_fileinfo.editor.document.return_value = mock_document
     mock_stack = mocker.Mock(data=[mock_fileinfo])
     addon = AutosaveForStack(mock_stack)
+    mock_manager = mocker.patch.object(addon, 'worker_manager')
     addon.name_mapping = {'orig': 'autosave'}
     addon.file_hashes = {'autosave': 2}
     if have_hash:
@@ -165,7 +168,8 @@ def test_autosave(mocker, have_hash):
 
     addon.maybe_autosave(0)
 
-    mock_stack._write_to_file.assert_called_with(mock_fileinfo, 'autosave')
+    mock_manager.create_python_worker.assert_called_with(
+        encoding.write, 'spam', 'autosave', 'utf-8')
     mock_stack.compute_hash.assert_called_with(mock_fileinfo)
     if have_hash:
         assert addon.file_hashes == {'orig': 1, 'autosave': 3}
@@ -245,14 +249,16 @@ def test_autosave_file_renamed(mocker, tmpdir, have_hash):
     mocker.patch('spyder.plugins.editor.utils.autosave.get_conf_path',
                  return_value=str(tmpdir))
     mock_editor = mocker.Mock()
+    mock_editor.get_text_with_eol.return_value = 'spam'
     mock_fileinfo = mocker.Mock(editor=mock_editor, filename='new_foo.py',
-                                newly_created=False)
+                                newly_created=False, encoding='utf-8')
     mock_document = mocker.Mock()
     mock_fileinfo.editor.document.return_value = mock_document
     mock_stack = mocker.Mock(data=[mock_fileinfo])
     mock_stack.has_filename.return_value = 0
     mock_stack.compute_hash.return_value = 3
     addon = AutosaveForStack(mock_stack)
+    mock_manager = mocker.patch.object(addon, 'worker_manager')
     old_autosavefile = str(tmpdir.join('old_foo.py'))
     new_autosavefile = str(tmpdir.join('new_foo.py'))
     addon.name_mapping = {'old_foo.py': old_autosavefile}
@@ -265,8 +271,8 @@ def test_autosave_file_renamed(mocker, tmpdir, have_hash):
     addon.file_renamed('old_foo.py', 'new_foo.py')
 
     mock_remove.assert_any_call(old_autosavefile)
-    mock_stack._write_to_file.assert_called_with(
-        mock_fileinfo, new_autosavefile)
+    mock_manager.create_python_worker.assert_called_with(
+        encoding.write, 'spam', new_autosavefile, 'utf-8')
     assert addon.name_mapping == {'new_foo.py': new_autosavefile}
     if have_hash:
         assert addon.file_hashes == {'new_foo.py': 1, new_autosavefile: 3}
@@ -279,6 +279,10 @@ class CodeEditor(TextEditBaseWidget):
     #: Signal emitted when the flags need to be updated in the scrollflagarea
     sig_flags_changed = Signal()
 
+    #: Signal emitted when the tasks (TODO, FIXME, ...) found by the
+    #  highlighter change
+    sig_tasks_changed = Signal()
+
     #: Signal emitted when the syntax color theme of the editor.
     sig_theme_colors_changed = Signal(dict)
 
@@ -772,6 +776,7 @@ class CodeEditor(TextEditBaseWidget):
         self.setDocument(editor.document())
         self.document_id = editor.get_document_id()
         self.highlighter = editor.highlighter
+        self.highlighter.sig_tasks_changed.connect(self.sig_tasks_changed)
         self.eol_chars = editor.eol_chars
         self._apply_highlighter_color_scheme()
 
@@ -1731,15 +1736,19 @@ class CodeEditor(TextEditBaseWidget):
 
     def _set_highlighter(self, sh_class):
         self.highlighter_class = sh_class
+        tasks_enabled = True
         if self.highlighter is not None:
             # Removing old highlighter
             # TODO: test if leaving parent/document as is eats memory
+            tasks_enabled = self.highlighter.tasks_enabled
             self.highlighter.setParent(None)
             self.highlighter.setDocument(None)
         self.highlighter = self.highlighter_class(self.document(),
                                                   self.font(),
                                                   self.color_scheme)
+        self.highlighter.tasks_enabled = tasks_enabled
         self.highlighter.sig_new_cell.connect(self.add_to_cell_list)
+        self.highlighter.sig_tasks_changed.connect(self.sig_tasks_changed)
         self._apply_highlighter_color_scheme()
 
         self.highlighter.editor = self
@@ -2258,6 +2267,7 @@ class CodeEditor(TextEditBaseWidget):
         self.document_did_change(text)
 
         if (isinstance(self.highlighter, sh.PygmentsSH)
+                and self.highlighter.document() is not None
                 and not running_under_pytest()):
             self.highlighter.make_charlist()
 
@@ -2691,10 +2701,26 @@ class CodeEditor(TextEditBaseWidget):
 
         return self.get_position('cursor')
 
+    def get_todo_results(self):
+        """
+        Return the tasks found by the highlighter as (text, line number)
+        pairs.
+        """
+        results = []
+        block = self.document().firstBlock()
+        while block.isValid():
+            data = block.userData()
+            if data:
+                line_number = block.blockNumber() + 1
+                results.extend((todo, line_number) for todo in data.tasks)
+            block = block.next()
+        return results
+
     def process_todo(self, todo_results):
         """Process todo finder results"""
         for data in self.blockuserdata_list():
             data.todo = ''
+            data.tasks = []
 
         for message, line_number in todo_results:
             block = self.document().findBlockByNumber(line_number - 1)
@@ -2702,6 +2728,7 @@ class CodeEditor(TextEditBaseWidget):
             if not data:
                 data = BlockUserData(self)
             data.todo = message
+            data.tasks.append(message)
             block.setUserData(data)
         self.sig_flags_changed.emit()
 
@@ -18,6 +18,7 @@ import os
 import os.path as osp
 import sys
 import unicodedata
+import uuid
 
 # Third party imports
 import qdarkstyle
@@ -181,12 +182,23 @@ class FileInfo(QObject):
         self.encoding = encoding
         self.editor = editor
         self.path = []
+        # Lazy files are highlighted, analyzed and registered with the
+        # completion services the first time they are shown
+        self.lazy = False
+        # Increased each time the text changes. Together with `uid`, it
+        # identifies a version of the text
+        self.revision = 0
+        self.uid = uuid.uuid4().hex
+        self._hash_key = None
+        self._hash = None
 
         self.classes = (filename, None, None)
-        self.todo_results = []
+        self._todo_results = []
+        self._todo_results_key = None
         self.lastmodified = QFileInfo(filename).lastModified()
 
         self.editor.textChanged.connect(self.text_changed)
+        self.editor.sig_tasks_changed.connect(self.tasks_changed)
         self.editor.sig_bookmarks_changed.connect(self.bookmarks_changed)
         self.editor.sig_show_object_info.connect(self.sig_show_object_info)
         self.editor.sig_show_completion_object_info.connect(
@@ -205,6 +217,7 @@ class FileInfo(QObject):
     def text_changed(self):
         """Editor's text has changed"""
         self.default = False
+        self.revision += 1
         self.text_changed_at.emit(self.filename,
                                   self.editor.get_position('cursor'))
 
@@ -212,8 +225,60 @@ class FileInfo(QObject):
         """Return associated editor source code"""
         return to_text_string(self.editor.toPlainText())
 
+    def get_hash(self):
+        """
+        Return the hash of the editor's text, with its end-of-line chars.
+
+        The hash is only computed again if the text or its end-of-line
+        chars changed since the last call.
+        """
+        key = (self.revision, self.editor.get_line_separator())
+        if key != self._hash_key:
+            self._hash = hash(self.editor.get_text_with_eol())
+            self._hash_key = key
+        return self._hash
+
+    @property
+    def todo_results(self):
+        """
+        Tasks (TODO, FIXME, ...) of the file as (text, line number) pairs.
+
+        The highlighter finds them while highlighting each block, so they're
+        only collected again after the text or the tasks changed. Lazy files
+        aren't highlighted yet, so their text is scanned instead.
+        """
+        highlighter = self.editor.highlighter
+        if not (self.editor.is_python() and highlighter.tasks_enabled):
+            return []
+        key = (self.revision, self.lazy)
+        if key != self._todo_results_key:
+            if self.lazy:
+                self._todo_results = find_tasks(self.get_source_code())
+            else:
+                self._todo_results = self.editor.get_todo_results()
+            self._todo_results_key = key
+        return self._todo_results
+
+    def tasks_changed(self):
+        """Tasks found by the highlighter have changed"""
+        self._todo_results_key = None
+        self.todo_results_changed.emit()
+
+    def set_todolist_enabled(self, state):
+        """Enable or disable finding the tasks of the file"""
+        highlighter = self.editor.highlighter
+        if highlighter.tasks_enabled == state:
+            return
+        highlighter.tasks_enabled = state
+        if state:
+            # Blocks highlighted while disabled have no tasks
+            self.run_todo_finder()
+        else:
+            self.editor.process_todo([])
+            self.tasks_changed()
+
     def run_todo_finder(self):
-        """Run TODO finder"""
+        """Run TODO finder over the whole file"""
         if self.editor.is_python():
             self.threadmanager.add_thread(find_tasks,
                                           self.todo_finished,
@@ -221,17 +286,8 @@ class FileInfo(QObject):
 
     def todo_finished(self, results):
         """Code analysis thread has finished"""
-        self.set_todo_results(results)
-        self.todo_results_changed.emit()
-
-    def set_todo_results(self, results):
-        """Set TODO results and update markers in editor"""
-        self.todo_results = results
         self.editor.process_todo(results)
-
-    def cleanup_todo_results(self):
-        """Clean-up TODO finder results"""
-        self.todo_results = []
+        self.tasks_changed()
 
     def bookmarks_changed(self):
         """Bookmarks list has changed."""
@@ -534,7 +590,6 @@ class EditorStack(QWidget):
         self.tempfile_path = None
         self.title = _("Editor")
         self.todolist_enabled = True
-        self.is_analysis_done = False
         self.linenumbers_enabled = True
         self.blanks_enabled = False
         self.scrollpastend_enabled = False
@@ -580,12 +635,6 @@ class EditorStack(QWidget):
         self.color_scheme = ccs
         self.__file_status_flag = False
 
-        # Real-time code analysis
-        self.analysis_timer = QTimer(self)
-        self.analysis_timer.setSingleShot(True)
-        self.analysis_timer.setInterval(1000)
-        self.analysis_timer.timeout.connect(self.analyze_script)
-
         # Update filename label
         self.editor_focus_changed.connect(self.update_fname_label)
 
@@ -935,7 +984,6 @@ class EditorStack(QWidget):
     def closeEvent(self, event):
         """Overrides QWidget closeEvent()."""
         self.threadmanager.close_all_threads()
-        self.analysis_timer.timeout.disconnect(self.analyze_script)
 
         # Remove editor references from the outline explorer settings
         if self.outlineexplorer is not None:
@@ -952,8 +1000,8 @@ class EditorStack(QWidget):
         new = other_finfo.newly_created
         finfo = self.create_new_editor(fname, enc, "",
                                        set_current=set_current, new=new,
-                                       cloned_from=other_finfo.editor)
-        finfo.set_todo_results(other_finfo.todo_results)
+                                       cloned_from=other_finfo.editor,
+                                       lazy=other_finfo.lazy)
         return finfo.editor
 
     def clone_from(self, other):
@@ -1134,10 +1182,7 @@ class EditorStack(QWidget):
         if self.data:
             for finfo in self.data:
                 self.__update_editor_margins(finfo.editor)
-                finfo.cleanup_todo_results()
-                if state and current_finfo is not None:
-                    if current_finfo is not finfo:
-                        finfo.run_todo_finder()
+                finfo.set_todolist_enabled(state)
 
     def set_linenumbers_enabled(self, state, current_finfo=None):
         # CONF.get(self.CONF_SECTION, 'line_numbers')
@@ -1906,8 +1951,7 @@ class EditorStack(QWidget):
         Returns:
             int: computed hash.
         """
-        txt = fileinfo.editor.get_text_with_eol()
-        return hash(txt)
+        return fileinfo.get_hash()
 
     def _write_to_file(self, fileinfo, filename):
         """Low-level function for writing text of editor to file.
@@ -1983,7 +2027,6 @@ class EditorStack(QWidget):
 
             finfo.editor.document().setModified(False)
             self.modification_changed(index=index)
-            self.analyze_script(index)
 
             # Rebuild the outline explorer data
             self._refresh_outlineexplorer(index)
@@ -2177,39 +2220,22 @@ class EditorStack(QWidget):
                 self.save(index, save_new_files=save_new_files)
 
     #------ Update UI
-    def start_stop_analysis_timer(self):
-        self.is_analysis_done = False
-        self.analysis_timer.stop()
-        self.analysis_timer.start()
-
-    def analyze_script(self, index=None):
-        """Analyze current script for TODOs."""
-        if self.is_analysis_done:
-            return
-        if index is None:
-            index = self.get_stack_index()
-        if self.data and len(self.data) > index:
-            finfo = self.data[index]
-            if self.todolist_enabled:
-                finfo.run_todo_finder()
-        self.is_analysis_done = True
-
-    def set_todo_results(self, filename, todo_results):
-        """Synchronize todo results between editorstacks"""
-        index = self.has_filename(filename)
-        if index is None:
-            return
-        self.data[index].set_todo_results(todo_results)
-
     def get_todo_results(self):
         if self.data:
             return self.data[self.get_stack_index()].todo_results
 
+    def get_all_todo_results(self):
+        """Return the filename and TODO results of each file with tasks."""
+        return [(finfo.filename, finfo.todo_results) for finfo in self.data
+                if finfo.todo_results]
+
     def current_changed(self, index):
         """Stack index has changed"""
 #        count = self.get_stack_count()
 #        for btn in (self.filelist_btn, self.previous_btn, self.next_btn):
 #            btn.setEnabled(count > 1)
+        if index != -1:
+            self.finish_loading(index)
         editor = self.get_current_editor()
         if editor.completions_available and not editor.document_opened:
             editor.document_did_open()
@@ -2513,10 +2539,13 @@ class EditorStack(QWidget):
         self.reload(index)
 
     def create_new_editor(self, fname, enc, txt, set_current, new=False,
-                          cloned_from=None, add_where='end'):
+                          cloned_from=None, add_where='end', lazy=False):
         """
         Create a new editor instance
         Returns finfo object (instead of editor as in previous releases)
+
+        If *lazy* is True, the text is not highlighted and the file is not
+        registered with the completion services until it's shown.
         """
         editor = codeeditor.CodeEditor(self)
         editor.go_to_definition.connect(
@@ -2583,6 +2612,10 @@ class EditorStack(QWidget):
             folding=self.code_folding_enabled,
         )
         if cloned_from is None:
+            editor.highlighter.tasks_enabled = self.todolist_enabled
+            if lazy:
+                # Highlighting is done by finish_loading
+                editor.highlighter.setDocument(None)
             editor.set_text(txt)
             editor.document().setModified(False)
         finfo.text_changed_at.connect(
@@ -2590,7 +2623,6 @@ class EditorStack(QWidget):
             self.text_changed_at.emit(fname, position))
         editor.sig_cursor_position_changed.connect(
                                            self.editor_cursor_position_changed)
-        editor.textChanged.connect(self.start_stop_analysis_timer)
 
         def perform_completion_request(lang, method, params):
             self.sig_perform_completion_request.emit(lang, method, params)
@@ -2612,6 +2644,17 @@ class EditorStack(QWidget):
         self.refresh_file_dependent_actions.emit()
         self.modification_changed(index=self.data.index(finfo))
 
+        finfo.lazy = lazy
+        if not lazy:
+            self._open_file(finfo)
+        if self.get_stack_index() == 0:
+            self.current_changed(0)
+
+        return finfo
+
+    def _open_file(self, finfo):
+        """Start highlighting and completion services for finfo."""
+        editor = finfo.editor
         # Needs to reset the highlighting on startup in case the PygmentsSH
         # is in use
         editor.run_pygments_highlighter()
@@ -2621,10 +2664,24 @@ class EditorStack(QWidget):
             'codeeditor': editor
         }
         self.sig_open_file.emit(options)
-        if self.get_stack_index() == 0:
-            self.current_changed(0)
 
-        return finfo
+    def finish_loading(self, index):
+        """
+        Finish loading the lazy file at *index*.
+
+        This highlights its text, registers it with the completion services
+        and adds it to the outline explorer.
+        """
+        finfo = self.data[index]
+        if not finfo.lazy:
+            return
+        finfo.lazy = False
+        editor = finfo.editor
+        # Clones share their highlighter with the original editor
+        if editor.highlighter.document() is None:
+            editor.highlighter.setDocument(editor.document())
+        self._open_file(finfo)
+        self._refresh_outlineexplorer(index, update=True)
 
     def editor_cursor_position_changed(self, line, index):
         """Cursor position of one of the editor in the stack has changed"""
@@ -2672,15 +2729,15 @@ class EditorStack(QWidget):
         return finfo
 
     def load(self, filename, set_current=True, add_where='end',
-             processevents=True):
+             processevents=True, lazy=False):
         """
         Load filename, create an editor instance and return it
 
         This also sets the hash of the loaded file in the autosave component.
 
-        *Warning* This is loading file, creating editor but not executing
-        the source code analysis -- the analysis must be done by the editor
-        plugin (in case multiple editorstack instances are handled)
+        If *lazy* is True, highlighting, completion services and the outline
+        explorer are set up by finish_loading the first time the file is
+        shown.
         """
         filename = osp.abspath(to_text_string(filename))
         if processevents:
@@ -2688,9 +2745,10 @@ class EditorStack(QWidget):
         text, enc = encoding.read(filename)
         self.autosave.file_hashes[filename] = hash(text)
         finfo = self.create_new_editor(filename, enc, text, set_current,
-                                       add_where=add_where)
+                                       add_where=add_where, lazy=lazy)
         index = self.data.index(finfo)
-        self._refresh_outlineexplorer(index, update=True)
+        if not finfo.lazy:
+            self._refresh_outlineexplorer(index, update=True)
         if processevents:
             self.ending_long_process.emit("")
         if self.isVisible() and self.checkeolchars_enabled \
@@ -2706,8 +2764,6 @@ class EditorStack(QWidget):
                     self)
             self.msgbox.exec_()
             self.set_os_eol_chars(index)
-        self.is_analysis_done = False
-        self.analyze_script(index)
         return finfo
 
     def set_os_eol_chars(self, index=None, osname=None):
@@ -3415,7 +3471,6 @@ class EditorPluginExample(QSplitter):
         QApplication.processEvents()
         editorstack = self.editorstacks[0]
         editorstack.load(fname)
-        editorstack.analyze_script()
 
     def register_editorstack(self, editorstack):
         logger.debug("FakePlugin.register_editorstack: %r" % editorstack)
@@ -14,7 +14,7 @@ from spyder.config.base import _
 from spyder.py3compat import to_text_string
 from spyder.utils import icon_manager as ima
 from spyder.utils.workers import WorkerManager
-from spyder.utils.vcs import get_git_refs
+from spyder.utils.vcs import GIT_STATES, get_git_refs
 from spyder.widgets.status import StatusBarWidget
 
 
@@ -73,14 +73,16 @@ class VCSStatus(StatusBarWidget):
     def __init__(self, parent, statusbar):
         super(VCSStatus, self).__init__(parent, statusbar,
                                         icon=ima.icon('code_fork'))
-        self._worker_manager = WorkerManager(max_threads=1)
+        self._worker_manager = WorkerManager(max_threads=1, name='VCS status')
         self._git_is_working = None
         self._git_job_queue = None
         self._last_git_job = None
+        self._saved_files = set()
 
     def update_vcs_state(self, idx, fname, fname2):
-        """Update vcs status."""
-        self.update_vcs(fname, None)
+        """Update vcs status after saving a file."""
+        self._saved_files.add(fname)
+        self.update_vcs(fname, None, force=True)
 
     def update_vcs(self, fname, index, force=False):
         """Update vcs status."""
@@ -92,16 +94,20 @@ class VCSStatus(StatusBarWidget):
             self._git_job_queue = (fname, index)
         else:
             self._worker_manager.terminate_all()
+            saved = fname in self._saved_files
+            self._saved_files.discard(fname)
             worker = self._worker_manager.create_python_worker(
-                self.get_git_refs, fname)
+                self.get_git_refs, fname, saved)
             worker.sig_finished.connect(self.process_git_data)
             self._last_git_job = (fname, index)
             self._git_job_queue = None
             self._git_is_working = True
             worker.start()
 
-    def get_git_refs(self, fname):
+    def get_git_refs(self, fname, saved=False):
         """Get Git active branch, state, branches (plus tags)."""
+        if saved:
+            GIT_STATES.update_file(fname)
         return get_git_refs(osp.dirname(fname))
 
     def process_git_data(self, worker, output, error):
@@ -688,15 +688,19 @@ def test_autosave_all(editor_bot, mocker):
     assert actual_calls == expected_calls
 
 
-def test_maybe_autosave(editor_bot):
+def test_maybe_autosave(editor_bot, mocker, qtbot):
     """
     Test that maybe_autosave() saves text to correct autosave file if contents
     are changed.
     """
     editor_stack, editor = editor_bot
     editor.set_text('spam\n')
+    autosave_finished = mocker.spy(editor_stack.autosave, 'autosave_finished')
     editor_stack.autosave.maybe_autosave(0)
-    contents = open(os.path.join(get_conf_path('autosave'), 'foo.py')).read()
+    autosave_filename = os.path.join(get_conf_path('autosave'), 'foo.py')
+
+    qtbot.waitUntil(lambda: autosave_finished.called)
+    contents = open(autosave_filename).read()
     assert contents == 'spam\n'
 
 
@@ -710,23 +714,42 @@ def test_maybe_autosave_saves_only_if_changed(editor_bot, mocker):
     call #3 should not autosave.
     """
     editor_stack, editor = editor_bot
-    mocker.patch.object(editor_stack, '_write_to_file')
+    mock_manager = mocker.patch.object(editor_stack.autosave,
+                                       'worker_manager')
     editor_stack.autosave.maybe_autosave(0)  # call #1, should not write
-    assert editor_stack._write_to_file.call_count == 0
+    assert mock_manager.create_python_worker.call_count == 0
     editor.set_text('ham\n')
     editor_stack.autosave.maybe_autosave(0)  # call #2, should write
-    assert editor_stack._write_to_file.call_count == 1
+    assert mock_manager.create_python_worker.call_count == 1
     editor_stack.autosave.maybe_autosave(0)  # call #3, should not write
-    assert editor_stack._write_to_file.call_count == 1
+    assert mock_manager.create_python_worker.call_count == 1
+
+
+def test_maybe_autosave_hashes_only_if_changed(editor_bot, mocker):
+    """
+    Test that the text of files is only hashed again after it changes.
+    """
+    editor_stack, editor = editor_bot
+    mocker.patch.object(editor_stack.autosave, 'worker_manager')
+    mocker.spy(editor, 'get_text_with_eol')
+    editor_stack.autosave.maybe_autosave(0)
+    editor_stack.autosave.maybe_autosave(0)
+    assert editor.get_text_with_eol.call_count == 1
+    editor.set_text('ham\n')
+    editor_stack.autosave.maybe_autosave(0)
+    editor_stack.autosave.maybe_autosave(0)
+    # Once to compute the hash and once to write the file
+    assert editor.get_text_with_eol.call_count == 3
 
 
 def test_maybe_autosave_does_not_save_new_files(editor_bot, mocker):
     """Test that maybe_autosave() does not save newly created files."""
     editor_stack, editor = editor_bot
     editor_stack.data[0].newly_created = True
-    mocker.patch.object(editor_stack, '_write_to_file')
+    mock_manager = mocker.patch.object(editor_stack.autosave,
+                                       'worker_manager')
     editor_stack.autosave.maybe_autosave(0)
-    editor_stack._write_to_file.assert_not_called()
+    mock_manager.create_python_worker.assert_not_called()
 
 
 def test_opening_sets_file_hash(base_editor_bot, mocker):
@@ -779,10 +802,11 @@ def test_maybe_autosave_does_not_save_after_open(base_editor_bot, mocker,
     mocker.patch('spyder.plugins.editor.widgets.editor.encoding.read',
                  return_value=('spam\n', 42))
     editor_stack.load(filename)
-    mocker.patch.object(editor_stack, '_write_to_file')
+    mock_manager = mocker.patch.object(editor_stack.autosave,
+                                       'worker_manager')
     qtbot.wait(100)  # Wait for PygmentsSH.makeCharlist() if applicable
     editor_stack.autosave.maybe_autosave(0)
-    editor_stack._write_to_file.assert_not_called()
+    mock_manager.create_python_worker.assert_not_called()
 
 
 def test_maybe_autosave_does_not_save_after_reload(base_editor_bot, mocker):
@@ -796,29 +820,31 @@ def test_maybe_autosave_does_not_save_after_reload(base_editor_bot, mocker):
     editor_stack = base_editor_bot
     txt = 'spam\n'
     editor_stack.create_new_editor('ham.py', 'ascii', txt, set_current=True)
-    mocker.patch.object(editor_stack, '_write_to_file')
+    mock_manager = mocker.patch.object(editor_stack.autosave,
+                                       'worker_manager')
     mocker.patch('spyder.plugins.editor.widgets.editor.encoding.read',
                  return_value=(txt, 'ascii'))
     editor_stack.reload(0)
     editor_stack.autosave.maybe_autosave(0)
-    editor_stack._write_to_file.assert_not_called()
+    mock_manager.create_python_worker.assert_not_called()
 
 
 def test_autosave_updates_name_mapping(editor_bot, mocker, qtbot):
     """Test that maybe_autosave() updates name_mapping."""
     editor_stack, editor = editor_bot
     assert editor_stack.autosave.name_mapping == {}
-    mocker.patch.object(editor_stack, '_write_to_file')
+    mocker.patch.object(editor_stack.autosave, 'worker_manager')
     editor.set_text('spam\n')
     editor_stack.autosave.maybe_autosave(0)
     expected = {'foo.py': os.path.join(get_conf_path('autosave'), 'foo.py')}
     assert editor_stack.autosave.name_mapping == expected
 
 
-def test_maybe_autosave_handles_error(editor_bot, mocker):
+def test_maybe_autosave_handles_error(editor_bot, mocker, qtbot):
     """Test that autosave() ignores errors when writing to file."""
     editor_stack, editor = editor_bot
-    mock_write = mocker.patch.object(editor_stack, '_write_to_file')
+    mock_write = mocker.patch(
+        'spyder.plugins.editor.utils.autosave.encoding.write')
     mock_dialog = mocker.patch(
         'spyder.plugins.editor.utils.autosave.AutosaveErrorDialog')
     try:
@@ -827,7 +853,7 @@ def test_maybe_autosave_handles_error(editor_bot, mocker):
         mock_write.side_effect = IOError
     editor.set_text('spam\n')
     editor_stack.autosave.maybe_autosave(0)
-    assert mock_dialog.called
+    qtbot.waitUntil(lambda: mock_dialog.called)
 
 
 def test_remove_autosave_file(editor_bot, mocker, qtbot):
@@ -839,10 +865,12 @@ def test_remove_autosave_file(editor_bot, mocker, qtbot):
     editor_stack, editor = editor_bot
     autosave = editor_stack.autosave
     editor.set_text('spam\n')
+    autosave_finished = mocker.spy(autosave, 'autosave_finished')
 
     autosave.maybe_autosave(0)
 
     autosave_filename = os.path.join(get_conf_path('autosave'), 'foo.py')
+    qtbot.waitUntil(lambda: autosave_finished.called)
     assert os.access(autosave_filename, os.R_OK)
     expected = {'foo.py': autosave_filename}
     assert autosave.name_mapping == expected
@@ -853,5 +881,73 @@ def test_remove_autosave_file(editor_bot, mocker, qtbot):
     assert autosave.name_mapping == {}
 
 
+def test_lazy_load(base_editor_bot, tmpdir, qtbot):
+    """
+    Test that lazy files are only highlighted and opened for completions
+    when they are shown for the first time.
+    """
+    editor_stack = base_editor_bot
+    qtbot.addWidget(editor_stack)
+    sig_open_file = Mock()
+    editor_stack.sig_open_file.connect(sig_open_file)
+    filenames = []
+    for name in ['first.py', 'second.py']:
+        path = tmpdir.join(name)
+        path.write('x = 1\n')
+        filenames.append(str(path))
+
+    editor_stack.load(filenames[0])
+    finfo = editor_stack.load(filenames[1], set_current=False, lazy=True)
+    editor = finfo.editor
+    assert finfo.lazy
+    assert editor.get_text_with_eol() == 'x = 1\n'
+    assert editor.highlighter.document() is None
+    assert sig_open_file.call_count == 1
+
+    editor_stack.set_stack_index(1)
+    assert not finfo.lazy
+    assert editor.highlighter.document() is editor.document()
+    assert sig_open_file.call_count == 2
+    assert sig_open_file.call_args[0][0]['filename'] == filenames[1]
+
+
+def test_todo_results(base_editor_bot, tmpdir, qtbot):
+    """
+    Test that tasks are found by the highlighter, including those of lazy
+    files, and that they can be disabled.
+
+    All the tasks of a line are found, also at the start of docstring lines.
+    """
+    editor_stack = base_editor_bot
+    qtbot.addWidget(editor_stack)
+    first = tmpdir.join('first.py')
+    first.write('x = 1  # TODO: fix this # BUG: and this\n'
+                '"TODO: not a comment"\n'
+                '"""\nHACK: in a docstring\n"""\n')
+    second = tmpdir.join('second.py')
+    second.write('# FIXME later\ny = 2\n')
+
+    finfo = editor_stack.load(str(first))
+    lazy_finfo = editor_stack.load(str(second), set_current=False, lazy=True)
+    results = [('Fix this', 1), ('And this', 1), ('In a docstring', 4)]
+    qtbot.waitUntil(lambda: finfo.todo_results == results)
+    assert lazy_finfo.todo_results == [('Later', 1)]
+    assert editor_stack.get_all_todo_results() == [
+        (str(first), results), (str(second), [('Later', 1)])]
+
+    # Tasks follow the text as it's edited
+    editor = finfo.editor
+    with qtbot.waitSignal(finfo.todo_results_changed):
+        editor.go_to_line(1)
+        editor.insert_text('# XXX new task\n')
+    assert finfo.todo_results == [
+        ('New task', 1), ('Fix this', 2), ('And this', 2),
+        ('In a docstring', 5)]
+
+    editor_stack.set_todolist_enabled(False)
+    assert finfo.todo_results == []
+    assert not any(data.todo for data in editor.blockuserdata_list())
+
+
 if __name__ == "__main__":
     pytest.main(['test_editor.py'])
@@ -25,7 +25,7 @@ import sys
 from qtpy.compat import getexistingdirectory, getsavefilename
 from qtpy.QtCore import (QDir, QFileInfo, QMimeData, QSize,
                          QSortFilterProxyModel, Qt, QTimer, QUrl, Signal, Slot)
-from qtpy.QtGui import QDrag, QKeySequence
+from qtpy.QtGui import QColor, QDrag, QKeySequence
 from qtpy.QtWidgets import (QApplication, QFileIconProvider, QFileSystemModel,
                             QHBoxLayout, QInputDialog, QLabel, QLineEdit,
                             QMenu, QMessageBox, QToolButton, QTreeView,
@@ -41,6 +41,7 @@ from spyder.utils import misc, programs, vcs
 from spyder.utils.misc import getcwd_or_home
 from spyder.utils.qthelpers import (add_actions, create_action,
                                     create_plugin_layout, file_uri)
+from spyder.utils.workers import WorkerManager
 
 try:
     from nbconvert import PythonExporter as nbexporter
@@ -70,6 +71,29 @@ def show_in_external_file_explorer(fnames=None):
         open_file_in_external_explorer(fname)
 
 
+# Colors of the files with these Git status codes
+VCS_STATUS_COLORS = {
+    'M': '#e5a50a',
+    'R': '#e5a50a',
+    'A': '#26a269',
+    '?': '#26a269',
+    'D': '#e01b24',
+    'U': '#e01b24',
+}
+
+# Shared by all views, so they get one state at a time
+_VCS_WORKER_MANAGER = None
+
+
+def get_vcs_worker_manager():
+    """Return the worker manager used to get VCS states"""
+    global _VCS_WORKER_MANAGER
+    if _VCS_WORKER_MANAGER is None:
+        _VCS_WORKER_MANAGER = WorkerManager(max_threads=1,
+                                            name='File explorer VCS')
+    return _VCS_WORKER_MANAGER
+
+
 def fixpath(path):
     """Normalize path fixing case, making absolute and removing symlinks"""
     norm = osp.normcase if os.name == 'nt' else osp.normpath
@@ -139,6 +163,35 @@ class IconProvider(QFileIconProvider):
             return icon
 
 
+class FileSystemModel(QFileSystemModel):
+    """File system model that colors files by their VCS status"""
+
+    def __init__(self, parent=None):
+        super(FileSystemModel, self).__init__(parent)
+        self.vcs_state = None
+
+    def set_vcs_state(self, state):
+        """Set the vcs.GitState used to color files, or None"""
+        self.vcs_state = state
+
+    def get_vcs_status(self, index):
+        """Return the VCS status code of the file at index, or None"""
+        if self.vcs_state is None or not index.isValid():
+            return None
+        path = osp.normpath(to_text_string(self.filePath(index)))
+        return self.vcs_state.get_file_status(path)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Reimplement Qt method"""
+        if role == Qt.ForegroundRole and index.column() == 0:
+            status = self.get_vcs_status(index)
+            if status:
+                code = status.strip()[0]
+                if code in VCS_STATUS_COLORS:
+                    return QColor(VCS_STATUS_COLORS[code])
+        return super(FileSystemModel, self).data(index, role)
+
+
 class DirView(QTreeView):
     """Base file/directory tree view"""
     sig_edit = Signal(str)
@@ -186,7 +239,7 @@ class DirView(QTreeView):
         """Setup filesystem model"""
         filters = (QDir.AllDirs | QDir.Files | QDir.Drives
                    | QDir.NoDotAndDotDot | QDir.Hidden)
-        self.fsmodel = QFileSystemModel(self)
+        self.fsmodel = FileSystemModel(self)
         self.fsmodel.setFilter(filters)
         self.fsmodel.setNameFilterDisables(False)
 
@@ -637,6 +690,17 @@ class DirView(QTreeView):
 
         return QTreeView.viewportEvent(self, event)
 
+    def showEvent(self, event):
+        """Reimplement Qt method"""
+        # Pick up commits and checkouts done outside Spyder
+        self.refresh_vcs_state()
+        super(DirView, self).showEvent(event)
+
+    def focusInEvent(self, event):
+        """Reimplement Qt method"""
+        self.refresh_vcs_state()
+        super(DirView, self).focusInEvent(event)
+
     def contextMenuEvent(self, event):
         """Override Qt method"""
         # Needed to handle not initialized menu.
@@ -1346,6 +1410,32 @@ class DirView(QTreeView):
         if index is not None:
             self.setRowHidden(index.row(), index.parent(), True)
 
+    #---- VCS state
+    def refresh_vcs_state(self, path=None):
+        """
+        Get the state of the repository of path, or of the root folder, in
+        a worker thread
+        """
+        if path is None:
+            path = to_text_string(self.fsmodel.rootPath())
+            if not osp.isabs(path):
+                # The root folder wasn't set yet
+                return
+        if path is None or vcs.get_git_root(path) is None:
+            self._set_vcs_state(None, None, None)
+            return
+        worker = get_vcs_worker_manager().create_python_worker(
+            vcs.get_git_state, path)
+        worker.sig_finished.connect(self._set_vcs_state)
+        worker.start()
+
+    def _set_vcs_state(self, worker, output, error):
+        """Color files with the VCS state received from the worker"""
+        if output is self.fsmodel.vcs_state:
+            return
+        self.fsmodel.set_vcs_state(output)
+        self.viewport().update()
+
 
 class ProxyModel(QSortFilterProxyModel):
     """Proxy model: filters tree view"""
@@ -1417,6 +1507,7 @@ class FilteredDirView(DirView):
         index = self.fsmodel.setRootPath(root_path)
         self.proxymodel.setup_filter(self.root_path, [])
         self.setRootIndex(self.proxymodel.mapFromSource(index))
+        self.refresh_vcs_state(root_path)
 
     def get_index(self, filename):
         """Return index associated with filename"""
@@ -1505,6 +1596,7 @@ class ExplorerTreeWidget(DirView):
         """Set current folder and return associated model index"""
         index = self.fsmodel.setRootPath(folder)
         self.__last_folder = folder
+        self.refresh_vcs_state(folder)
         if self.show_cd_only:
             if self.__original_root_index is None:
                 self.__original_root_index = self.rootIndex()
@@ -16,18 +16,20 @@ from qtpy.QtCore import QUrl, Signal, Slot
 from qtpy.QtWidgets import (QActionGroup, QComboBox, QHBoxLayout,
                             QLabel, QLineEdit, QMessageBox)
 from qtpy.QtWebEngineWidgets import QWebEnginePage, WEBENGINE
+from spyder_kernels.utils.dochelpers import getdoc
 
 # Local imports
 from spyder.config.base import (_, get_conf_path, get_image_path,
                                 get_module_source_path)
 from spyder.config.fonts import DEFAULT_SMALL_DELTA
 from spyder.api.plugins import SpyderPluginWidget
-from spyder.py3compat import get_meth_class_inst, to_text_string
+from spyder.py3compat import builtins, get_meth_class_inst, to_text_string
 from spyder.utils import icon_manager as ima
 from spyder.utils import programs
 from spyder.plugins.help.utils.sphinxify import (CSS_PATH,
                                                  generate_context,
-                                                 loading, usage, warning)
+                                                 loading, RenderCache,
+                                                 usage, warning)
 from spyder.utils.qthelpers import (add_actions, create_action,
                                     create_toolbutton, create_plugin_layout,
                                     MENU_SEPARATOR)
@@ -36,6 +38,15 @@ from spyder.plugins.help.utils.sphinxthread import SphinxThread
 from spyder.plugins.help.widgets import PlainText, RichText, ObjectComboBox
 
 
+# Builtins whose documentation is rendered in the background on startup, so
+# it's shown right away the first time it's requested
+PRERENDERED_BUILTINS = [
+    'abs', 'any', 'all', 'dict', 'enumerate', 'float', 'getattr',
+    'isinstance', 'int', 'len', 'list', 'max', 'min', 'open', 'print',
+    'range', 'round', 'set', 'sorted', 'str', 'sum', 'tuple', 'type', 'zip',
+]
+
+
 class Help(SpyderPluginWidget):
     """
     Docstrings viewer widget
@@ -44,6 +55,7 @@ class Help(SpyderPluginWidget):
     CONFIGWIDGET_CLASS = HelpConfigPage
     CONF_FILE = False
     LOG_PATH = get_conf_path(CONF_SECTION)
+    CACHE_PATH = get_conf_path('help_render_cache.json')
     FONT_SIZE_DELTA = DEFAULT_SMALL_DELTA
     DISABLE_ACTIONS_WHEN_HIDDEN = False  # SpyderPluginWidget class attribute
 
@@ -165,10 +177,12 @@ class Help(SpyderPluginWidget):
         self.setLayout(layout)
 
         # Add worker thread for handling rich text rendering
+        self._render_cache = RenderCache(self.CACHE_PATH)
         self._sphinx_thread = SphinxThread(
                               html_text_no_doc=warning(self.no_doc_string,
                                                        css_path=self.css_path),
-                              css_path=self.css_path)
+                              css_path=self.css_path,
+                              cache=self._render_cache)
         self._sphinx_thread.html_ready.connect(
                                              self._on_sphinx_thread_html_ready)
         self._sphinx_thread.error_msg.connect(self._on_sphinx_thread_error_msg)
@@ -223,6 +237,14 @@ class Help(SpyderPluginWidget):
             self._starting_up = False
             self.switch_to_rich_text()
             self.show_intro_message()
+            if self.rich_help:
+                self.prerender_builtins()
+
+    def closing_plugin(self, cancelable=False):
+        """Perform actions before parent main window is closed"""
+        self._sphinx_thread.close()
+        self._render_cache.save()
+        return True
 
     def update_font(self):
         """Update font from Preferences"""
@@ -672,6 +694,13 @@ class Help(SpyderPluginWidget):
                                    dname, css_path=self.css_path)
         self.show_loading_message()
 
+    def prerender_builtins(self):
+        """Render the documentation of common builtins in the background"""
+        docs = [getdoc(getattr(builtins, name))
+                for name in PRERENDERED_BUILTINS]
+        self._sphinx_thread.prerender(docs, self.get_option('math'),
+                                      css_path=self.css_path)
+
     def _on_sphinx_thread_html_ready(self, html_text):
         """Set our sphinx documentation based on thread result"""
         self._sphinx_thread.wait()
@@ -25,6 +25,7 @@ from flaky import flaky
 
 # Local imports
 from spyder.plugins.help.plugin import Help
+from spyder.plugins.help.utils.sphinxify import RenderCache
 from spyder.plugins.completion.fallback.utils import default_info_response
 
 
@@ -137,5 +138,40 @@ def test_help_opens_when_show_tutorial_unit(help_plugin, qtbot):
     assert mock_show_rich_text.call_count == 2
 
 
+@pytest.mark.skipif(PYQT_VERSION > '5.10', reason='Segfaults in PyQt 5.10+')
+def test_render_cache(help_plugin, qtbot, tmpdir):
+    """Test that rendered docs are cached and kept between sessions."""
+    cache_path = str(tmpdir.join('render_cache.json'))
+    cache = RenderCache(cache_path)
+    help_plugin._render_cache = cache
+    sphinx_thread = help_plugin._sphinx_thread
+    sphinx_thread.cache = cache
+    doc = {'name': 'foo', 'argspec': '(x)', 'note': 'Function of bar',
+           'docstring': 'Foo does *nothing*.'}
+
+    with qtbot.waitSignal(sphinx_thread.html_ready, timeout=30000) as blocker:
+        help_plugin.render_sphinx_doc(doc)
+    html = blocker.args[0]
+    assert 'Foo does' in html
+    assert len(cache.entries) == 1
+
+    # The same Sphinx application is reused for other docs
+    app = sphinx_thread.renderer.app
+    other_doc = dict(doc, docstring='Foo does *something*.')
+    with qtbot.waitSignal(sphinx_thread.html_ready, timeout=30000):
+        help_plugin.render_sphinx_doc(other_doc)
+    assert sphinx_thread.renderer.app is app
+    assert len(cache.entries) == 2
+
+    # Rendering the first doc again gives the cached result
+    with qtbot.waitSignal(sphinx_thread.html_ready, timeout=30000) as blocker:
+        help_plugin.render_sphinx_doc(doc)
+    assert blocker.args[0] == html
+
+    help_plugin.closing_plugin()
+    assert sphinx_thread.renderer.app is None
+    assert RenderCache(cache_path).entries == cache.entries
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -21,7 +21,11 @@ part of the `SageMath <https://www.sagemath.org/>`_ system.
 """
 
 # Standard library imports
+from collections import OrderedDict
 import codecs
+import hashlib
+import json
+import logging
 import os
 import os.path as osp
 import shutil
@@ -36,6 +40,7 @@ import sphinx
 from sphinx.application import Sphinx
 
 # Local imports
+from spyder import __version__ as spyder_version
 from spyder.config.base import (_, get_module_data_path,
                                 get_module_source_path)
 from spyder.py3compat import PY2
@@ -46,6 +51,9 @@ if PY2:
 else:
     import pathlib
 
+
+logger = logging.getLogger(__name__)
+
 #-----------------------------------------------------------------------------
 # Globals and constants
 #-----------------------------------------------------------------------------
@@ -70,6 +78,11 @@ JQUERY_PATH = get_module_data_path('spyder',
                                                     JS_PATH),
                                    attr_name='JQUERYPATH')
 
+# Message shown when Sphinx can't render a docstring
+RENDER_ERROR = _("It was not possible to generate rich text help for this "
+                 "object.</br>"
+                 "Please see it in plain text.")
+
 #-----------------------------------------------------------------------------
 # Utility functions
 #-----------------------------------------------------------------------------
@@ -80,6 +93,12 @@ def is_sphinx_markup(docstring):
     return ("`" in docstring or "::" in docstring)
 
 
+def has_images(docstring):
+    """Returns whether a docstring can show images."""
+    return ("image::" in docstring or "figure::" in docstring or
+            "<img" in docstring)
+
+
 def warning(message, css_path=CSS_PATH):
     """Print a warning message on the rich text view"""
     env = Environment()
@@ -163,7 +182,177 @@ def generate_context(name='', argspec='', note='', math=False, collapse=False,
     return context
 
 
-def sphinxify(docstring, context, buildername='html'):
+class SphinxRenderer(object):
+    """
+    Sphinx application kept alive between renders.
+
+    Creating a Sphinx application takes much longer than building a single
+    document with it, so the same application is used for all docstrings
+    until the math option changes or a build fails.
+    """
+
+    def __init__(self, buildername='html'):
+        self.buildername = buildername
+        self.app = None
+        self.math = None
+        self.srcdir = None
+        self.confdir = None
+        self.temp_confdir_needed = False
+
+    def _create_app(self, context):
+        """Create the Sphinx application and its directories."""
+        confdir = osp.join(get_module_source_path('spyder.plugins.help.utils'))
+        srcdir = mkdtemp()
+        srcdir = encoding.to_unicode_from_fs(srcdir)
+        temp_confdir_needed = False
+
+        if os.name == 'nt':
+            # Check if confdir and srcdir are in the same drive
+            # See spyder-ide/spyder#11762
+            drive_confdir = pathlib.Path(confdir).parts[0]
+            drive_srcdir = pathlib.Path(srcdir).parts[0]
+            temp_confdir_needed = drive_confdir != drive_srcdir
+
+            if temp_confdir_needed:
+                confdir = mkdtemp()
+                confdir = encoding.to_unicode_from_fs(confdir)
+                generate_configuration(confdir)
+
+        self.srcdir = srcdir
+        self.confdir = confdir
+        self.temp_confdir_needed = temp_confdir_needed
+
+        # Sphinx needs the master document to exist when it's created
+        self._write_docstring('')
+
+        destdir = osp.join(srcdir, '_build')
+        doctreedir = osp.join(srcdir, 'doctrees')
+        confoverrides = {'html_context': context}
+        self.app = Sphinx(srcdir, confdir, destdir, doctreedir,
+                          self.buildername, confoverrides, status=None,
+                          warning=None, freshenv=True, warningiserror=False,
+                          tags=None)
+        # The math extension is selected when the configuration is read
+        self.math = context['math_on']
+
+    def _write_docstring(self, docstring):
+        rst_name = osp.join(self.srcdir, 'docstring.rst')
+        doc_file = codecs.open(rst_name, 'w', encoding='utf-8')
+        doc_file.write(docstring)
+        doc_file.close()
+        return rst_name
+
+    def build(self, docstring, context):
+        """
+        Build `docstring` and return its output.
+
+        Returns None if Sphinx didn't generate an output file.
+        """
+        if self.app is None or self.math != context['math_on']:
+            self.close()
+            self._create_app(context)
+
+        rst_name = self._write_docstring(docstring)
+        self.app.config.html_context = context
+        # Force Sphinx to read the docstring again, even if its file has
+        # the same modification time as the previous one
+        self.app.env.all_docs.pop('docstring', None)
+        try:
+            self.app.build(False, [rst_name])
+        except Exception:
+            # Don't reuse an application left in an unknown state
+            self.close()
+            raise
+
+        if self.buildername == 'html':
+            suffix = '.html'
+        else:
+            suffix = '.txt'
+        output_name = osp.join(self.srcdir, '_build', 'docstring' + suffix)
+        if osp.exists(output_name):
+            with codecs.open(output_name, 'r', encoding='utf-8') as f:
+                return f.read()
+
+    def close(self):
+        """Remove the Sphinx application and its directories."""
+        if self.temp_confdir_needed:
+            shutil.rmtree(self.confdir, ignore_errors=True)
+        if self.srcdir is not None:
+            shutil.rmtree(self.srcdir, ignore_errors=True)
+        self.app = None
+        self.math = None
+        self.srcdir = None
+        self.confdir = None
+        self.temp_confdir_needed = False
+
+
+class RenderCache(object):
+    """
+    Least recently used cache of rendered docstrings.
+
+    Entries are kept while Sphinx's and Spyder's versions stay the same, so
+    they can be saved and reused in later sessions.
+    """
+
+    VERSION = 1
+    MAX_ENTRIES = 200
+
+    def __init__(self, path=None, max_entries=MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self._modified = False
+        if path is None:
+            return
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if (data.get('version') == self.VERSION and
+                    data.get('sphinx') == sphinx.__version__ and
+                    data.get('spyder') == spyder_version):
+                self.entries = OrderedDict(data['entries'])
+        except (IOError, OSError, ValueError, KeyError, TypeError,
+                AttributeError):
+            pass
+
+    @staticmethod
+    def get_key(docstring, context, buildername='html'):
+        """Return the key of `docstring` rendered with `context`."""
+        data = json.dumps([docstring, context, buildername], sort_keys=True)
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Return the output cached for `key`, or None."""
+        output = self.entries.pop(key, None)
+        if output is not None:
+            self.entries[key] = output
+        return output
+
+    def set(self, key, output):
+        """Cache `output` for `key`."""
+        self.entries.pop(key, None)
+        self.entries[key] = output
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self._modified = True
+
+    def save(self):
+        """Save the cache to disk, if it changed."""
+        if self.path is None or not self._modified:
+            return
+        data = {'version': self.VERSION,
+                'sphinx': sphinx.__version__,
+                'spyder': spyder_version,
+                'entries': list(self.entries.items())}
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(data, f)
+            self._modified = False
+        except (IOError, OSError) as error:
+            logger.debug("Unable to save Help render cache: %s", error)
+
+
+def sphinxify(docstring, context, buildername='html', renderer=None):
     """
     Runs Sphinx on a docstring and outputs the processed documentation.
 
@@ -179,38 +368,16 @@ def sphinxify(docstring, context, buildername='html'):
     buildername:  str
         It can be either `html` or `text`.
 
+    renderer : SphinxRenderer
+        Renderer to reuse. If None, a new one is created and removed after
+        processing the docstring.
+
     Returns
     -------
     An Sphinx-processed string, in either HTML or plain text format, depending
     on the value of `buildername`
     """
 
-    confdir = osp.join(get_module_source_path('spyder.plugins.help.utils'))
-    srcdir = mkdtemp()
-    srcdir = encoding.to_unicode_from_fs(srcdir)
-    destdir = osp.join(srcdir, '_build')
-    temp_confdir_needed = False
-
-    if os.name == 'nt':
-        # Check if confdir and srcdir are in the same drive
-        # See spyder-ide/spyder#11762
-        drive_confdir = pathlib.Path(confdir).parts[0]
-        drive_srcdir = pathlib.Path(srcdir).parts[0]
-        temp_confdir_needed = drive_confdir != drive_srcdir
-
-        if temp_confdir_needed:
-            # TODO: This may be inefficient. Find a faster way to do it.
-            confdir = mkdtemp()
-            confdir = encoding.to_unicode_from_fs(confdir)
-            generate_configuration(confdir)
-
-    rst_name = osp.join(srcdir, 'docstring.rst')
-    if buildername == 'html':
-        suffix = '.html'
-    else:
-        suffix = '.txt'
-    output_name = osp.join(destdir, 'docstring' + suffix)
-
     # This is needed so users can type \\ on latex eqnarray envs inside raw
     # docstrings
     if context['right_sphinx_version'] and context['math_on']:
@@ -230,38 +397,22 @@ def sphinxify(docstring, context, buildername='html'):
                          '<span class="argspec-highlight">' + char + '</span>')
     context['argspec'] = argspec
 
-    doc_file = codecs.open(rst_name, 'w', encoding='utf-8')
-    doc_file.write(docstring)
-    doc_file.close()
-
-    confoverrides = {'html_context': context}
-
-    doctreedir = osp.join(srcdir, 'doctrees')
-
-    sphinx_app = Sphinx(srcdir, confdir, destdir, doctreedir, buildername,
-                        confoverrides, status=None, warning=None,
-                        freshenv=True, warningiserror=False, tags=None)
+    temporary_renderer = renderer is None
+    if temporary_renderer:
+        renderer = SphinxRenderer(buildername)
     try:
-        sphinx_app.build(None, [rst_name])
+        output = renderer.build(docstring, context)
     except SystemMessage:
-        output = _("It was not possible to generate rich text help for this "
-                    "object.</br>"
-                    "Please see it in plain text.")
-        return warning(output)
+        output = None
+    finally:
+        if temporary_renderer:
+            renderer.close()
 
     # TODO: Investigate if this is necessary/important for us
-    if osp.exists(output_name):
-        output = codecs.open(output_name, 'r', encoding='utf-8').read()
+    if output is not None:
         output = output.replace('<pre>', '<pre class="literal-block">')
     else:
-        output = _("It was not possible to generate rich text help for this "
-                    "object.</br>"
-                    "Please see it in plain text.")
-        return warning(output)
-
-    if temp_confdir_needed:
-        shutil.rmtree(confdir, ignore_errors=True)
-    shutil.rmtree(srcdir, ignore_errors=True)
+        return warning(RENDER_ERROR)
 
     return output
 
@@ -13,7 +13,9 @@ from qtpy.QtCore import QThread, Signal
 from spyder.config.base import _
 from spyder.py3compat import to_text_string
 from spyder.plugins.help.utils.sphinxify import (CSS_PATH, generate_context,
-                                                 sphinxify)
+                                                 has_images, RENDER_ERROR,
+                                                 SphinxRenderer, sphinxify,
+                                                 warning)
 
 
 class SphinxThread(QThread):
@@ -32,32 +34,95 @@ class SphinxThread(QThread):
         Text to be rendered if doc string cannot be extracted.
     math_option : bool
         Use LaTeX math rendering.
+    cache : RenderCache
+        Cache of rendered docstrings, or None.
+
+    Notes
+    -----
+    The same Sphinx application is reused for all renders, and docstrings
+    can be pre-rendered in the background to fill the cache.
     """
     # Signals
     error_msg = Signal(str)
     html_ready = Signal(str)
 
-    def __init__(self, html_text_no_doc='', css_path=CSS_PATH):
+    def __init__(self, html_text_no_doc='', css_path=CSS_PATH, cache=None):
         super(SphinxThread, self).__init__()
         self.doc = None
         self.context = None
         self.html_text_no_doc = html_text_no_doc
         self.math_option = False
+        self.img_path = ''
         self.css_path = css_path
+        self.cache = cache
+        self.renderer = SphinxRenderer()
+        self._pending_render = None
+        self._prerender_queue = []
+        self._prerendering = False
+        self.finished.connect(self._render_next)
 
     def render(self, doc, context=None, math_option=False, img_path='',
                css_path=CSS_PATH):
         """Start thread to render a given documentation"""
-        # If the thread is already running wait for it to finish before
-        # starting it again.
-        if self.wait():
-            self.doc = doc
-            self.context = context
-            self.math_option = math_option
-            self.img_path = img_path
-            self.css_path = css_path
-            # This causes run() to be executed in separate thread
-            self.start()
+        # If the thread is already running, render the documentation after
+        # it finishes instead of blocking the GUI while waiting for it.
+        self._pending_render = (doc, context, math_option, img_path,
+                                css_path)
+        self._render_next()
+
+    def prerender(self, docs, math_option=False, img_path='',
+                  css_path=CSS_PATH):
+        """
+        Render doc dicts in the background to add them to the cache.
+
+        Docs are rendered one at a time while no other render is requested.
+        """
+        if self.cache is None:
+            return
+        self._prerender_queue = [(doc, None, math_option, img_path, css_path)
+                                 for doc in docs]
+        self._render_next()
+
+    def close(self):
+        """Stop rendering and remove the Sphinx application."""
+        self._pending_render = None
+        self._prerender_queue = []
+        self.wait()
+        self.renderer.close()
+
+    def _render_next(self):
+        """
+        Start the requested render, or else the next doc to pre-render, if
+        the thread is idle.
+        """
+        if self.isRunning():
+            return
+        if self._pending_render is not None:
+            request = self._pending_render
+            self._pending_render = None
+            self._prerendering = False
+        elif self._prerender_queue:
+            request = self._prerender_queue.pop(0)
+            self._prerendering = True
+        else:
+            return
+        (self.doc, self.context, self.math_option, self.img_path,
+         self.css_path) = request
+        # This causes run() to be executed in separate thread
+        self.start()
+
+    def _sphinxify(self, docstring, context):
+        """Return the cached output of `docstring` or render it."""
+        if self.cache is None:
+            return sphinxify(docstring, context, renderer=self.renderer)
+        key = self.cache.get_key(docstring, context)
+        html_text = self.cache.get(key)
+        if html_text is None:
+            html_text = sphinxify(docstring, context, renderer=self.renderer)
+            # Errors aren't cached, so rendering is tried again next time
+            if html_text != warning(RENDER_ERROR):
+                self.cache.set(key, html_text)
+        return html_text
 
     def run(self):
         html_text = self.html_text_no_doc
@@ -65,13 +130,18 @@ class SphinxThread(QThread):
         if doc is not None:
             if type(doc) is dict and 'docstring' in doc.keys():
                 try:
+                    # Docs without images render the same for all files
+                    if has_images(doc['docstring']):
+                        img_path = self.img_path
+                    else:
+                        img_path = ''
                     context = generate_context(name=doc['name'],
                                                argspec=doc['argspec'],
                                                note=doc['note'],
                                                math=self.math_option,
-                                               img_path=self.img_path,
+                                               img_path=img_path,
                                                css_path=self.css_path)
-                    html_text = sphinxify(doc['docstring'], context)
+                    html_text = self._sphinxify(doc['docstring'], context)
                     if doc['docstring'] == '':
                         if any([doc['name'], doc['argspec'], doc['note']]):
                             msg = _("No further documentation available")
@@ -80,12 +150,14 @@ class SphinxThread(QThread):
                             msg = _("No documentation available")
                         html_text += '<div id="doc-warning">%s</div>' % msg
                 except Exception as error:
-                    self.error_msg.emit(to_text_string(error))
+                    if not self._prerendering:
+                        self.error_msg.emit(to_text_string(error))
                     return
             elif self.context is not None:
                 try:
-                    html_text = sphinxify(doc, self.context)
+                    html_text = self._sphinxify(doc, self.context)
                 except Exception as error:
                     self.error_msg.emit(to_text_string(error))
                     return
-        self.html_ready.emit(html_text)
+        if not self._prerendering:
+            self.html_ready.emit(html_text)
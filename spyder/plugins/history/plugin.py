@@ -8,16 +8,17 @@
 
 # Standard library imports
 import os.path as osp
-import sys
 import re
+import sqlite3
+import sys
 
 # Third party imports
-from qtpy.QtCore import Signal, Slot
+from qtpy.QtCore import QTimer, Signal, Slot
 from qtpy.QtWidgets import (QHBoxLayout, QInputDialog,
                             QVBoxLayout, QWidget)
 
 # Local imports
-from spyder.config.base import _
+from spyder.config.base import _, get_conf_path
 from spyder.api.plugins import SpyderPluginWidget
 from spyder.py3compat import is_text_string, to_text_string
 from spyder.utils import encoding
@@ -29,7 +30,14 @@ from spyder.plugins.editor.widgets import codeeditor
 from spyder.widgets.findreplace import FindReplace
 
 from spyder.plugins.history.confpage import HistoryConfigPage
-#from spyder.plugins.history.widgets import History
+from spyder.plugins.history.store import (get_command_from_history_text,
+                                          get_commands_from_history_file,
+                                          HistoryStore)
+from spyder.plugins.history.widgets import HistorySearchWidget
+
+
+# Time to wait before saving new commands to the history store (in ms)
+COMMIT_DELAY = 2000
 
 
 class HistoryLog(SpyderPluginWidget):
@@ -38,6 +46,7 @@ class HistoryLog(SpyderPluginWidget):
     CONF_SECTION = 'historylog'
     CONFIGWIDGET_CLASS = HistoryConfigPage
     CONF_FILE = False
+    STORE_PATH = get_conf_path('history.sqlite')
     focus_changed = Signal()
 
     def __init__(self, parent):
@@ -48,10 +57,23 @@ class HistoryLog(SpyderPluginWidget):
         self.dockviewer = None
         self.wrap_action = None
         self.linenumbers_action = None
+        self.search_action = None
 
         self.editors = []
         self.filenames = []
 
+        # Store with the commands of all consoles
+        try:
+            self.store = HistoryStore(self.STORE_PATH)
+        except sqlite3.Error:
+            self.store = HistoryStore(':memory:')
+
+        # Save new commands in batches instead of on every command
+        self.commit_timer = QTimer(self)
+        self.commit_timer.setSingleShot(True)
+        self.commit_timer.setInterval(COMMIT_DELAY)
+        self.commit_timer.timeout.connect(self.commit_history)
+
         layout = QVBoxLayout()
         self.tabwidget = Tabs(self, self._plugin_actions)
         self.tabwidget.currentChanged.connect(self.refresh_plugin)
@@ -77,6 +99,11 @@ class HistoryLog(SpyderPluginWidget):
 
         layout.addWidget(self.find_widget)
 
+        # Search widget for the history of all consoles
+        self.search_widget = HistorySearchWidget(self, self.store)
+        self.search_widget.hide()
+        layout.addWidget(self.search_widget)
+
         self.setLayout(layout)
 
     #------ SpyderPluginWidget API ---------------------------------------------
@@ -95,6 +122,12 @@ class HistoryLog(SpyderPluginWidget):
         """
         return self.tabwidget.currentWidget()
 
+    def closing_plugin(self, cancelable=False):
+        """Save pending commands and close the history store."""
+        self.commit_timer.stop()
+        self.store.close()
+        return True
+
     def refresh_plugin(self):
         """Refresh tabwidget"""
         if self.tabwidget.count():
@@ -115,9 +148,12 @@ class HistoryLog(SpyderPluginWidget):
         self.linenumbers_action = create_action(
                 self, _("Show line numbers"), toggled=self.toggle_line_numbers)
         self.linenumbers_action.setChecked(self.get_option('line_numbers'))
+        self.search_action = create_action(
+            self, _("Search all history"), icon=ima.icon('find'),
+            toggled=self.toggle_search)
 
         menu_actions = [self.history_action, self.wrap_action,
-                        self.linenumbers_action]
+                        self.linenumbers_action, self.search_action]
         return menu_actions
 
     def on_first_registration(self):
@@ -198,7 +234,7 @@ class HistoryLog(SpyderPluginWidget):
         try:
             text, _ = encoding.read(filename)
         except (IOError, OSError):
-            text = "# Previous history could not be read from disk, sorry\n\n"
+            text = ''
         text = normalize_eols(text)
         linebreaks = [m.start() for m in re.finditer('\n', text)]
         maxNline = self.get_option('max_entries')
@@ -211,7 +247,15 @@ class HistoryLog(SpyderPluginWidget):
                 encoding.write(text, filename)
             except (IOError, OSError):
                 pass
-        editor.set_text(text)
+
+        # History files are only imported in the store the first time
+        # they're loaded. After that, the store already has their commands.
+        if not self.store.count(source=filename):
+            self.store.extend(filename, get_commands_from_history_file(text))
+            self.commit_history()
+        commands = self.store.get_commands(filename,
+                                           self.get_option('max_entries'))
+        editor.set_text('\n'.join(commands))
         editor.set_cursor_position('eof')
 
         self.editors.append(editor)
@@ -236,6 +280,17 @@ class HistoryLog(SpyderPluginWidget):
             self.editors[index].set_cursor_position('eof')
         self.tabwidget.setCurrentIndex(index)
 
+        self.store.add(filename, get_command_from_history_text(command))
+        self.commit_timer.start()
+
+    @Slot()
+    def commit_history(self):
+        """Save the commands added to the history store to disk."""
+        self.commit_timer.stop()
+        self.store.commit()
+        if self.search_widget.has_filter():
+            self.search_widget.refresh()
+
     @Slot()
     def change_history_depth(self):
         "Change history max entries"""
@@ -255,6 +310,11 @@ class HistoryLog(SpyderPluginWidget):
             editor.toggle_wrap_mode(checked)
         self.set_option('wrap', checked)
 
+    @Slot(bool)
+    def toggle_search(self, checked):
+        """Show or hide the search widget for all history."""
+        self.search_widget.setVisible(checked)
+
     @Slot(bool)
     def toggle_line_numbers(self, checked):
         """Toggle line numbers."""
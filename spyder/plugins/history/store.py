@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Append-only history store shared by all consoles.
+
+Commands are kept in a SQLite database, indexed by insertion order and
+source, so the History pane can page through and search the full history
+of every console without reading it all into memory.
+"""
+
+# Standard library imports
+import codeop
+import logging
+import sqlite3
+import time
+import warnings
+
+# Local imports
+from spyder.utils.sourcecode import normalize_eols
+
+
+logger = logging.getLogger(__name__)
+
+# Character used to escape LIKE wildcards in search patterns
+ESCAPE = '\\'
+
+# Line beginnings that continue the previous command in a history file
+CONTINUATION_PREFIXES = (')', ']', '}', 'elif ', 'else:', 'except ', 'except:',
+                         'finally:')
+
+# Maximum number of commands kept in a store
+MAX_ENTRIES = 100000
+
+
+def escape_like(text):
+    """Escape `text` so it's matched literally in a LIKE pattern."""
+    for char in (ESCAPE, '%', '_'):
+        text = text.replace(char, ESCAPE + char)
+    return text
+
+
+def get_search_pattern(text, fuzzy=False):
+    """
+    Return the LIKE pattern to search for `text`.
+
+    Fuzzy patterns match commands that contain the characters of `text`
+    in the same order, but not necessarily next to each other.
+    """
+    if fuzzy:
+        chars = [escape_like(char) for char in text if not char.isspace()]
+        return '%' + '%'.join(chars) + '%'
+    return '%' + escape_like(text) + '%'
+
+
+def get_command_from_history_text(text):
+    """
+    Return the command contained in `text`, as sent by the append_to_history
+    signal of consoles.
+
+    That text is the command preceded by a line break and, for the first
+    command of a session, by the session separator.
+    """
+    text = normalize_eols(text)
+    if text.startswith('\n\n'):
+        # Remove session separator
+        text = text[2:].partition('\n')[2]
+    elif text.startswith('\n'):
+        text = text[1:]
+    return text
+
+
+def is_incomplete_command(command):
+    """Return True if `command` needs more lines to be valid Python."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        try:
+            return codeop.compile_command(command, symbol='exec') is None
+        except (SyntaxError, OverflowError, ValueError):
+            return False
+
+
+def get_commands_from_history_file(text):
+    """
+    Return the commands of a history file, skipping comment lines.
+
+    Lines that are indented, start a clause of a compound statement or
+    follow an incomplete statement belong to the previous command, so
+    multiline commands are kept as single entries.
+    """
+    commands = []
+    lines = []
+    blank_lines = []
+    for line in normalize_eols(text).split('\n'):
+        if not line.strip():
+            if lines:
+                blank_lines.append(line)
+            continue
+        if lines and (line[0].isspace() or
+                      line.startswith(CONTINUATION_PREFIXES) or
+                      is_incomplete_command('\n'.join(lines))):
+            lines.extend(blank_lines + [line])
+        elif not line.startswith('#'):
+            if lines:
+                commands.append('\n'.join(lines))
+            lines = [line]
+        blank_lines = []
+    if lines:
+        commands.append('\n'.join(lines))
+    return commands
+
+
+class HistoryStore(object):
+    """
+    Append-only store of console commands.
+
+    New commands are committed to disk by `commit`, so several of them
+    can be saved at once.
+
+    Parameters
+    ----------
+    path: str
+        Path of the database file. Use ':memory:' for a temporary store.
+    max_entries: int or None
+        Maximum number of commands to keep. The oldest ones are removed
+        on commit. If None, all commands are kept.
+    """
+
+    def __init__(self, path, max_entries=MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._connection = sqlite3.connect(path, timeout=5)
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS history ("
+            "    id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            "    source TEXT NOT NULL,"
+            "    time REAL NOT NULL,"
+            "    command TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS history_source "
+            "    ON history (source, id);"
+        )
+
+    def close(self):
+        """Commit pending commands and close the database connection."""
+        self.commit()
+        self._connection.close()
+
+    def commit(self):
+        """
+        Save the commands added since the last commit to disk, removing
+        the oldest ones beyond `max_entries`.
+        """
+        try:
+            self.prune()
+            self._connection.commit()
+        except sqlite3.Error as error:
+            logger.debug("Unable to save history entries: %s", error)
+
+    def prune(self):
+        """Remove the oldest commands beyond `max_entries`."""
+        if self.max_entries is None:
+            return
+        self._connection.execute(
+            "DELETE FROM history WHERE id <= "
+            "(SELECT id FROM history ORDER BY id DESC LIMIT 1 OFFSET ?)",
+            (self.max_entries,))
+
+    def add(self, source, command, timestamp=None):
+        """Append `command`, entered in the console `source`."""
+        self.extend(source, [command], timestamp=timestamp)
+
+    def extend(self, source, commands, timestamp=None):
+        """
+        Append several `commands` entered in the console `source`.
+
+        They are visible to this store right away, but are only saved to
+        disk by the next `commit`.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        try:
+            self._connection.executemany(
+                "INSERT INTO history (source, time, command) "
+                "VALUES (?, ?, ?)",
+                [(source, timestamp, command) for command in commands])
+        except sqlite3.Error as error:
+            logger.debug("Unable to save history entries: %s", error)
+
+    def get_commands(self, source, limit):
+        """Return the last `limit` commands of `source`, oldest first."""
+        entries = self.get_entries(limit=limit, source=source)
+        return [entry[3] for entry in reversed(entries)]
+
+    def count(self, source=None):
+        """Return the number of stored commands, optionally for `source`."""
+        where, args = self._get_where(source=source)
+        query = "SELECT COUNT(*) FROM history" + where
+        return self._connection.execute(query, args).fetchone()[0]
+
+    def get_entries(self, offset=0, limit=100, text='', fuzzy=False,
+                    source=None):
+        """
+        Return up to `limit` entries, newest first, skipping the `offset`
+        newest ones.
+
+        Entries are (id, source, time, command) tuples. If `text` is given,
+        only commands containing it (or, if `fuzzy`, its characters in
+        order) are returned.
+        """
+        where, args = self._get_where(text=text, fuzzy=fuzzy, source=source)
+        query = ("SELECT id, source, time, command FROM history" + where +
+                 " ORDER BY id DESC LIMIT ? OFFSET ?")
+        return self._connection.execute(
+            query, args + [limit, offset]).fetchall()
+
+    def _get_where(self, text='', fuzzy=False, source=None):
+        """Return the WHERE clause and arguments to filter entries."""
+        conditions, args = [], []
+        if source is not None:
+            conditions.append("source = ?")
+            args.append(source)
+        if text:
+            conditions.append("command LIKE ? ESCAPE '{}'".format(ESCAPE))
+            args.append(get_search_pattern(text, fuzzy=fuzzy))
+        if conditions:
+            return " WHERE " + " AND ".join(conditions), args
+        return "", args
@@ -38,6 +38,7 @@ def historylog(qtbot, monkeypatch):
     monkeypatch.setattr(history.HistoryLog,
                         'register_widget_shortcuts',
                         lambda *args: None)
+    monkeypatch.setattr(history.HistoryLog, 'STORE_PATH', ':memory:')
     historylog = history.HistoryLog(None)
     historylog._setup()
     qtbot.addWidget(historylog)
@@ -106,8 +107,8 @@ def test_init(historylog):
     hl = historylog
     assert hl.editors == []
     assert hl.filenames == []
-    assert len(hl._plugin_actions) == 5
-    assert len(hl.tabwidget.cornerWidget().menu().actions()) == 5
+    assert len(hl._plugin_actions) == 6
+    assert len(hl.tabwidget.cornerWidget().menu().actions()) == 6
 
 
 def test_add_history(historylog, mocker, monkeypatch):
@@ -173,13 +174,20 @@ def test_add_history(historylog, mocker, monkeypatch):
     assert hle[0].is_python()
     assert hle[0].isReadOnly()
     assert not hle[0].isVisible()
-    assert hle[0].toPlainText() == text1
+    assert hle[0].toPlainText() == text1.strip()
 
     assert not hle[1].supported_language
     assert not hle[1].is_python()
     assert hle[1].isReadOnly()
     assert hle[1].isVisible()
-    assert hle[1].toPlainText() == text2
+    assert hle[1].toPlainText() == text2.strip()
+
+    # Files are only imported in the history store once
+    history.encoding.read.return_value = (text1, '')
+    hl.filenames.remove(tab1)
+    hl.add_history(tab1)
+    assert hl.store.count(source=tab1) == 3
+    assert hle[-1].toPlainText() == text1.strip()
 
 
 def test_append_to_history(historylog_with_tab, mocker):
@@ -211,6 +219,40 @@ def test_append_to_history(historylog_with_tab, mocker):
     assert not hl.editors[0].is_cursor_at_end()
 
 
+def test_search_history(historylog_with_tab):
+    """Test searching the commands of all consoles in the history store."""
+    hl = historylog_with_tab
+    hl.append_to_history('test_history.py', '\n\n## ---(date)---\nx = 1')
+    hl.append_to_history('test_history.py', '\nprint(x)')
+    assert hl.store.count() == 2
+    assert hl.commit_timer.isActive()
+
+    hl.search_action.setChecked(True)
+    assert hl.search_widget.isVisible()
+    model = hl.search_widget.model
+    assert model.rowCount() == 2
+    assert model.get_command(0) == 'print(x)'
+
+    hl.search_widget.search_edit.setText('x =')
+    assert model.rowCount() == 1
+    assert model.get_command(0) == 'x = 1'
+
+    # Results are only updated when new commands are committed
+    hl.append_to_history('test_history.py', '\nx = 2')
+    assert model.rowCount() == 1
+    hl.commit_history()
+    assert model.rowCount() == 2
+    assert model.get_command(0) == 'x = 2'
+
+    hl.search_widget.search_edit.setText('prx')
+    assert model.rowCount() == 0
+    hl.search_widget.fuzzy_checkbox.setChecked(True)
+    assert model.rowCount() == 1
+
+    hl.search_action.setChecked(False)
+    assert not hl.search_widget.isVisible()
+
+
 def test_change_history_depth(historylog_with_tab, mocker):
     """Test the change_history_depth method.
 
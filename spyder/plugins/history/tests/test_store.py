@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""Tests for the history store."""
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.history import store as history_store
+from spyder.plugins.history.store import HistoryStore
+
+
+@pytest.fixture
+def store():
+    """Return a history store with commands of two consoles."""
+    store = HistoryStore(':memory:')
+    store.extend('console1', ['import os', 'os.getcwd()', 'x = 100%'])
+    store.add('console2', 'print_x(1)')
+    yield store
+    store.close()
+
+
+def test_count(store):
+    assert store.count() == 4
+    assert store.count(source='console1') == 3
+    assert store.count(source='console3') == 0
+
+
+def test_get_entries(store):
+    """Test entries are returned newest first and can be paged."""
+    commands = [entry[3] for entry in store.get_entries()]
+    assert commands == ['print_x(1)', 'x = 100%', 'os.getcwd()', 'import os']
+
+    page = store.get_entries(offset=1, limit=2)
+    assert [entry[3] for entry in page] == ['x = 100%', 'os.getcwd()']
+
+    entries = store.get_entries(source='console2')
+    assert [entry[1] for entry in entries] == ['console2']
+
+
+def test_search(store):
+    """Test substring and fuzzy search."""
+    def search(text, fuzzy=False):
+        return [entry[3] for entry in store.get_entries(text=text,
+                                                        fuzzy=fuzzy)]
+
+    assert search('os') == ['os.getcwd()', 'import os']
+    assert search('OS.GET') == ['os.getcwd()']
+    assert search('ogc') == []
+    assert search('ogc', fuzzy=True) == ['os.getcwd()']
+
+    # Wildcards are matched literally
+    assert search('%') == ['x = 100%']
+    assert search('t_x') == ['print_x(1)']
+    assert search('t_x', fuzzy=True) == ['print_x(1)']
+
+
+def test_commit(tmpdir):
+    """Test commands are saved to disk on commit."""
+    path = str(tmpdir.join('history.sqlite'))
+    store = HistoryStore(path)
+    store.add('console1', 'x = 1')
+    assert store.count() == 1
+
+    reader = HistoryStore(path)
+    assert reader.count() == 0
+    store.commit()
+    assert reader.count() == 1
+
+    store.add('console1', 'y = 2')
+    store.close()
+    assert reader.count() == 2
+    assert reader.get_commands('console1', 1) == ['y = 2']
+    reader.close()
+
+
+def test_max_entries():
+    """Test the oldest commands are removed on commit."""
+    store = HistoryStore(':memory:', max_entries=3)
+    store.extend('console1', ['a = 1', 'b = 2', 'c = 3'])
+    store.add('console2', 'd = 4')
+    assert store.count() == 4
+
+    store.commit()
+    assert store.count() == 3
+    assert store.get_commands('console1', 10) == ['b = 2', 'c = 3']
+    assert store.get_commands('console2', 10) == ['d = 4']
+    store.close()
+
+
+def test_get_command_from_history_text():
+    get_command = history_store.get_command_from_history_text
+    assert get_command('\nx = 1') == 'x = 1'
+    assert get_command('\r\n\r\n## ---(Mon Jan 1)---\r\nx = 1') == 'x = 1'
+    assert get_command('\nfor i in x:\n    pass') == 'for i in x:\n    pass'
+
+
+def test_get_commands_from_history_file():
+    text = '# -*- coding: utf-8 -*-\n\n## ---(date)---\nx = 1\n\ny = 2\n'
+    commands = history_store.get_commands_from_history_file(text)
+    assert commands == ['x = 1', 'y = 2']
+
+
+def test_get_multiline_commands_from_history_file():
+    """Test multiline commands are kept as single entries."""
+    text = ('\n\n## ---(date)---\n'
+            'for i in x:\n    a = i\n\n    print(a)\n'
+            'if x:\n    y\nelse:\n    z\n'
+            'l = [1,\n2]\n'
+            '%timeit x\n')
+    commands = history_store.get_commands_from_history_file(text)
+    assert commands == ['for i in x:\n    a = i\n\n    print(a)',
+                        'if x:\n    y\nelse:\n    z',
+                        'l = [1,\n2]',
+                        '%timeit x']
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -9,10 +9,13 @@
 # Standard library imports
 import os.path as osp
 import sys
+import time
 
 # Third party imports
-from qtpy.QtCore import Signal
-from qtpy.QtWidgets import (QHBoxLayout, QMenu, QWidget, QToolButton,
+from qtpy.compat import to_qvariant
+from qtpy.QtCore import QAbstractListModel, QModelIndex, Qt, Signal
+from qtpy.QtWidgets import (QApplication, QCheckBox, QHBoxLayout, QLineEdit,
+                            QListView, QMenu, QWidget, QToolButton,
                             QVBoxLayout)
 
 # Local imports
@@ -26,6 +29,10 @@ from spyder.widgets.tabs import Tabs
 from spyder.widgets.findreplace import FindReplace
 
 
+# Number of entries fetched from the history store at a time
+ENTRIES_TO_LOAD = 200
+
+
 class History(QWidget):
     """History plugin main widget."""
 
@@ -152,6 +159,139 @@ class History(QWidget):
             self.editors[index].set_cursor_position('eof')
         self.tabwidget.setCurrentIndex(index)
 
+
+class HistorySearchModel(QAbstractListModel):
+    """
+    List model that loads entries from a history store, newest first,
+    as the view scrolls.
+    """
+
+    def __init__(self, store, parent=None):
+        QAbstractListModel.__init__(self, parent)
+        self.store = store
+        self.text = ''
+        self.fuzzy = False
+        self._entries = []
+        self._exhausted = False
+
+    def set_filter(self, text, fuzzy=False):
+        """Only show commands matching `text`."""
+        self.beginResetModel()
+        self.text = text
+        self.fuzzy = fuzzy
+        self._entries = []
+        self._exhausted = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def refresh(self):
+        """Reload entries to show the ones added after the last load."""
+        self.set_filter(self.text, fuzzy=self.fuzzy)
+
+    def get_command(self, row):
+        """Return the command shown in `row`."""
+        return self._entries[row][3]
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of loaded entries."""
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Return data for `index`."""
+        if not index.isValid():
+            return to_qvariant()
+        _id, source, timestamp, command = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            return to_qvariant(command)
+        elif role == Qt.ToolTipRole:
+            return to_qvariant(u'{0}\n{1}'.format(
+                source, time.ctime(timestamp)))
+        return to_qvariant()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        """Return True if there are more entries in the store."""
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Load the next page of entries from the store."""
+        if not self.canFetchMore(parent):
+            return
+        entries = self.store.get_entries(offset=len(self._entries),
+                                         limit=ENTRIES_TO_LOAD,
+                                         text=self.text, fuzzy=self.fuzzy)
+        if len(entries) < ENTRIES_TO_LOAD:
+            self._exhausted = True
+        if entries:
+            start = len(self._entries)
+            self.beginInsertRows(QModelIndex(), start,
+                                 start + len(entries) - 1)
+            self._entries.extend(entries)
+            self.endInsertRows()
+
+
+class HistorySearchWidget(QWidget):
+    """Widget to search the commands of all consoles."""
+
+    sig_command_activated = Signal(str)
+
+    def __init__(self, parent, store):
+        QWidget.__init__(self, parent)
+
+        self.search_edit = QLineEdit(self)
+        self.search_edit.setPlaceholderText(_("Search all history"))
+        self.search_edit.textChanged.connect(self.update_filter)
+
+        self.fuzzy_checkbox = QCheckBox(_("Fuzzy"), self)
+        self.fuzzy_checkbox.setToolTip(
+            _("Match commands that contain the typed characters in the "
+              "same order, but not necessarily next to each other"))
+        self.fuzzy_checkbox.toggled.connect(self.update_filter)
+
+        self.model = HistorySearchModel(store, self)
+        self.view = QListView(self)
+        self.view.setUniformItemSizes(True)
+        self.view.setModel(self.model)
+        self.view.activated.connect(self.activate_command)
+
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(self.search_edit)
+        search_layout.addWidget(self.fuzzy_checkbox)
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(search_layout)
+        layout.addWidget(self.view)
+        self.setLayout(layout)
+
+    def update_filter(self, *args):
+        """Filter commands with the current search text."""
+        self.model.set_filter(self.search_edit.text(),
+                              fuzzy=self.fuzzy_checkbox.isChecked())
+
+    def has_filter(self):
+        """Return True if commands are filtered by a search text."""
+        return bool(self.search_edit.text())
+
+    def refresh(self):
+        """Reload commands if the widget is visible."""
+        if self.isVisible():
+            self.model.refresh()
+
+    def activate_command(self, index):
+        """Copy the command at `index` to the clipboard."""
+        command = self.model.get_command(index.row())
+        QApplication.clipboard().setText(command)
+        self.sig_command_activated.emit(command)
+
+    def showEvent(self, event):
+        """Load the latest commands when shown."""
+        self.update_filter()
+        self.search_edit.setFocus()
+        QWidget.showEvent(self, event)
+
+
 def test():
     """Run history widget."""
     from spyder.utils.qthelpers import qapplication
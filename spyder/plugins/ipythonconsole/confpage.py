@@ -368,13 +368,30 @@ class IPythonConsoleConfigPage(PluginConfigPage):
         windows_layout.addWidget(hide_cmd_windows)
         windows_group.setLayout(windows_layout)
 
+        # Kernel pool
+        kernel_pool_group = QGroupBox(_("Preloaded kernels"))
+        kernel_pool_label = QLabel(_(
+            "Kernels started in the background so new consoles are ready "
+            "right away. Each one uses the memory of an idle console."))
+        kernel_pool_label.setWordWrap(True)
+        kernel_pool_spin = self.create_spinbox(
+            _("Number of preloaded kernels:"), "", 'kernel_pool_size',
+            min_=0, max_=5, step=1,
+            tip=_("Set it to 0 to start the kernel of each console when "
+                  "it's created"))
+        kernel_pool_layout = QVBoxLayout()
+        kernel_pool_layout.addWidget(kernel_pool_label)
+        kernel_pool_layout.addWidget(kernel_pool_spin)
+        kernel_pool_group.setLayout(kernel_pool_layout)
+
         # --- Tabs organization ---
         tabs = QTabWidget()
         tabs.addTab(self.create_tab(interface_group, comp_group,
                                     source_code_group), _("Display"))
         tabs.addTab(self.create_tab(pylab_group, backend_group, inline_group),
                     _("Graphics"))
-        tabs.addTab(self.create_tab(run_lines_group, run_file_group),
+        tabs.addTab(self.create_tab(run_lines_group, run_file_group,
+                                    kernel_pool_group),
                     _("Startup"))
         tabs.addTab(self.create_tab(jedi_group, greedy_group, autocall_group,
                                     sympy_group, prompts_group,
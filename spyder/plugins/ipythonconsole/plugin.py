@@ -39,6 +39,7 @@ from spyder.config.base import (_, get_conf_path, get_home_dir,
 from spyder.config.gui import get_font, is_dark_interface
 from spyder.config.manager import CONF
 from spyder.plugins.ipythonconsole.confpage import IPythonConsoleConfigPage
+from spyder.plugins.ipythonconsole.utils.kernelpool import KernelPool
 from spyder.plugins.ipythonconsole.utils.kernelspec import SpyderKernelSpec
 from spyder.plugins.ipythonconsole.utils.manager import SpyderKernelManager
 from spyder.plugins.ipythonconsole.utils.ssh import openssh_tunnel
@@ -78,6 +79,7 @@ class IPythonConsole(SpyderPluginWidget):
     focus_changed = Signal()
     edit_goto = Signal((str, int, str), (str, int, str, bool))
     sig_pdb_state = Signal(bool, dict)
+    sig_profile_samples = Signal(object)
 
     # Error messages
     permission_error_msg = _("The directory {} is not writable and it is "
@@ -110,6 +112,10 @@ class IPythonConsole(SpyderPluginWidget):
             if not osp.isdir(osp.join(test_dir)):
                 os.makedirs(osp.join(test_dir))
 
+        # Idle kernels for new consoles
+        self.kernel_pool = KernelPool(
+            self, size=0 if testing else self.get_option('kernel_pool_size'))
+
         layout = QVBoxLayout()
         self.tabwidget = Tabs(self, menu=self._options_menu,
                               actions=self.menu_actions,
@@ -184,6 +190,12 @@ class IPythonConsole(SpyderPluginWidget):
         reset_namespace_o = self.get_option(reset_namespace_n)
         ask_before_restart_n = 'ask_before_restart'
         ask_before_restart_o = self.get_option(ask_before_restart_n)
+        kernel_pool_size_n = 'kernel_pool_size'
+        if kernel_pool_size_n in options and not self.testing:
+            self.kernel_pool.set_size(self.get_option(kernel_pool_size_n))
+        else:
+            # Replace idle kernels started with other settings
+            self.kernel_pool.schedule_refill()
         for client in self.clients:
             control = client.get_control()
             if font_n in options:
@@ -235,6 +247,7 @@ class IPythonConsole(SpyderPluginWidget):
     def closing_plugin(self, cancelable=False):
         """Perform actions before parent main window is closed"""
         self.mainwindow_close = True
+        self.kernel_pool.close()
         for client in self.clients:
             client.shutdown()
             client.remove_stderr_file()
@@ -275,7 +288,8 @@ class IPythonConsole(SpyderPluginWidget):
         if client:
             sw = client.shellwidget
             self.main.variableexplorer.set_shellwidget_from_id(id(sw))
-            self.main.plots.set_shellwidget_from_id(id(sw))
+            if self.main.plots is not None:
+                self.main.plots.set_shellwidget_from_id(id(sw))
             self.main.help.set_shell(sw)
             self.sig_pdb_state.emit(sw.in_debug_loop(), sw.get_pdb_last_step())
         self.update_tabs_text()
@@ -446,17 +460,14 @@ class IPythonConsole(SpyderPluginWidget):
             # Internal kernels, use runfile
             if (client.get_kernel() is not None or
                     client.shellwidget.is_spyder_kernel()):
-                line = "%s('%s'" % ('debugfile' if debug else 'runfile',
-                                    norm(filename))
-                if args:
-                    line += ", args='%s'" % norm(args)
-                if wdir:
-                    line += ", wdir='%s'" % norm(wdir)
+                options = {}
                 if post_mortem:
-                    line += ", post_mortem=True"
+                    options['post_mortem'] = True
                 if console_namespace:
-                    line += ", current_namespace=True"
-                line += ")"
+                    options['current_namespace'] = True
+                line = self._get_runfile_line(
+                    'debugfile' if debug else 'runfile', filename, wdir,
+                    args, **options)
             else:  # External, non spyder-kernels, use %run
                 line = "%run "
                 if debug:
@@ -466,15 +477,9 @@ class IPythonConsole(SpyderPluginWidget):
                     line += " %s" % norm(args)
 
             try:
-                if client.shellwidget._executing:
-                    # Don't allow multiple executions when there's
-                    # still an execution taking place
-                    # Fixes spyder-ide/spyder#7293.
-                    pass
-                elif (client.shellwidget.in_debug_loop()):
-                    client.shellwidget.pdb_execute('!' + line)
-                elif current_client:
-                    self.execute_code(line, current_client, clear_variables)
+                if (current_client or client.shellwidget._executing or
+                        client.shellwidget.in_debug_loop()):
+                    self._execute_in_client(client, line, clear_variables)
                 else:
                     if is_new_client:
                         client.shellwidget.silent_execute('%clear')
@@ -493,13 +498,42 @@ class IPythonConsole(SpyderPluginWidget):
                   "<br><br>Please open a new one and try again."
                   ) % osp.basename(filename), QMessageBox.Ok)
 
+    def profile_script(self, filename, wdir, args, interval):
+        """
+        Profile script in the current client by sampling its call stack.
+
+        The samples are sent back through sig_profile_samples.
+        """
+        client = self._get_profiling_client()
+        if client is not None:
+            line = self._get_runfile_line('profilefile', filename, wdir,
+                                          args, interval=interval)
+            try:
+                self._execute_in_client(client, line)
+            except AttributeError:
+                pass
+            self.switch_to_plugin()
+
+    def profile_cell(self, cell_name, filename, interval):
+        """
+        Profile cell in the current client by sampling its call stack.
+
+        The samples are sent back through sig_profile_samples.
+        """
+        client = self._get_profiling_client()
+        if client is not None:
+            self.run_cell_filename = filename
+            line = self._get_runcell_line('profilecell', cell_name, filename,
+                                          interval=interval)
+            try:
+                self._execute_in_client(client, line)
+            except AttributeError:
+                pass
+            self.switch_to_plugin()
+
     def run_cell(self, code, cell_name, filename, run_cell_copy,
                  function='runcell'):
         """Run cell in current or dedicated client."""
-
-        def norm(text):
-            return remove_backslashes(to_text_string(text))
-
         self.run_cell_filename = filename
 
         # Select client to execute code on it
@@ -510,26 +544,14 @@ class IPythonConsole(SpyderPluginWidget):
         if client is not None:
             # Internal kernels, use runcell
             if client.get_kernel() is not None and not run_cell_copy:
-                line = (to_text_string(
-                        "{}({}, '{}')").format(
-                                to_text_string(function),
-                                repr(cell_name),
-                                norm(filename).replace("'", r"\'")))
+                line = self._get_runcell_line(function, cell_name, filename)
 
             # External kernels and run_cell_copy, just execute the code
             else:
                 line = code.strip()
 
             try:
-                if client.shellwidget._executing:
-                    # Don't allow multiple executions when there's
-                    # still an execution taking place
-                    # Fixes spyder-ide/spyder#7293.
-                    pass
-                elif (client.shellwidget.in_debug_loop()):
-                    client.shellwidget.pdb_execute('!' + line)
-                else:
-                    self.execute_code(line)
+                self._execute_in_client(client, line)
             except AttributeError:
                 pass
             self._visibility_changed(True)
@@ -649,7 +671,15 @@ class IPythonConsole(SpyderPluginWidget):
         self.master_clients += 1
         client_id = dict(int_id=to_text_string(self.master_clients),
                          str_id='A')
-        cf = self._new_connection_file()
+
+        # Take an idle kernel from the pool for regular consoles
+        pooled_kernel = None
+        if not (is_cython or is_pylab or is_sympy):
+            pooled_kernel = self.kernel_pool.take(self.create_kernel_spec())
+        if pooled_kernel is not None:
+            cf = pooled_kernel[0].connection_file
+        else:
+            cf = self._new_connection_file()
         show_elapsed_time = self.get_option('show_elapsed_time')
         reset_warning = self.get_option('show_reset_namespace_warning')
         ask_before_restart = self.get_option('ask_before_restart')
@@ -672,6 +702,7 @@ class IPythonConsole(SpyderPluginWidget):
         # Change stderr_dir if requested
         if self.test_dir is not None:
             client.stderr_dir = self.test_dir
+        client.stderr_append = pooled_kernel is not None
 
         self.add_tab(client, name=client.get_name(), filename=filename)
 
@@ -701,10 +732,13 @@ class IPythonConsole(SpyderPluginWidget):
                       "<br><br>or<br><br>"
                       "<tt>pip install spyder-kernels</tt>")
                 )
+                if pooled_kernel is not None:
+                    pooled_kernel[0].shutdown_kernel(now=True)
                 return
 
         self.connect_client_to_kernel(client, is_cython=is_cython,
-                                      is_pylab=is_pylab, is_sympy=is_sympy)
+                                      is_pylab=is_pylab, is_sympy=is_sympy,
+                                      pooled_kernel=pooled_kernel)
         if client.shellwidget.kernel_manager is None:
             return
         self.register_client(client)
@@ -733,16 +767,26 @@ class IPythonConsole(SpyderPluginWidget):
                                            password)
 
     def connect_client_to_kernel(self, client, is_cython=False,
-                                 is_pylab=False, is_sympy=False):
-        """Connect a client to its kernel"""
-        connection_file = client.connection_file
-        stderr_handle = None if self.test_no_stderr else client.stderr_handle
-        km, kc = self.create_kernel_manager_and_kernel_client(
-                     connection_file,
-                     stderr_handle,
-                     is_cython=is_cython,
-                     is_pylab=is_pylab,
-                     is_sympy=is_sympy)
+                                 is_pylab=False, is_sympy=False,
+                                 pooled_kernel=None):
+        """
+        Connect a client to its kernel.
+
+        If given, `pooled_kernel` is the (kernel_manager, kernel_client) of
+        an already started kernel, which is used instead of a new one.
+        """
+        if pooled_kernel is not None:
+            km, kc = pooled_kernel
+        else:
+            connection_file = client.connection_file
+            stderr_handle = (None if self.test_no_stderr
+                             else client.stderr_handle)
+            km, kc = self.create_kernel_manager_and_kernel_client(
+                         connection_file,
+                         stderr_handle,
+                         is_cython=is_cython,
+                         is_pylab=is_pylab,
+                         is_sympy=is_sympy)
 
         # An error occurred if this is True
         if is_string(km) and kc is None:
@@ -911,6 +955,7 @@ class IPythonConsole(SpyderPluginWidget):
                               lambda fname, lineno, shellwidget=shellwidget:
                               self.pdb_has_stopped(fname, lineno, shellwidget))
         shellwidget.sig_pdb_state.connect(self.sig_pdb_state)
+        shellwidget.sig_profile_samples.connect(self.sig_profile_samples)
 
         # To handle %edit magic petitions
         shellwidget.custom_edit_requested.connect(self.edit_file)
@@ -1392,6 +1437,60 @@ class IPythonConsole(SpyderPluginWidget):
         self.main.help.show_plain_text(quick_reference)
 
     #------ Private API -------------------------------------------------------
+    def _get_runfile_line(self, function, filename, wdir, args, **kwargs):
+        """
+        Return the call to `function` (e.g. runfile) that runs `filename`
+        in a Spyder kernel, passing it `kwargs` as keyword arguments.
+        """
+        norm = lambda text: remove_backslashes(to_text_string(text))
+        line = "%s('%s'" % (function, norm(filename))
+        if args:
+            line += ", args='%s'" % norm(args)
+        if wdir:
+            line += ", wdir='%s'" % norm(wdir)
+        for name in sorted(kwargs):
+            line += ", %s=%r" % (name, kwargs[name])
+        return line + ")"
+
+    def _get_runcell_line(self, function, cell_name, filename, **kwargs):
+        """
+        Return the call to `function` (e.g. runcell) that runs the cell
+        `cell_name` of `filename` in a Spyder kernel.
+        """
+        filename = remove_backslashes(to_text_string(filename))
+        line = to_text_string("{}({}, '{}'").format(
+            to_text_string(function), repr(cell_name),
+            filename.replace("'", r"\'"))
+        for name in sorted(kwargs):
+            line += ", %s=%r" % (name, kwargs[name])
+        return line + ")"
+
+    def _execute_in_client(self, client, line, clear_variables=False):
+        """Execute `line` in `client`, or in its debugger if it's active."""
+        if client.shellwidget._executing:
+            # Don't allow multiple executions when there's
+            # still an execution taking place
+            # Fixes spyder-ide/spyder#7293.
+            pass
+        elif client.shellwidget.in_debug_loop():
+            client.shellwidget.pdb_execute('!' + line)
+        else:
+            self.execute_code(line, clear_variables=clear_variables)
+
+    def _get_profiling_client(self):
+        """
+        Return the current client if it can be profiled, or warn that it
+        can't.
+        """
+        client = self.get_current_client()
+        if client is None or client.get_kernel() is None:
+            QMessageBox.warning(self, _('Warning'),
+                _("Profiling in a console is only possible in consoles "
+                  "started by Spyder. Please open a new one and try again."),
+                QMessageBox.Ok)
+            return None
+        return client
+
     def _init_asyncio_patch(self):
         """
         Same workaround fix as https://github.com/ipython/ipykernel/pull/456
@@ -1446,6 +1545,27 @@ class IPythonConsole(SpyderPluginWidget):
             cf = cf if not os.path.exists(cf) else ''
         return cf
 
+    def add_clients_to_plots(self):
+        """Add the consoles to the Plots plugin, if it was created later."""
+        for client in self.clients:
+            sw = client.shellwidget
+            kc = sw.kernel_client
+            if kc is None:
+                continue
+            self.main.plots.add_shellwidget(sw)
+            kc.stopped_channels.connect(lambda sw=sw:
+                self.main.plots.remove_shellwidget(id(sw)))
+        sw = self.get_current_shellwidget()
+        if sw is not None:
+            self.main.plots.set_shellwidget_from_id(id(sw))
+
+    def add_clients_to_history(self):
+        """Add the consoles to the History plugin, if it was created later."""
+        for client in self.clients:
+            self.main.historylog.add_history(client.history_filename)
+            client.append_to_history.connect(
+                self.main.historylog.append_to_history)
+
     def process_started(self, client):
         if self.main.help is not None:
             self.main.help.set_shell(client.shellwidget)
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Pool of kernels started before they are needed.
+
+New consoles take an idle kernel from the pool instead of waiting for a
+new one to import IPython, spydercustomize and the rest of its startup
+code, and the pool starts a replacement in the background.
+"""
+
+# Standard library imports
+import codecs
+import logging
+import os
+import os.path as osp
+
+# Third party imports
+from qtpy.QtCore import QObject, QTimer
+
+# Local imports
+from spyder.utils.programs import get_temp_dir
+
+
+logger = logging.getLogger(__name__)
+
+# Time to wait before starting the kernels of the pool, in milliseconds.
+# This avoids competing with the console that took a kernel from it.
+REFILL_DELAY = 2000
+
+
+def get_kernel_spec_signature(kernel_spec):
+    """Return what determines the environment of a kernel spec's kernels."""
+    return (tuple(kernel_spec.argv), tuple(sorted(kernel_spec.env.items())))
+
+
+class KernelPool(QObject):
+    """
+    Idle kernels for new consoles.
+
+    Kernels are only given to consoles that would start them with the same
+    interpreter and environment variables, so they're replaced when the
+    interpreter or the console's settings change.
+
+    Parameters
+    ----------
+    plugin: spyder.plugins.ipythonconsole.plugin.IPythonConsole
+        Plugin used to create the kernel spec and start the kernels.
+    size: int
+        Number of idle kernels to keep. The pool is disabled if it's 0.
+    """
+
+    def __init__(self, plugin, size=0):
+        QObject.__init__(self, plugin)
+        self.plugin = plugin
+        self.size = size
+        self._kernels = []
+
+        self._refill_timer = QTimer(self)
+        self._refill_timer.setSingleShot(True)
+        self._refill_timer.setInterval(REFILL_DELAY)
+        self._refill_timer.timeout.connect(self.refill)
+
+    def __len__(self):
+        return len(self._kernels)
+
+    def set_size(self, size):
+        """Set the number of idle kernels to keep."""
+        self.size = size
+        while len(self._kernels) > size:
+            self._shutdown(self._kernels.pop())
+        self.schedule_refill()
+
+    def schedule_refill(self):
+        """Refill the pool after a delay."""
+        if self.size > 0:
+            self._refill_timer.start()
+
+    def take(self, kernel_spec):
+        """
+        Return (kernel_manager, kernel_client) of an idle kernel started
+        with the same environment as `kernel_spec`, or None.
+        """
+        if self.size <= 0:
+            return None
+        self._discard_stale(get_kernel_spec_signature(kernel_spec))
+        self.schedule_refill()
+        if not self._kernels:
+            return None
+        kernel = self._kernels.pop(0)
+        if kernel['stderr_handle'] is not None:
+            # The kernel process has its own handle to the file
+            kernel['stderr_handle'].close()
+        logger.debug("Taking kernel %s from the pool",
+                     kernel['kernel_manager'].connection_file)
+        return kernel['kernel_manager'], kernel['kernel_client']
+
+    def refill(self):
+        """Start kernels until the pool is full."""
+        if len(self._kernels) >= self.size:
+            return
+        kernel_spec = self.plugin.create_kernel_spec()
+        self._discard_stale(get_kernel_spec_signature(kernel_spec))
+        while len(self._kernels) < self.size:
+            if not self._start_kernel():
+                break
+
+    def close(self):
+        """Shutdown all idle kernels."""
+        self._refill_timer.stop()
+        while self._kernels:
+            self._shutdown(self._kernels.pop())
+
+    def _discard_stale(self, signature):
+        """Shutdown kernels that died or have another environment."""
+        for kernel in self._kernels[:]:
+            if (kernel['signature'] != signature or
+                    not kernel['kernel_manager'].is_alive()):
+                self._kernels.remove(kernel)
+                self._shutdown(kernel)
+
+    def _get_stderr_file(self, connection_file):
+        """Return the stderr file a console uses for `connection_file`."""
+        kernel_id = osp.basename(connection_file).split('.json')[0]
+        stderr_dir = self.plugin.test_dir
+        if stderr_dir is None:
+            try:
+                stderr_dir = get_temp_dir()
+            except (IOError, OSError):
+                return None
+        return osp.join(stderr_dir, kernel_id + '.stderr')
+
+    def _start_kernel(self):
+        """Start an idle kernel and return True if that was possible."""
+        connection_file = self.plugin._new_connection_file()
+        if connection_file is None:
+            return False
+
+        stderr_file = None
+        stderr_handle = None
+        if not self.plugin.test_no_stderr:
+            stderr_file = self._get_stderr_file(connection_file)
+            try:
+                stderr_handle = codecs.open(stderr_file, 'w',
+                                            encoding='utf-8')
+            except Exception:
+                stderr_file = None
+
+        km, kc = self.plugin.create_kernel_manager_and_kernel_client(
+            connection_file, stderr_handle)
+        if kc is None:
+            logger.debug("Unable to start a kernel for the pool: %s", km)
+            if stderr_handle is not None:
+                stderr_handle.close()
+            return False
+
+        self._kernels.append({
+            'kernel_manager': km,
+            'kernel_client': kc,
+            'signature': get_kernel_spec_signature(km.kernel_spec),
+            'stderr_file': stderr_file,
+            'stderr_handle': stderr_handle,
+        })
+        return True
+
+    def _shutdown(self, kernel):
+        """Shutdown an idle kernel and remove its files."""
+        try:
+            kernel['kernel_manager'].shutdown_kernel(now=True)
+        except Exception as error:
+            logger.debug("Error shutting down a pooled kernel: %s", error)
+        if kernel['stderr_handle'] is not None:
+            kernel['stderr_handle'].close()
+        if kernel['stderr_file'] is not None:
+            try:
+                os.remove(kernel['stderr_file'])
+            except OSError:
+                pass
@@ -163,6 +163,8 @@ class SpyderKernelSpec(KernelSpec):
             'SPY_EXTERNAL_INTERPRETER': not default_interpreter,
             'SPY_UMR_ENABLED': CONF.get('main_interpreter', 'umr/enabled'),
             'SPY_UMR_VERBOSE': CONF.get('main_interpreter', 'umr/verbose'),
+            'SPY_UMR_SELECTIVE': CONF.get('main_interpreter',
+                                          'umr/selective'),
             'SPY_UMR_NAMELIST': ','.join(umr_namelist),
             'SPY_RUN_LINES_O': CONF.get('ipython_console', 'startup/run_lines'),
             'SPY_PYLAB_O': CONF.get('ipython_console', 'pylab'),
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the pool of idle kernels
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from qtpy.QtCore import QObject
+
+from spyder.plugins.ipythonconsole.utils.kernelpool import KernelPool
+
+
+class PluginMock(QObject):
+    """Plugin that starts fake kernels."""
+
+    def __init__(self, tmpdir):
+        QObject.__init__(self)
+        self.test_dir = str(tmpdir)
+        self.test_no_stderr = False
+        self.env = {'SPY_PYLAB_O': 'True'}
+        self.started = []
+        self._count = 0
+
+    def create_kernel_spec(self):
+        return Mock(argv=['python', '-m', 'spyder_kernels.console'],
+                    env=dict(self.env))
+
+    def _new_connection_file(self):
+        self._count += 1
+        return 'kernel-{}.json'.format(self._count)
+
+    def create_kernel_manager_and_kernel_client(self, connection_file,
+                                                stderr_handle):
+        km = Mock(connection_file=connection_file,
+                  kernel_spec=self.create_kernel_spec())
+        km.is_alive.return_value = True
+        self.started.append(km)
+        return km, Mock()
+
+
+@pytest.fixture
+def plugin(tmpdir):
+    return PluginMock(tmpdir)
+
+
+def test_take_and_refill(plugin):
+    """Test that kernels are taken from the pool and replaced."""
+    pool = KernelPool(plugin, size=2)
+
+    # The pool is empty at first
+    assert pool.take(plugin.create_kernel_spec()) is None
+    assert pool._refill_timer.isActive()
+    pool.refill()
+    assert len(pool) == 2
+
+    km = pool.take(plugin.create_kernel_spec())[0]
+    assert km is plugin.started[0]
+    assert len(pool) == 1
+    assert pool._refill_timer.isActive()
+    pool.refill()
+    assert len(pool) == 2
+    assert len(plugin.started) == 3
+    km.shutdown_kernel.assert_not_called()
+
+
+def test_stale_kernels(plugin):
+    """Test that kernels with other settings or that died are replaced."""
+    pool = KernelPool(plugin, size=2)
+    pool.refill()
+    first, second = plugin.started
+
+    # Kernels that died are not given to consoles
+    first.is_alive.return_value = False
+    km = pool.take(plugin.create_kernel_spec())[0]
+    assert km is second
+    first.shutdown_kernel.assert_called_once_with(now=True)
+
+    # Nor kernels started with other settings
+    pool.refill()
+    plugin.env['SPY_PYLAB_O'] = 'False'
+    assert pool.take(plugin.create_kernel_spec()) is None
+    assert len(pool) == 0
+
+    # Closing the pool shuts down its kernels
+    pool.refill()
+    kernels = plugin.started[-2:]
+    pool.close()
+    assert len(pool) == 0
+    for km in kernels:
+        km.shutdown_kernel.assert_called_once_with(now=True)
+
+
+def test_disabled_pool(plugin):
+    """Test that no kernels are started if the pool size is 0."""
+    pool = KernelPool(plugin, size=0)
+    assert pool.take(plugin.create_kernel_spec()) is None
+    assert not pool._refill_timer.isActive()
+    pool.refill()
+    assert len(pool) == 0
+    assert plugin.started == []
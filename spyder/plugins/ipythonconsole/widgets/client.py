@@ -121,6 +121,9 @@ class ClientWidget(QWidget, SaveHistoryMixin):
         self.history = []
         self.allow_rename = True
         self.stderr_dir = None
+        # Kernels taken from the pool already write to their stderr file,
+        # so it has to be appended to instead of truncated
+        self.stderr_append = False
         self.is_error_shown = False
         self.restart_thread = None
 
@@ -207,7 +210,8 @@ class ClientWidget(QWidget, SaveHistoryMixin):
             # Needed to prevent any error that could appear.
             # See spyder-ide/spyder#6267.
             try:
-                handle = codecs.open(self.stderr_file, 'w', encoding='utf-8')
+                mode = 'a' if self.stderr_append else 'w'
+                handle = codecs.open(self.stderr_file, mode, encoding='utf-8')
             except Exception:
                 handle = None
         else:
@@ -288,6 +292,10 @@ class ClientWidget(QWidget, SaveHistoryMixin):
         # Show possible errors when setting Matplotlib backend
         self._show_mpl_backend_errors()
 
+        # Log how long the kernel took to start
+        if not self.external_kernel:
+            self.shellwidget.request_startup_timeline()
+
         # To show if special console is valid
         self._check_special_console_error()
 
@@ -388,10 +396,17 @@ class ClientWidget(QWidget, SaveHistoryMixin):
                             triggered=self.shellwidget.request_syspath
                          )
 
+        timeline_action = create_action(
+                            self,
+                            _("Show kernel startup timeline"),
+                            triggered=self.shellwidget.show_startup_timeline
+                          )
+
         self.show_time_action.setChecked(self.show_elapsed_time)
         additional_actions = [MENU_SEPARATOR,
                               env_action,
                               syspath_action,
+                              timeline_action,
                               self.show_time_action]
 
         if self.menu_actions is not None:
@@ -9,11 +9,13 @@ Widget that handles communications between a console in debugging
 mode and Spyder
 """
 
+import copy
 import re
 import pdb
 
 from IPython.core.history import HistoryManager
 from qtconsole.rich_jupyter_widget import RichJupyterWidget
+from qtpy.QtCore import QTimer
 
 from spyder.config.base import get_conf_path
 from spyder.config.manager import CONF
@@ -24,6 +26,55 @@ else:
     from IPython.core.inputsplitter import IPythonInputSplitter
 
 
+def get_breakpoints_delta(old, new):
+    """
+    Return the breakpoints of the files that changed from `old` to `new`.
+
+    Files whose breakpoints were all removed get an empty list.
+    """
+    delta = dict((filename, breakpoints)
+                 for filename, breakpoints in new.items()
+                 if old.get(filename) != breakpoints)
+    for filename in old:
+        if filename not in new:
+            delta[filename] = []
+    return delta
+
+
+def merge_view_deltas(old, new):
+    """
+    Return a namespace view delta with the changes of `old` followed by
+    those of `new` (see get_namespace_view_delta in spyder_kernels).
+
+    If `new` doesn't apply to the view of `old`, it's returned as is, so
+    the mismatch is detected when it's shown.
+    """
+    if new['reset'] or new.get('base') != old.get('version'):
+        return new
+    update = dict(old['update'])
+    update.update(new['update'])
+    for name in new['remove']:
+        update.pop(name, None)
+    remove = [name for name in old['remove'] if name not in new['update']]
+    remove += [name for name in new['remove'] if name not in remove]
+    return {'reset': old['reset'], 'update': update, 'remove': remove,
+            'base': old.get('base'), 'version': new.get('version')}
+
+
+def merge_pdb_states(old, new):
+    """
+    Return a Pdb state with the latest step and variable properties of
+    `old` and `new`, and the changes of both namespace view deltas.
+    """
+    state = dict(old)
+    state.update(new)
+    if ('namespace_view_delta' in old and
+            'namespace_view_delta' in new):
+        state['namespace_view_delta'] = merge_view_deltas(
+            old['namespace_view_delta'], new['namespace_view_delta'])
+    return state
+
+
 class PdbHistory(HistoryManager):
 
     def _get_hist_file_name(self, profile=None):
@@ -44,6 +95,10 @@ class DebuggingWidget(RichJupyterWidget):
     """
     PDB_HIST_MAX = 400
 
+    # Minimum time between two refreshes from Pdb states, in milliseconds.
+    # States received in between are merged and shown together.
+    PDB_STATE_INTERVAL = 100
+
     def __init__(self, *args, **kwargs):
         self._pdb_in_loop = False
         self._previous_prompt = None
@@ -69,9 +124,19 @@ class DebuggingWidget(RichJupyterWidget):
 
         self._tmp_reading = False
         self._pdb_frame_loc = (None, None)
+        # Last breakpoints sent to the kernel
+        self._pdb_breakpoints = None
+
+        # Pdb state waiting for the end of the refresh interval
+        self._pending_pdb_state = None
+        self._pdb_state_timer = QTimer(self)
+        self._pdb_state_timer.setSingleShot(True)
+        self._pdb_state_timer.setInterval(self.PDB_STATE_INTERVAL)
+        self._pdb_state_timer.timeout.connect(self.flush_pdb_state)
 
     def handle_debug_state(self, in_debug_loop):
         """Update the debug state."""
+        self.flush_pdb_state()
         self._pdb_in_loop = in_debug_loop
         # If debugging starts or stops, clear the input queue.
         self._pdb_input_queue = []
@@ -129,8 +194,10 @@ class DebuggingWidget(RichJupyterWidget):
 
     def handle_get_pdb_settings(self):
         """Get pdb settings"""
+        breakpoints = CONF.get('run', 'breakpoints', {})
+        self._pdb_breakpoints = copy.deepcopy(breakpoints)
         return {
-            "breakpoints": CONF.get('run', 'breakpoints', {}),
+            "breakpoints": breakpoints,
             "pdb_ignore_lib": CONF.get(
                 'run', 'pdb_ignore_lib', False),
             "pdb_execute_events": CONF.get(
@@ -138,9 +205,31 @@ class DebuggingWidget(RichJupyterWidget):
             }
 
     def set_spyder_breakpoints(self):
-        """Set Spyder breakpoints into a debugging session"""
-        self.call_kernel(interrupt=True).set_breakpoints(
-            CONF.get('run', 'breakpoints', {}))
+        """
+        Set Spyder breakpoints into a debugging session.
+
+        Only the breakpoints of the files that changed since they were last
+        sent are updated.
+        """
+        breakpoints = CONF.get('run', 'breakpoints', {})
+        previous = self._pdb_breakpoints
+        self._pdb_breakpoints = copy.deepcopy(breakpoints)
+        if previous is None:
+            self.call_kernel(interrupt=True).set_breakpoints(breakpoints)
+            return
+
+        changed = get_breakpoints_delta(previous, breakpoints)
+        if changed:
+            self.call_kernel(
+                interrupt=True,
+                callback=self._update_breakpoints_callback
+            ).update_breakpoints(changed)
+
+    def _update_breakpoints_callback(self, updated):
+        """Send all breakpoints if the kernel couldn't update them."""
+        if not updated:
+            self._pdb_breakpoints = None
+            self.set_spyder_breakpoints()
 
     def set_pdb_ignore_lib(self):
         """Set pdb_ignore_lib into a debugging session"""
@@ -180,16 +269,42 @@ class DebuggingWidget(RichJupyterWidget):
                 self._pdb_frame_loc = (fname, lineno)
                 self.sig_pdb_step.emit(fname, lineno)
 
-        if 'namespace_view' in pdb_state:
+        if 'namespace_view_delta' in pdb_state:
+            self.set_namespace_view_delta(pdb_state['namespace_view_delta'])
+        elif 'namespace_view' in pdb_state:
             self.set_namespace_view(pdb_state['namespace_view'])
 
         if 'var_properties' in pdb_state:
             self.set_var_properties(pdb_state['var_properties'])
 
     def set_pdb_state(self, pdb_state):
-        """Set current pdb state."""
-        if pdb_state is not None and isinstance(pdb_state, dict):
+        """
+        Set current pdb state.
+
+        States are shown right away, unless the last one was shown less
+        than PDB_STATE_INTERVAL ago. Then they're merged and shown when the
+        interval ends, so stepping quickly doesn't flood the Editor and the
+        Variable Explorer.
+        """
+        if pdb_state is None or not isinstance(pdb_state, dict):
+            return
+        if self._pdb_state_timer.isActive():
+            if self._pending_pdb_state is None:
+                self._pending_pdb_state = pdb_state
+            else:
+                self._pending_pdb_state = merge_pdb_states(
+                    self._pending_pdb_state, pdb_state)
+        else:
+            self.refresh_from_pdb(pdb_state)
+            self._pdb_state_timer.start()
+
+    def flush_pdb_state(self):
+        """Show the Pdb state waiting for the end of the interval."""
+        if self._pending_pdb_state is not None:
+            pdb_state = self._pending_pdb_state
+            self._pending_pdb_state = None
             self.refresh_from_pdb(pdb_state)
+            self._pdb_state_timer.start()
 
     def get_pdb_last_step(self):
         """Get last pdb step retrieved from a Pdb session."""
@@ -48,23 +48,34 @@ class NamepaceBrowserWidget(RichJupyterWidget):
     # To save values and messages returned by the kernel
     _kernel_is_starting = True
 
+    # To ask the kernel for its full namespace view on the next refresh
+    _reset_namespace_view = True
+
+    # Version of the last namespace view received from the kernel
+    _namespace_view_version = None
+
     # --- Public API --------------------------------------------------
     def set_namespacebrowser(self, namespacebrowser):
         """Set namespace browser widget"""
         self.namespacebrowser = namespacebrowser
+        self._reset_namespace_view = True
+        self._namespace_view_version = None
 
     def refresh_namespacebrowser(self, interrupt=True):
         """Refresh namespace browser"""
         if self.kernel_client is None:
             return
         if self.namespacebrowser:
+            reset = self._reset_namespace_view
+            self._reset_namespace_view = False
             self.call_kernel(
                 interrupt=interrupt,
-                callback=self.set_namespace_view
-            ).get_namespace_view()
+                callback=self._set_requested_namespace_view_delta
+            ).get_namespace_view_delta(
+                reset=reset, version=self._namespace_view_version)
             self.call_kernel(
                 interrupt=interrupt,
-                callback=self.set_var_properties
+                callback=self._set_requested_var_properties
             ).get_var_properties()
 
     def set_namespace_view(self, view):
@@ -72,6 +83,21 @@ class NamepaceBrowserWidget(RichJupyterWidget):
         if self.namespacebrowser is not None:
             self.namespacebrowser.process_remote_view(view)
 
+    def set_namespace_view_delta(self, delta):
+        """Apply the changes of the namespace view sent by the kernel."""
+        if delta is None:
+            return
+        if (not delta['reset'] and
+                delta.get('base') != self._namespace_view_version):
+            # The changes don't apply to the view we have, so ask for the
+            # full one
+            self._reset_namespace_view = True
+            self.refresh_namespacebrowser()
+            return
+        self._namespace_view_version = delta.get('version')
+        if self.namespacebrowser is not None:
+            self.namespacebrowser.process_remote_view_delta(delta)
+
     def set_var_properties(self, properties):
         """Set var properties."""
         if self.namespacebrowser is not None:
@@ -152,6 +178,19 @@ class NamepaceBrowserWidget(RichJupyterWidget):
         except UnpicklingError:
             return None
 
+    # ---- Private API ---------------------------------------------
+    def _set_requested_namespace_view_delta(self, delta):
+        """Apply a namespace view delta requested to the kernel."""
+        # Deltas are relative to the previous ones, so the changes of Pdb
+        # states that are waiting to be shown must be applied first
+        self.flush_pdb_state()
+        self.set_namespace_view_delta(delta)
+
+    def _set_requested_var_properties(self, properties):
+        """Set var properties requested to the kernel."""
+        self.flush_pdb_state()
+        self.set_var_properties(properties)
+
     # ---- Private API (overrode by us) ----------------------------
     def _handle_execute_reply(self, msg):
         """
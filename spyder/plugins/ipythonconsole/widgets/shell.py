@@ -9,6 +9,7 @@ Shell Widget for the IPython Console
 """
 
 # Standard library imports
+import logging
 import os
 import os.path as osp
 import uuid
@@ -32,6 +33,9 @@ from spyder.plugins.ipythonconsole.widgets import (
         HelpWidget, NamepaceBrowserWidget, PageControlWidget)
 
 
+logger = logging.getLogger(__name__)
+
+
 class ShellWidget(NamepaceBrowserWidget, HelpWidget, DebuggingWidget,
                   FigureBrowserWidget):
     """
@@ -64,6 +68,9 @@ class ShellWidget(NamepaceBrowserWidget, HelpWidget, DebuggingWidget,
     # For global working directory
     sig_change_cwd = Signal(str)
 
+    # For the Profiler
+    sig_profile_samples = Signal(object)
+
     # For printing internal errors
     sig_exception_occurred = Signal(str, bool)
 
@@ -99,11 +106,13 @@ class ShellWidget(NamepaceBrowserWidget, HelpWidget, DebuggingWidget,
             'pdb_continue': self.pdb_continue,
             'get_pdb_settings': self.handle_get_pdb_settings,
             'run_cell': self.handle_run_cell,
+            'get_cell_code': self.handle_get_cell_code,
             'cell_count': self.handle_cell_count,
             'current_filename': self.handle_current_filename,
             'get_file_code': self.handle_get_file_code,
             'set_debug_state': self.handle_debug_state,
             'update_syspath': self.update_syspath,
+            'profile_samples': self.sig_profile_samples.emit,
         }
         for request_id in handlers:
             self.spyder_kernel_comm.register_call_handler(
@@ -232,6 +241,17 @@ class ShellWidget(NamepaceBrowserWidget, HelpWidget, DebuggingWidget,
         self.call_kernel(
             interrupt=True, callback=self.sig_show_env.emit).get_env()
 
+    def request_startup_timeline(self):
+        """Ask the kernel for the timeline of its startup and log it."""
+        self.call_kernel(
+            callback=self._log_startup_timeline).get_startup_timeline()
+
+    def show_startup_timeline(self):
+        """Ask the kernel for the timeline of its startup and print it."""
+        self.call_kernel(
+            interrupt=True, callback=self._print_startup_timeline
+            ).get_startup_timeline()
+
     # --- To handle the banner
     def long_banner(self):
         """Banner for clients with additional content."""
@@ -574,6 +594,28 @@ the sympy module (e.g. plot)
         # The file is open, load code from editor
         return editor.get_cell_code(cell_name)
 
+    def handle_get_cell_code(self, cell_name, filename, file_version=None):
+        """
+        Get cell code from cell name and file name, together with the
+        version of the file code.
+
+        The kernel caches the code of the file, so it's only returned if
+        its version is different from `file_version`.
+        """
+        cell_code = self.handle_run_cell(cell_name, filename)
+        editorstack = self.get_editorstack()
+        finfo = editorstack.data[editorstack.has_filename(filename)]
+        version = '{}-{}'.format(finfo.uid, finfo.revision)
+        if version == file_version:
+            file_code = None
+        else:
+            file_code = finfo.editor.toPlainText()
+        return {
+            'cell_code': cell_code,
+            'file_version': version,
+            'file_code': file_code,
+        }
+
     def handle_cell_count(self, filename):
         """Get number of cells in file to loop."""
         editorstack = self.get_editorstack()
@@ -590,6 +632,19 @@ the sympy module (e.g. plot)
         """Get the current filename."""
         return self.get_editorstack().get_current_finfo().filename
 
+    def _log_startup_timeline(self, timeline):
+        """Log the startup timeline sent by the kernel."""
+        logger.debug(timeline['report'])
+
+    def _print_startup_timeline(self, timeline):
+        """Print the startup timeline sent by the kernel."""
+        if timeline['entries']:
+            report = timeline['report']
+        else:
+            report = _("The startup timeline is only available for kernels "
+                       "started by Spyder")
+        self._append_plain_text('\n' + report + '\n', before_prompt=True)
+
     # ---- Private methods (overrode by us) ---------------------------------
 
     def _handle_error(self, msg):
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""Tests for the merging of Pdb states."""
+
+# Local imports
+from spyder.plugins.ipythonconsole.widgets.debugging import merge_pdb_states
+
+
+def test_merge_pdb_states():
+    """Test that the latest step is kept and view deltas are combined."""
+    old = {'step': {'fname': 'test.py', 'lineno': 1},
+           'namespace_view_delta': {'reset': False,
+                                    'update': {'a': 1, 'b': 1},
+                                    'remove': ['c', 'd']},
+           'var_properties': {'a': 1}}
+    new = {'step': {'fname': 'test.py', 'lineno': 2},
+           'namespace_view_delta': {'reset': False,
+                                    'update': {'a': 2, 'c': 2},
+                                    'remove': ['b']}}
+
+    state = merge_pdb_states(old, new)
+    assert state['step'] == new['step']
+    assert state['var_properties'] == old['var_properties']
+    assert state['namespace_view_delta'] == {'reset': False,
+                                             'update': {'a': 2, 'c': 2},
+                                             'remove': ['d', 'b']}
+
+    # Full views replace the previous changes
+    new['namespace_view_delta']['reset'] = True
+    state = merge_pdb_states(old, new)
+    assert state['namespace_view_delta'] == new['namespace_view_delta']
+
+    # But not the other way around
+    state = merge_pdb_states(new, {'step': old['step']})
+    assert state['namespace_view_delta'] == new['namespace_view_delta']
+    assert state['step'] == old['step']
@@ -9,6 +9,7 @@ Tests for editortool.py
 """
 # Standard Libray Imports
 from textwrap import dedent
+from unittest.mock import patch
 
 # Third party imports
 import pytest
@@ -415,6 +416,44 @@ def test_code_cell_grouping(create_outlineexplorer):
         if type(item) == FunctionItem:
             assert item.is_method() == expected_result[4]
 
+
+def test_filter_symbols(create_outlineexplorer, qtbot):
+    """
+    Test that the symbol filter searches the trees of all files, and that
+    the trees of files that didn't change are not populated again.
+    """
+    outlineexplorer = create_outlineexplorer(TEXT, 'test.py')
+    tree_widget = outlineexplorer.treewidget
+    editor = tree_widget.current_editor
+
+    code_editor = CodeEditor(None)
+    code_editor.set_language('py', 'other.py')
+    code_editor.set_text("def method1_helper():\n    pass\n\n\n"
+                         "def other():\n    pass\n")
+    other_editor = OutlineExplorerProxyEditor(code_editor, 'other.py')
+    outlineexplorer.set_current_editor(other_editor, False, False)
+
+    # Going back to a file that didn't change doesn't populate its tree
+    tree_widget.stale_editor_ids.clear()
+    with patch.object(tree_widget, 'populate_branch') as populate_branch:
+        outlineexplorer.set_current_editor(editor, True, False)
+        assert not populate_branch.called
+
+    # Symbols are searched in all files, once typing stops
+    outlineexplorer.filter_edit.setText('METHOD')
+    outlineexplorer.filter_edit.setText('METHOD1')
+    assert tree_widget.filter_text == ''
+    qtbot.waitUntil(lambda: tree_widget.filter_text == 'METHOD1')
+    visible_items = [item.text(0) for item in tree_widget.get_visible_items()]
+    assert visible_items == ['test.py', 'classes', 'class1', 'method1',
+                             'other.py', 'method1_helper']
+
+    # All symbols are shown again when the filter is cleared
+    outlineexplorer.filter_edit.setText('')
+    qtbot.waitUntil(lambda: tree_widget.filter_text == '')
+    assert not any(item.isHidden() for item in tree_widget.get_items())
+
+
 # Code used to create expected_results
 # =============================================================================
 #     for item in cell_items2:
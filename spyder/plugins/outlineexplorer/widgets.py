@@ -12,9 +12,9 @@ import os.path as osp
 
 # Third party imports
 from qtpy.compat import from_qvariant
-from qtpy.QtCore import QSize, Qt, Signal, Slot
-from qtpy.QtWidgets import (QHBoxLayout, QTreeWidgetItem, QWidget,
-                            QTreeWidgetItemIterator)
+from qtpy.QtCore import QSize, Qt, QTimer, Signal, Slot
+from qtpy.QtWidgets import (QHBoxLayout, QLineEdit, QTreeWidgetItem,
+                            QWidget, QTreeWidgetItemIterator)
 
 # Local imports
 from spyder.config.base import _, STDOUT
@@ -25,6 +25,10 @@ from spyder.utils.qthelpers import (create_action, create_toolbutton,
 from spyder.widgets.onecolumntree import OneColumnTree
 
 
+# Delay before applying a new symbol filter, in milliseconds
+FILTER_DELAY = 300
+
+
 class FileRootItem(QTreeWidgetItem):
     def __init__(self, path, treewidget, is_python=True):
         QTreeWidgetItem.__init__(self, treewidget, QTreeWidgetItem.Type)
@@ -209,11 +213,16 @@ class OutlineExplorerTreeWidget(OneColumnTree):
         self.editor_tree_cache = {}
         self.editor_ids = {}
         self.ordered_editor_ids = []
+        # Ids of the editors whose tree is out of date
+        self.stale_editor_ids = set()
+        self.filter_text = ''
+        self.unfiltered_state = None
         self._current_editor = None
         title = _("Outline")
         self.set_title(title)
         self.setWindowTitle(title)
         self.setUniformRowHeights(True)
+        self.itemExpanded.connect(self.item_expanded)
 
     @property
     def current_editor(self):
@@ -364,10 +373,9 @@ class OutlineExplorerTreeWidget(OneColumnTree):
                 self.scrollToItem(item)
                 self.root_item_selected(item)
                 self.__hide_or_show_root_items(item)
-            if update:
+            if update and editor_id in self.stale_editor_ids:
                 self.save_expanded_state()
-                tree_cache = self.editor_tree_cache[editor_id]
-                self.populate_branch(editor, item, tree_cache)
+                self.__do_update(editor, editor_id)
                 self.restore_expanded_state()
         else:
             root_item = FileRootItem(editor.fname, self, editor.is_python())
@@ -382,6 +390,10 @@ class OutlineExplorerTreeWidget(OneColumnTree):
             self.editor_ids[editor] = editor_id
             self.ordered_editor_ids.append(editor_id)
             self.__sort_toplevel_items()
+            editor.sig_outline_explorer_data_changed.connect(
+                self.editor_data_changed)
+        if self.filter_text:
+            self.__filter_root_item(self.editor_items[editor_id])
         self.current_editor = editor
 
     def file_renamed(self, editor, new_filename):
@@ -396,16 +408,24 @@ class OutlineExplorerTreeWidget(OneColumnTree):
             root_item = self.editor_items[editor_id]
             root_item.set_path(new_filename, fullpath=self.show_fullpath)
             self.__sort_toplevel_items()
+            # The file type, and with it its symbols, could have changed
+            self.stale_editor_ids.add(editor_id)
 
     @Slot()
     def update_all(self):
         """
         Update the outline explorer for all editors tree preserving the tree
-        state
+        state.
+
+        Only the trees that can be seen are updated right away. The others
+        are updated when they are shown.
         """
+        self.stale_editor_ids.update(self.editor_ids.values())
         self.save_expanded_state()
         for editor, editor_id in list(self.editor_ids.items()):
-            self.__do_update(editor, editor_id)
+            if (editor_id in self.stale_editor_ids and
+                    self.__is_shown(editor, editor_id)):
+                self.__do_update(editor, editor_id)
         self.restore_expanded_state()
         self.do_follow_cursor()
 
@@ -431,18 +451,116 @@ class OutlineExplorerTreeWidget(OneColumnTree):
         """
         item = self.editor_items[editor_id]
         tree_cache = self.editor_tree_cache[editor_id]
+        self.stale_editor_ids.discard(editor_id)
         self.populate_branch(editor, item, tree_cache)
+        if self.filter_text:
+            self.__filter_root_item(item)
+
+    def __is_shown(self, editor, editor_id):
+        """Return True if the tree of an editor can be seen."""
+        if editor is self.current_editor or self.filter_text:
+            return True
+        item = self.editor_items[editor_id]
+        return item.isExpanded() and not item.isHidden()
+
+    @Slot()
+    def editor_data_changed(self):
+        """
+        Mark the tree of an editor as out of date.
+
+        The current editor is updated by `update_current`, and the others
+        only if their tree can be seen.
+        """
+        editor = self.sender()
+        editor_id = self.editor_ids.get(editor)
+        if editor_id is None:
+            return
+        self.stale_editor_ids.add(editor_id)
+        if (editor is not self.current_editor and
+                self.__is_shown(editor, editor_id)):
+            self.__do_update(editor, editor_id)
+
+    @Slot(QTreeWidgetItem)
+    def item_expanded(self, item):
+        """Update the tree of a file when its root item is expanded."""
+        if not isinstance(item, FileRootItem):
+            return
+        for editor, editor_id in list(self.editor_ids.items()):
+            if (self.editor_items.get(editor_id) is item and
+                    editor_id in self.stale_editor_ids):
+                self.__do_update(editor, editor_id)
+                break
+
+    def set_filter_text(self, text):
+        """
+        Show only the symbols whose name contains `text` (ignoring case),
+        in all files.
+
+        Out of date trees are updated first so all files can be searched.
+        """
+        text = to_text_string(text)
+        if text and not self.filter_text:
+            self.unfiltered_state = self.get_expanded_state()
+        self.filter_text = text
+        if text:
+            for editor, editor_id in list(self.editor_ids.items()):
+                if editor_id in self.stale_editor_ids:
+                    self.__do_update(editor, editor_id)
+            for root_item in self.get_top_level_items():
+                self.__filter_root_item(root_item)
+        else:
+            for item in self.get_items():
+                item.setHidden(False)
+            if self.current_editor is not None:
+                editor_id = self.editor_ids[self.current_editor]
+                self.__hide_or_show_root_items(self.editor_items[editor_id])
+            if self.unfiltered_state is not None:
+                self.set_expanded_state(self.unfiltered_state)
+                self.unfiltered_state = None
+
+    def __filter_root_item(self, root_item):
+        """Apply the symbol filter to the tree of a file."""
+        matches = self.__filter_children(root_item,
+                                         self.filter_text.lower())
+        root_item.setHidden(not matches)
+        if matches:
+            root_item.setExpanded(True)
+
+    def __filter_children(self, item, text):
+        """
+        Hide the children of `item` that don't match `text` and have no
+        matching descendants.
+
+        Return True if any child is left visible.
+        """
+        any_visible = False
+        for index in range(item.childCount()):
+            child = item.child(index)
+            descendant_matches = self.__filter_children(child, text)
+            visible = (descendant_matches or
+                       text in to_text_string(child.text(0)).lower())
+            child.setHidden(not visible)
+            if descendant_matches:
+                child.setExpanded(True)
+            any_visible = any_visible or visible
+        return any_visible
 
     def remove_editor(self, editor):
         if editor in self.editor_ids:
             if self.current_editor is editor:
                 self.current_editor = None
             editor_id = self.editor_ids.pop(editor)
+            try:
+                editor.sig_outline_explorer_data_changed.disconnect(
+                    self.editor_data_changed)
+            except (RuntimeError, TypeError):
+                pass
             if editor_id in self.ordered_editor_ids:
                 self.ordered_editor_ids.remove(editor_id)
             if editor_id not in list(self.editor_ids.values()):
                 root_item = self.editor_items.pop(editor_id)
                 self.editor_tree_cache.pop(editor_id)
+                self.stale_editor_ids.discard(editor_id)
                 try:
                     self.takeTopLevelItem(self.indexOfTopLevelItem(root_item))
                 except RuntimeError:
@@ -771,6 +889,16 @@ class OutlineExplorerWidget(QWidget):
                                            toggled=self.toggle_visibility)
         self.visibility_action.setChecked(True)
 
+        self.filter_edit = QLineEdit(self)
+        self.filter_edit.setPlaceholderText(_("Filter symbols in all files"))
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY)
+        self.filter_timer.timeout.connect(
+            lambda: self.treewidget.set_filter_text(self.filter_edit.text()))
+        self.filter_edit.textChanged.connect(self.filter_timer.start)
+
         btn_layout = QHBoxLayout()
         for btn in self.setup_buttons():
             btn.setAutoRaise(True)
@@ -780,7 +908,9 @@ class OutlineExplorerWidget(QWidget):
             btn_layout.addStretch()
             btn_layout.addWidget(options_button, Qt.AlignRight)
 
-        layout = create_plugin_layout(btn_layout, self.treewidget)
+        layout = create_plugin_layout(btn_layout)
+        layout.addWidget(self.filter_edit)
+        layout.addWidget(self.treewidget)
         self.setLayout(layout)
 
     @Slot(bool)
@@ -107,6 +107,7 @@ class Plots(SpyderPluginWidget):
             fig_browser = self.shellwidgets.pop(shellwidget_id)
             self.remove_widget(fig_browser)
             fig_browser.close()
+            fig_browser.thumbnails_sb.figure_store.close()
 
     def set_shellwidget_from_id(self, shellwidget_id):
         if shellwidget_id in self.shellwidgets:
@@ -11,24 +11,27 @@ This is the main widget used in the Plots plugin
 """
 
 # ---- Standard library imports
+from collections import OrderedDict
 import datetime
+import os
 import os.path as osp
 import sys
+import tempfile
 
 # ---- Third library imports
 import qdarkstyle
 from qtconsole.svg import svg_to_image, svg_to_clipboard
 from qtpy.compat import getsavefilename, getexistingdirectory
-from qtpy.QtCore import Qt, Signal, QRect, QEvent, QPoint, QSize, QTimer, Slot
-from qtpy.QtGui import QPixmap, QPainter, QKeySequence
+from qtpy.QtCore import (Qt, Signal, QBuffer, QByteArray, QRect, QEvent,
+                         QPoint, QSize, QTimer, Slot)
+from qtpy.QtGui import QImageReader, QPixmap, QPainter, QKeySequence
+from qtpy.QtSvg import QSvgRenderer
 from qtpy.QtWidgets import (QApplication, QHBoxLayout, QMenu,
                             QVBoxLayout, QWidget, QGridLayout, QFrame,
                             QScrollArea, QScrollBar, QSpinBox, QSplitter,
                             QStyle)
 
 # ---- Local library imports
-import spyder.utils.icon_manager as ima
-
 from spyder.config.base import _
 from spyder.config.manager import CONF
 from spyder.utils import icon_manager as ima
@@ -39,6 +42,18 @@ from spyder.utils.misc import getcwd_or_home
 from spyder.config.gui import is_dark_interface
 
 
+# Maximum number of thumbnail pixmaps kept in memory
+MAX_THUMBNAILS = 200
+
+# Maximum number of full size pixmaps kept in memory
+MAX_RENDERS = 4
+
+# File extension of each figure format
+FIGURE_EXTENSIONS = {'image/png': '.png',
+                     'image/jpeg': '.jpg',
+                     'image/svg+xml': '.svg'}
+
+
 def save_figure_tofile(fig, fmt, fname):
     """Save fig to fname in the format specified by fmt."""
     root, ext = osp.splitext(fname)
@@ -68,6 +83,168 @@ def get_unique_figname(dirname, root, ext):
             return osp.join(dirname, figname)
 
 
+def get_figure_size(fig, fmt):
+    """
+    Return the size in pixels of a png, jpg, or svg image, without decoding
+    it, or (0, 0) if it's not valid.
+    """
+    if fmt == 'image/svg+xml':
+        renderer = QSvgRenderer(QByteArray(fig))
+        size = renderer.defaultSize() if renderer.isValid() else QSize()
+    else:
+        buffer = QBuffer()
+        buffer.setData(QByteArray(fig))
+        size = QImageReader(buffer, fmt.split('/')[-1].encode()).size()
+    if not size.isValid():
+        return 0, 0
+    return size.width(), size.height()
+
+
+class FigureStore(object):
+    """
+    Figures saved in a temporary directory instead of kept in memory.
+
+    Figures are only decoded when their pixmaps are requested for painting,
+    and the least recently used pixmaps are dropped once there are more of
+    them than allowed. Thumbnails and full size renders are bounded
+    separately.
+    """
+
+    def __init__(self, max_thumbnails=MAX_THUMBNAILS,
+                 max_renders=MAX_RENDERS):
+        self.max_thumbnails = max_thumbnails
+        self.max_renders = max_renders
+        self._tempdir = None
+        self._figures = {}
+        self._next_key = 0
+        self._thumbnails = OrderedDict()
+        self._renders = OrderedDict()
+
+    def add(self, fig, fmt):
+        """Save a figure and return its key."""
+        key = self._next_key
+        self._next_key += 1
+        is_text = isinstance(fig, str)
+        data = fig.encode('utf-8') if is_text else fig
+        entry = {'fmt': fmt,
+                 'is_text': is_text,
+                 'size': get_figure_size(data, fmt),
+                 'filename': None,
+                 'data': data}
+        try:
+            if self._tempdir is None:
+                self._tempdir = tempfile.TemporaryDirectory(
+                    prefix='spyder-plots-')
+            filename = osp.join(self._tempdir.name,
+                                str(key) + FIGURE_EXTENSIONS.get(fmt, ''))
+            with open(filename, 'wb') as f:
+                f.write(data)
+            entry['filename'] = filename
+            entry['data'] = None
+        except (IOError, OSError):
+            # Keep the figure in memory if it can't be saved
+            pass
+        self._figures[key] = entry
+        return key
+
+    def get_figure(self, key):
+        """Return the data of a figure, as it was added."""
+        entry = self._figures[key]
+        data = entry['data']
+        if data is None:
+            with open(entry['filename'], 'rb') as f:
+                data = f.read()
+        if entry['is_text']:
+            data = data.decode('utf-8')
+        return data
+
+    def get_format(self, key):
+        """Return the format of a figure."""
+        return self._figures[key]['fmt']
+
+    def get_size(self, key):
+        """Return the (width, height) of a figure, in pixels."""
+        return self._figures[key]['size']
+
+    def get_pixmap(self, key, size=None, thumbnail=False):
+        """
+        Return a pixmap of a figure.
+
+        Parameters
+        ----------
+        key: int
+            Key of the figure.
+        size: QSize
+            Size to render the figure to. Bitmaps are scaled to its width to
+            keep their ratio. If None, the figure is rendered to its size.
+        thumbnail: bool
+            Whether the pixmap is a thumbnail. Thumbnails don't replace the
+            full size renders in memory.
+        """
+        if thumbnail:
+            cache, max_entries = self._thumbnails, self.max_thumbnails
+        else:
+            cache, max_entries = self._renders, self.max_renders
+        cache_key = (key,) if size is None else (key, size.width(),
+                                                 size.height())
+        pixmap = cache.pop(cache_key, None)
+        if pixmap is None:
+            pixmap = self._render(key, size, thumbnail)
+        cache[cache_key] = pixmap
+        while len(cache) > max_entries:
+            cache.popitem(last=False)
+        return pixmap
+
+    def _render(self, key, size, thumbnail):
+        fmt = self.get_format(key)
+        if fmt == 'image/svg+xml':
+            try:
+                return QPixmap(svg_to_image(self.get_figure(key), size))
+            except ValueError:
+                return QPixmap()
+        if size is not None:
+            if thumbnail:
+                original = self._render(key, None, thumbnail)
+            else:
+                original = self.get_pixmap(key)
+            if original.width() == size.width():
+                return original
+            return original.scaledToWidth(size.width(),
+                                          mode=Qt.SmoothTransformation)
+        pixmap = QPixmap()
+        pixmap.loadFromData(self.get_figure(key), fmt.upper())
+        return pixmap
+
+    def remove(self, key):
+        """Remove a figure and its pixmaps."""
+        entry = self._figures.pop(key, None)
+        if entry is None:
+            return
+        for cache in [self._thumbnails, self._renders]:
+            for cache_key in list(cache):
+                if cache_key[0] == key:
+                    del cache[cache_key]
+        if entry['filename'] is not None:
+            try:
+                os.remove(entry['filename'])
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove all figures."""
+        for key in list(self._figures):
+            self.remove(key)
+
+    def close(self):
+        """Remove all figures and the temporary directory."""
+        self._figures = {}
+        self._thumbnails.clear()
+        self._renders.clear()
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
+
+
 class FigureBrowser(QWidget):
     """
     Widget to browse the figures that were sent by the kernel to the IPython
@@ -520,6 +697,12 @@ class FigureViewer(QScrollArea):
         self.scale_image()
         self.figcanvas.repaint()
 
+    def load_stored_figure(self, figure_store, key):
+        """Set a figure saved in a FigureStore in the figure canvas."""
+        self.figcanvas.set_stored_figure(figure_store, key)
+        self.scale_image()
+        self.figcanvas.repaint()
+
     def eventFilter(self, widget, event):
         """A filter to control the zooming and panning of the figure canvas."""
 
@@ -616,7 +799,7 @@ class FigureViewer(QScrollArea):
                     new_width = int(height / fheight * fwidth)
             except ZeroDivisionError:
                 icon = ima.icon('broken_image')
-                self.figcanvas._qpix_orig = icon.pixmap(fwidth, fheight)
+                self.figcanvas.set_broken_image(icon.pixmap(fwidth, fheight))
                 self.figcanvas.setToolTip(
                     _('The image is broken, please try to generate it again'))
                 new_width = fwidth
@@ -661,6 +844,7 @@ class ThumbnailScrollBar(QFrame):
     def __init__(self, figure_viewer, parent=None, background_color=None):
         super().__init__(parent)
         self._thumbnails = []
+        self.figure_store = FigureStore()
 
         self.background_color = background_color
         self.current_thumbnail = None
@@ -846,7 +1030,8 @@ class ThumbnailScrollBar(QFrame):
         """
         thumbnail = FigureThumbnail(
             parent=self, background_color=self.background_color)
-        thumbnail.canvas.load_figure(fig, fmt)
+        thumbnail.canvas.set_stored_figure(
+            self.figure_store, self.figure_store.add(fig, fmt))
         thumbnail.sig_canvas_clicked.connect(self.set_current_thumbnail)
         thumbnail.sig_remove_figure.connect(self.remove_thumbnail)
         thumbnail.sig_save_figure.connect(self.save_figure_as)
@@ -880,6 +1065,7 @@ class ThumbnailScrollBar(QFrame):
         self._thumbnails = []
         self.current_thumbnail = None
         self.figure_viewer.figcanvas.clear_canvas()
+        self.figure_store.clear()
 
     def remove_thumbnail(self, thumbnail):
         """Remove thumbnail."""
@@ -911,6 +1097,7 @@ class ThumbnailScrollBar(QFrame):
         self.layout().removeWidget(thumbnail)
         thumbnail.hide()
         thumbnail.close()
+        self.figure_store.remove(thumbnail.canvas.key)
 
         # See: spyder-ide/spyder#12459
         QTimer.singleShot(150, lambda: thumbnail.setParent(None))
@@ -929,8 +1116,8 @@ class ThumbnailScrollBar(QFrame):
     def set_current_thumbnail(self, thumbnail):
         """Set the currently selected thumbnail."""
         self.current_thumbnail = thumbnail
-        self.figure_viewer.load_figure(
-            thumbnail.canvas.fig, thumbnail.canvas.fmt)
+        self.figure_viewer.load_stored_figure(
+            self.figure_store, thumbnail.canvas.key)
         for thumbnail in self._thumbnails:
             thumbnail.highlight_canvas(thumbnail == self.current_thumbnail)
 
@@ -1002,7 +1189,8 @@ class FigureThumbnail(QWidget):
 
     def __init__(self, parent=None, background_color=None):
         super().__init__(parent)
-        self.canvas = FigureCanvas(self, background_color=background_color)
+        self.canvas = FigureCanvas(self, background_color=background_color,
+                                   thumbnail=True)
         self.canvas.installEventFilter(self)
         self.canvas.sig_clear_fig_requested.connect(self.emit_remove_figure)
         self.canvas.sig_save_fig_requested.connect(self.emit_save_figure)
@@ -1076,11 +1264,13 @@ class FigureThumbnail(QWidget):
 class FigureCanvas(QFrame):
     """
     A basic widget on which can be painted a custom png, jpg, or svg image.
+
+    The image is kept in a FigureStore and only decoded when painted.
     """
     sig_clear_fig_requested = Signal()
     sig_save_fig_requested = Signal()
 
-    def __init__(self, parent=None, background_color=None):
+    def __init__(self, parent=None, background_color=None, thumbnail=False):
         super().__init__(parent)
         self.setLineWidth(2)
         self.setMidLineWidth(1)
@@ -1088,17 +1278,34 @@ class FigureCanvas(QFrame):
         self.setStyleSheet(
             "#figcanvas {background-color:" + str(background_color) + "}")
 
-        self.fig = None
-        self.fmt = None
+        self.figure_store = None
+        self.key = None
+        self.thumbnail = thumbnail
         self.fwidth, self.fheight = 200, 200
         self._blink_flag = False
+        self._own_figure_store = None
+        self._qpix_broken = None
 
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.context_menu_requested)
 
+    @property
+    def fig(self):
+        """Data of the figure painted on the widget, or None."""
+        if self.key is None:
+            return None
+        return self.figure_store.get_figure(self.key)
+
+    @property
+    def fmt(self):
+        """Format of the figure painted on the widget, or None."""
+        if self.key is None:
+            return None
+        return self.figure_store.get_format(self.key)
+
     def context_menu_requested(self, event):
         """Popup context menu."""
-        if self.fig:
+        if self.key is not None:
             pos = QPoint(event.x(), event.y())
             context_menu = QMenu(self)
             context_menu.addAction(
@@ -1134,7 +1341,7 @@ class FigureCanvas(QFrame):
 
     def blink_figure(self):
         """Blink figure once."""
-        if self.fig:
+        if self.key is not None:
             self._blink_flag = not self._blink_flag
             self.repaint()
             if self._blink_flag:
@@ -1143,28 +1350,30 @@ class FigureCanvas(QFrame):
 
     def clear_canvas(self):
         """Clear the figure that was painted on the widget."""
-        self.fig = None
-        self.fmt = None
-        self._qpix_scaled = None
+        self.key = None
         self.repaint()
 
     def load_figure(self, fig, fmt):
-        """
-        Load the figure from a png, jpg, or svg image, convert it in
-        a QPixmap, and force a repaint of the widget.
-        """
-        self.fig = fig
-        self.fmt = fmt
-
-        if fmt in ['image/png', 'image/jpeg']:
-            self._qpix_orig = QPixmap()
-            self._qpix_orig.loadFromData(fig, fmt.upper())
-        elif fmt == 'image/svg+xml':
-            self._qpix_orig = QPixmap(svg_to_image(fig))
-
-        self._qpix_scaled = self._qpix_orig
-        self.fwidth = self._qpix_orig.width()
-        self.fheight = self._qpix_orig.height()
+        """Load the figure from a png, jpg, or svg image."""
+        # Figures loaded directly are saved in a store of their own that
+        # only keeps the last one
+        if self._own_figure_store is None:
+            self._own_figure_store = FigureStore(max_thumbnails=1,
+                                                 max_renders=2)
+        self._own_figure_store.clear()
+        self.set_stored_figure(self._own_figure_store,
+                               self._own_figure_store.add(fig, fmt))
+
+    def set_stored_figure(self, figure_store, key):
+        """Set the figure of `key` in `figure_store`."""
+        self.figure_store = figure_store
+        self.key = key
+        self.fwidth, self.fheight = figure_store.get_size(key)
+        self._qpix_broken = None
+
+    def set_broken_image(self, qpixmap):
+        """Paint `qpixmap` instead of the figure, which can't be shown."""
+        self._qpix_broken = qpixmap
 
     def paintEvent(self, event):
         """Qt method override to paint a custom image on the Widget."""
@@ -1175,22 +1384,19 @@ class FigureCanvas(QFrame):
                      self.size().width() - 2 * fw,
                      self.size().height() - 2 * fw)
 
-        if self.fig is None or self._blink_flag:
+        if self.key is None or self._blink_flag:
             return
 
-        # Prepare the scaled qpixmap to paint on the widget.
-        if (self._qpix_scaled is None or
-                self._qpix_scaled.size().width() != rect.width()):
-            if self.fmt in ['image/png', 'image/jpeg']:
-                self._qpix_scaled = self._qpix_orig.scaledToWidth(
-                    rect.width(), mode=Qt.SmoothTransformation)
-            elif self.fmt == 'image/svg+xml':
-                self._qpix_scaled = QPixmap(svg_to_image(
-                    self.fig, rect.size()))
-
-        if self._qpix_scaled is not None:
+        # Get the scaled qpixmap to paint on the widget.
+        if self._qpix_broken is not None:
+            qpix_scaled = self._qpix_broken.scaled(rect.size())
+        else:
+            qpix_scaled = self.figure_store.get_pixmap(
+                self.key, rect.size(), thumbnail=self.thumbnail)
+
+        if not qpix_scaled.isNull():
             # Paint the image on the widget.
             qp = QPainter()
             qp.begin(self)
-            qp.drawPixmap(rect, self._qpix_scaled)
+            qp.drawPixmap(rect, qpix_scaled)
             qp.end()
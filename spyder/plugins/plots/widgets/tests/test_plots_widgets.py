@@ -21,7 +21,7 @@ from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 from qtpy.QtWidgets import QApplication, QStyle
 from qtpy.QtGui import QPixmap
-from qtpy.QtCore import Qt
+from qtpy.QtCore import Qt, QSize
 
 # Local imports
 from spyder.plugins.plots.widgets.figurebrowser import (FigureBrowser,
@@ -229,6 +229,42 @@ def test_close_one_thumbnail(qtbot, figbrowser, tmpdir, fmt):
     assert len(figbrowser.thumbnails_sb.findChildren(FigureThumbnail)) == 1
 
 
+@pytest.mark.parametrize("fmt", ['image/png', 'image/svg+xml'])
+def test_figure_store(figbrowser, tmpdir, fmt):
+    """
+    Test that figures are saved to disk and that only a bounded number of
+    their pixmaps are kept in memory.
+    """
+    figs = add_figures_to_browser(figbrowser, 5, tmpdir, fmt)
+    thumbnails_sb = figbrowser.thumbnails_sb
+    figure_store = thumbnails_sb.figure_store
+    figure_store.max_thumbnails = 2
+    keys = [thumbnail.canvas.key for thumbnail in thumbnails_sb._thumbnails]
+
+    # Figure data is only kept on disk
+    for key, fig in zip(keys, figs):
+        assert figure_store._figures[key]['data'] is None
+        assert figure_store.get_figure(key) == fig
+
+    # Only the last used thumbnails are kept
+    for key in keys:
+        pixmap = figure_store.get_pixmap(key, QSize(50, 50), thumbnail=True)
+        assert pixmap.width() == 50
+    assert list(figure_store._thumbnails) == [(keys[3], 50, 50),
+                                              (keys[4], 50, 50)]
+    assert len(figure_store._renders) <= figure_store.max_renders
+
+    # Removing a thumbnail removes its figure from disk
+    filename = figure_store._figures[keys[0]]['filename']
+    assert osp.exists(filename)
+    thumbnails_sb.remove_thumbnail(thumbnails_sb._thumbnails[0])
+    assert not osp.exists(filename)
+    assert keys[0] not in figure_store._figures
+
+    figbrowser.close_all_figures()
+    assert figure_store._figures == {}
+
+
 @pytest.mark.parametrize("fmt", ['image/png', 'image/svg+xml'])
 def test_go_prev_next_thumbnail(figbrowser, tmpdir, fmt):
     """
@@ -35,7 +35,23 @@ class ProfilerConfigPage(PluginConfigPage):
         results_layout.addWidget(results_label2)
         results_group.setLayout(results_layout)
 
+        sampling_group = QGroupBox(_("Profiling in a console"))
+        sampling_label = QLabel(_("Code profiled in a console is sampled "
+                                  "periodically instead of being traced, "
+                                  "which has a much lower overhead."))
+        sampling_label.setWordWrap(True)
+        interval_spin = self.create_spinbox(
+            _("Sampling interval:"), _("ms"), 'sampling_interval',
+            min_=1, max_=1000, step=1,
+            tip=_("Time between two samples of the call stack"))
+
+        sampling_layout = QVBoxLayout()
+        sampling_layout.addWidget(sampling_label)
+        sampling_layout.addWidget(interval_spin)
+        sampling_group.setLayout(sampling_layout)
+
         vlayout = QVBoxLayout()
         vlayout.addWidget(results_group)
+        vlayout.addWidget(sampling_group)
         vlayout.addStretch(1)
         self.setLayout(vlayout)
@@ -16,6 +16,7 @@ from qtpy.QtWidgets import QVBoxLayout
 from spyder.config.base import _
 from spyder.config.gui import is_dark_interface
 from spyder.api.plugins import SpyderPluginWidget
+from spyder.plugins.outlineexplorer.api import cell_name
 from spyder.preferences.runconfig import get_run_configuration
 from spyder.utils import icon_manager as ima
 from spyder.utils.qthelpers import create_action
@@ -74,6 +75,9 @@ class Profiler(SpyderPluginWidget):
     def register_plugin(self):
         """Register plugin in Spyder's main window"""
         self.profiler.datatree.sig_edit_goto.connect(self.main.editor.load)
+        if self.main.ipyconsole is not None:
+            self.main.ipyconsole.sig_profile_samples.connect(
+                self.show_samples)
         self.profiler.redirect_stdio.connect(
             self.main.redirect_internalshell_stdio)
         self.add_dockwidget()
@@ -85,8 +89,21 @@ class Profiler(SpyderPluginWidget):
         self.register_shortcut(profiler_act, context="Profiler",
                                name="Run profiler")
         
-        self.main.run_menu_actions += [profiler_act]
-        self.main.editor.pythonfile_dependent_actions += [profiler_act]
+        sampling_act = create_action(self, _("Profile in console"),
+                                     icon=self.get_plugin_icon(),
+                                     triggered=self.run_sampling_profiler)
+        sampling_act.setEnabled(self.main.ipyconsole is not None)
+
+        sampling_cell_act = create_action(
+            self, _("Profile cell in console"), icon=self.get_plugin_icon(),
+            triggered=self.run_sampling_profiler_cell)
+        sampling_cell_act.setEnabled(self.main.ipyconsole is not None)
+
+        self.main.run_menu_actions += [profiler_act, sampling_act,
+                                       sampling_cell_act]
+        self.main.editor.pythonfile_dependent_actions += [profiler_act,
+                                                          sampling_act,
+                                                          sampling_cell_act]
 
     def refresh_plugin(self):
         """Refresh profiler widget"""
@@ -100,11 +117,40 @@ class Profiler(SpyderPluginWidget):
             self.switch_to_plugin()
             self.analyze(self.main.editor.get_current_filename())
 
-    def analyze(self, filename):
-        """Reimplement analyze method"""
-        if self.dockwidget:
-            self.switch_to_plugin()
-        pythonpath = self.main.get_spyder_pythonpath()
+    def run_sampling_profiler(self):
+        """
+        Profile the current file in the current console, by sampling its
+        call stack from the kernel.
+        """
+        if self.main.editor.save():
+            filename = self.main.editor.get_current_filename()
+            wdir, args = self.get_run_settings(filename)
+            interval = self.get_option('sampling_interval') / 1000.
+            self.main.ipyconsole.profile_script(filename, wdir, args,
+                                                interval)
+
+    def run_sampling_profiler_cell(self):
+        """
+        Profile the current cell in the current console, by sampling its
+        call stack from the kernel.
+        """
+        editorstack = self.main.editor.get_current_editorstack()
+        editor = editorstack.get_current_editor()
+        if editor is None or not editor.is_python():
+            return
+        block = editor.get_cell_as_executable_code()[1]
+        filename = editorstack.get_current_filename()
+        interval = self.get_option('sampling_interval') / 1000.
+        self.main.ipyconsole.profile_cell(cell_name(block), filename,
+                                          interval)
+
+    def show_samples(self, data):
+        """Show the call stacks sampled in a console."""
+        self.switch_to_plugin()
+        self.profiler.show_samples(data)
+
+    def get_run_settings(self, filename):
+        """Return the working directory and arguments to run `filename`."""
         runconf = get_run_configuration(filename)
         wdir, args = None, []
         if runconf is not None:
@@ -112,5 +158,13 @@ class Profiler(SpyderPluginWidget):
                 wdir = runconf.wdir
             if runconf.args_enabled:
                 args = runconf.args
+        return wdir, args
+
+    def analyze(self, filename):
+        """Reimplement analyze method"""
+        if self.dockwidget:
+            self.switch_to_plugin()
+        pythonpath = self.main.get_spyder_pythonpath()
+        wdir, args = self.get_run_settings(filename)
         self.profiler.analyze(filename, wdir=wdir, args=args,
                               pythonpath=pythonpath)
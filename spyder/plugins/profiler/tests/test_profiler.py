@@ -10,6 +10,8 @@ Tests for profiler.py
 
 
 # Standard library imports
+import cProfile
+import sys
 try:
     from unittest.mock import Mock
 except ImportError:
@@ -17,13 +19,28 @@ except ImportError:
 
 # Third party imports
 import pytest
+from qtpy.QtCore import Qt
 
 # Local imports
-from spyder.plugins.profiler.widgets import profilergui
+from spyder.plugins.profiler.widgets import flamegraph, profilergui
 
 
 # --- Helper methods
 # -----------------------------------------------------------------------------
+def fibonacci(n):
+    """Recursive function to profile."""
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+def run_fibonacci():
+    return [fibonacci(n) for n in range(12)]
+
+
+def create_profile(path):
+    """Profile run_fibonacci and save its results to `path`."""
+    profile = cProfile.Profile()
+    profile.runcall(run_fibonacci)
+    profile.dump_stats(str(path))
 
 
 # --- Fixtures
@@ -102,5 +119,140 @@ def test_format_output(profiler_datatree_bot):
                                   ['2.00 sec', ['-400.00 ms', 'green']]]
 
 
+def test_lazy_tree(profiler_datatree_bot, tmpdir):
+    """Test that the children of tree items are only created on demand."""
+    tree = profiler_datatree_bot
+    results = tmpdir.join('profiler.results')
+    create_profile(results)
+    tree.load_data(str(results))
+    tree.show_tree()
+
+    # Only the children of the expanded top level items are created
+    model = tree.data_model
+    assert model.root.children
+    second_level = [child for node in model.root.children
+                    for child in node.children]
+    assert second_level
+    assert all(node.children is None for node in second_level)
+
+    # Expanding one more level creates the next one
+    tree.change_view(1)
+    assert all(node.children is not None for node in second_level)
+
+    # Callees of a recursive function are marked and can't be expanded
+    tree.change_view(2)
+    fibonacci_node = [node for node in tree.get_items(maxlevel=3)
+                      if node.data() == 'fibonacci'][0]
+    fibonacci_node = tree.proxy_model.mapToSource(fibonacci_node)
+    model.fetchMore(fibonacci_node)
+    recursive_node = model.index(0, 0, fibonacci_node)
+    assert model.get_node(recursive_node).is_recursive()
+    assert not model.hasChildren(recursive_node)
+    assert not model.flags(recursive_node) & Qt.ItemIsEnabled
+    file_index = model.index(0, profilergui.FILE_COLUMN, fibonacci_node)
+    assert model.data(file_index) == '(recursion)'
+
+
+def test_hotspots(profiler_datatree_bot, qtbot, tmpdir):
+    """Test the flat list of functions sorted by their local time."""
+    tree = profiler_datatree_bot
+    results = tmpdir.join('profiler.results')
+    create_profile(results)
+    tree.load_data(str(results))
+
+    hotspots = profilergui.ProfilerHotspotsView(tree)
+    qtbot.addWidget(hotspots)
+    hotspots.refresh()
+    assert hotspots.hotspots_model.rowCount() == len(tree.stats)
+    assert hotspots.isColumnHidden(profilergui.LOCAL_TIME_DIFF_COLUMN)
+
+    proxy = hotspots.proxy_model
+    local_times = [
+        proxy.data(proxy.index(row, profilergui.LOCAL_TIME_COLUMN),
+                   profilergui.SORT_ROLE)
+        for row in range(proxy.rowCount())]
+    assert local_times == sorted(local_times, reverse=True)
+
+    # Activating a function goes to its definition
+    rows = [row for row in range(proxy.rowCount())
+            if proxy.index(row, 0).data() == 'fibonacci']
+    with qtbot.waitSignal(hotspots.sig_edit_goto) as blocker:
+        hotspots.activated.emit(proxy.index(rows[0], 0))
+    assert blocker.args == [__file__.replace('.pyc', '.py'),
+                            fibonacci.__code__.co_firstlineno, '']
+
+
+def test_sampled_stats(profiler_datatree_bot):
+    """Test that sampled stacks are converted to a call tree."""
+    tree = profiler_datatree_bot
+    main = ['test.py', 1, '<module>']
+    outer = ['test.py', 3, 'outer']
+    inner = ['test.py', 6, 'inner']
+    data = {'interval': 0.01,
+            'samples': 10,
+            'stacks': [[[main, outer], 2],
+                       [[main, outer, inner], 3],
+                       [[main, outer, inner, inner], 4],
+                       [[main], 1]]}
+
+    stats = profilergui.get_stats_from_samples(data).stats
+    calls, __, local_time, cum_time, callers = stats[tuple(inner)]
+    assert calls == 7
+    assert local_time == pytest.approx(0.07)
+    assert cum_time == pytest.approx(0.07)
+    assert callers == {tuple(outer): 7, tuple(inner): 4}
+    calls, __, local_time, cum_time, callers = stats[tuple(main)]
+    assert (calls, callers) == (10, {})
+    assert local_time == pytest.approx(0.01)
+    assert cum_time == pytest.approx(0.1)
+
+    # The flame graph merges stacks that share the same callers
+    root = flamegraph.build_flame_graph(data['stacks'])
+    assert root.count == 10
+    outer_node = root.children[tuple(main)].children[tuple(outer)]
+    assert outer_node.count == 9
+    assert outer_node.children[tuple(inner)].count == 7
+    assert root.get_depth() == 4
+
+    # Sampled results are shown in the tree like the deterministic ones
+    tree.load_stats(profilergui.get_stats_from_samples(data))
+    tree.show_tree()
+    assert [node.key for node in tree.data_model.root.children] == [
+        tuple(outer)]
+
+
+def test_deep_flame_graph(qtbot):
+    """Test showing stacks deeper than the recursion limit."""
+    depth = sys.getrecursionlimit() + 100
+    stack = [['test.py', 1, 'recurse']] * depth
+    data = {'interval': 0.01, 'samples': 1, 'stacks': [[stack, 1]]}
+
+    graph = flamegraph.FlameGraph()
+    qtbot.addWidget(graph)
+    graph.resize(400, 100)
+    graph.set_samples(data)
+    assert graph.root.get_depth() == depth
+    assert len(graph.boxes) == depth
+
+
+def test_hotspots_refreshed_when_shown(qtbot):
+    """Test that the hotspots view is only refreshed when it's shown."""
+    widget = profilergui.ProfilerWidget(None)
+    qtbot.addWidget(widget)
+    main = ['test.py', 1, '<module>']
+    outer = ['test.py', 3, 'outer']
+    data = {'interval': 0.01,
+            'samples': 3,
+            'stacks': [[[main, outer], 2], [[main], 1]]}
+
+    widget.show_samples(data)
+    assert widget.hotspots_outdated
+    assert widget.hotspots.hotspots_model.rowCount() == 0
+
+    widget.hotspots_button.setChecked(True)
+    assert not widget.hotspots_outdated
+    assert widget.hotspots.hotspots_model.rowCount() == 2
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Flame graph of the call stacks sampled by the in-kernel profiler.
+
+Each box is a function, its width is proportional to the number of samples
+in which it was on the stack and the boxes below it are the functions it
+called.
+"""
+
+# Standard library imports
+import os.path as osp
+import zlib
+
+# Third party imports
+from qtpy.QtCore import QRectF, Qt, Signal
+from qtpy.QtGui import QColor, QPainter
+from qtpy.QtWidgets import QScrollArea, QToolTip, QWidget
+
+# Local imports
+from spyder.config.base import _
+
+
+# Height of each level of the graph, in pixels
+ROW_HEIGHT = 20
+
+# Boxes narrower than this (in pixels) are not drawn
+MIN_BOX_WIDTH = 1.0
+
+
+class FlameGraphNode(object):
+    """Function in the flame graph, with the samples it appeared in."""
+
+    def __init__(self, key=None):
+        self.key = key
+        self.count = 0
+        self.children = {}
+
+    def get_child(self, key):
+        """Return the child node of `key`, creating it if needed."""
+        if key not in self.children:
+            self.children[key] = FlameGraphNode(key)
+        return self.children[key]
+
+    def get_depth(self):
+        """Return the number of levels below this node."""
+        # Sampled stacks can be deeper than the recursion limit, so nodes
+        # are visited with an explicit stack.
+        max_depth = 0
+        nodes = [(self, 0)]
+        while nodes:
+            node, depth = nodes.pop()
+            max_depth = max(max_depth, depth)
+            nodes.extend((child, depth + 1)
+                         for child in node.children.values())
+        return max_depth
+
+
+def build_flame_graph(stacks):
+    """Merge the sampled `stacks` into a tree of FlameGraphNode's."""
+    root = FlameGraphNode()
+    for stack, count in stacks:
+        root.count += count
+        node = root
+        for key in stack:
+            node = node.get_child(tuple(key))
+            node.count += count
+    return root
+
+
+def get_function_name(key):
+    """Return the name shown for the function of `key`."""
+    filename, __, name = key
+    if name == '<module>':
+        return '<%s>' % osp.basename(filename)
+    return name
+
+
+def get_color(key):
+    """Return a stable warm color for the function of `key`."""
+    value = zlib.crc32(repr(key).encode('utf-8')) & 0xffffffff
+    hue = 5 + value % 50
+    saturation = 150 + (value >> 8) % 80
+    return QColor.fromHsv(hue, saturation, 235)
+
+
+class FlameGraph(QWidget):
+    """Widget that paints a flame graph."""
+
+    sig_edit_goto = Signal(str, int, str)
+
+    def __init__(self, parent=None):
+        QWidget.__init__(self, parent)
+        self.root = FlameGraphNode()
+        self.boxes = []
+        self.setMouseTracking(True)
+
+    def set_samples(self, data):
+        """Show the samples sent by the in-kernel profiler."""
+        if data is None:
+            self.root = FlameGraphNode()
+        else:
+            self.root = build_flame_graph(data['stacks'])
+        self.setMinimumHeight((self.root.get_depth() + 1) * ROW_HEIGHT)
+        self.update_boxes()
+
+    def update_boxes(self):
+        """Compute the rectangle of each function."""
+        self.boxes = []
+        if self.root.count:
+            scale = self.width() / float(self.root.count)
+            self._add_boxes(self.root, scale)
+        self.update()
+
+    def _add_boxes(self, root, scale):
+        # Visit nodes with an explicit stack, like get_depth
+        nodes = [(root, 0.0, 0)]
+        while nodes:
+            node, x, depth = nodes.pop()
+            for key in sorted(node.children):
+                child = node.children[key]
+                width = child.count * scale
+                if width >= MIN_BOX_WIDTH:
+                    rect = QRectF(x, depth * ROW_HEIGHT, width,
+                                  ROW_HEIGHT - 1)
+                    self.boxes.append((rect, child))
+                    nodes.append((child, x, depth + 1))
+                x += width
+
+    def get_node_at(self, pos):
+        """Return the node drawn at `pos`, if any."""
+        for rect, node in self.boxes:
+            if rect.contains(pos):
+                return node
+
+    # ---- Qt methods
+    def resizeEvent(self, event):
+        QWidget.resizeEvent(self, event)
+        self.update_boxes()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        metrics = painter.fontMetrics()
+        exposed = QRectF(event.rect())
+        for rect, node in self.boxes:
+            if not rect.intersects(exposed):
+                continue
+            painter.fillRect(rect, get_color(node.key))
+            if rect.width() > 20:
+                text = metrics.elidedText(get_function_name(node.key),
+                                          Qt.ElideRight,
+                                          int(rect.width()) - 4)
+                painter.setPen(Qt.black)
+                painter.drawText(rect.adjusted(2, 0, -2, 0),
+                                 Qt.AlignLeft | Qt.AlignVCenter, text)
+        painter.end()
+
+    def mouseMoveEvent(self, event):
+        node = self.get_node_at(event.pos())
+        if node is None:
+            QToolTip.hideText()
+        else:
+            filename, line_number, __ = node.key
+            percent = 100.0 * node.count / self.root.count
+            text = _("{name}\n{filename}:{line}\n{count} samples "
+                     "({percent:.1f}%)").format(
+                         name=get_function_name(node.key), filename=filename,
+                         line=line_number, count=node.count, percent=percent)
+            QToolTip.showText(event.globalPos(), text, self)
+        QWidget.mouseMoveEvent(self, event)
+
+    def mouseDoubleClickEvent(self, event):
+        node = self.get_node_at(event.pos())
+        if node is not None:
+            filename, line_number, __ = node.key
+            if osp.isfile(filename):
+                self.sig_edit_goto.emit(filename, line_number, '')
+        QWidget.mouseDoubleClickEvent(self, event)
+
+
+class FlameGraphWidget(QScrollArea):
+    """Scrollable flame graph."""
+
+    sig_edit_goto = Signal(str, int, str)
+
+    def __init__(self, parent=None):
+        QScrollArea.__init__(self, parent)
+        self.flamegraph = FlameGraph(self)
+        self.flamegraph.sig_edit_goto.connect(self.sig_edit_goto)
+        self.setWidget(self.flamegraph)
+        self.setWidgetResizable(True)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+    def set_samples(self, data):
+        """Show the samples sent by the in-kernel profiler."""
+        self.flamegraph.set_samples(data)
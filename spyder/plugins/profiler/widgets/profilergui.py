@@ -24,22 +24,24 @@ import re
 import logging
 
 # Third party imports
-from qtpy.compat import getopenfilename, getsavefilename
-from qtpy.QtCore import QByteArray, QProcess, QProcessEnvironment, Qt, Signal
+from qtpy.compat import getopenfilename, getsavefilename, to_qvariant
+from qtpy.QtCore import (QAbstractItemModel, QAbstractTableModel, QByteArray,
+                         QModelIndex, QProcess, QProcessEnvironment,
+                         QSortFilterProxyModel, Qt, Signal)
 from qtpy.QtGui import QColor
 from qtpy.QtWidgets import (QApplication, QHBoxLayout, QLabel, QMessageBox,
-                            QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
+                            QTreeView, QVBoxLayout, QWidget)
 
 # Local imports
 from spyder.config.base import get_conf_path, get_translation
 from spyder.py3compat import to_text_string
 from spyder.utils import icon_manager as ima
-from spyder.utils.qthelpers import (create_toolbutton, get_item_user_text,
-                                    set_item_user_text)
+from spyder.utils.qthelpers import create_toolbutton
 from spyder.utils.programs import shell_split
 from spyder.widgets.comboboxes import PythonModulesComboBox
 from spyder.utils.misc import add_pathlist_to_PYTHONPATH, getcwd_or_home
 from spyder.plugins.variableexplorer.widgets.texteditor import TextEditor
+from spyder.plugins.profiler.widgets.flamegraph import FlameGraphWidget
 
 # This is needed for testing this module as a stand alone script
 try:
@@ -108,6 +110,13 @@ class ProfilerWidget(QWidget):
                                             triggered=self.show_log)
 
         self.datatree = ProfilerDataTree(self)
+        self.hotspots = ProfilerHotspotsView(self.datatree, self)
+        self.hotspots.sig_edit_goto.connect(self.datatree.sig_edit_goto)
+        self.hotspots.hide()
+        self.hotspots_outdated = False
+        self.flamegraph = FlameGraphWidget(self)
+        self.flamegraph.sig_edit_goto.connect(self.datatree.sig_edit_goto)
+        self.flamegraph.hide()
 
         self.collapse_button = create_toolbutton(self,
                                                  icon=ima.icon('collapse'),
@@ -119,6 +128,20 @@ class ProfilerWidget(QWidget):
                                                triggered=lambda dD:
                                                self.datatree.change_view(1),
                                                tip=_('Expand one level down'))
+        self.hotspots_button = create_toolbutton(
+            self, icon=ima.icon('filelist'),
+            text=_("Hot functions"),
+            text_beside_icon=True,
+            toggled=self.show_hotspots,
+            tip=_('Show all functions sorted by the time spent in them'))
+        self.flamegraph_button = create_toolbutton(
+            self, icon=ima.icon('hist'),
+            text=_("Flame graph"),
+            text_beside_icon=True,
+            toggled=self.show_flamegraph,
+            tip=_('Show the call stacks sampled by the last profiling '
+                  'run in a console'))
+        self.flamegraph_button.setEnabled(False)
 
         self.save_button = create_toolbutton(self, text_beside_icon=True,
                                              text=_("Save data"),
@@ -146,6 +169,8 @@ class ProfilerWidget(QWidget):
         hlayout2 = QHBoxLayout()
         hlayout2.addWidget(self.collapse_button)
         hlayout2.addWidget(self.expand_button)
+        hlayout2.addWidget(self.hotspots_button)
+        hlayout2.addWidget(self.flamegraph_button)
         hlayout2.addStretch()
         hlayout2.addWidget(self.datelabel)
         hlayout2.addStretch()
@@ -158,6 +183,8 @@ class ProfilerWidget(QWidget):
         layout.addLayout(hlayout1)
         layout.addLayout(hlayout2)
         layout.addWidget(self.datatree)
+        layout.addWidget(self.hotspots)
+        layout.addWidget(self.flamegraph)
         self.setLayout(layout)
 
         self.process = None
@@ -197,6 +224,31 @@ class ProfilerWidget(QWidget):
             self.show_data()
             self.clear_button.setEnabled(True)
 
+    def show_hotspots(self, state):
+        """Show the list of hot functions instead of the call tree."""
+        if state:
+            self.flamegraph_button.setChecked(False)
+        self.update_view()
+
+    def show_flamegraph(self, state):
+        """Show the flame graph of sampled stacks instead of the call tree."""
+        if state:
+            self.hotspots_button.setChecked(False)
+        self.update_view()
+
+    def update_view(self):
+        """Show the view selected by the view buttons."""
+        show_hotspots = self.hotspots_button.isChecked()
+        show_flamegraph = self.flamegraph_button.isChecked()
+        show_tree = not (show_hotspots or show_flamegraph)
+        if show_hotspots and self.hotspots_outdated:
+            self.refresh_hotspots()
+        self.hotspots.setVisible(show_hotspots)
+        self.flamegraph.setVisible(show_flamegraph)
+        self.datatree.setVisible(show_tree)
+        self.collapse_button.setEnabled(show_tree)
+        self.expand_button.setEnabled(show_tree)
+
     def clear(self):
         self.datatree.compare(None)
         self.datatree.hide_diff_cols(True)
@@ -362,6 +414,7 @@ class ProfilerWidget(QWidget):
         if self.stopped:
             self.datelabel.setText(_('Run stopped by user.'))
             self.datatree.initialize_view()
+            self.refresh_hotspots()
             return
 
         self.datelabel.setText(_('Sorting data, please wait...'))
@@ -369,12 +422,54 @@ class ProfilerWidget(QWidget):
 
         self.datatree.load_data(self.DATAPATH)
         self.datatree.show_tree()
+        self.refresh_hotspots()
+        self.set_samples(None)
+        self.set_date_text()
+
+    def show_samples(self, data):
+        """Show the call stacks sampled by profiling code in a console."""
+        self.output = None
+        self.log_button.setEnabled(False)
+        self.datatree.load_stats(get_stats_from_samples(data))
+        self.datatree.show_tree()
+        self.refresh_hotspots()
+        self.set_samples(data)
+        self.set_date_text(_("{} samples").format(data['samples']))
 
+    def refresh_hotspots(self):
+        """
+        Show the current results in the hotspots view.
+
+        Sorting all functions has a cost, so that's only done when the view
+        is shown.
+        """
+        self.hotspots_outdated = not self.hotspots_button.isChecked()
+        if not self.hotspots_outdated:
+            self.hotspots.refresh()
+
+    def set_samples(self, data):
+        """Set the samples shown in the flame graph, if any."""
+        self.flamegraph.set_samples(data)
+        self.flamegraph_button.setEnabled(data is not None)
+        if data is None:
+            self.flamegraph_button.setChecked(False)
+
+    def set_date_text(self, extra_text=None):
+        """Show the time of the results, followed by `extra_text`."""
         text_style = "<span style=\'color: %s\'><b>%s </b></span>"
-        date_text = text_style % (self.text_color,
-                                  time.strftime("%Y-%m-%d %H:%M:%S",
-                                                time.localtime()))
-        self.datelabel.setText(date_text)
+        text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        if extra_text:
+            text = "%s (%s)" % (text, extra_text)
+        self.datelabel.setText(text_style % (self.text_color, text))
+
+
+# Columns of the profiler results tree
+(NAME_COLUMN, TOTAL_TIME_COLUMN, TOTAL_TIME_DIFF_COLUMN, LOCAL_TIME_COLUMN,
+ LOCAL_TIME_DIFF_COLUMN, CALLS_COLUMN, CALLS_DIFF_COLUMN,
+ FILE_COLUMN) = range(8)
+
+# Role used to sort results by their raw values instead of their text
+SORT_ROLE = Qt.UserRole + 1
 
 
 def gettime_s(text):
@@ -404,27 +499,206 @@ def gettime_s(text):
         time += tmp
     return time
 
-class TreeWidgetItem( QTreeWidgetItem ):
-    def __init__(self, parent=None):
-        QTreeWidgetItem.__init__(self, parent)
 
-    def __lt__(self, otherItem):
-        column = self.treeWidget().sortColumn()
-        try:
-            if column == 1 or column == 3: #TODO: Hardcoded Column
-                t0 = gettime_s(self.text(column))
-                t1 = gettime_s(otherItem.text(column))
-                if t0 is not None and t1 is not None:
-                    return t0 > t1
+def get_stats_from_samples(data):
+    """
+    Return a pstats.Stats instance with the stacks sampled by the in-kernel
+    profiler.
+
+    Times are estimated as the number of samples times the sampling
+    interval, and the number of calls is the number of samples in which
+    each function was on the stack.
+    """
+    import pstats
+    interval = data['interval']
+    stats = {}
+    for stack, count in data['stacks']:
+        stack = [tuple(key) for key in stack]
+        seen = set()
+        for depth, key in enumerate(stack):
+            calls, local_time, cum_time, callers = stats.get(
+                key, (0, 0., 0., {}))
+            if depth == len(stack) - 1:
+                local_time += count * interval
+            if key not in seen:
+                # Recursive functions only count once per sample
+                seen.add(key)
+                calls += count
+                cum_time += count * interval
+            if depth > 0:
+                caller = stack[depth - 1]
+                callers[caller] = callers.get(caller, 0) + count
+            stats[key] = (calls, local_time, cum_time, callers)
+
+    profdata = pstats.Stats()
+    profdata.stats = dict(
+        (key, (calls, calls, local_time, cum_time, callers))
+        for key, (calls, local_time, cum_time, callers) in stats.items())
+    profdata.get_top_level_stats()
+    return profdata
+
+
+class ProfilerTreeNode(object):
+    """Node of the profiler results tree, with children fetched on demand."""
+
+    def __init__(self, key, parent=None, row=0):
+        self.key = key
+        self.parent = parent
+        self.row = row
+        self.children = None  # Not fetched yet
+        self.row_data = None  # Computed on first display
+
+    def is_recursive(self):
+        """Return True if the node's function is one of its ancestors."""
+        ancestor = self.parent
+        while ancestor is not None and ancestor.key is not None:
+            if ancestor.key == self.key:
+                return True
+            ancestor = ancestor.parent
+        return False
+
+
+class ProfilerModelMixin(object):
+    """
+    Header and cell data shared by the profiler models.
+
+    Models using it must define a `datatree` attribute and a
+    `get_row_data(index)` method.
+    """
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return to_qvariant(self.datatree.header_list[section])
+        return to_qvariant()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return to_qvariant()
+        column = index.column()
+        row_data = self.get_row_data(index)
+        if role == Qt.DisplayRole:
+            return to_qvariant(row_data['display'][column])
+        elif role == SORT_ROLE:
+            return to_qvariant(row_data['sort'][column])
+        elif role == Qt.DecorationRole and column == NAME_COLUMN:
+            return self.datatree.icon_list[row_data['node_type']]
+        elif role == Qt.ForegroundRole and column in row_data['colors']:
+            return QColor(row_data['colors'][column])
+        elif role == Qt.TextAlignmentRole:
+            if column in (TOTAL_TIME_COLUMN, LOCAL_TIME_COLUMN,
+                          CALLS_COLUMN):
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+        elif role == Qt.ToolTipRole:
+            return to_qvariant(self.datatree.tooltips.get(column))
+        return to_qvariant()
+
+
+class ProfilerDataModel(ProfilerModelMixin, QAbstractItemModel):
+    """
+    Model of the profiler call tree.
+
+    Only the children of expanded nodes are created, so loading the results
+    of large programs doesn't require walking all their calls.
+    """
+
+    def __init__(self, datatree):
+        QAbstractItemModel.__init__(self, datatree)
+        self.datatree = datatree
+        self.root = ProfilerTreeNode(None)
+        self.root.children = []
+
+    def set_root(self, rootkey):
+        """Show the callees of `rootkey` as top level items."""
+        self.beginResetModel()
+        self.root = ProfilerTreeNode(None)
+        if rootkey is None:
+            self.root.children = []
+        else:
+            self.root.children = self._create_children(
+                self.root, self.datatree.find_callees(rootkey))
+        self.endResetModel()
+
+    def get_node(self, index):
+        """Return the node of `index`."""
+        if index.isValid():
+            return index.internalPointer()
+        return self.root
+
+    def _create_children(self, node, callees):
+        return [ProfilerTreeNode(key, parent=node, row=row)
+                for row, key in enumerate(callees)]
+
+    def get_row_data(self, index):
+        """Return the formatted and raw values shown for `index`."""
+        node = self.get_node(index)
+        if node.row_data is None:
+            node.row_data = self.datatree.get_row_data(node.key)
+            if node.is_recursive():
+                node.row_data['display'][FILE_COLUMN] = '(%s)' % _('recursion')
+        return node.row_data
+
+    # ---- Qt methods
+    def index(self, row, column, parent=QModelIndex()):
+        node = self.get_node(parent)
+        if (node.children is None or row < 0 or row >= len(node.children) or
+                column < 0 or column >= self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        node = self.get_node(parent)
+        return len(node.children) if node.children is not None else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.datatree.header_list)
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.get_node(parent)
+        if node.children is not None:
+            return len(node.children) > 0
+        if node.is_recursive():
+            return False
+        return len(self.datatree.find_callees(node.key)) > 0
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return self.get_node(parent).children is None
+
+    def fetchMore(self, parent=QModelIndex()):
+        node = self.get_node(parent)
+        if node.children is not None:
+            return
+        if node.is_recursive():
+            callees = []
+        else:
+            callees = self.datatree.find_callees(node.key)
+        if callees:
+            self.beginInsertRows(parent, 0, len(callees) - 1)
+            node.children = self._create_children(node, callees)
+            self.endInsertRows()
+        else:
+            node.children = []
 
-            return float( self.text(column) ) > float( otherItem.text(column) )
-        except ValueError:
-            return self.text(column) > otherItem.text(column)
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.internalPointer().is_recursive():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
 
-class ProfilerDataTree(QTreeWidget):
+
+class ProfilerDataTree(QTreeView):
     """
-    Convenience tree widget (with built-in model)
-    to store and view profiler data.
+    Tree view to show profiler data.
 
     The quantities calculated by the profiler are as follows
     (from profile.Profile):
@@ -442,46 +716,43 @@ class ProfilerDataTree(QTreeWidget):
 
     sig_edit_goto = Signal(str, int, str)
 
-    SEP = r"<[=]>"  # separator between filename and linenumber
-    # (must be improbable as a filename to avoid splitting the filename itself)
-
     def __init__(self, parent=None):
-        QTreeWidget.__init__(self, parent)
+        QTreeView.__init__(self, parent)
         self.header_list = [_('Function/Module'), _('Total Time'), _('Diff'),
                             _('Local Time'), _('Diff'), _('Calls'), _('Diff'),
                             _('File:line')]
+        self.tooltips = {
+            NAME_COLUMN: _('Function or module name'),
+            TOTAL_TIME_COLUMN: _('Time in function '
+                                 '(including sub-functions)'),
+            LOCAL_TIME_COLUMN: _('Local time in function '
+                                 '(not in sub-functions)'),
+            CALLS_COLUMN: _('Total number of calls (including recursion)'),
+            FILE_COLUMN: _('File:line where function is defined'),
+        }
         self.icon_list = {'module': ima.icon('python'),
                          'function': ima.icon('function'),
                          'builtin': ima.icon('python'),
                          'constructor': ima.icon('class')}
         self.profdata = None   # To be filled by self.load_data()
         self.stats = None      # To be filled by self.load_data()
-        self.item_depth = None
-        self.item_list = None
-        self.items_to_be_shown = None
+        self.stats1 = []       # To be filled by self.load_data()
         self.current_view_depth = None
         self.compare_file = None
-        self.setColumnCount(len(self.header_list))
-        self.setHeaderLabels(self.header_list)
-        self.initialize_view()
-        self.itemActivated.connect(self.item_activated)
-        self.itemExpanded.connect(self.item_expanded)
 
-    def set_item_data(self, item, filename, line_number):
-        """Set tree item user data: filename (string) and line_number (int)"""
-        set_item_user_text(item, '%s%s%d' % (filename, self.SEP, line_number))
+        self.data_model = ProfilerDataModel(self)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSortRole(SORT_ROLE)
+        self.proxy_model.setSourceModel(self.data_model)
+        self.setModel(self.proxy_model)
+        self.setUniformRowHeights(True)
 
-    def get_item_data(self, item):
-        """Get tree item user data: (filename, line_number)"""
-        filename, line_number_str = get_item_user_text(item).split(self.SEP)
-        return filename, int(line_number_str)
+        self.initialize_view()
+        self.activated.connect(self.item_activated)
 
     def initialize_view(self):
         """Clean the tree and view parameters"""
-        self.clear()
-        self.item_depth = 0   # To be use for collapsing/expanding one level
-        self.item_list = []  # To be use for collapsing/expanding one level
-        self.items_to_be_shown = {}
+        self.data_model.set_root(None)
         self.current_view_depth = 0
 
     def load_data(self, profdatafile):
@@ -489,11 +760,17 @@ class ProfilerDataTree(QTreeWidget):
         import pstats
         # Fixes spyder-ide/spyder#6220.
         try:
-            stats_indi = [pstats.Stats(profdatafile), ]
+            profdata = pstats.Stats(profdatafile)
         except (OSError, IOError):
             self.profdata = None
             return
-        self.profdata = stats_indi[0]
+        self.load_stats(profdata)
+
+    def load_stats(self, profdata):
+        """Load profiler data from a pstats.Stats instance"""
+        import pstats
+        stats_indi = [profdata]
+        self.profdata = profdata
 
         if self.compare_file is not None:
             # Fixes spyder-ide/spyder#5587.
@@ -506,7 +783,6 @@ class ProfilerDataTree(QTreeWidget):
                       "The error was<br><br>"
                       "<tt>{0}</tt>").format(e))
                 self.compare_file = None
-        map(lambda x: x.calc_callees(), stats_indi)
         self.profdata.calc_callees()
         self.stats1 = stats_indi
         self.stats = stats_indi[0].stats
@@ -516,7 +792,8 @@ class ProfilerDataTree(QTreeWidget):
         self.compare_file = filename
 
     def hide_diff_cols(self, hide):
-        for i in (2,4,6):
+        for i in (TOTAL_TIME_DIFF_COLUMN, LOCAL_TIME_DIFF_COLUMN,
+                  CALLS_DIFF_COLUMN):
             self.setColumnHidden(i, hide)
 
     def save_data(self, filename):
@@ -539,21 +816,17 @@ class ProfilerDataTree(QTreeWidget):
 
     def find_callees(self, parent):
         """Find all functions called by (parent) function."""
-        # FIXME: This implementation is very inneficient, because it
-        #        traverses all the data to find children nodes (callees)
-        return self.profdata.all_callees[parent]
+        return self.profdata.all_callees.get(parent, {})
 
     def show_tree(self):
         """Populate the tree with profiler data and display it."""
         self.initialize_view() # Clear before re-populating
-        self.setItemsExpandable(True)
-        self.setSortingEnabled(False)
         rootkey = self.find_root()  # This root contains profiler overhead
         if rootkey is not None:
-            self.populate_tree(self, self.find_callees(rootkey))
-            self.resizeColumnToContents(0)
+            self.data_model.set_root(rootkey)
+            self.resizeColumnToContents(NAME_COLUMN)
             self.setSortingEnabled(True)
-            self.sortItems(1, Qt.AscendingOrder) # FIXME: hardcoded index
+            self.sortByColumn(TOTAL_TIME_COLUMN, Qt.DescendingOrder)
             self.change_view(1)
 
     def function_info(self, functionKey):
@@ -644,112 +917,72 @@ class ProfilerDataTree(QTreeWidget):
         data = [x.stats.get(child_key, [0, 0, 0, 0, {}]) for x in self.stats1]
         return (map(self.color_string, islice(zip(*data), 1, 4)))
 
-    def populate_tree(self, parentItem, children_list):
-        """Recursive method to create each item (and associated data) in the tree."""
-        for child_key in children_list:
-            self.item_depth += 1
-            (filename, line_number, function_name, file_and_line, node_type
-             ) = self.function_info(child_key)
-
-            ((total_calls, total_calls_dif), (loc_time, loc_time_dif), (cum_time,
-             cum_time_dif)) = self.format_output(child_key)
-
-            child_item = TreeWidgetItem(parentItem)
-            self.item_list.append(child_item)
-            self.set_item_data(child_item, filename, line_number)
-
-            # FIXME: indexes to data should be defined by a dictionary on init
-            child_item.setToolTip(0, _('Function or module name'))
-            child_item.setData(0, Qt.DisplayRole, function_name)
-            child_item.setIcon(0, self.icon_list[node_type])
-
-            child_item.setToolTip(1, _('Time in function '\
-                                       '(including sub-functions)'))
-            child_item.setData(1, Qt.DisplayRole, cum_time)
-            child_item.setTextAlignment(1, Qt.AlignRight)
-
-            child_item.setData(2, Qt.DisplayRole, cum_time_dif[0])
-            child_item.setForeground(2, QColor(cum_time_dif[1]))
-            child_item.setTextAlignment(2, Qt.AlignLeft)
-
-            child_item.setToolTip(3, _('Local time in function '\
-                                      '(not in sub-functions)'))
-
-            child_item.setData(3, Qt.DisplayRole, loc_time)
-            child_item.setTextAlignment(3, Qt.AlignRight)
-
-            child_item.setData(4, Qt.DisplayRole, loc_time_dif[0])
-            child_item.setForeground(4, QColor(loc_time_dif[1]))
-            child_item.setTextAlignment(4, Qt.AlignLeft)
-
-            child_item.setToolTip(5, _('Total number of calls '\
-                                       '(including recursion)'))
-
-            child_item.setData(5, Qt.DisplayRole, total_calls)
-            child_item.setTextAlignment(5, Qt.AlignRight)
-
-            child_item.setData(6, Qt.DisplayRole, total_calls_dif[0])
-            child_item.setForeground(6, QColor(total_calls_dif[1]))
-            child_item.setTextAlignment(6, Qt.AlignLeft)
-
-            child_item.setToolTip(7, _('File:line '\
-                                       'where function is defined'))
-            child_item.setData(7, Qt.DisplayRole, file_and_line)
-            #child_item.setExpanded(True)
-            if self.is_recursive(child_item):
-                child_item.setData(7, Qt.DisplayRole, '(%s)' % _('recursion'))
-                child_item.setDisabled(True)
-            else:
-                callees = self.find_callees(child_key)
-                if self.item_depth < 3:
-                    self.populate_tree(child_item, callees)
-                elif callees:
-                    child_item.setChildIndicatorPolicy(child_item.ShowIndicator)
-                    self.items_to_be_shown[id(child_item)] = callees
-            self.item_depth -= 1
-
-    def item_activated(self, item):
-        filename, line_number = self.get_item_data(item)
-        self.sig_edit_goto.emit(filename, line_number, '')
-
-    def item_expanded(self, item):
-        if item.childCount() == 0 and id(item) in self.items_to_be_shown:
-            callees = self.items_to_be_shown[id(item)]
-            self.populate_tree(item, callees)
-
-    def is_recursive(self, child_item):
-        """Returns True is a function is a descendant of itself."""
-        ancestor = child_item.parent()
-        # FIXME: indexes to data should be defined by a dictionary on init
-        while ancestor:
-            if (child_item.data(0, Qt.DisplayRole
-                                ) == ancestor.data(0, Qt.DisplayRole) and
-                child_item.data(7, Qt.DisplayRole
-                                ) == ancestor.data(7, Qt.DisplayRole)):
-                return True
+    def get_raw_values(self, key):
+        """
+        Return the cumulative time, local time and number of calls of `key`,
+        each followed by its difference with the compared run.
+        """
+        data = [x.stats.get(key, [0, 0, 0, 0, {}]) for x in self.stats1]
+        columns = list(zip(*data))
+        values = []
+        for measures in (columns[3], columns[2], columns[1]):
+            if len(measures) == 2 and self.compare_file is not None:
+                difference = measures[0] - measures[1]
             else:
-                ancestor = ancestor.parent()
-        return False
-
-    def get_top_level_items(self):
-        """Iterate over top level items"""
-        return [self.topLevelItem(_i) for _i in range(self.topLevelItemCount())]
+                difference = 0
+            values.extend([measures[0], difference])
+        return values
+
+    def get_sort_values(self, key):
+        """Return the values used to sort function `key` by each column."""
+        __, __, function_name, file_and_line, __ = self.function_info(key)
+        return [function_name] + self.get_raw_values(key) + [file_and_line]
+
+    def get_row_data(self, key):
+        """Return the formatted and raw values shown for function `key`."""
+        (filename, line_number, function_name, file_and_line, node_type
+         ) = self.function_info(key)
+        calls, loc_time, cum_time = self.format_output(key)
+        return {
+            'filename': filename,
+            'line_number': line_number,
+            'node_type': node_type,
+            'display': [function_name, cum_time[0], cum_time[1][0],
+                        loc_time[0], loc_time[1][0], calls[0], calls[1][0],
+                        file_and_line],
+            'colors': {TOTAL_TIME_DIFF_COLUMN: cum_time[1][1],
+                       LOCAL_TIME_DIFF_COLUMN: loc_time[1][1],
+                       CALLS_DIFF_COLUMN: calls[1][1]},
+            'sort': self.get_sort_values(key),
+        }
+
+    def item_activated(self, index):
+        source_index = self.proxy_model.mapToSource(index)
+        if not source_index.isValid():
+            return
+        row_data = self.data_model.get_row_data(source_index)
+        self.sig_edit_goto.emit(row_data['filename'],
+                                row_data['line_number'], '')
 
     def get_items(self, maxlevel):
-        """Return all items with a level <= `maxlevel`"""
-        itemlist = []
-        def add_to_itemlist(item, maxlevel, level=1):
-            level += 1
-            for index in range(item.childCount()):
-                citem = item.child(index)
-                itemlist.append(citem)
-                if level <= maxlevel:
-                    add_to_itemlist(citem, maxlevel, level)
-        for tlitem in self.get_top_level_items():
-            itemlist.append(tlitem)
-            if maxlevel > 0:
-                add_to_itemlist(tlitem, maxlevel=maxlevel)
-        return itemlist
+        """
+        Return the indexes of all items with a level <= `maxlevel`.
+
+        The children of those items are fetched if needed.
+        """
+        indexes = []
+
+        def add_to_indexes(parent, level):
+            if self.proxy_model.canFetchMore(parent):
+                self.proxy_model.fetchMore(parent)
+            for row in range(self.proxy_model.rowCount(parent)):
+                index = self.proxy_model.index(row, 0, parent)
+                indexes.append(index)
+                if level < maxlevel:
+                    add_to_indexes(index, level + 1)
+
+        add_to_indexes(QModelIndex(), 0)
+        return indexes
 
     def change_view(self, change_in_depth):
         """Change the view depth by expand or collapsing all same-level nodes"""
@@ -758,8 +991,101 @@ class ProfilerDataTree(QTreeWidget):
             self.current_view_depth = 0
         self.collapseAll()
         if self.current_view_depth > 0:
-            for item in self.get_items(maxlevel=self.current_view_depth-1):
-                item.setExpanded(True)
+            for index in self.get_items(maxlevel=self.current_view_depth-1):
+                self.expand(index)
+
+
+class ProfilerHotspotsModel(ProfilerModelMixin, QAbstractTableModel):
+    """
+    Flat model with one row per profiled function.
+
+    It uses the same columns as the call tree, so functions can be sorted by
+    their local or cumulative time regardless of where they are called from.
+    """
+
+    def __init__(self, datatree):
+        QAbstractTableModel.__init__(self, datatree)
+        self.datatree = datatree
+        self.keys = []
+        self._row_data = {}
+        self._sort_values = {}
+
+    def refresh(self):
+        """Reload the functions of the data tree's current results."""
+        self.beginResetModel()
+        stats = self.datatree.stats
+        self.keys = list(stats) if stats is not None else []
+        self._row_data = {}
+        self._sort_values = {}
+        self.endResetModel()
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Sorting needs the raw values of every function, so don't format
+        # whole rows just for that.
+        if role == SORT_ROLE and index.isValid():
+            key = self.keys[index.row()]
+            if key not in self._sort_values:
+                self._sort_values[key] = self.datatree.get_sort_values(key)
+            return to_qvariant(self._sort_values[key][index.column()])
+        return ProfilerModelMixin.data(self, index, role)
+
+    def get_row_data(self, index):
+        """Return the formatted and raw values shown for `index`."""
+        key = self.keys[index.row()]
+        if key not in self._row_data:
+            self._row_data[key] = self.datatree.get_row_data(key)
+        return self._row_data[key]
+
+    # ---- Qt methods
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.datatree.header_list)
+
+
+class ProfilerHotspotsView(QTreeView):
+    """Sortable list of all profiled functions."""
+
+    sig_edit_goto = Signal(str, int, str)
+
+    def __init__(self, datatree, parent=None):
+        QTreeView.__init__(self, parent)
+        self.datatree = datatree
+        self.hotspots_model = ProfilerHotspotsModel(datatree)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSortRole(SORT_ROLE)
+        self.proxy_model.setSourceModel(self.hotspots_model)
+        self.setModel(self.proxy_model)
+        self.setRootIsDecorated(False)
+        self.setUniformRowHeights(True)
+        self.setSortingEnabled(True)
+        self.sortByColumn(LOCAL_TIME_COLUMN, Qt.DescendingOrder)
+        self.activated.connect(self.item_activated)
+
+    def refresh(self):
+        """Show the functions of the data tree's current results."""
+        self.hotspots_model.refresh()
+        compared = (self.datatree.compare_file is not None and
+                    len(self.datatree.stats1) > 1)
+        self.hide_diff_cols(not compared)
+        self.resizeColumnToContents(NAME_COLUMN)
+
+    def hide_diff_cols(self, hide):
+        for i in (TOTAL_TIME_DIFF_COLUMN, LOCAL_TIME_DIFF_COLUMN,
+                  CALLS_DIFF_COLUMN):
+            self.setColumnHidden(i, hide)
+
+    def item_activated(self, index):
+        source_index = self.proxy_model.mapToSource(index)
+        if source_index.isValid():
+            row_data = self.hotspots_model.get_row_data(source_index)
+            self.sig_edit_goto.emit(row_data['filename'],
+                                    row_data['line_number'], '')
 
 
 #==============================================================================
@@ -17,7 +17,7 @@ import os.path as osp
 
 # Third party imports
 from qtpy.QtCore import Slot
-from qtpy.QtWidgets import QInputDialog, QVBoxLayout
+from qtpy.QtWidgets import QInputDialog, QMessageBox, QVBoxLayout
 
 # Local imports
 from spyder.config.base import _
@@ -111,7 +111,13 @@ class Pylint(SpyderPluginWidget):
         self.register_shortcut(pylint_act, context="Pylint",
                                name="Run analysis")
 
-        self.main.source_menu_actions += [MENU_SEPARATOR, pylint_act]
+        pylint_project_act = create_action(
+            self, _("Run static code analysis on project"),
+            triggered=self.run_pylint_project)
+        pylint_project_act.setEnabled(is_module_installed('pylint'))
+
+        self.main.source_menu_actions += [MENU_SEPARATOR, pylint_act,
+                                          pylint_project_act]
         self.main.editor.pythonfile_dependent_actions += [pylint_act]
 
     def refresh_plugin(self):
@@ -152,6 +158,23 @@ class Pylint(SpyderPluginWidget):
         self.switch_to_plugin()
         self.analyze(self.main.editor.get_current_filename())
 
+    @Slot()
+    def run_pylint_project(self):
+        """Run pylint code analysis on all files of the active project"""
+        project_path = None
+        if self.main.projects is not None:
+            project_path = self.main.projects.get_active_project_path()
+        if project_path is None:
+            QMessageBox.warning(
+                self, _("Code Analysis"),
+                _("There is no active project to analyze. Please open "
+                  "or create a project first."))
+            return
+        if self.get_option('save_before', True):
+            self.main.editor.save_all(save_new_files=False)
+        self.switch_to_plugin()
+        self.pylint.analyze_project(project_path)
+
     def analyze(self, filename):
         """Reimplement analyze method"""
         if self.dockwidget:
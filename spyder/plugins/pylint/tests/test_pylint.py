@@ -16,7 +16,8 @@ import pytest
 
 # Local imports
 from spyder.plugins.pylint.widgets.pylintgui import PylintWidget
-from spyder.plugins.pylint.utils import get_pylintrc_path
+from spyder.plugins.pylint.utils import (get_pylintrc_path,
+                                         PylintOutputParser)
 
 # pylint: disable=redefined-outer-name
 
@@ -160,5 +161,87 @@ def test_pylint_widget_pylintrc(
                 for bad_name in bad_names])
 
 
+def test_pylint_output_parser():
+    """Test that pylint's output is parsed as it arrives."""
+    output = ("************* Module first\n"
+              "C:  1,0: : Missing module docstring\n"
+              "************* Module second\n"
+              "W:  3,4: f: Unused variable 'x'\n"
+              "E:  5,0: : Undefined variable 'y'\n"
+              "\n"
+              "Your code has been rated at 2.00/10\n")
+    parser = PylintOutputParser()
+    second_start = output.index('second') + len('second\n')
+
+    # Nothing is complete until the next module starts
+    assert parser.feed(output[:40]) == []
+    completed = parser.feed(output[40:second_start])
+    assert completed == [
+        ('first', {'C:': [('first', 1, ' : Missing module docstring', 'C')],
+                   'R:': [], 'W:': [], 'E:': []})]
+
+    assert parser.feed(output[second_start:]) == []
+    (module, results), = parser.close()
+    assert module == 'second'
+    assert [item[1] for item in results['W:'] + results['E:']] == [3, 5]
+
+
+def test_pylint_output_parser_with_path():
+    """
+    Test that modules are identified by path and modules with fatal
+    messages are skipped.
+    """
+    output = ("************* Module broken\n"
+              "/p/broken.py\tF0002:  1,0: : Astroid error\n"
+              "/p/broken.py\tC0114:  1,0: : Missing module docstring\n"
+              "************* Module package.module\n"
+              "/p/package/module.py\tW0611:  2,0: : Unused import os\n")
+    parser = PylintOutputParser(with_path=True)
+    assert parser.feed(output) == []
+    (path, results), = parser.close()
+    assert path == '/p/package/module.py'
+    assert results['W:'] == [
+        ('/p/package/module.py', 2, ' : Unused import os', 'W0611')]
+
+
+def test_pylint_widget_project(tmp_path, qtbot, mocker):
+    """Test that project mode reuses the results of unchanged files."""
+    mocker.patch.object(PylintWidget, 'CACHEPATH',
+                        str(tmp_path / 'cache.json'))
+    project = tmp_path / 'project'
+    package = project / 'package'
+    package.mkdir(parents=True)
+    (package / '__init__.py').write_text('"""Package."""\n')
+    (package / 'module.py').write_text('"""Module."""\nimport os\n')
+    (project / 'script.py').write_text('"""Script."""\nprint(y)\n')
+
+    pylint_widget = PylintWidget(parent=None)
+    qtbot.addWidget(pylint_widget)
+    with qtbot.waitSignal(pylint_widget.project_linter.sig_finished,
+                          timeout=30000):
+        pylint_widget.analyze_project(str(project))
+
+    results = pylint_widget.get_data(str(project))[1][3]
+    assert [item[0] for item in results['W:']] == [
+        str(package / 'module.py')]
+    assert [item[0] for item in results['E:']] == [str(project / 'script.py')]
+
+    # Only the modified file is analyzed again
+    (project / 'script.py').write_text('"""Script."""\nprint(1)\n')
+    analyzed = []
+    pylint_widget.project_linter.sig_file_results.connect(
+        lambda filename, results, cached: analyzed.append((filename, cached)))
+    with qtbot.waitSignal(pylint_widget.project_linter.sig_finished,
+                          timeout=30000):
+        pylint_widget.analyze_project(str(project))
+
+    assert [filename for filename, cached in analyzed if not cached] == [
+        str(project / 'script.py')]
+    assert len(analyzed) == 3
+    results = pylint_widget.get_data(str(project))[1][3]
+    assert results['E:'] == []
+    assert len(results['W:']) == 1
+
+
 if __name__ == "__main__":
     pytest.main([osp.basename(__file__), '-vv', '-rw'])
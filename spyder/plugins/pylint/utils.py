@@ -9,13 +9,37 @@
 
 
 # Standard library imports
+import hashlib
+import json
+import logging
 import os
 import os.path as osp
+import re
 
 # Third party imports
+import pylint
 import pylint.config
 
 
+logger = logging.getLogger(__name__)
+
+# Categories of pylint messages: Convention, Refactor, Warning, Error
+MESSAGE_CATEGORIES = ('C:', 'R:', 'W:', 'E:')
+
+# Line that starts the messages of each module in pylint's output
+MODULE_HEADER = '************* Module '
+
+# Separator between the file path and the message in project mode
+PATH_SEPARATOR = '\t'
+
+# Bits of pylint's exit code that mean some files weren't analyzed
+FATAL_EXIT_CODE = 1
+USAGE_ERROR_EXIT_CODE = 32
+
+# Directories that are never analyzed in project mode
+EXCLUDED_DIRS = ('__pycache__', 'build', 'dist', 'node_modules')
+
+
 def _find_pylintrc_path(path):
     os.chdir(path)
     return pylint.config.find_pylintrc()
@@ -41,3 +65,209 @@ def get_pylintrc_path(search_paths=None, home_path=None):
         os.chdir(current_cwd)
 
     return pylintrc_path
+
+
+def get_pylint_args(pylintrc_path=None, with_path=False):
+    """
+    Return the arguments to run pylint as a module.
+
+    If `with_path` is True, messages start with the absolute path of their
+    file, followed by PATH_SEPARATOR.
+    """
+    p_args = ['-m', 'pylint', '--output-format=text']
+    if pylint.__version__.split('.')[0] == '0':
+        p_args += ['-i', 'yes']
+    else:
+        # Option '-i' (alias for '--include-ids') was removed in pylint
+        # 1.0
+        path = '{abspath}' + PATH_SEPARATOR if with_path else ''
+        p_args += ["--msg-template='" + path + "{msg_id}:{line:3d},"
+                   "{column}: {obj}: {msg}"]
+    if pylintrc_path is not None:
+        p_args += ['--rcfile={}'.format(pylintrc_path)]
+    return p_args
+
+
+def get_empty_results():
+    """Return results without any message."""
+    return {category: [] for category in MESSAGE_CATEGORIES}
+
+
+def parse_message_line(line, module):
+    """
+    Parse a message line of pylint's output.
+
+    Return its category and a (module, line number, message, message id)
+    tuple, or None if `line` is not a message.
+    """
+    # Supporting option include-ids: ('R3873:' instead of 'R:')
+    if not re.match(r'^[CRWE]+([0-9]{4})?:', line):
+        return
+    i1 = line.find(':')
+    if i1 == -1:
+        return
+    msg_id = line[:i1]
+    i2 = line.find(':', i1+1)
+    if i2 == -1:
+        return
+    line_nb = line[i1+1:i2].strip()
+    if not line_nb:
+        return
+    line_nb = int(line_nb.split(',')[0])
+    message = line[i2+1:]
+    return line[0] + ':', (module, line_nb, message, msg_id)
+
+
+def parse_pylint_output(output):
+    """Return the messages in pylint's `output`, grouped by category."""
+    results = get_empty_results()
+    module = ''  # Should not be needed - just in case something goes wrong
+    for line in output.splitlines():
+        if line.startswith(MODULE_HEADER):
+            # New module
+            module = line[len(MODULE_HEADER):]
+            continue
+        message = parse_message_line(line, module)
+        if message is not None:
+            category, item = message
+            results[category].append(item)
+    return results
+
+
+class PylintOutputParser(object):
+    """
+    Parse pylint's output while it's being written.
+
+    Pylint prints the messages of each module after a header, so the
+    messages of a module are complete as soon as the next header arrives.
+    Modules with fatal messages weren't fully analyzed, so they're skipped.
+
+    If `with_path` is True, the output must come from pylint run with
+    `get_pylint_args(with_path=True)`, and modules are identified by the
+    path of their file instead of their name.
+    """
+
+    def __init__(self, with_path=False):
+        self.with_path = with_path
+        self._buffer = ''
+        self.module = None
+        self.results = None
+        self._failed = False
+
+    def feed(self, text):
+        """
+        Parse `text`, the next piece of output.
+
+        Return the (module, results) pairs of the modules it completed.
+        """
+        self._buffer += text
+        lines = self._buffer.split('\n')
+        self._buffer = lines.pop()
+        completed = []
+        for line in lines:
+            line = line.rstrip('\r')
+            if line.startswith(MODULE_HEADER):
+                completed += self._complete_module()
+                self.module = (None if self.with_path
+                               else line[len(MODULE_HEADER):])
+                self.results = get_empty_results()
+            elif self.results is not None:
+                if self.with_path:
+                    path, separator, line = line.partition(PATH_SEPARATOR)
+                    if not separator:
+                        continue
+                    self.module = path
+                if re.match(r'^F([0-9]{4})?:', line):
+                    self._failed = True
+                message = parse_message_line(line, self.module)
+                if message is not None:
+                    category, item = message
+                    self.results[category].append(item)
+        return completed
+
+    def close(self):
+        """Return the (module, results) pairs of the remaining output."""
+        completed = self.feed('\n')
+        return completed + self._complete_module()
+
+    def _complete_module(self):
+        """Return the results of the current module, if any, as a list."""
+        completed = []
+        if self.module is not None and not self._failed:
+            completed.append((self.module, self.results))
+        self.module = None
+        self.results = None
+        self._failed = False
+        return completed
+
+
+def get_project_files(path):
+    """Return the Python files of the project in `path`."""
+    filenames = []
+    for dirpath, dirnames, files in os.walk(path):
+        # Skip hidden directories, build artifacts and virtual environments
+        dirnames[:] = sorted(
+            dirname for dirname in dirnames
+            if not dirname.startswith('.') and dirname not in EXCLUDED_DIRS
+            and not osp.isfile(osp.join(dirpath, dirname, 'pyvenv.cfg')))
+        filenames += [osp.join(dirpath, filename) for filename in sorted(files)
+                      if osp.splitext(filename)[1] in ('.py', '.pyw')]
+    return filenames
+
+
+def get_file_hash(filename):
+    """Return the hash of the contents of `filename`, or '' if unreadable."""
+    try:
+        with open(filename, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except (IOError, OSError):
+        return ''
+
+
+class PylintResultsCache(object):
+    """
+    Results of pylint for each file of a project.
+
+    Results are reused while the file, the pylintrc file used to analyze
+    it and pylint's version stay the same.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if (data.get('version') == self.VERSION and
+                    data.get('pylint') == pylint.__version__):
+                self.entries = data['entries']
+        except (IOError, OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def get(self, filename, file_hash, pylintrc_hash):
+        """Return the cached results of `filename`, or None."""
+        entry = self.entries.get(filename)
+        if (entry is not None and entry['hash'] == file_hash and
+                entry['pylintrc_hash'] == pylintrc_hash):
+            return entry['results']
+
+    def set(self, filename, file_hash, pylintrc_hash, results):
+        """Cache the `results` of `filename`."""
+        self.entries[filename] = {
+            'hash': file_hash,
+            'pylintrc_hash': pylintrc_hash,
+            'results': results,
+        }
+
+    def save(self):
+        """Save the cache to disk."""
+        data = {'version': self.VERSION,
+                'pylint': pylint.__version__,
+                'entries': self.entries}
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(data, f)
+        except (IOError, OSError) as error:
+            logger.debug("Unable to save pylint cache: %s", error)
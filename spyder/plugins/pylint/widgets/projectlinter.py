@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Pylint analysis of whole projects.
+
+Files are analyzed in chunks by several pylint processes running in
+parallel, and their results are cached so only the files that changed since
+the last analysis are analyzed again.
+"""
+
+# Standard library imports
+import multiprocessing
+import os.path as osp
+import sys
+
+# Third party imports
+from qtpy.QtCore import QObject, QProcess, QProcessEnvironment, Signal
+
+# Local imports
+from spyder.plugins.pylint.utils import (FATAL_EXIT_CODE, get_empty_results,
+                                         get_file_hash, get_pylint_args,
+                                         PylintOutputParser,
+                                         USAGE_ERROR_EXIT_CODE)
+from spyder.utils.workers import handle_qbytearray
+
+
+# Number of files analyzed by each pylint process
+FILES_PER_CHUNK = 8
+
+
+def get_max_workers():
+    """Return the number of pylint processes to run at the same time."""
+    try:
+        cpu_count = multiprocessing.cpu_count()
+    except NotImplementedError:
+        cpu_count = 1
+    return max(1, min(cpu_count, 8))
+
+
+def get_path_key(filename):
+    """Return the key used to match `filename` with pylint's paths."""
+    return osp.normcase(osp.abspath(filename))
+
+
+class ProjectLinter(QObject):
+    """
+    Run pylint over many files with a pool of processes.
+
+    Parameters
+    ----------
+    parent: QObject
+        Parent object.
+    cache: spyder.plugins.pylint.utils.PylintResultsCache
+        Cache of the results of each file.
+    max_workers: int
+        Maximum number of pylint processes running at the same time.
+    """
+
+    # Results of a file, with a flag that is True if they came from cache
+    sig_file_results = Signal(str, object, bool)
+
+    # All files were analyzed
+    sig_finished = Signal()
+
+    def __init__(self, parent, cache, max_workers=None):
+        QObject.__init__(self, parent)
+        self.cache = cache
+        self.max_workers = max_workers or get_max_workers()
+        self.output = ''
+        self.error_output = ''
+        self._chunks = []
+        self._workers = {}
+        self._hashes = {}
+        self._wdir = None
+        self._pylintrc_path = None
+        self._pylintrc_hash = ''
+
+    def is_running(self):
+        """Return True if an analysis is taking place."""
+        return bool(self._workers or self._chunks)
+
+    def start(self, filenames, pylintrc_path=None, wdir=None):
+        """
+        Analyze `filenames`.
+
+        Cached results are sent right away and the other files are split
+        into chunks that are analyzed in parallel.
+        """
+        self.stop()
+        self.output = ''
+        self.error_output = ''
+        self._wdir = wdir
+        self._pylintrc_path = pylintrc_path
+        self._pylintrc_hash = (get_file_hash(pylintrc_path)
+                               if pylintrc_path else '')
+        self._hashes = {}
+
+        pending = []
+        for filename in filenames:
+            file_hash = get_file_hash(filename)
+            results = self.cache.get(filename, file_hash, self._pylintrc_hash)
+            if results is None:
+                self._hashes[filename] = file_hash
+                pending.append(filename)
+            else:
+                self.sig_file_results.emit(filename, results, True)
+
+        self._chunks = [pending[i:i + FILES_PER_CHUNK]
+                        for i in range(0, len(pending), FILES_PER_CHUNK)]
+        if self._chunks:
+            for __ in range(min(self.max_workers, len(self._chunks))):
+                self._start_next_chunk()
+        else:
+            self._finish()
+
+    def stop(self):
+        """Stop all pylint processes."""
+        self._chunks = []
+        for process in list(self._workers):
+            process.finished.disconnect()
+            process.kill()
+            process.waitForFinished()
+        self._workers = {}
+
+    def _start_next_chunk(self):
+        """Start a pylint process on the next chunk of files, if any."""
+        if not self._chunks:
+            return
+        chunk = self._chunks.pop(0)
+
+        process = QProcess(self)
+        process.setProcessChannelMode(QProcess.SeparateChannels)
+        if self._wdir is not None:
+            process.setWorkingDirectory(self._wdir)
+        environment = QProcessEnvironment.systemEnvironment()
+        environment.insert("PYTHONIOENCODING", "utf8")
+        process.setProcessEnvironment(environment)
+        process.readyReadStandardOutput.connect(
+            lambda: self._read_output(process))
+        process.readyReadStandardError.connect(
+            lambda: self._read_error(process))
+        process.finished.connect(
+            lambda exit_code, exit_status: self._process_finished(process))
+
+        # Files are identified by the path pylint prints with each message
+        self._workers[process] = {
+            'parser': PylintOutputParser(with_path=True),
+            'paths': dict((get_path_key(filename), filename)
+                          for filename in chunk),
+            'pending': set(chunk),
+        }
+        process.start(sys.executable,
+                      get_pylint_args(self._pylintrc_path, with_path=True) +
+                      chunk)
+
+    def _read_output(self, process):
+        worker = self._workers.get(process)
+        if worker is None:
+            return
+        text = handle_qbytearray(process.readAllStandardOutput(), 'utf-8')
+        self.output += text
+        for path, results in worker['parser'].feed(text):
+            self._set_results(worker, path, results)
+
+    def _read_error(self, process):
+        text = handle_qbytearray(process.readAllStandardError(), 'utf-8')
+        self.error_output += text
+
+    def _process_finished(self, process):
+        if process not in self._workers:
+            return
+        # Parse output that arrived after the last readyRead signal
+        self._read_output(process)
+        worker = self._workers.pop(process)
+
+        # Pylint sets bits of its exit code when it fails to analyze some
+        # file or can't run at all. In that case, the messages of the last
+        # module may be incomplete and files without messages, which don't
+        # appear in its output, may not have been analyzed.
+        completed = (process.exitStatus() == QProcess.NormalExit and
+                     not process.exitCode() & (FATAL_EXIT_CODE |
+                                               USAGE_ERROR_EXIT_CODE))
+        if completed:
+            for path, results in worker['parser'].close():
+                self._set_results(worker, path, results)
+            for filename in sorted(worker['pending']):
+                self._file_done(filename, get_empty_results())
+        process.deleteLater()
+
+        self._start_next_chunk()
+        if not self._workers:
+            self._finish()
+
+    def _set_results(self, worker, path, results):
+        filename = worker['paths'].get(get_path_key(path))
+        if filename is not None and filename in worker['pending']:
+            worker['pending'].discard(filename)
+            self._file_done(filename, results)
+
+    def _file_done(self, filename, results):
+        # Messages refer to the file path instead of its module name, so
+        # they can be shown with the results of other files
+        results = dict(
+            (category, [(filename,) + tuple(item[1:]) for item in items])
+            for category, items in results.items())
+        self.cache.set(filename, self._hashes.get(filename, ''),
+                       self._pylintrc_hash, results)
+        self.sig_file_results.emit(filename, results, False)
+
+    def _finish(self):
+        self.cache.save()
+        self.sig_finished.emit()
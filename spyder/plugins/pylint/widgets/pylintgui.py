@@ -14,14 +14,14 @@
 # Standard library imports
 import os.path as osp
 import pickle
-import re
 import sys
 import time
 
 # Third party imports
 import pylint
 from qtpy.compat import getopenfilename
-from qtpy.QtCore import QByteArray, QProcess, Signal, Slot, QProcessEnvironment
+from qtpy.QtCore import (QByteArray, QProcess, QProcessEnvironment, QTimer,
+                         Signal, Slot)
 from qtpy.QtWidgets import (QHBoxLayout, QLabel, QMessageBox, QTreeWidgetItem,
                             QVBoxLayout, QWidget)
 
@@ -33,7 +33,11 @@ from spyder.utils.misc import getcwd_or_home
 from spyder.widgets.comboboxes import (is_module_or_package,
                                        PythonModulesComboBox)
 from spyder.widgets.onecolumntree import OneColumnTree
-from spyder.plugins.pylint.utils import get_pylintrc_path
+from spyder.plugins.pylint.utils import (get_empty_results, get_pylint_args,
+                                         get_project_files, get_pylintrc_path,
+                                         parse_pylint_output,
+                                         PylintResultsCache)
+from spyder.plugins.pylint.widgets.projectlinter import ProjectLinter
 from spyder.plugins.variableexplorer.widgets.texteditor import TextEditor
 
 
@@ -102,22 +106,12 @@ class ResultsTree(OneColumnTree):
                 title_item.setDisabled(True)
             modules = {}
             for module, lineno, message, msg_id in messages:
-                basename = osp.splitext(osp.basename(self.filename))[0]
-                if not module.startswith(basename):
-                    # Pylint bug
-                    i_base = module.find(basename)
-                    module = module[i_base:]
-                dirname = osp.dirname(self.filename)
-                if module.startswith('.') or module == basename:
-                    modname = osp.join(dirname, module)
+                if osp.isabs(module):
+                    # Project mode results refer to the path of each file
+                    modname = module
+                    module = osp.relpath(module, self.filename)
                 else:
-                    modname = osp.join(dirname, *module.split('.'))
-                if osp.isdir(modname):
-                    modname = osp.join(modname, '__init__')
-                for ext in ('.py', '.pyw'):
-                    if osp.isfile(modname+ext):
-                        modname = modname + ext
-                        break
+                    modname = self.get_module_path(module)
                 if osp.isdir(self.filename):
                     parent = modules.get(modname)
                     if parent is None:
@@ -137,12 +131,33 @@ class ResultsTree(OneColumnTree):
                 msg_item.setIcon(0, ima.icon('arrow'))
                 self.data[id(msg_item)] = (modname, lineno)
 
+    def get_module_path(self, module):
+        """Return the path of `module`, as named in pylint's output."""
+        basename = osp.splitext(osp.basename(self.filename))[0]
+        if not module.startswith(basename):
+            # Pylint bug
+            i_base = module.find(basename)
+            module = module[i_base:]
+        dirname = osp.dirname(self.filename)
+        if module.startswith('.') or module == basename:
+            modname = osp.join(dirname, module)
+        else:
+            modname = osp.join(dirname, *module.split('.'))
+        if osp.isdir(modname):
+            modname = osp.join(modname, '__init__')
+        for ext in ('.py', '.pyw'):
+            if osp.isfile(modname+ext):
+                modname = modname + ext
+                break
+        return modname
+
 
 class PylintWidget(QWidget):
     """
     Pylint widget
     """
     DATAPATH = get_conf_path('pylint.results')
+    CACHEPATH = get_conf_path('pylint_project_cache.json')
     VERSION = '1.1.0'
     redirect_stdio = Signal(bool)
     start_analysis = Signal()
@@ -226,6 +241,22 @@ class PylintWidget(QWidget):
         self.setLayout(layout)
 
         self.process = None
+
+        # Project mode
+        self.project_linter = ProjectLinter(
+            self, PylintResultsCache(self.CACHEPATH))
+        self.project_linter.sig_file_results.connect(self.add_file_results)
+        self.project_linter.sig_finished.connect(self.project_finished)
+        self.stop_button.clicked.connect(self.project_linter.stop)
+        self.stop_button.clicked.connect(self.project_stopped)
+        self.project_path = None
+        self.project_files = 0
+        self.project_results = {}
+        self.project_timer = QTimer(self)
+        self.project_timer.setSingleShot(True)
+        self.project_timer.setInterval(300)
+        self.project_timer.timeout.connect(self.show_project_progress)
+
         self.set_running_state(False)
         self.show_data()
 
@@ -346,6 +377,9 @@ class PylintWidget(QWidget):
     def start(self):
         """Start the code analysis."""
         filename = str(self.filecombo.currentText())
+        if osp.isdir(filename):
+            self.start_project(filename)
+            return
 
         self.process = QProcess(self)
         self.process.setProcessChannelMode(QProcess.SeparateChannels)
@@ -360,22 +394,8 @@ class PylintWidget(QWidget):
         self.output = ''
         self.error_output = ''
 
-        plver = PYLINT_VER
-        if plver is not None:
-            p_args = ['-m', 'pylint', '--output-format=text']
-            if plver.split('.')[0] == '0':
-                p_args += ['-i', 'yes']
-            else:
-                # Option '-i' (alias for '--include-ids') was removed in pylint
-                # 1.0
-                p_args += ["--msg-template='{msg_id}:{line:3d},"
-                           "{column}: {obj}: {msg}"]
-
         pylintrc_path = self.get_pylintrc_path(filename=filename)
-        if pylintrc_path is not None:
-            p_args += ['--rcfile={}'.format(pylintrc_path)]
-
-        p_args += [filename]
+        p_args = get_pylint_args(pylintrc_path) + [filename]
         processEnvironment = QProcessEnvironment()
         processEnvironment.insert("PYTHONIOENCODING", "utf8")
         self.process.setProcessEnvironment(processEnvironment)
@@ -388,6 +408,76 @@ class PylintWidget(QWidget):
             QMessageBox.critical(self, _("Error"),
                                  _("Process failed to start"))
 
+    def analyze_project(self, path):
+        """Perform code analysis for all Python files in `path`."""
+        self.set_filename(path)
+        self.start_project(path)
+
+    def start_project(self, path):
+        """
+        Start the code analysis of all Python files in `path`.
+
+        Files are analyzed in parallel and only the ones that changed since
+        the last analysis are analyzed again.
+        """
+        self.kill_if_running()
+        self.output = ''
+        self.error_output = ''
+        self.project_path = path
+        self.project_results = {}
+
+        filenames = get_project_files(path)
+        self.project_files = len(filenames)
+        # The trailing separator makes the project the first search path
+        pylintrc_path = self.get_pylintrc_path(filename=osp.join(path, ''))
+        self.set_running_state(True)
+        self.treewidget.clear_results()
+        self.project_linter.start(filenames, pylintrc_path=pylintrc_path,
+                                  wdir=getcwd_or_home())
+
+    def add_file_results(self, filename, results, cached):
+        """Add the results of a file analyzed in project mode."""
+        self.project_results[filename] = results
+        if not self.project_timer.isActive():
+            self.project_timer.start()
+
+    def get_project_results(self):
+        """Merge the results of all files analyzed in project mode."""
+        results = get_empty_results()
+        for filename in sorted(self.project_results):
+            for category, messages in self.project_results[filename].items():
+                results[category] += [tuple(message) for message in messages]
+        return results
+
+    def show_project_progress(self):
+        """Show the results of the files analyzed so far."""
+        if self.project_path is None:
+            return
+        self.treewidget.set_results(self.project_path,
+                                    self.get_project_results())
+        text = _('Analyzing project: {0}/{1} files').format(
+            len(self.project_results), self.project_files)
+        self.ratelabel.setText(text)
+
+    def project_finished(self):
+        """Save and show the results of the project analysis."""
+        self.project_timer.stop()
+        self.set_running_state(False)
+        self.set_data(self.project_path, (time.localtime(), None, '',
+                                          self.get_project_results()))
+        self.error_output = self.project_linter.error_output
+        self.output = self.error_output + self.project_linter.output
+        self.project_path = None
+        self.show_data(justanalyzed=True)
+
+    def project_stopped(self):
+        """Show the partial results of a stopped project analysis."""
+        if self.project_path is not None:
+            self.show_project_progress()
+            self.project_timer.stop()
+            self.project_path = None
+            self.set_running_state(False)
+
     def set_running_state(self, state=True):
         self.start_button.setEnabled(not state)
         self.stop_button.setEnabled(state)
@@ -418,32 +508,7 @@ class PylintWidget(QWidget):
             return
 
         # Convention, Refactor, Warning, Error
-        results = {'C:': [], 'R:': [], 'W:': [], 'E:': []}
-        txt_module = '************* Module '
-
-        module = ''  # Should not be needed - just in case something goes wrong
-        for line in self.output.splitlines():
-            if line.startswith(txt_module):
-                # New module
-                module = line[len(txt_module):]
-                continue
-            # Supporting option include-ids: ('R3873:' instead of 'R:')
-            if not re.match(r'^[CRWE]+([0-9]{4})?:', line):
-                continue
-            i1 = line.find(':')
-            if i1 == -1:
-                continue
-            msg_id = line[:i1]
-            i2 = line.find(':', i1+1)
-            if i2 == -1:
-                continue
-            line_nb = line[i1+1:i2].strip()
-            if not line_nb:
-                continue
-            line_nb = int(line_nb.split(',')[0])
-            message = line[i2+1:]
-            item = (module, line_nb, message, msg_id)
-            results[line[0]+':'].append(item)
+        results = parse_pylint_output(self.output)
 
         # Rate
         rate = None
@@ -469,6 +534,8 @@ class PylintWidget(QWidget):
         self.show_data(justanalyzed=True)
 
     def kill_if_running(self):
+        self.project_linter.stop()
+        self.project_path = None
         if self.process is not None:
             if self.process.state() == QProcess.Running:
                 self.process.kill()
@@ -491,7 +558,16 @@ class PylintWidget(QWidget):
             date_text = ''
         else:
             datetime, rate, previous_rate, results = data
-            if rate is None:
+            if rate is None and osp.isdir(filename):
+                text_style = "<span style=\'color: %s\'><b>%s </b></span>"
+                count = sum(len(messages) for messages in results.values())
+                text = text_style % (
+                    self.text_color,
+                    _('Project analysis: {} messages').format(count))
+                self.treewidget.set_results(filename, results)
+                date = time.strftime("%Y-%m-%d %H:%M:%S", datetime)
+                date_text = text_style % (self.text_color, date)
+            elif rate is None:
                 text = _('Analysis did not succeed '
                          '(see output for more details).')
                 self.treewidget.clear_results()
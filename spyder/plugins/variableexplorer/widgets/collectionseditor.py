@@ -57,6 +57,8 @@ from spyder.utils.stringmatching import get_search_scores, get_search_regex
 from spyder.plugins.variableexplorer.widgets.collectionsdelegate import (
     CollectionsDelegate)
 from spyder.plugins.variableexplorer.widgets.importwizard import ImportWizard
+from spyder.plugins.variableexplorer.widgets.pagedcollectionseditor import (
+    RemotePagedCollectionsEditor)
 from spyder.widgets.helperwidgets import CustomSortFilterProxy
 from spyder.plugins.variableexplorer.widgets.basedialog import BaseDialog
 
@@ -66,6 +68,9 @@ MAX_SERIALIZED_LENGHT = 1e6
 LARGE_NROWS = 100
 ROWS_TO_LOAD = 50
 
+# Collections in the kernel larger than this are browsed in pages
+PAGED_COLLECTION = 1e4
+
 
 class ProxyObject(object):
     """Dictionary proxy to an unknown object."""
@@ -1376,6 +1381,39 @@ class RemoteCollectionsDelegate(CollectionsDelegate):
     def __init__(self, parent=None):
         CollectionsDelegate.__init__(self, parent)
 
+    def is_paged(self, index):
+        """
+        Return True if the collection in `index` is so large that it must
+        be browsed in pages instead of being retrieved from the kernel.
+        """
+        val_type = index.sibling(index.row(), 1).data()
+        val_size = index.sibling(index.row(), 2).data()
+        try:
+            return (val_type in ['list', 'set', 'tuple', 'dict'] and
+                    int(val_size) > PAGED_COLLECTION)
+        except (TypeError, ValueError):
+            return False
+
+    def createEditor(self, parent, option, index, object_explorer=False):
+        """Overriding method createEditor"""
+        if (index.column() == 3 and not object_explorer and
+                self.is_paged(index)):
+            self.sig_open_editor.emit()
+            source_index = index.model().mapToSource(index)
+            name = source_index.model().keys[source_index.row()]
+            editor = RemotePagedCollectionsEditor(parent=parent)
+            editor.setup(self.parent().shellwidget, name,
+                         minmax=index.model().minmax,
+                         dataframe_format=index.model().dataframe_format,
+                         icon=self.parent().windowIcon())
+            # Changes are applied in the kernel by the editor itself
+            self.create_dialog(editor, dict(model=index.model(),
+                                            editor=editor, key=name,
+                                            readonly=True))
+            return None
+        return CollectionsDelegate.createEditor(
+            self, parent, option, index, object_explorer=object_explorer)
+
     def get_value(self, index):
         if index.isValid():
             source_index = index.model().mapToSource(index)
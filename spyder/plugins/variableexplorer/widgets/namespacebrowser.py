@@ -394,6 +394,24 @@ class NamespaceBrowser(QWidget):
         if remote_view is not None:
             self.set_data(remote_view)
 
+    def process_remote_view_delta(self, delta):
+        """
+        Process the changes of the remote view since the last ones.
+
+        Only the entries that changed are sent by the kernel, so nothing
+        is done when the namespace didn't change.
+        """
+        if delta is None:
+            return
+        if delta['reset']:
+            self.set_data(delta['update'])
+        elif delta['update'] or delta['remove']:
+            data = dict(self.editor.source_model.get_data())
+            for name in delta['remove']:
+                data.pop(name, None)
+            data.update(delta['update'])
+            self.set_data(data)
+
     def set_var_properties(self, properties):
         """Set properties of variables"""
         if properties is not None:
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Paged editor for large collections living in a kernel.
+
+Only the rows of the visible pages are requested to the kernel, which
+also sorts and filters the collection, so opening a list or dict with
+millions of elements doesn't transfer it to Spyder.
+"""
+
+# Standard library imports
+from collections import OrderedDict
+from pickle import PicklingError, UnpicklingError
+
+# Third party imports
+from qtpy.compat import to_qvariant
+from qtpy.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, Signal
+from qtpy.QtGui import QColor
+from qtpy.QtWidgets import (QDialog, QHBoxLayout, QLineEdit, QPushButton,
+                            QTableView, QVBoxLayout)
+
+# Local imports
+from spyder.config.base import _
+from spyder.config.fonts import DEFAULT_SMALL_DELTA
+from spyder.config.gui import get_font
+from spyder.py3compat import to_text_string, TimeoutError
+from spyder.utils import icon_manager as ima
+from spyder.plugins.variableexplorer.widgets.basedialog import BaseDialog
+from spyder.plugins.variableexplorer.widgets.collectionsdelegate import (
+    CollectionsDelegate)
+
+
+# Number of rows requested to the kernel at once
+PAGE_SIZE = 200
+
+# Maximum number of pages kept in memory
+MAX_PAGES = 50
+
+# Timeout to get the value of an element, in seconds
+CALL_KERNEL_TIMEOUT = 30
+
+# Delay before applying a new filter, in milliseconds
+FILTER_DELAY = 300
+
+# Text shown in rows that are being loaded
+LOADING_TEXT = '...'
+
+
+class RemotePagedCollectionsModel(QAbstractTableModel):
+    """
+    Table model of a collection in a kernel, loaded one page at a time.
+
+    Parameters
+    ----------
+    parent: QObject
+        Parent object.
+    shellwidget: ShellWidget
+        Console of the kernel where the collection lives.
+    name: str
+        Name of the variable that holds the collection.
+    """
+
+    # The total number of rows changed
+    sig_loaded = Signal()
+
+    def __init__(self, parent, shellwidget, name, minmax=False,
+                 dataframe_format=None):
+        QAbstractTableModel.__init__(self, parent)
+        self.shellwidget = shellwidget
+        self.name = name
+        self.minmax = minmax
+        self.dataframe_format = dataframe_format
+        self.show_callable_attributes = None
+        self.show_special_attributes = None
+        self.sort_column = None
+        self.reverse = False
+        self.filter_text = ''
+        self.total_rows = 0
+        self.length = 0
+        self.type = ''
+        self.readonly = True
+        self.pages = OrderedDict()
+        self._requested = set()
+        self._generation = 0
+        self._reset_pending = False
+
+    # ---- Kernel requests
+    def reload(self):
+        """Discard the loaded pages and request the first one again."""
+        self._generation += 1
+        self._requested = set()
+        self._reset_pending = True
+        self.request_page(0)
+
+    def request_page(self, number):
+        """Ask the kernel for the rows of page `number`."""
+        if number in self._requested:
+            return
+        self._requested.add(number)
+        generation = self._generation
+        self.shellwidget.call_kernel(
+            interrupt=True,
+            callback=lambda page: self.set_page(generation, number, page)
+        ).get_collection_page(self.name, number * PAGE_SIZE,
+                              (number + 1) * PAGE_SIZE,
+                              sort_column=self.sort_column,
+                              reverse=self.reverse,
+                              filter_text=self.filter_text)
+
+    def set_page(self, generation, number, page):
+        """Show the rows of page `number` sent by the kernel."""
+        if generation != self._generation:
+            # Sent before sorting or filtering changed
+            return
+        self._requested.discard(number)
+        total_rows = 0 if page is None else page['total']
+        if self._reset_pending or total_rows != self.total_rows:
+            self._reset_pending = False
+            self.beginResetModel()
+            self.pages.clear()
+            if page is not None:
+                self.pages[number] = page['rows']
+                self.length = page['length']
+                self.type = page['type']
+                self.readonly = page['readonly']
+            self.total_rows = total_rows
+            self.endResetModel()
+            self.sig_loaded.emit()
+        else:
+            self.pages[number] = page['rows']
+            first_row = number * PAGE_SIZE
+            last_row = min(first_row + PAGE_SIZE, self.total_rows) - 1
+            self.dataChanged.emit(self.index(first_row, 0),
+                                  self.index(last_row, 3))
+        while len(self.pages) > MAX_PAGES:
+            self.pages.popitem(last=False)
+
+    def refresh(self):
+        """Index the collection again in the kernel and reload it."""
+        self.shellwidget.call_kernel(interrupt=True).close_collection(
+            self.name)
+        self.reload()
+
+    def close(self):
+        """Tell the kernel that the collection is not shown anymore."""
+        self._generation += 1
+        self.shellwidget.call_kernel(interrupt=True).close_collection(
+            self.name)
+
+    def set_filter_text(self, text):
+        """Only show the keys that contain `text`."""
+        if text != self.filter_text:
+            self.filter_text = text
+            self.reload()
+
+    def get_row(self, row):
+        """Return the entry of `row`, or None if it's not loaded yet."""
+        number = row // PAGE_SIZE
+        page = self.pages.get(number)
+        if page is None:
+            self.request_page(number)
+            return None
+        self.pages.move_to_end(number)
+        row = row % PAGE_SIZE
+        if row < len(page):
+            return page[row]
+
+    # ---- Collections delegate API
+    def get_key(self, index):
+        """Return the display of the key of `index`."""
+        entry = self.get_row(index.row())
+        return '' if entry is None else entry['key']
+
+    def get_index_from_key(self, key):
+        """Return the index of the loaded row with `key`."""
+        for number, page in self.pages.items():
+            for row, entry in enumerate(page):
+                if entry['key'] == key:
+                    return self.index(number * PAGE_SIZE + row, 3)
+        return QModelIndex()
+
+    def get_value(self, index):
+        """Get the value of the element in `index` from the kernel."""
+        reason_big = _("The variable is too big to be retrieved")
+        reason_not_picklable = _("The variable is not picklable")
+        msg = _("%s.<br><br>"
+                "Note: Please don't report this problem on Github, "
+                "there's nothing to do about it.")
+        try:
+            return self.shellwidget.call_kernel(
+                interrupt=True,
+                blocking=True,
+                timeout=CALL_KERNEL_TIMEOUT
+            ).get_collection_item(self.name, index.row())
+        except TimeoutError:
+            raise ValueError(msg % reason_big)
+        except (PicklingError, UnpicklingError):
+            raise ValueError(msg % reason_not_picklable)
+
+    def set_value(self, index, value):
+        """Set the value of the element in `index` in the kernel."""
+        if self.readonly:
+            return
+        self.shellwidget.call_kernel(
+            interrupt=True, blocking=False
+        ).set_collection_item(self.name, index.row(), value)
+        self.reload()
+        self.shellwidget.refresh_namespacebrowser()
+
+    # ---- Qt methods
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Ask the kernel to sort the collection by `column`."""
+        self.sort_column = column if column >= 0 else None
+        self.reverse = (order == Qt.DescendingOrder)
+        self.reload()
+
+    def rowCount(self, index=QModelIndex()):
+        return self.total_rows
+
+    def columnCount(self, index=QModelIndex()):
+        return 4
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsEnabled
+        flags = QAbstractTableModel.flags(self, index)
+        if self.readonly:
+            return flags
+        return Qt.ItemFlags(int(flags | Qt.ItemIsEditable))
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return to_qvariant()
+        key_header = _("Key") if self.type == 'dict' else _("Index")
+        headers = (key_header, _("Type"), _("Size"), _("Value"))
+        return to_qvariant(headers[section])
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return to_qvariant()
+        entry = self.get_row(index.row())
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if entry is None:
+                return to_qvariant(LOADING_TEXT)
+            value = entry[('key', 'type', 'size', 'view')[column]]
+            if not isinstance(value, int):
+                value = to_text_string(value)
+            return to_qvariant(value)
+        elif role == Qt.TextAlignmentRole:
+            if (column == 3 and entry is not None and
+                    len(entry['view'].splitlines()) >= 3):
+                return to_qvariant(int(Qt.AlignLeft | Qt.AlignTop))
+            return to_qvariant(int(Qt.AlignLeft | Qt.AlignVCenter))
+        elif role == Qt.BackgroundColorRole:
+            if column == 3 and entry is not None:
+                color = QColor(entry['color'])
+                color.setAlphaF(.2)
+            else:
+                color = QColor(Qt.lightGray)
+                color.setAlphaF(.05 if column == 0 else .2)
+            return to_qvariant(color)
+        elif role == Qt.FontRole:
+            return to_qvariant(get_font(font_size_delta=DEFAULT_SMALL_DELTA))
+        return to_qvariant()
+
+
+class RemotePagedCollectionsTableView(QTableView):
+    """Table view of a collection in a kernel."""
+
+    def __init__(self, parent, shellwidget, name, minmax=False,
+                 dataframe_format=None):
+        QTableView.__init__(self, parent)
+        self.readonly = True
+        self.source_model = RemotePagedCollectionsModel(
+            self, shellwidget, name, minmax=minmax,
+            dataframe_format=dataframe_format)
+        self.source_model.sig_loaded.connect(self.update_readonly)
+        self.setModel(self.source_model)
+
+        self.delegate = CollectionsDelegate(self)
+        self.setItemDelegate(self.delegate)
+
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().hide()
+        # Keep the order of the collection until a column is clicked
+        self.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.setSortingEnabled(True)
+
+    def update_readonly(self):
+        """Don't allow editing tuples and sets."""
+        self.readonly = self.source_model.readonly
+
+    def set_filter_text(self, text):
+        """Only show the keys that contain `text`."""
+        self.source_model.set_filter_text(text)
+
+    # ---- Options changed in the editors opened by the delegate
+    def set_dataframe_format(self, new_format):
+        self.source_model.dataframe_format = new_format
+
+    def toggle_show_callable_attributes(self, state):
+        self.source_model.show_callable_attributes = state
+
+    def toggle_show_special_attributes(self, state):
+        self.source_model.show_special_attributes = state
+
+
+class RemotePagedCollectionsEditor(BaseDialog):
+    """Dialog to browse a large collection living in a kernel."""
+
+    def __init__(self, parent=None):
+        QDialog.__init__(self, parent)
+        # See CollectionsEditor
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.name = None
+        self.view = None
+        self.filter_edit = None
+        self.filter_timer = None
+
+    def setup(self, shellwidget, name, minmax=False, dataframe_format=None,
+              icon=None):
+        """Setup editor."""
+        self.name = name
+        self.view = RemotePagedCollectionsTableView(
+            self, shellwidget, name, minmax=minmax,
+            dataframe_format=dataframe_format)
+        self.view.source_model.sig_loaded.connect(self.update_title)
+
+        self.filter_edit = QLineEdit(self)
+        self.filter_edit.setPlaceholderText(_("Filter by key or index"))
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY)
+        self.filter_timer.timeout.connect(
+            lambda: self.view.set_filter_text(self.filter_edit.text()))
+        self.filter_edit.textChanged.connect(self.filter_timer.start)
+
+        refresh_button = QPushButton(_('Refresh'))
+        refresh_button.clicked.connect(self.view.source_model.refresh)
+        close_button = QPushButton(_('Close'))
+        close_button.setAutoDefault(True)
+        close_button.setDefault(True)
+        close_button.clicked.connect(self.reject)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        btn_layout.addWidget(refresh_button)
+        btn_layout.addWidget(close_button)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.filter_edit)
+        layout.addWidget(self.view)
+        layout.addLayout(btn_layout)
+        self.setLayout(layout)
+
+        self.update_title()
+        self.setWindowIcon(ima.icon('dictedit') if icon is None else icon)
+        self.setWindowFlags(Qt.Window)
+        self.view.source_model.reload()
+
+    def update_title(self):
+        """Show the type and number of elements of the collection."""
+        model = self.view.source_model
+        title = self.name
+        if model.type:
+            if model.total_rows == model.length:
+                count = _("{0} elements").format(model.length)
+            else:
+                count = _("{0} of {1} elements").format(model.total_rows,
+                                                        model.length)
+            title += ' - {0} ({1})'.format(model.type, count)
+        self.setWindowTitle(title)
+
+    def get_value(self):
+        """Changes are applied in the kernel as they're made."""
+        return None
+
+    def reject(self):
+        self.view.source_model.close()
+        QDialog.reject(self)
@@ -28,6 +28,7 @@ import pytest
 from flaky import flaky
 from qtpy.QtCore import Qt
 from qtpy.QtWidgets import QWidget
+from spyder_kernels.console.kernel import SpyderKernel
 
 # Local imports
 from spyder.plugins.variableexplorer.widgets.collectionseditor import (
@@ -35,6 +36,8 @@ from spyder.plugins.variableexplorer.widgets.collectionseditor import (
     CollectionsModel, CollectionsEditor, LARGE_NROWS, ROWS_TO_LOAD)
 from spyder.plugins.variableexplorer.widgets.namespacebrowser import (
     NamespacesBrowserFinder)
+from spyder.plugins.variableexplorer.widgets.pagedcollectionseditor import (
+    PAGE_SIZE, LOADING_TEXT, RemotePagedCollectionsModel)
 from spyder.plugins.variableexplorer.widgets.tests.test_dataframeeditor import \
     generate_pandas_indexes
 from spyder.py3compat import PY2
@@ -58,6 +61,51 @@ def data_table(cm, n_rows, n_cols):
     return [[data(cm, i, j) for i in range(n_rows)] for j in range(n_cols)]
 
 
+class FakeKernel(object):
+    """Kernel that only answers the requests of paged collections."""
+
+    get_collection_page = SpyderKernel.get_collection_page
+    get_collection_item = SpyderKernel.get_collection_item
+    set_collection_item = SpyderKernel.set_collection_item
+    close_collection = SpyderKernel.close_collection
+    _get_collection_index = SpyderKernel._get_collection_index
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.namespace_view_settings = {}
+        self._collection_indexes = {}
+
+    def _get_current_namespace(self):
+        return self.namespace
+
+
+class FakeKernelCall(object):
+    """Call FakeKernel methods as ShellWidget.call_kernel does."""
+
+    def __init__(self, kernel, callback=None):
+        self.kernel = kernel
+        self.callback = callback
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            result = getattr(self.kernel, name)(*args, **kwargs)
+            if self.callback is not None:
+                self.callback(result)
+            return result
+        return call
+
+
+def create_paged_model(namespace, name):
+    """Create a paged model of namespace[name] served by a FakeKernel."""
+    kernel = FakeKernel(namespace)
+    shellwidget = Mock()
+    shellwidget.call_kernel = lambda callback=None, **kwargs: (
+        FakeKernelCall(kernel, callback))
+    model = RemotePagedCollectionsModel(None, shellwidget, name)
+    model.reload()
+    return model
+
+
 # =============================================================================
 # Pytest Fixtures
 # =============================================================================
@@ -692,6 +740,58 @@ def test_edit_nonsettable_objects(qtbot, nonsettable_objects_data):
                     == getattr(expected_obj, key) for key in keys])
 
 
+def test_remote_paged_collections_model():
+    """Test that large remote collections are loaded in pages."""
+    namespace = {'data': dict(('key%d' % i, i) for i in range(1000))}
+    model = create_paged_model(namespace, 'data')
+    assert model.rowCount() == 1000
+    assert model.length == 1000
+    assert list(model.pages) == [0]
+    assert data(model, 0, 0) == 'key0'
+    assert data(model, 0, 1) == 'int'
+    assert data(model, 0, 3) == '0'
+
+    # Other pages are requested when shown
+    row = 3 * PAGE_SIZE + 5
+    assert 3 not in model.pages
+    assert data(model, row, 3) == LOADING_TEXT
+    assert data(model, row, 3) == str(row)
+
+    # Sorting and filtering happen in the kernel
+    model.sort(3, Qt.DescendingOrder)
+    assert data(model, 0, 3) == '999'
+    model.set_filter_text('KEY99')
+    assert model.rowCount() == 11
+    assert model.length == 1000
+
+    # Values are edited in the kernel
+    model.set_value(model.index(0, 3), -1)
+    assert namespace['data']['key999'] == -1
+    assert model.flags(model.index(0, 3)) & Qt.ItemIsEditable
+
+    # Edited values are sorted again
+    assert data(model, 0, 3) == '998'
+    assert model.get_value(model.index(10, 3)) == -1
+
+    # Refreshing indexes changes made in place
+    namespace['data']['key990'] = 2000
+    model.refresh()
+    assert data(model, 0, 3) == '2000'
+
+    model.close()
+    assert model.shellwidget.call_kernel().kernel._collection_indexes == {}
+
+
+def test_remote_paged_collections_model_readonly():
+    """Test that remote tuples and sets can't be edited."""
+    namespace = {'data': tuple(range(100))}
+    model = create_paged_model(namespace, 'data')
+    assert model.readonly
+    assert not model.flags(model.index(0, 3)) & Qt.ItemIsEditable
+    model.set_value(model.index(0, 3), -1)
+    assert namespace['data'][0] == 0
+
+
 def test_collectionseditor_with_class_having_buggy_copy(qtbot):
     """
     Test that editor for object whose .copy() returns a different type is
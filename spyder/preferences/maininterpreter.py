@@ -131,6 +131,15 @@ class MainInterpreterConfigPage(GeneralConfigPage):
                                 'umr/verbose', msg_info=_(
                                 "Please note that these changes will "
                                 "be applied only to new consoles"))
+        umr_selective_box = newcb(_("Only reload changed modules"),
+                                  'umr/selective', tip=_(
+                                  "Reload only the modules whose files "
+                                  "changed since the last run, and the "
+                                  "modules that import them, instead of "
+                                  "all modules"),
+                                  msg_info=_(
+                                  "Please note that these changes will "
+                                  "be applied only to new consoles"))
         umr_namelist_btn = QPushButton(
                             _("Set UMR excluded (not reloaded) modules"))
         umr_namelist_btn.clicked.connect(self.set_umr_namelist)
@@ -139,6 +148,7 @@ class MainInterpreterConfigPage(GeneralConfigPage):
         umr_layout.addWidget(umr_label)
         umr_layout.addWidget(umr_enabled_box)
         umr_layout.addWidget(umr_verbose_box)
+        umr_layout.addWidget(umr_selective_box)
         umr_layout.addWidget(umr_namelist_btn)
         umr_group.setLayout(umr_layout)
 
@@ -172,13 +182,14 @@ class MainInterpreterConfigPage(GeneralConfigPage):
             return
         spyder_version = sys.version_info[0]
         try:
-            args = ["-c", "import sys; print(sys.version_info[0])"]
-            proc = programs.run_program(pyexec, args)
-            console_version = int(proc.communicate()[0])
-        except IOError:
+            # This also gets the modules needed by the IPython console
+            info = programs.get_interpreter_info(pyexec, raise_errors=True)
+        except (IOError, OSError, programs.ProgramError):
             console_version = spyder_version
-        except ValueError:
-            return False
+        else:
+            if info is None:
+                return False
+            console_version = info['version'][0]
         if spyder_version != console_version:
             QMessageBox.warning(self, _('Warning'),
                 _("You selected a <b>Python %d</b> interpreter for the console "
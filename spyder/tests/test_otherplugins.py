@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the third-party plugins discovery manifest."""
+
+# Standard library imports
+import os
+import os.path as osp
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder import otherplugins
+
+
+@pytest.fixture
+def plugin_dir(tmpdir, monkeypatch):
+    """Create a directory with a plugin and a package that is not one."""
+    conf_dir = tmpdir.mkdir('conf')
+    monkeypatch.setattr(
+        otherplugins, 'get_conf_path',
+        lambda filename=None: osp.join(str(conf_dir), filename or ''))
+
+    plugins = tmpdir.mkdir('site-packages')
+    plugin = plugins.mkdir('spyder_foo')
+    plugin.join('__init__.py').write('PLUGIN_CLASS = object\n')
+    not_plugin = plugins.mkdir('spyder_bar')
+    not_plugin.join('__init__.py').write('\n')
+    plugins.mkdir('spyder_foo-1.0.dist-info')
+    plugins.mkdir('other_package')
+    return str(plugins)
+
+
+def test_plugins_manifest(plugin_dir, monkeypatch):
+    """Test that the manifest is reused while the paths are unchanged."""
+    manifest = otherplugins.get_plugins_manifest([plugin_dir])
+    assert manifest['candidates'] == [['spyder_bar', plugin_dir],
+                                      ['spyder_foo', plugin_dir]]
+
+    # Paths are not listed again if they didn't change
+    scanned = []
+    listdir = os.listdir
+    monkeypatch.setattr(otherplugins.os, 'listdir',
+                        lambda path: scanned.append(path) or listdir(path))
+    assert otherplugins.get_plugins_manifest([plugin_dir]) == manifest
+    assert scanned == []
+
+    # Adding a package changes the directory mtime and invalidates it
+    os.mkdir(osp.join(plugin_dir, 'spyder_baz'))
+    mtime = osp.getmtime(plugin_dir) + 10
+    os.utime(plugin_dir, (mtime, mtime))
+    manifest = otherplugins.get_plugins_manifest([plugin_dir])
+    assert scanned == [plugin_dir]
+    assert ['spyder_baz', plugin_dir] in manifest['candidates']
+
+
+def test_get_spyderplugins_mods(plugin_dir, monkeypatch):
+    """Test that modules without PLUGIN_CLASS are not imported again."""
+    monkeypatch.setattr(otherplugins.sys, 'path', [plugin_dir])
+    monkeypatch.setattr(otherplugins, 'USER_PLUGIN_DIR', 'plugins')
+    imported = []
+    import_plugin = otherplugins._import_plugin
+
+    def import_plugin_mock(name, *args):
+        imported.append(name)
+        return import_plugin(name, *args)
+
+    monkeypatch.setattr(otherplugins, '_import_plugin', import_plugin_mock)
+    mods = otherplugins.get_spyderplugins_mods()
+    assert [mod.__name__ for mod in mods] == ['spyder_foo']
+    assert imported == ['spyder_bar', 'spyder_foo']
+
+    manifest = otherplugins._load_plugins_manifest()
+    assert list(manifest['not_plugins']['plugins']) == ['spyder_bar']
+    assert 'io' not in manifest['not_plugins']
+
+    # Packages that are not plugins are skipped...
+    del imported[:]
+    otherplugins.get_spyderplugins_mods()
+    assert imported == ['spyder_foo']
+
+    # ...until one of their files changes
+    init = osp.join(plugin_dir, 'spyder_bar', '__init__.py')
+    mtime = osp.getmtime(init) + 10
+    os.utime(init, (mtime, mtime))
+    del imported[:]
+    otherplugins.get_spyderplugins_mods()
+    assert imported == ['spyder_bar', 'spyder_foo']
+
+
+if __name__ == "__main__":
+    pytest.main()
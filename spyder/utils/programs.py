@@ -14,8 +14,8 @@ from distutils.version import LooseVersion
 from getpass import getuser
 import glob
 import imp
-import inspect
 import itertools
+import json
 import os
 import os.path as osp
 import re
@@ -29,7 +29,8 @@ import time
 import psutil
 
 # Local imports
-from spyder.config.base import is_stable_version, running_under_pytest
+from spyder.config.base import (get_conf_path, is_stable_version,
+                                running_under_pytest)
 from spyder.config.utils import is_anaconda
 from spyder.py3compat import PY2, is_text_string, to_text_string
 from spyder.utils import encoding
@@ -824,48 +825,20 @@ def is_module_installed(module_name, version=None, installed_version=None,
     in a determined interpreter
     """
     if interpreter:
-        if is_python_interpreter(interpreter):
-            checkver = inspect.getsource(check_version)
-            get_modver = inspect.getsource(get_module_version)
-            stable_ver = inspect.getsource(is_stable_version)
-            ismod_inst = inspect.getsource(is_module_installed)
-
-            f = tempfile.NamedTemporaryFile('wt', suffix='.py',
-                                            dir=get_temp_dir(), delete=False)
-            try:
-                script = f.name
-                f.write("# -*- coding: utf-8 -*-" + "\n\n")
-                f.write("from distutils.version import LooseVersion" + "\n")
-                f.write("import re" + "\n\n")
-                f.write(stable_ver + "\n")
-                f.write(checkver + "\n")
-                f.write(get_modver + "\n")
-                f.write(ismod_inst + "\n")
-                if version:
-                    f.write("print(is_module_installed('%s','%s'))"\
-                            % (module_name, version))
-                else:
-                    f.write("print(is_module_installed('%s'))" % module_name)
-
-                # We need to flush and sync changes to ensure that the content
-                # of the file is in disk before running the script
-                f.flush()
-                os.fsync(f)
-                f.close()
-                try:
-                    proc = run_program(interpreter, [script])
-                    output, _err = proc.communicate()
-                except subprocess.CalledProcessError:
-                    return True
-                return eval(output.decode())
-            finally:
-                if not f.closed:
-                    f.close()
-                os.remove(script)
-        else:
+        info = get_interpreter_info(interpreter, [module_name])
+        if info is None:
             # Try to not take a wrong decision if interpreter check
             # fails
             return True
+        module_info = info['modules'][module_name]
+        if not module_info['installed']:
+            return False
+        elif version is None:
+            return True
+        elif module_info['version'] is None:
+            return False
+        return is_module_installed(module_name, version,
+                                   installed_version=module_info['version'])
     else:
         if installed_version is None:
             try:
@@ -883,7 +856,8 @@ def is_module_installed(module_name, version=None, installed_version=None,
             if ';' in version:
                 output = True
                 for ver in version.split(';'):
-                    output = output and is_module_installed(module_name, ver)
+                    output = output and is_module_installed(
+                        module_name, ver, installed_version=installed_version)
                 return output
             match = re.search(r'[0-9]', version)
             assert match is not None, "Invalid version number"
@@ -967,6 +941,171 @@ def check_python_help(filename):
         return False
 
 
+# Script run by InterpreterInfoCache in the inspected interpreter, with the
+# names of the modules to check as arguments. It must run on Python 2 and 3.
+INTERPRETER_INFO_SCRIPT = """
+import json
+import sys
+
+modules = {}
+for name in sys.argv[1:]:
+    try:
+        module = __import__(name)
+    except Exception:
+        modules[name] = {'installed': False, 'version': None}
+        continue
+    for part in name.split('.')[1:]:
+        module = getattr(module, part, None)
+    version = getattr(module, '__version__', getattr(module, 'VERSION', None))
+    if isinstance(version, (tuple, list)):
+        version = '.'.join([str(i) for i in version])
+    elif version is not None:
+        version = str(version)
+    modules[name] = {'installed': True, 'version': version}
+
+sys.stdout.write('%s' + json.dumps({
+    'version': list(sys.version_info[:3]),
+    'path': [p for p in sys.path if p],
+    'modules': modules,
+}))
+"""
+
+# Prefix of the output of INTERPRETER_INFO_SCRIPT, to ignore anything
+# printed when importing modules
+INTERPRETER_INFO_PREFIX = '<spyder-interpreter-info>'
+
+# Modules whose versions are always requested, so that the IPython console
+# doesn't have to launch the interpreter again
+INTERPRETER_INFO_MODULES = ['spyder_kernels']
+
+
+class InterpreterInfoCache(object):
+    """
+    Cache of the Python version, sys.path and module versions of Python
+    interpreters, saved in a JSON file.
+
+    All the missing information about an interpreter is gathered by running
+    it once. Entries are discarded when the interpreter or any directory of
+    its sys.path (e.g. site-packages) is modified.
+    """
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self._entries = None
+        self._lock = threading.RLock()
+
+    def get_info(self, interpreter, modules=(), raise_errors=False):
+        """
+        Return a dict with the 'version' (as a list), 'path' and 'modules'
+        of interpreter, or None if it can't be run.
+
+        'modules' maps the name of each module in modules to a dict with
+        the keys 'installed' and 'version'.
+
+        If raise_errors is True, errors running interpreter are raised
+        instead of returning None.
+        """
+        key = osp.normcase(osp.realpath(interpreter))
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if (entry is not None and
+                    entry['signature'] != self._get_signature(
+                        interpreter, entry['path'])):
+                entry = None
+
+            if entry is None:
+                if not is_python_interpreter(interpreter):
+                    return None
+                names = set(INTERPRETER_INFO_MODULES)
+            else:
+                names = set()
+            names.update(name for name in modules
+                         if entry is None or name not in entry['modules'])
+            if names:
+                info = self._run(interpreter, sorted(names),
+                                 raise_errors=raise_errors)
+                if info is None:
+                    return None
+                if entry is not None:
+                    info['modules'] = dict(entry['modules'],
+                                           **info['modules'])
+                info['signature'] = self._get_signature(interpreter,
+                                                        info['path'])
+                entries[key] = entry = info
+                self._save()
+            return entry
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._load()
+            self._entries = {}
+            self._save()
+
+    def _get_signature(self, interpreter, path):
+        """Modification times of interpreter and its sys.path."""
+        signature = []
+        for dirname in [interpreter] + path:
+            try:
+                signature.append(os.stat(dirname).st_mtime)
+            except OSError:
+                signature.append(None)
+        return signature
+
+    def _run(self, interpreter, modules, raise_errors=False):
+        """Run interpreter to get its information."""
+        script = INTERPRETER_INFO_SCRIPT % INTERPRETER_INFO_PREFIX
+        try:
+            proc = run_program(interpreter, ['-c', script] + modules)
+            output, _err = proc.communicate()
+        except (subprocess.CalledProcessError, ProgramError, OSError):
+            if raise_errors:
+                raise
+            return None
+        output = to_text_string(output, 'utf-8')
+        if INTERPRETER_INFO_PREFIX not in output:
+            return None
+        output = output.rsplit(INTERPRETER_INFO_PREFIX, 1)[1]
+        try:
+            return json.loads(output)
+        except ValueError:
+            return None
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = {}
+            if self.filename is None:
+                self.filename = get_conf_path('interpreters.json')
+            try:
+                with open(self.filename) as f:
+                    self._entries = json.load(f)
+            except (IOError, OSError, ValueError):
+                pass
+        return self._entries
+
+    def _save(self):
+        try:
+            with open(self.filename, 'w') as f:
+                json.dump(self._entries, f)
+        except (IOError, OSError):
+            pass
+
+
+INTERPRETER_INFO = InterpreterInfoCache()
+
+
+def get_interpreter_info(interpreter, modules=(), raise_errors=False):
+    """
+    Return the Python version, sys.path and versions of modules of
+    interpreter, or None if it can't be run.
+
+    See InterpreterInfoCache.get_info.
+    """
+    return INTERPRETER_INFO.get_info(interpreter, modules,
+                                     raise_errors=raise_errors)
+
+
 def is_spyder_process(pid):
     """
     Test whether given PID belongs to a Spyder process.
@@ -34,7 +34,9 @@ from spyder.py3compat import (builtins, is_text_string, to_text_string, PY3,
 from spyder.plugins.editor.utils.languages import CELL_LANGUAGES
 from spyder.plugins.editor.utils.editor import TextBlockHelper as tbh
 from spyder.plugins.editor.utils.editor import BlockUserData
-from spyder.utils.workers import WorkerManager
+from spyder.plugins.editor.utils.findtasks import find_line_tasks
+from spyder.utils.workers import (get_cancellation_token, INTERACTIVE,
+                                   WorkerManager)
 from spyder.plugins.outlineexplorer.api import OutlineExplorerData
 from spyder.utils.qstringhelpers import qstring_length
 
@@ -169,6 +171,8 @@ class BaseSH(QSyntaxHighlighter):
     sig_outline_explorer_data_changed = Signal()
     # Signal to advertise a new cell
     sig_new_cell = Signal(OutlineExplorerData)
+    # Signal emitted when the tasks (TODO, FIXME, ...) of a block change
+    sig_tasks_changed = Signal()
 
     def __init__(self, parent, font=None, color_scheme='Spyder'):
         QSyntaxHighlighter.__init__(self, parent)
@@ -194,6 +198,7 @@ class BaseSH(QSyntaxHighlighter):
         self.cell_separators = None
         self.editor = None
         self.patterns = DEFAULT_COMPILED_PATTERNS
+        self.tasks_enabled = True
 
     def get_background_color(self):
         return QColor(self.background_color)
@@ -506,6 +511,10 @@ class PythonSH(BaseSH):
         self.outline_explorer_data_update_timer.setSingleShot(True)
         self.outline_explorer_data_update_timer.timeout.connect(
             self.sig_outline_explorer_data_changed)
+        # Tasks are found in each block while highlighting it
+        self.tasks_update_timer = QTimer()
+        self.tasks_update_timer.setSingleShot(True)
+        self.tasks_update_timer.timeout.connect(self.sig_tasks_changed)
 
     def highlight_match(self, text, match, key, value, offset,
                         state, import_stmt, oedata):
@@ -598,6 +607,10 @@ class PythonSH(BaseSH):
     def highlight_block(self, text):
         """Implement specific highlight for Python."""
         text = to_text_string(text)
+        if self.tasks_enabled:
+            tasks = find_line_tasks(text)
+        else:
+            tasks = []
         prev_state = tbh.get_state(self.currentBlock().previous())
         if prev_state == self.INSIDE_DQ3STRING:
             offset = -4
@@ -651,7 +664,7 @@ class PythonSH(BaseSH):
         block = self.currentBlock()
         data = block.userData()
 
-        need_data = (oedata or import_stmt)
+        need_data = (oedata or import_stmt or tasks)
 
         if need_data and not data:
             data = BlockUserData(self.editor)
@@ -668,6 +681,11 @@ class PythonSH(BaseSH):
         if (import_stmt) or (data and data.import_statement):
             data.import_statement = import_stmt
 
+        if data and data.tasks != tasks:
+            data.tasks = tasks
+            data.todo = tasks[-1] if tasks else ''
+            self.tasks_update_timer.start(500)
+
         block.setUserData(data)
 
     def get_import_statements(self):
@@ -1256,7 +1274,8 @@ class PygmentsSH(BaseSH):
 
         # This worker runs in a thread to avoid blocking when doing full file
         # parsing
-        self._worker_manager = WorkerManager()
+        self._worker_manager = WorkerManager(
+            max_threads=1, priority=INTERACTIVE, name='Syntax highlighting')
 
         # Store the format for all the tokens after Pygments parsing
         self._charlist = []
@@ -1316,8 +1335,13 @@ class PygmentsSH(BaseSH):
 
             return 'normal'
 
+        # Stop if a new charlist was requested in the meantime
+        cancellation_token = get_cancellation_token()
+
         charlist = []
         for typ, token in tokens:
+            if cancellation_token.is_cancelled():
+                return None
             fmt = formats[_get_fmt(typ)]
             for letter in token:
                 charlist.append((fmt, letter))
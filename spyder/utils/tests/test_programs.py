@@ -14,9 +14,11 @@ from flaky import flaky
 import pytest
 
 # Local imports
+from spyder.utils import programs
 from spyder.utils.programs import (_clean_win_application_path, check_version,
                                    find_program, get_application_icon,
                                    get_installed_applications, get_temp_dir,
+                                   InterpreterInfoCache,
                                    is_module_installed, is_python_interpreter,
                                    is_python_interpreter_valid_name,
                                    open_files_with_application,
@@ -197,6 +199,58 @@ def test_is_module_installed_with_custom_interpreter():
     assert is_module_installed('jedi', '>=0.7.0', interpreter=current)
 
 
+def test_interpreter_info_cache(tmpdir, monkeypatch):
+    """Test that interpreters are only run to get missing information."""
+    filename = str(tmpdir.join('interpreters.json'))
+    cache = InterpreterInfoCache(filename)
+    calls = []
+    run_program = programs.run_program
+
+    def run_program_mock(program, args, **kwargs):
+        if 'import this' not in args:
+            calls.append(args[2:])
+        return run_program(program, args, **kwargs)
+
+    monkeypatch.setattr(programs, 'run_program', run_program_mock)
+    # Interpreter validation is tested above
+    monkeypatch.setattr(programs, 'is_python_interpreter', lambda f: True)
+    info = cache.get_info(sys.executable, ['pytest', 'not_a_module'])
+    assert info['version'] == list(sys.version_info[:3])
+    assert info['modules']['pytest'] == {'installed': True,
+                                         'version': pytest.__version__}
+    assert not info['modules']['not_a_module']['installed']
+    assert calls == [['not_a_module', 'pytest', 'spyder_kernels']]
+
+    # Cached results are used, also after restarting
+    cache = InterpreterInfoCache(filename)
+    assert cache.get_info(sys.executable, ['pytest']) == info
+    assert len(calls) == 1
+
+    # Only missing modules are requested
+    info = cache.get_info(sys.executable, ['flaky', 'pytest'])
+    assert info['modules']['flaky']['installed']
+    assert calls[1] == ['flaky']
+
+    # Everything is requested again if the interpreter changes
+    info['signature'][0] = 0
+    cache.get_info(sys.executable, ['pytest'])
+    assert calls[2] == ['pytest', 'spyder_kernels']
+
+
+def test_interpreter_info_errors(tmpdir, monkeypatch):
+    """Test that errors running interpreters can be raised."""
+    cache = InterpreterInfoCache(str(tmpdir.join('interpreters.json')))
+
+    def run_program_mock(program, args, **kwargs):
+        raise OSError
+
+    monkeypatch.setattr(programs, 'run_program', run_program_mock)
+    monkeypatch.setattr(programs, 'is_python_interpreter', lambda f: True)
+    assert cache.get_info(sys.executable) is None
+    with pytest.raises(OSError):
+        cache.get_info(sys.executable, raise_errors=True)
+
+
 def test_get_temp_dir_ensure_dir_exists():
     """Test that the call to get_temp_dir creates the dir when it doesn't exists
     """
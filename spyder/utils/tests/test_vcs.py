@@ -11,6 +11,7 @@ Tests for vcs.py
 # Standard library imports
 import os
 import os.path as osp
+import subprocess
 import sys
 
 # Test library imports
@@ -18,9 +19,10 @@ from spyder.utils import programs
 import pytest
 
 # Local imports
-from spyder.utils.vcs import (ActionToolNotFound, get_git_refs,
-                              get_git_remotes, get_git_revision, get_vcs_root,
-                              remote_to_url, run_vcs_tool)
+from spyder.utils.vcs import (ActionToolNotFound, GitStateCache,
+                              get_git_refs, get_git_remotes,
+                              get_git_revision, get_git_root, get_vcs_root,
+                              parse_git_status, remote_to_url, run_vcs_tool)
 
 
 HERE = os.path.abspath(os.path.dirname(__file__))
@@ -28,6 +30,27 @@ HERE = os.path.abspath(os.path.dirname(__file__))
 skipnogit = pytest.mark.skipif(not(get_vcs_root(HERE)),
                                reason="Not running from a git repo")
 
+skipnogitprogram = pytest.mark.skipif(not programs.find_program('git'),
+                                      reason="Git is not installed")
+
+
+@pytest.fixture
+def git_repo(tmpdir):
+    """Git repository with one commit."""
+    def git(*args):
+        subprocess.check_call(['git'] + list(args), cwd=str(tmpdir),
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    tmpdir.join('foo.py').write('a = 1\n')
+    git('init')
+    git('checkout', '-b', 'master')
+    git('add', 'foo.py')
+    git('-c', 'user.name=Test', '-c', 'user.email=test@example.com',
+        'commit', '-m', 'First commit')
+    git('tag', 'v1.0')
+    git.path = str(tmpdir)
+    return git
+
 
 @skipnogit
 @pytest.mark.skipif(os.environ.get('CI', None) is None,
@@ -77,6 +100,78 @@ def test_get_git_refs():
     assert any([('master' in b or '4.x' in b) for b in branch_tags])
 
 
+@skipnogitprogram
+def test_git_state_cache(git_repo, monkeypatch):
+    """Test that states are only refreshed when the repository changes."""
+    cache = GitStateCache()
+    foo = osp.join(git_repo.path, 'foo.py')
+    state = cache.get_state(foo)
+    assert state.branch == 'master'
+    assert state.refs == ['master', 'v1.0']
+    assert state.file_status == {}
+
+    # Changes in the working tree don't invalidate the state
+    with open(foo, 'w') as f:
+        f.write('a = 2\n')
+    with open(osp.join(git_repo.path, 'bar.py'), 'w') as f:
+        f.write('b = 1\n')
+    calls = []
+    run_program = programs.run_program
+
+    def run_program_mock(*args, **kwargs):
+        calls.append(args)
+        return run_program(*args, **kwargs)
+
+    monkeypatch.setattr(programs, 'run_program', run_program_mock)
+    assert cache.get_state(git_repo.path) is state
+    assert calls == []
+
+    # Saved files are updated with a single call
+    cache.update_file(foo)
+    assert len(calls) == 1
+    state = cache.get_state(foo)
+    assert state.file_status == {'foo.py': ' M'}
+    assert state.get_file_status(foo) == ' M'
+    assert state.get_file_status(git_repo.path) is None
+
+    # But the index, branches and tags do
+    git_repo('add', 'bar.py')
+    state = cache.get_state(foo)
+    assert state.file_status == {'foo.py': ' M', 'bar.py': 'A '}
+    assert state.files_modified == ['A  bar.py', 'M foo.py']
+    git_repo('checkout', '-b', 'feature')
+    state = cache.get_state(foo)
+    assert state.branch == 'feature'
+    assert state.refs == ['feature', 'master', 'v1.0']
+
+
+@skipnogitprogram
+def test_git_state_worktree(git_repo, tmpdir_factory):
+    """Test that the states of worktrees are read from their gitdir."""
+    worktree = osp.join(str(tmpdir_factory.mktemp('worktree')), 'wt')
+    git_repo('worktree', 'add', '-b', 'feature', worktree)
+    foo = osp.join(worktree, 'foo.py')
+    assert get_git_root(foo) == worktree
+
+    cache = GitStateCache()
+    state = cache.get_state(foo)
+    assert state.root == worktree
+    assert state.branch == 'feature'
+    assert state.refs == ['feature', 'master', 'v1.0']
+
+    # New branches of the main repository invalidate the state
+    git_repo('branch', 'other')
+    state = cache.get_state(foo)
+    assert state.refs == ['feature', 'master', 'other', 'v1.0']
+
+
+def test_parse_git_status():
+    """Test parsing the output of git status."""
+    output = ' M foo.py\0R  new.py\0old.py\0?? sub/\0'
+    assert parse_git_status(output) == {'foo.py': ' M', 'new.py': 'R ',
+                                        'sub/': '??'}
+
+
 @skipnogit
 def test_get_git_remotes():
     remotes = get_git_remotes(HERE)
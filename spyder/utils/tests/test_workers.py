@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for workers.py
+"""
+
+# Standard library imports
+import threading
+import time
+
+# Test library imports
+import pytest
+
+# Local imports
+from spyder.utils.workers import (get_cancellation_token, INTERACTIVE,
+                                  WorkerManager, WorkerMetrics)
+
+
+@pytest.fixture
+def manager():
+    """Worker manager that runs one worker at a time."""
+    manager = WorkerManager(max_threads=1, name='Test')
+    yield manager
+    manager.terminate_all()
+
+
+def test_python_workers(qtbot, manager):
+    """Test that workers are queued by priority and their results sent."""
+    event = threading.Event()
+    results = []
+
+    def collect(worker, output, error):
+        results.append(output)
+
+    workers = [manager.create_python_worker(event.wait, 10)]
+    for i in range(3):
+        workers.append(manager.create_python_worker(lambda i=i: i))
+    workers[-1].priority = INTERACTIVE
+    for worker in workers:
+        worker.sig_finished.connect(collect)
+        worker.start()
+
+    info = manager.get_queue_info()
+    assert info['pending'] == 3
+    assert info['running'] == 1
+
+    event.set()
+    qtbot.waitUntil(lambda: len(results) == 4)
+    assert results == [True, 2, 0, 1]
+    assert manager.get_queue_info()['max_pending'] == 3
+
+
+def test_cancellation(qtbot, manager):
+    """Test that cancelled workers stop and don't send results."""
+    started = threading.Event()
+    results = []
+
+    def loop():
+        started.set()
+        token = get_cancellation_token()
+        while not token.is_cancelled():
+            time.sleep(0.01)
+        return 'cancelled'
+
+    running = manager.create_python_worker(loop)
+    pending = manager.create_python_worker(lambda: 'pending')
+    last = manager.create_python_worker(lambda: 'last')
+    for worker in (running, pending, last):
+        worker.sig_finished.connect(
+            lambda worker, output, error: results.append(output))
+    running.start()
+    pending.start()
+    assert started.wait(10)
+
+    manager.terminate_all()
+    last.start()
+    qtbot.waitUntil(lambda: results == ['last'])
+    assert running.is_finished() and pending.is_finished()
+
+    # Outside of workers tokens are never cancelled
+    assert not get_cancellation_token().is_cancelled()
+
+
+def test_metrics(qtbot):
+    """Test that task timings are recorded."""
+    metrics = WorkerMetrics()
+    manager = WorkerManager(max_threads=1, name='Metrics', metrics=metrics)
+    workers = [manager.create_python_worker(lambda: 1),
+               manager.create_python_worker(lambda: 1 / 0)]
+    for worker in workers:
+        worker.start()
+    qtbot.waitUntil(lambda: len(metrics.records) == 2)
+    assert manager.get_queue_info()['running'] == 0
+
+    summary = metrics.get_summary()
+    assert [task['count'] for task in summary] == [2]
+    assert summary[0]['errors'] == 1
+    assert summary[0]['max_duration'] >= 0
+    assert metrics.get_queues()[0]['name'] == 'Metrics'
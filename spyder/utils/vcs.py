@@ -12,6 +12,7 @@ import os
 import os.path as osp
 import subprocess
 import sys
+import threading
 
 # Local imports
 from spyder.config.base import running_under_pytest
@@ -151,63 +152,324 @@ def get_git_revision(repopath):
         return None, None
 
 
-def get_git_refs(repopath):
+def get_git_root(path):
     """
-    Return Git active branch, state, branches (plus tags).
+    Return the root of the Git repository of path, or None.
+
+    Worktrees and submodules, whose .git is a file, are repositories too.
     """
-    tags = []
-    branches = []
-    branch = ''
-    files_modifed = []
+    if osp.isfile(path):
+        path = osp.dirname(path)
+    path = osp.abspath(path)
+    while not osp.exists(osp.join(path, '.git')):
+        parent = abspardir(path)
+        if parent == path:
+            return None
+        path = parent
+    return path
+
+
+def get_git_dir(root):
+    """
+    Return the Git directory of the repository at root, following the
+    `gitdir:` line of worktrees and submodules. Return None on error.
+    """
+    git_dir = osp.join(root, '.git')
+    if osp.isdir(git_dir):
+        return git_dir
+    try:
+        with open(git_dir) as f:
+            line = f.readline().strip()
+    except (IOError, OSError):
+        return None
+    if not line.startswith('gitdir:'):
+        return None
+    git_dir = osp.join(root, line[len('gitdir:'):].strip())
+    git_dir = osp.normpath(git_dir)
+    return git_dir if osp.isdir(git_dir) else None
+
+
+def get_git_common_dir(git_dir):
+    """
+    Return the directory with the refs shared by the worktrees of a
+    repository, which is git_dir itself if it's not a worktree.
+    """
+    try:
+        with open(osp.join(git_dir, 'commondir')) as f:
+            common_dir = f.readline().strip()
+    except (IOError, OSError):
+        return git_dir
+    return osp.normpath(osp.join(git_dir, common_dir))
 
-    if os.path.isfile(repopath):
-        repopath = os.path.dirname(repopath)
 
-    git = programs.find_program('git')
+def get_git_state_signature(git_dir):
+    """
+    Return a signature of the files of git_dir that change when the
+    active branch, the refs or the index of its repository change.
 
-    if git:
+    Git replaces these files instead of writing to them, so their inode
+    is part of the signature along with their size and modification time.
+    """
+    def stat(path):
         try:
-            # Files modified
-            out, err = programs.run_program(
-                git, ['status', '-s'],
-                cwd=repopath,
-            ).communicate()
-
-            if PY3:
-                out = out.decode(sys.getdefaultencoding())
-            files_modifed = [line.strip() for line in out.split('\n') if line]
-
-            # Tags
-            out, err = programs.run_program(
-                git, ['tag'],
-                cwd=repopath,
-            ).communicate()
-
-            if PY3:
-                out = out.decode(sys.getdefaultencoding())
-            tags = [line.strip() for line in out.split('\n') if line]
-
-            # Branches
-            out, err = programs.run_program(
-                git, ['branch', '-a'],
-                cwd=repopath,
-            ).communicate()
-
-            if PY3:
-                out = out.decode(sys.getdefaultencoding())
-
-            lines = [line.strip() for line in out.split('\n') if line]
-            for line in lines:
-                if line.startswith('*'):
-                    line = line.replace('*', '').strip()
-                    branch = line
-
-                branches.append(line)
-
-        except (subprocess.CalledProcessError, AttributeError, OSError):
-            pass
-
-    return branches + tags, branch, files_modifed
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime, st.st_size, st.st_ino)
+
+    common_dir = get_git_common_dir(git_dir)
+    signature = [stat(osp.join(git_dir, 'HEAD')),
+                 stat(osp.join(git_dir, 'index')),
+                 stat(osp.join(common_dir, 'packed-refs'))]
+    for dirpath, __, filenames in os.walk(osp.join(common_dir, 'refs')):
+        for filename in sorted(filenames):
+            path = osp.join(dirpath, filename)
+            signature.append((path, stat(path)))
+    return tuple(signature)
+
+
+def read_git_refs(git_dir):
+    """
+    Return the active branch and the refs of a repository, reading them
+    from its Git directory instead of calling git.
+
+    Refs are named as `git branch -a` and `git tag` do. For worktrees,
+    they're read from the directory shared with the main repository.
+    """
+    branch = ''
+    try:
+        with open(osp.join(git_dir, 'HEAD')) as f:
+            head = f.read().strip()
+    except (IOError, OSError):
+        head = ''
+    if head.startswith('ref: refs/heads/'):
+        branch = head[len('ref: refs/heads/'):]
+    elif head:
+        branch = '(HEAD detached at {})'.format(head[:7])
+
+    refs = set()
+    common_dir = get_git_common_dir(git_dir)
+    refs_dir = osp.join(common_dir, 'refs')
+    for dirpath, __, filenames in os.walk(refs_dir):
+        for filename in filenames:
+            ref = osp.relpath(osp.join(dirpath, filename), common_dir)
+            refs.add(ref.replace(os.sep, '/'))
+    try:
+        with open(osp.join(common_dir, 'packed-refs')) as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and not line.startswith(('#', '^')):
+                    refs.add(parts[1])
+    except (IOError, OSError):
+        pass
+
+    branches, remotes, tags = [], [], []
+    for ref in sorted(refs):
+        if ref.startswith('refs/heads/'):
+            branches.append(ref[len('refs/heads/'):])
+        elif ref.startswith('refs/remotes/') and not ref.endswith('/HEAD'):
+            remotes.append('remotes/' + ref[len('refs/remotes/'):])
+        elif ref.startswith('refs/tags/'):
+            tags.append(ref[len('refs/tags/'):])
+    if branch.startswith('(HEAD detached'):
+        branches.insert(0, branch)
+    return branch, branches + remotes + tags
+
+
+def parse_git_status(output):
+    """
+    Return a dict of the statuses of the files listed in the output of
+    `git status --porcelain -z`, keyed by their path in the repository.
+    """
+    file_status = {}
+    entries = output.split('\0')
+    i = 0
+    while i < len(entries):
+        entry = entries[i]
+        i += 1
+        if len(entry) < 4:
+            continue
+        code, path = entry[:2], entry[3:]
+        if code[0] in 'RC':
+            # The original path of renamed and copied files comes next
+            i += 1
+        file_status[path] = code
+    return file_status
+
+
+def run_git_status(git, root, paths=None):
+    """
+    Return the statuses of the files of the repository at root, or only of
+    paths if given, with a single git call. Return None on error.
+    """
+    args = ['status', '--porcelain', '-z']
+    if paths:
+        args += ['--'] + [osp.relpath(path, root) for path in paths]
+    try:
+        proc = programs.run_program(git, args, cwd=root)
+        out, __ = proc.communicate()
+    except (subprocess.CalledProcessError, AttributeError, OSError):
+        return None
+    if proc.returncode != 0:
+        return None
+    if PY3:
+        out = out.decode(sys.getdefaultencoding(), 'replace')
+    return parse_git_status(out)
+
+
+class GitState(object):
+    """Active branch, refs and file statuses of a Git repository."""
+
+    def __init__(self, root, branch, refs, file_status, signature=None):
+        self.root = root
+        self.branch = branch
+        self.refs = refs
+        self.file_status = file_status
+        self.signature = signature
+        self._dir_status = None
+
+    @property
+    def files_modified(self):
+        """Changed files, as listed by `git status -s`."""
+        return sorted('{} {}'.format(code, path).strip()
+                      for path, code in self.file_status.items())
+
+    def get_file_status(self, path):
+        """
+        Return the status code of path, as given by `git status`, or None
+        if it's unchanged or not in the repository.
+
+        Directories that contain changed files get an 'M' status.
+        """
+        relpath = osp.relpath(path, self.root)
+        if relpath == os.curdir or relpath.startswith(os.pardir):
+            return None
+        relpath = relpath.replace(os.sep, '/')
+        code = self.file_status.get(relpath)
+        if code is not None:
+            return code
+
+        # Untracked directories are listed instead of their files
+        parts = relpath.split('/')
+        for i in range(1, len(parts)):
+            code = self.file_status.get('/'.join(parts[:i]) + '/')
+            if code is not None:
+                return code
+
+        if self._dir_status is None:
+            self._dir_status = set()
+            for changed_path in self.file_status:
+                parts = changed_path.rstrip('/').split('/')
+                for i in range(1, len(parts)):
+                    self._dir_status.add('/'.join(parts[:i]))
+        if relpath.rstrip('/') in self._dir_status:
+            return 'M'
+        return None
+
+
+class GitStateCache(object):
+    """
+    Cache of the states of the Git repositories used by the editor status
+    bar and the file explorer.
+
+    A state is refreshed only when the branch, refs or index of its
+    repository change (see get_git_state_signature), with one git call to
+    get all file statuses. Saved files must be passed to update_file.
+    It can be used from worker threads.
+    """
+
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.RLock()
+
+    def get_state(self, path):
+        """
+        Return the GitState of the repository that contains path, or None
+        if there's no such repository or git is not installed.
+        """
+        git = programs.find_program('git')
+        root = get_git_root(path)
+        if git is None or root is None:
+            return None
+        git_dir = get_git_dir(root)
+        if git_dir is None:
+            return None
+
+        with self._lock:
+            state = self._states.get(root)
+            if (state is not None and
+                    state.signature == get_git_state_signature(git_dir)):
+                return state
+
+            file_status = run_git_status(git, root)
+            if file_status is None:
+                return None
+            branch, refs = read_git_refs(git_dir)
+            # Taken after calling git, which can refresh the index
+            signature = get_git_state_signature(git_dir)
+            state = GitState(root, branch, refs, file_status, signature)
+            self._states[root] = state
+            return state
+
+    def update_file(self, path):
+        """Refresh the status of path in the cached state of its repository."""
+        git = programs.find_program('git')
+        root = get_git_root(path)
+        if git is None or root is None:
+            return
+        git_dir = get_git_dir(root)
+        if git_dir is None:
+            return
+
+        with self._lock:
+            state = self._states.get(root)
+            if state is None:
+                return
+            if state.signature != get_git_state_signature(git_dir):
+                # The whole state has to be refreshed anyway
+                self.invalidate(root)
+                return
+            file_status = run_git_status(git, root, [path])
+            if file_status is None:
+                self.invalidate(root)
+                return
+            relpath = osp.relpath(path, root).replace(os.sep, '/')
+            code = file_status.get(relpath)
+            file_status = dict(state.file_status)
+            if code is None:
+                file_status.pop(relpath, None)
+            else:
+                file_status[relpath] = code
+            # git status can refresh the index, which isn't a change
+            signature = get_git_state_signature(git_dir)
+            self._states[root] = GitState(root, state.branch, state.refs,
+                                          file_status, signature)
+
+    def invalidate(self, path=None):
+        """Forget the state of the repository of path, or all of them."""
+        with self._lock:
+            if path is None:
+                self._states.clear()
+            else:
+                self._states.pop(get_git_root(path), None)
+
+
+GIT_STATES = GitStateCache()
+
+
+def get_git_state(path):
+    """Return the cached GitState of the repository of path, or None."""
+    return GIT_STATES.get_state(path)
+
+
+def get_git_refs(repopath):
+    """
+    Return Git active branch, state, branches (plus tags).
+    """
+    state = get_git_state(repopath)
+    if state is None:
+        return [], '', []
+    return list(state.refs), state.branch, state.files_modified
 
 
 def get_git_remotes(fpath):
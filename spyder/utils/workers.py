@@ -8,16 +8,24 @@
 """
 Worker manager and workers for running files long processes in non GUI
 blocking threads.
+
+Python workers run in a thread pool shared by all worker managers, where
+interactive ones are picked before background ones.
 """
 
 # Standard library imports
 from collections import deque
+import heapq
+import itertools
 import os
 import sys
+import threading
+import time
+import weakref
 
 # Third party imports
-from qtpy.QtCore import (QByteArray, QObject, QProcess, QThread, QTimer,
-                         Signal)
+from qtpy.QtCore import (QByteArray, QObject, QProcess, QRunnable, QThread,
+                         QThreadPool, QTimer, Signal)
 
 # Local imports
 from spyder.py3compat import PY2, to_text_string
@@ -25,6 +33,19 @@ from spyder.py3compat import PY2, to_text_string
 
 WIN = os.name == 'nt'
 
+# Priorities of python workers in the thread pool
+BACKGROUND = 0
+INTERACTIVE = 1
+
+# Minimum number of threads of the pool
+MIN_POOL_THREADS = 4
+
+try:
+    clock = time.perf_counter
+except AttributeError:
+    # Python 2
+    clock = time.time
+
 
 def handle_qbytearray(obj, encoding):
     """Qt/Python2/3 compatibility helper."""
@@ -34,6 +55,131 @@ def handle_qbytearray(obj, encoding):
     return to_text_string(obj, encoding=encoding)
 
 
+class CancellationToken(object):
+    """
+    Flag used to ask a python worker to stop.
+
+    Functions run by workers get the token of their worker with
+    get_cancellation_token and should check it from time to time.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Ask the worker to stop."""
+        self._event.set()
+
+    def is_cancelled(self):
+        """Return True if the worker was asked to stop."""
+        return self._event.is_set()
+
+
+_local = threading.local()
+
+
+def get_cancellation_token():
+    """
+    Return the token of the python worker running in the current thread.
+
+    Outside of workers, the returned token is never cancelled.
+    """
+    token = getattr(_local, 'token', None)
+    if token is None:
+        token = CancellationToken()
+    return token
+
+
+class WorkerMetrics(object):
+    """
+    Timings of the last python workers run and queues of worker managers,
+    shown in the worker metrics dialog.
+    """
+
+    def __init__(self, maxlen=500):
+        self.records = deque(maxlen=maxlen)
+        self._managers = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def register(self, manager):
+        """Add a worker manager whose queue is reported."""
+        with self._lock:
+            self._managers.add(manager)
+
+    def add(self, worker, manager):
+        """Record the timing of a worker that finished or was cancelled."""
+        started = worker.started_at
+        finished = worker.finished_at
+        record = {
+            'manager': manager.name,
+            'name': worker.name,
+            'priority': worker.priority,
+            'wait': (started if started is not None else finished) -
+                    worker.queued_at,
+            'duration': finished - started if started is not None else 0,
+            'cancelled': worker.token.is_cancelled(),
+            'error': worker.error is not None,
+        }
+        with self._lock:
+            self.records.append(record)
+
+    def get_queues(self):
+        """
+        Return a list of dicts with the name, number of pending and running
+        workers, and maximum number of pending workers of each manager.
+        """
+        with self._lock:
+            managers = list(self._managers)
+        return sorted([manager.get_queue_info() for manager in managers],
+                      key=lambda info: info['name'])
+
+    def get_summary(self):
+        """
+        Return a list of dicts with the number of runs, cancellations and
+        errors, and the mean wait and mean and max durations of each task.
+        """
+        with self._lock:
+            records = list(self.records)
+        tasks = {}
+        for record in records:
+            key = (record['manager'], record['name'])
+            tasks.setdefault(key, []).append(record)
+        summary = []
+        for (manager, name), records in sorted(tasks.items()):
+            durations = [r['duration'] for r in records]
+            summary.append({
+                'manager': manager,
+                'name': name,
+                'count': len(records),
+                'cancelled': sum(r['cancelled'] for r in records),
+                'errors': sum(r['error'] for r in records),
+                'mean_wait': sum(r['wait'] for r in records) / len(records),
+                'mean_duration': sum(durations) / len(durations),
+                'max_duration': max(durations),
+            })
+        return summary
+
+    def clear(self):
+        """Forget the recorded timings."""
+        with self._lock:
+            self.records.clear()
+
+
+WORKER_METRICS = WorkerMetrics()
+
+_THREAD_POOL = None
+
+
+def get_thread_pool():
+    """Return the thread pool shared by all worker managers."""
+    global _THREAD_POOL
+    if _THREAD_POOL is None:
+        _THREAD_POOL = QThreadPool()
+        _THREAD_POOL.setMaxThreadCount(
+            max(QThread.idealThreadCount(), MIN_POOL_THREADS))
+    return _THREAD_POOL
+
+
 class PythonWorker(QObject):
     """
     Generic python worker for running python code on threads.
@@ -49,8 +195,16 @@ class PythonWorker(QObject):
         self.func = func
         self.args = args
         self.kwargs = kwargs
+        self.name = getattr(func, '__name__', repr(func))
+        self.priority = BACKGROUND
+        self.token = CancellationToken()
+        self.error = None
+        self.queued_at = None
+        self.started_at = None
+        self.finished_at = None
         self._is_finished = False
         self._started = False
+        self._lock = threading.Lock()
 
     def is_finished(self):
         """Return True if worker status is finished otherwise return False."""
@@ -59,26 +213,63 @@ class PythonWorker(QObject):
     def start(self):
         """Start the worker (emits sig_started signal with worker as arg)."""
         if not self._started:
+            self.queued_at = clock()
             self.sig_started.emit(self)
             self._started = True
 
+    def cancel(self):
+        """
+        Cancel the worker.
+
+        It won't run if it's waiting in a queue, sig_finished won't be
+        emitted, and its cancellation token is set.
+        """
+        with self._lock:
+            self._is_finished = True
+        self.token.cancel()
+
     def terminate(self):
         """Mark the worker as finished."""
-        self._is_finished = True
+        self.cancel()
 
     def _start(self):
         """Start process worker for given method args and kwargs."""
         error = None
         output = None
 
+        self.started_at = clock()
+        _local.token = self.token
         try:
             output = self.func(*self.args, **self.kwargs)
         except Exception as err:
             error = err
-
-        if not self._is_finished:
+        finally:
+            _local.token = None
+            self.finished_at = clock()
+        self.error = error
+
+        with self._lock:
+            cancelled = self._is_finished
+            self._is_finished = True
+        if not cancelled:
             self.sig_finished.emit(self, output, error)
-        self._is_finished = True
+
+
+class PythonRunnable(QRunnable):
+    """Runnable that runs a python worker in the thread pool."""
+
+    def __init__(self, worker, manager):
+        super(PythonRunnable, self).__init__()
+        self.worker = worker
+        self.manager = manager
+        self.setAutoDelete(True)
+
+    def run(self):
+        try:
+            if not self.worker.token.is_cancelled():
+                self.worker._start()
+        finally:
+            self.manager._worker_done(self)
 
 
 class ProcessWorker(QObject):
@@ -217,106 +408,109 @@ class ProcessWorker(QObject):
 
 
 class WorkerManager(QObject):
-    """Spyder Worker Manager for Generic Workers."""
-
-    def __init__(self, max_threads=10):
-        """Spyder Worker Manager for Generic Workers."""
-        super(QObject, self).__init__()
-        self._queue = deque()
-        self._queue_workers = deque()
-        self._threads = []
-        self._workers = []
-        self._timer = QTimer()
-        self._timer_worker_delete = QTimer()
-        self._running_threads = 0
-        self._max_threads = max_threads
+    """
+    Spyder Worker Manager for Generic Workers.
 
-        # Keeps references to old workers
-        # Needed to avoud C++/python object errors
-        self._bag_collector = deque()
+    Python workers wait in a queue until fewer than max_threads of them are
+    running, and then run in the shared thread pool with the manager's
+    priority, unless another one is set on the worker before starting it.
+    """
 
-        self._timer.setInterval(333)
-        self._timer.timeout.connect(self._start)
-        self._timer_worker_delete.setInterval(5000)
-        self._timer_worker_delete.timeout.connect(self._clean_workers)
+    _counter = itertools.count()
 
-    def _clean_workers(self):
-        """Delete periodically workers in workers bag."""
-        while self._bag_collector:
-            self._bag_collector.popleft()
-        self._timer_worker_delete.stop()
+    def __init__(self, max_threads=10, priority=BACKGROUND, name=None,
+                 metrics=WORKER_METRICS):
+        """Spyder Worker Manager for Generic Workers."""
+        super(WorkerManager, self).__init__()
+        self.name = name or 'Workers {}'.format(next(self._counter))
+        self._max_threads = max_threads
+        self._priority = priority
+        self._lock = threading.RLock()
+        self._queue = []
+        self._count = itertools.count()
+        self._running = set()
+        self._max_queue_depth = 0
+        self._process_workers = []
+        self._metrics = metrics
+        metrics.register(self)
 
     def _start(self, worker=None):
-        """Start threads and check for inactive workers."""
-        if worker:
-            self._queue_workers.append(worker)
-
-        if self._queue_workers and self._running_threads < self._max_threads:
-            #print('Queue: {0} Running: {1} Workers: {2} '
-            #       'Threads: {3}'.format(len(self._queue_workers),
-            #                                 self._running_threads,
-            #                                 len(self._workers),
-            #                                 len(self._threads)))
-            self._running_threads += 1
-            worker = self._queue_workers.popleft()
-            thread = QThread()
-            if isinstance(worker, PythonWorker):
-                worker.moveToThread(thread)
-                worker.sig_finished.connect(thread.quit)
-                thread.started.connect(worker._start)
-                thread.start()
-            elif isinstance(worker, ProcessWorker):
-                thread.quit()
-                worker._start()
-            self._threads.append(thread)
-        else:
-            self._timer.start()
-
-        if self._workers:
-            for w in self._workers:
-                if w.is_finished():
-                    self._bag_collector.append(w)
-                    self._workers.remove(w)
-
-        if self._threads:
-            for t in self._threads:
-                if t.isFinished():
-                    self._threads.remove(t)
-                    self._running_threads -= 1
-
-        if len(self._threads) == 0 and len(self._workers) == 0:
-            self._timer.stop()
-            self._timer_worker_delete.start()
+        """Queue a worker and run as many queued workers as possible."""
+        if isinstance(worker, ProcessWorker):
+            worker._start()
+            return
+
+        with self._lock:
+            if worker is not None:
+                heapq.heappush(self._queue,
+                               (-worker.priority, next(self._count), worker))
+                self._max_queue_depth = max(self._max_queue_depth,
+                                            len(self._queue))
+            while self._queue and len(self._running) < self._max_threads:
+                worker = heapq.heappop(self._queue)[-1]
+                if worker.token.is_cancelled():
+                    self._record(worker)
+                    continue
+                runnable = PythonRunnable(worker, self)
+                self._running.add(runnable)
+                get_thread_pool().start(runnable, worker.priority)
+
+    def _worker_done(self, runnable):
+        """Called from the pool thread when a worker is done."""
+        with self._lock:
+            self._running.discard(runnable)
+            self._record(runnable.worker)
+            self._start()
+
+    def _record(self, worker):
+        """Add the timing of a worker to the metrics."""
+        if worker.finished_at is None:
+            worker.finished_at = clock()
+        self._metrics.add(worker, self)
+
+    def get_queue_info(self):
+        """Return the state of the queue of the manager."""
+        with self._lock:
+            return {'name': self.name,
+                    'pending': len(self._queue),
+                    'running': len(self._running),
+                    'max_threads': self._max_threads,
+                    'max_pending': self._max_queue_depth}
 
     def create_python_worker(self, func, *args, **kwargs):
         """Create a new python worker instance."""
         worker = PythonWorker(func, args, kwargs)
+        worker.priority = self._priority
         self._create_worker(worker)
         return worker
 
     def create_process_worker(self, cmd_list, environ=None):
         """Create a new process worker instance."""
         worker = ProcessWorker(cmd_list, environ=environ)
+        self._process_workers = [w for w in self._process_workers
+                                 if not w.is_finished()]
+        self._process_workers.append(worker)
         self._create_worker(worker)
         return worker
 
     def terminate_all(self):
-        """Terminate all worker processes."""
-        for worker in self._workers:
+        """
+        Cancel queued and running python workers, and terminate process
+        workers.
+        """
+        with self._lock:
+            for __, __, worker in self._queue:
+                worker.cancel()
+                self._record(worker)
+            self._queue = []
+            for runnable in self._running:
+                runnable.worker.cancel()
+        for worker in self._process_workers:
             worker.terminate()
 
-        # for thread in self._threads:
-        #     try:
-        #         thread.terminate()
-        #         thread.wait()
-        #     except Exception:
-        #         pass
-        self._queue_workers = deque()
-
     def _create_worker(self, worker):
         """Common worker setup."""
         worker.sig_started.connect(self._start)
-        self._workers.append(worker)
 
 # --- Local testing
 # -----------------------------------------------------------------------------
@@ -327,7 +521,6 @@ def ready_print(worker, output, error):  # pragma: no cover
 
 def sleeping_func(arg, secs=10, result_queue=None):
     """This methods illustrates how the workers can be used."""
-    import time
     time.sleep(secs)
     if result_queue is not None:
         result_queue.put(arg)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Dialog showing the queues and timings of python workers"""
+
+# Standard library imports
+import sys
+
+# Third party imports
+from qtpy.QtCore import QTimer
+from qtpy.QtWidgets import (QDialog, QDialogButtonBox, QHBoxLayout, QLabel,
+                            QPushButton, QTreeWidget, QTreeWidgetItem,
+                            QVBoxLayout)
+
+# Local imports
+from spyder import __version__
+from spyder.config.base import _
+from spyder.utils import icon_manager as ima
+from spyder.utils.workers import INTERACTIVE, WORKER_METRICS
+
+
+# Refresh interval of the dialog, in ms
+REFRESH_INTERVAL = 1000
+
+
+class WorkerMetricsDialog(QDialog):
+
+    def __init__(self, parent, metrics=WORKER_METRICS):
+        QDialog.__init__(self, parent)
+        self.metrics = metrics
+
+        # Widgets
+        self.queues_label = QLabel(_("Queues"))
+        self.queues_tree = QTreeWidget(self)
+        self.queues_tree.setHeaderLabels([_("Worker manager"), _("Pending"),
+                                          _("Running"), _("Max threads"),
+                                          _("Max pending")])
+        self.queues_tree.setRootIsDecorated(False)
+        self.tasks_label = QLabel(_("Last tasks (times in ms)"))
+        self.tasks_tree = QTreeWidget(self)
+        self.tasks_tree.setHeaderLabels([_("Worker manager"), _("Task"),
+                                         _("Runs"), _("Cancelled"),
+                                         _("Errors"), _("Mean wait"),
+                                         _("Mean duration"),
+                                         _("Max duration")])
+        self.tasks_tree.setRootIsDecorated(False)
+        clear_btn = QPushButton(_("Clear"))
+        bbox = QDialogButtonBox(QDialogButtonBox.Ok)
+        self.timer = QTimer(self)
+        self.timer.setInterval(REFRESH_INTERVAL)
+
+        # Widget setup
+        self.setWindowTitle("Spyder %s: %s" % (__version__,
+                                               _("Worker metrics")))
+        self.setWindowIcon(ima.icon('tooloptions'))
+
+        # Layout
+        hlayout = QHBoxLayout()
+        hlayout.addWidget(clear_btn)
+        hlayout.addStretch()
+        hlayout.addWidget(bbox)
+
+        vlayout = QVBoxLayout()
+        vlayout.addWidget(self.queues_label)
+        vlayout.addWidget(self.queues_tree)
+        vlayout.addWidget(self.tasks_label)
+        vlayout.addWidget(self.tasks_tree)
+        vlayout.addLayout(hlayout)
+
+        self.setLayout(vlayout)
+        self.resize(860, 560)
+
+        # Signals
+        clear_btn.clicked.connect(self.clear)
+        bbox.accepted.connect(self.accept)
+        self.timer.timeout.connect(self.refresh)
+
+        self.refresh()
+        self.timer.start()
+
+    def refresh(self):
+        """Show the current metrics"""
+        self.queues_tree.clear()
+        for queue in self.metrics.get_queues():
+            self.queues_tree.addTopLevelItem(QTreeWidgetItem(
+                [queue['name']] +
+                [str(queue[key]) for key in ('pending', 'running',
+                                             'max_threads', 'max_pending')]))
+
+        self.tasks_tree.clear()
+        for task in self.metrics.get_summary():
+            self.tasks_tree.addTopLevelItem(QTreeWidgetItem(
+                [task['manager'], task['name']] +
+                [str(task[key]) for key in ('count', 'cancelled', 'errors')] +
+                ['{:.1f}'.format(task[key] * 1000)
+                 for key in ('mean_wait', 'mean_duration', 'max_duration')]))
+
+        for tree in (self.queues_tree, self.tasks_tree):
+            for col in range(tree.columnCount()):
+                tree.resizeColumnToContents(col)
+
+    def clear(self):
+        """Forget the recorded timings"""
+        self.metrics.clear()
+        self.refresh()
+
+
+def test():
+    """Run worker metrics dialog test"""
+    from spyder.utils.qthelpers import qapplication
+    from spyder.utils.workers import WorkerManager, sleeping_func
+
+    qapplication()
+    manager = WorkerManager(max_threads=2, name='Test')
+    for i in range(6):
+        worker = manager.create_python_worker(sleeping_func, i, secs=1)
+        if i % 2:
+            worker.priority = INTERACTIVE
+        worker.start()
+    dlg = WorkerMetricsDialog(None)
+    dlg.show()
+    sys.exit(dlg.exec_())
+
+
+if __name__ == '__main__':
+    test()